@@ -1,94 +1,190 @@
+"""
+The public API of autoarray, whose classes, functions and modules are imported when they are first accessed (e.g.
+`aa.Imaging`) via the module level `__getattr__` below (see PEP 562).
+
+This means `import autoarray` does not import every subpackage and the optional dependencies they use (e.g. numba,
+scipy, astropy, scikit-learn, pylops and pynufft), which would otherwise take over a second for every short lived
+process which imports autoarray but only uses a small part of it.
+"""
+import importlib
+from typing import Dict, Optional, Tuple
+
 from . import exc
-from . import type
-from . import util
-from . import fixtures
-from . import mock as m
+
+# The numba settings are read from the config when `numba_util` is imported, which is therefore before the default
+# config of autoarray is registered below (as it was when every module was imported here), such that compiled
+# functions are cached unless a workspace config sets otherwise.
+from . import numba_util
 from .numba_util import profile_func
-from .preloads import Preloads
-from .dataset import preprocess
-from .dataset.abstract.dataset import AbstractDataset
-from .dataset.abstract.w_tilde import AbstractWTilde
-from .dataset.grids import GridsInterface
-from .dataset.imaging.dataset import Imaging
-from .dataset.imaging.simulator import SimulatorImaging
-from .dataset.imaging.w_tilde import WTildeImaging
-from .dataset.interferometer.dataset import Interferometer
-from .dataset.interferometer.simulator import SimulatorInterferometer
-from .dataset.interferometer.w_tilde import WTildeInterferometer
-from .dataset.over_sampling import OverSamplingDataset
-from .dataset.dataset_model import DatasetModel
-from .fit.fit_dataset import AbstractFit
-from .fit.fit_dataset import FitDataset
-from .fit.fit_imaging import FitImaging
-from .fit.fit_interferometer import FitInterferometer
-from .geometry.geometry_2d import Geometry2D
-from .inversion.pixelization.mappers.abstract import AbstractMapper
-from .inversion.pixelization import mesh
-from .inversion.pixelization import image_mesh
-from .inversion import regularization as reg
-from .inversion.inversion.settings import SettingsInversion
-from .inversion.inversion.abstract import AbstractInversion
-from .inversion.regularization.abstract import AbstractRegularization
-from .inversion.inversion.factory import inversion_from as Inversion
-from .inversion.inversion.dataset_interface import DatasetInterface
-from .inversion.pixelization.border_relocator import BorderRelocator
-from .inversion.pixelization.pixelization import Pixelization
-from .inversion.pixelization.mappers.abstract import AbstractMapper
-from .inversion.pixelization.mappers.mapper_grids import MapperGrids
-from .inversion.pixelization.mappers.factory import mapper_from as Mapper
-from .inversion.pixelization.mappers.rectangular import MapperRectangular
-from .inversion.pixelization.mappers.delaunay import MapperDelaunay
-from .inversion.pixelization.mappers.voronoi import MapperVoronoi
-from .inversion.pixelization.image_mesh.abstract import AbstractImageMesh
-from .inversion.pixelization.mesh.abstract import AbstractMesh
-from .inversion.inversion.imaging.mapping import InversionImagingMapping
-from .inversion.inversion.imaging.w_tilde import InversionImagingWTilde
-from .inversion.inversion.interferometer.w_tilde import InversionInterferometerWTilde
-from .inversion.inversion.interferometer.mapping import InversionInterferometerMapping
-from .inversion.inversion.interferometer.lop import InversionInterferometerMappingPyLops
-from .inversion.linear_obj.linear_obj import LinearObj
-from .inversion.linear_obj.func_list import AbstractLinearObjFuncList
-from .mask.derive.indexes_2d import DeriveIndexes2D
-from .mask.derive.mask_1d import DeriveMask1D
-from .mask.derive.mask_2d import DeriveMask2D
-from .mask.derive.grid_1d import DeriveGrid1D
-from .mask.derive.grid_2d import DeriveGrid2D
-from .mask.mask_1d import Mask1D
-from .mask.mask_2d import Mask2D
-from .operators.convolver import Convolver
-from .operators.convolver import Convolver
-from .operators.transformer import TransformerDFT
-from .operators.transformer import TransformerNUFFT
-from .operators.over_sampling.decorator import over_sample
-from .operators.contour import Grid2DContour
-from .layout.layout import Layout1D
-from .layout.layout import Layout2D
-from .structures.arrays.uniform_1d import Array1D
-from .structures.arrays.uniform_2d import Array2D
-from .structures.arrays.irregular import ArrayIrregular
-from .structures.grids.uniform_1d import Grid1D
-from .structures.grids.uniform_2d import Grid2D
-from .operators.over_sampling.decorator import perform_over_sampling_from
-from .operators.over_sampling.grid_oversampled import Grid2DOverSampled
-from .operators.over_sampling.uniform import OverSamplingUniform
-from .operators.over_sampling.iterate import OverSamplingIterate
-from .operators.over_sampling.uniform import OverSamplerUniform
-from .operators.over_sampling.iterate import OverSamplerIterate
-from .structures.grids.irregular_2d import Grid2DIrregular
-from .structures.grids.irregular_2d import Grid2DIrregularUniform
-from .structures.mesh.rectangular_2d import Mesh2DRectangular
-from .structures.mesh.voronoi_2d import Mesh2DVoronoi
-from .structures.mesh.delaunay_2d import Mesh2DDelaunay
-from .structures.arrays.kernel_2d import Kernel2D
-from .structures.vectors.uniform import VectorYX2D
-from .structures.vectors.irregular import VectorYX2DIrregular
-from .structures.triangles.abstract import AbstractTriangles
-from .structures import decorators as grid_dec
-from .structures.header import Header
-from .layout.region import Region1D
-from .layout.region import Region2D
-from .structures.visibilities import Visibilities
-from .structures.visibilities import VisibilitiesNoiseMap
+
+"""
+The public attributes of autoarray, mapped to the module they are imported from and their name in that module, where
+a name of `None` means the attribute is the module itself.
+"""
+_lazy_dict: Dict[str, Tuple[str, Optional[str]]] = {
+    "type": (".type", None),
+    "util": (".util", None),
+    "fixtures": (".fixtures", None),
+    "m": (".mock", None),
+    "Profiler": (".profiler", "Profiler"),
+    "Preloads": (".preloads", "Preloads"),
+    "preprocess": (".dataset.preprocess", None),
+    "AbstractDataset": (".dataset.abstract.dataset", "AbstractDataset"),
+    "NoiseCovarianceLowRank": (
+        ".dataset.abstract.noise_covariance",
+        "NoiseCovarianceLowRank",
+    ),
+    "NoiseCovarianceSparse": (
+        ".dataset.abstract.noise_covariance",
+        "NoiseCovarianceSparse",
+    ),
+    "AbstractWTilde": (".dataset.abstract.w_tilde", "AbstractWTilde"),
+    "GridsInterface": (".dataset.grids", "GridsInterface"),
+    "Imaging": (".dataset.imaging.dataset", "Imaging"),
+    "SimulatorImaging": (".dataset.imaging.simulator", "SimulatorImaging"),
+    "WTildeImaging": (".dataset.imaging.w_tilde", "WTildeImaging"),
+    "Interferometer": (".dataset.interferometer.dataset", "Interferometer"),
+    "SimulatorInterferometer": (
+        ".dataset.interferometer.simulator",
+        "SimulatorInterferometer",
+    ),
+    "WTildeInterferometer": (".dataset.interferometer.w_tilde", "WTildeInterferometer"),
+    "OverSamplingDataset": (".dataset.over_sampling", "OverSamplingDataset"),
+    "DatasetModel": (".dataset.dataset_model", "DatasetModel"),
+    "AbstractFit": (".fit.fit_dataset", "AbstractFit"),
+    "FitDataset": (".fit.fit_dataset", "FitDataset"),
+    "FitImaging": (".fit.fit_imaging", "FitImaging"),
+    "FitInterferometer": (".fit.fit_interferometer", "FitInterferometer"),
+    "Geometry2D": (".geometry.geometry_2d", "Geometry2D"),
+    "AbstractMapper": (".inversion.pixelization.mappers.abstract", "AbstractMapper"),
+    "mesh": (".inversion.pixelization.mesh", None),
+    "image_mesh": (".inversion.pixelization.image_mesh", None),
+    "reg": (".inversion.regularization", None),
+    "SettingsInversion": (".inversion.inversion.settings", "SettingsInversion"),
+    "InversionWorkspace": (".inversion.inversion.workspace", "InversionWorkspace"),
+    "AbstractInversion": (".inversion.inversion.abstract", "AbstractInversion"),
+    "AbstractRegularization": (
+        ".inversion.regularization.abstract",
+        "AbstractRegularization",
+    ),
+    "Inversion": (".inversion.inversion.factory", "inversion_from"),
+    "DatasetInterface": (".inversion.inversion.dataset_interface", "DatasetInterface"),
+    "BorderRelocator": (".inversion.pixelization.border_relocator", "BorderRelocator"),
+    "Pixelization": (".inversion.pixelization.pixelization", "Pixelization"),
+    "MapperGrids": (".inversion.pixelization.mappers.mapper_grids", "MapperGrids"),
+    "Mapper": (".inversion.pixelization.mappers.factory", "mapper_from"),
+    "MapperRectangular": (
+        ".inversion.pixelization.mappers.rectangular",
+        "MapperRectangular",
+    ),
+    "MapperDelaunay": (".inversion.pixelization.mappers.delaunay", "MapperDelaunay"),
+    "MapperVoronoi": (".inversion.pixelization.mappers.voronoi", "MapperVoronoi"),
+    "AbstractImageMesh": (
+        ".inversion.pixelization.image_mesh.abstract",
+        "AbstractImageMesh",
+    ),
+    "AbstractMesh": (".inversion.pixelization.mesh.abstract", "AbstractMesh"),
+    "InversionImagingMapping": (
+        ".inversion.inversion.imaging.mapping",
+        "InversionImagingMapping",
+    ),
+    "InversionImagingWTilde": (
+        ".inversion.inversion.imaging.w_tilde",
+        "InversionImagingWTilde",
+    ),
+    "InversionInterferometerWTilde": (
+        ".inversion.inversion.interferometer.w_tilde",
+        "InversionInterferometerWTilde",
+    ),
+    "InversionInterferometerMapping": (
+        ".inversion.inversion.interferometer.mapping",
+        "InversionInterferometerMapping",
+    ),
+    "InversionInterferometerMappingPyLops": (
+        ".inversion.inversion.interferometer.lop",
+        "InversionInterferometerMappingPyLops",
+    ),
+    "LinearObj": (".inversion.linear_obj.linear_obj", "LinearObj"),
+    "AbstractLinearObjFuncList": (
+        ".inversion.linear_obj.func_list",
+        "AbstractLinearObjFuncList",
+    ),
+    "DeriveIndexes2D": (".mask.derive.indexes_2d", "DeriveIndexes2D"),
+    "DeriveMask1D": (".mask.derive.mask_1d", "DeriveMask1D"),
+    "DeriveMask2D": (".mask.derive.mask_2d", "DeriveMask2D"),
+    "DeriveGrid1D": (".mask.derive.grid_1d", "DeriveGrid1D"),
+    "DeriveGrid2D": (".mask.derive.grid_2d", "DeriveGrid2D"),
+    "Mask1D": (".mask.mask_1d", "Mask1D"),
+    "Mask2D": (".mask.mask_2d", "Mask2D"),
+    "Convolver": (".operators.convolver", "Convolver"),
+    "TransformerDFT": (".operators.transformer", "TransformerDFT"),
+    "TransformerNUFFT": (".operators.transformer", "TransformerNUFFT"),
+    "over_sample": (".operators.over_sampling.decorator", "over_sample"),
+    "Grid2DContour": (".operators.contour", "Grid2DContour"),
+    "Layout1D": (".layout.layout", "Layout1D"),
+    "Layout2D": (".layout.layout", "Layout2D"),
+    "Array1D": (".structures.arrays.uniform_1d", "Array1D"),
+    "Array2D": (".structures.arrays.uniform_2d", "Array2D"),
+    "ArrayIrregular": (".structures.arrays.irregular", "ArrayIrregular"),
+    "Grid1D": (".structures.grids.uniform_1d", "Grid1D"),
+    "Grid2D": (".structures.grids.uniform_2d", "Grid2D"),
+    "perform_over_sampling_from": (
+        ".operators.over_sampling.decorator",
+        "perform_over_sampling_from",
+    ),
+    "Grid2DOverSampled": (
+        ".operators.over_sampling.grid_oversampled",
+        "Grid2DOverSampled",
+    ),
+    "OverSamplingUniform": (".operators.over_sampling.uniform", "OverSamplingUniform"),
+    "OverSamplingIterate": (".operators.over_sampling.iterate", "OverSamplingIterate"),
+    "OverSamplerUniform": (".operators.over_sampling.uniform", "OverSamplerUniform"),
+    "OverSamplerIterate": (".operators.over_sampling.iterate", "OverSamplerIterate"),
+    "Grid2DIrregular": (".structures.grids.irregular_2d", "Grid2DIrregular"),
+    "Grid2DIrregularUniform": (
+        ".structures.grids.irregular_2d",
+        "Grid2DIrregularUniform",
+    ),
+    "Mesh2DRectangular": (".structures.mesh.rectangular_2d", "Mesh2DRectangular"),
+    "Mesh2DVoronoi": (".structures.mesh.voronoi_2d", "Mesh2DVoronoi"),
+    "Mesh2DDelaunay": (".structures.mesh.delaunay_2d", "Mesh2DDelaunay"),
+    "Kernel2D": (".structures.arrays.kernel_2d", "Kernel2D"),
+    "VectorYX2D": (".structures.vectors.uniform", "VectorYX2D"),
+    "VectorYX2DIrregular": (".structures.vectors.irregular", "VectorYX2DIrregular"),
+    "AbstractTriangles": (".structures.triangles.abstract", "AbstractTriangles"),
+    "grid_dec": (".structures.decorators", None),
+    "Header": (".structures.header", "Header"),
+    "Region1D": (".layout.region", "Region1D"),
+    "Region2D": (".layout.region", "Region2D"),
+    "Visibilities": (".structures.visibilities", "Visibilities"),
+    "VisibilitiesNoiseMap": (".structures.visibilities", "VisibilitiesNoiseMap"),
+}
+
+__all__ = ["exc", "profile_func"] + list(_lazy_dict)
+
+
+def __getattr__(name: str):
+    """
+    Import a public attribute of autoarray the first time it is accessed, after which it is stored in the module's
+    globals so that `__getattr__` is not called for it again.
+    """
+    try:
+        module_name, attr_name = _lazy_dict[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_name, __name__)
+
+    value = module if attr_name is None else getattr(module, attr_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_dict))
+
 
 from autoconf import conf
 
@@ -68,15 +68,35 @@ class AbstractNDArray(ABC):
         while isinstance(array, AbstractNDArray):
             array = array.array
         self._array = array
+
+        self.register_pytree_node_once()
+
+    # The classes registered as a pytree node, which is performed the first time an instance of each class is created.
+    _pytree_registered_classes = set()
+
+    @classmethod
+    def register_pytree_node_once(cls):
+        """
+        Register the class as a pytree node (e.g. for use with JAX), if it has not already been registered.
+
+        Registration is performed once per class, as opposed to every time an instance is created, because
+        registering (and handling the `ValueError` raised for an already registered class) is expensive compared to
+        the construction of the array itself.
+        """
+        if cls in AbstractNDArray._pytree_registered_classes:
+            return
+
         try:
             register_pytree_node(
-                type(self),
-                self.instance_flatten,
-                self.instance_unflatten,
+                cls,
+                cls.instance_flatten,
+                cls.instance_unflatten,
             )
         except ValueError:
             pass
 
+        AbstractNDArray._pytree_registered_classes.add(cls)
+
     __no_flatten__ = ()
 
     def invert(self):
@@ -123,6 +143,9 @@ class AbstractNDArray(ABC):
         This is used to ensure that when an array is modified, associated
         attributes such as pixel size are retained.
 
+        The underlying array of this object is not copied, because it is
+        immediately replaced by the new array.
+
         Parameters
         ----------
         array
@@ -132,7 +155,8 @@ class AbstractNDArray(ABC):
         -------
 
         """
-        new_array = self.copy()
+        new_array = self.__new__(self.__class__)
+        new_array.__dict__.update(self.__dict__)
         new_array._array = array
         return new_array
 
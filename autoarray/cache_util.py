@@ -0,0 +1,118 @@
+from __future__ import annotations
+from collections import OrderedDict
+import hashlib
+import numpy as np
+from typing import TYPE_CHECKING, Callable, Hashable, ItemsView
+
+if TYPE_CHECKING:
+    from autoarray.mask.mask_2d import Mask2D
+
+
+class LRUCache:
+    def __init__(self, size: int):
+        """
+        A least-recently-used cache, which stores up to `size` values and discards the least recently used value
+        when a new value is added to a full cache.
+
+        This is used by the module level caches which memoise quantities computed from a mask (e.g. the quantities
+        derived from a mask, over-sampling plans and image-mesh grids), whose keys are computed via
+        `mask_cache_key_from`.
+
+        Parameters
+        ----------
+        size
+            The maximum number of values stored in the cache.
+        """
+        self.size = size
+        self._dict = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._dict
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def get(self, key: Hashable, default=None):
+        """
+        Returns the value stored under a key, marking it as the most recently used, or `default` if the key is not
+        in the cache.
+        """
+        try:
+            self._dict.move_to_end(key)
+        except KeyError:
+            return default
+
+        return self._dict[key]
+
+    def set(self, key: Hashable, value):
+        """
+        Store a value under a key, discarding the least recently used values if the cache exceeds its size.
+        """
+        self._dict[key] = value
+        self._dict.move_to_end(key)
+
+        while len(self._dict) > self.size:
+            self._dict.popitem(last=False)
+
+    def pop(self, key: Hashable, default=None):
+        return self._dict.pop(key, default)
+
+    def items(self) -> ItemsView:
+        return self._dict.items()
+
+    def clear(self):
+        self._dict.clear()
+
+    def value_from(self, key: Hashable, func: Callable):
+        """
+        Returns the value stored under a key, calling `func` (which takes no arguments) to compute and store it if
+        the key is not in the cache.
+        """
+        try:
+            self._dict.move_to_end(key)
+            return self._dict[key]
+        except KeyError:
+            pass
+
+        value = func()
+
+        self.set(key=key, value=value)
+
+        return value
+
+
+def mask_cache_key_from(mask: Mask2D, *values) -> str:
+    """
+    Returns a hash of a mask and any other values which determine a quantity computed from it, which is used as the
+    key of an `LRUCache`.
+
+    The mask is hashed via its `content_hash`, such that every `Mask2D` with the same values, `pixel_scales` and
+    `origin` has the same key. Every other value is hashed via its shape, type and bytes if it is an `ndarray` and
+    its `repr` otherwise.
+
+    Parameters
+    ----------
+    mask
+        The mask the quantity is computed from.
+    values
+        The other values the quantity depends on (e.g. a sub-size map or adapt data), where `None` values are
+        hashed as `None`.
+
+    Returns
+    -------
+    The hexadecimal hash of the inputs.
+    """
+    key = hashlib.sha1()
+
+    key.update(mask.content_hash.encode())
+
+    for value in values:
+        if isinstance(value, np.ndarray):
+            value = np.ascontiguousarray(value)
+
+            key.update(repr((value.shape, value.dtype.str)).encode())
+            key.update(value.tobytes())
+        else:
+            key.update(repr(value).encode())
+
+    return key.hexdigest()
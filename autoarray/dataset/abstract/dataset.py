@@ -4,10 +4,12 @@ import numpy as np
 import warnings
 from typing import Optional, Union
 
+from autoarray.dataset.abstract.noise_covariance import AbstractNoiseCovariance
 from autoarray.dataset.over_sampling import OverSamplingDataset
 from autoarray.dataset.grids import GridsDataset
 
 from autoarray import exc
+from autoarray.fit import fit_util
 from autoarray.mask.mask_1d import Mask1D
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.structures.abstract_structure import Structure
@@ -23,7 +25,9 @@ class AbstractDataset:
         self,
         data: Structure,
         noise_map: Structure,
-        noise_covariance_matrix: Optional[np.ndarray] = None,
+        noise_covariance_matrix: Optional[
+            Union[np.ndarray, AbstractNoiseCovariance]
+        ] = None,
         over_sampling: Optional[OverSamplingDataset] = OverSamplingDataset(),
     ):
         """
@@ -55,7 +59,9 @@ class AbstractDataset:
             chi-squared in a fit (in PyAutoGalaxy and PyAutoLens the recommended units are electrons per second).
         noise_covariance_matrix
             A noise-map covariance matrix representing the covariance between noise in every `data` value, which
-            can be used via a bespoke fit to account for correlated noise in the data.
+            can be used via a bespoke fit to account for correlated noise in the data. This is either a dense
+            `ndarray` or a structured noise covariance (e.g. `NoiseCovarianceSparse`, `NoiseCovarianceLowRank`)
+            which is never inverted to a dense matrix.
         over_sampling
             The over sampling schemes which divide the grids into sub grids of smaller pixels within their host image
             pixels when using the grid to evaluate a function (e.g. images) to better approximate the 2D line integral
@@ -68,8 +74,13 @@ class AbstractDataset:
 
         if noise_map is None:
             try:
+                if isinstance(noise_covariance_matrix, AbstractNoiseCovariance):
+                    noise_map_values = noise_covariance_matrix.matrix_diagonal
+                else:
+                    noise_map_values = np.diag(noise_covariance_matrix)
+
                 noise_map = Array2D.no_mask(
-                    values=np.diag(noise_covariance_matrix),
+                    values=noise_map_values,
                     shape_native=data.shape_native,
                     pixel_scales=data.shape_native,
                 )
@@ -95,6 +106,46 @@ class AbstractDataset:
 
         self.over_sampling = over_sampling
 
+    @property
+    def noise_map(self) -> Structure:
+        return self._noise_map
+
+    @noise_map.setter
+    def noise_map(self, noise_map: Structure):
+        """
+        Set the noise-map of the dataset, which resets the memoised `noise_normalization` that is computed from it.
+
+        If the values of the noise-map are changed in-place the noise-map must be set again for this to be reset.
+        """
+        self._noise_map = noise_map
+        self._noise_normalization = None
+
+    @property
+    def noise_normalization(self) -> float:
+        """
+        Returns the noise-map normalization term of the noise-map, summing the noise_map value in every pixel as:
+
+        [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+
+        The noise-map is fixed for every fit to the dataset (e.g. throughout a model-fit), therefore this term is
+        computed once and memoised, such that fits which use the dataset's noise-map do not recompute it (see
+        `FitDataset.chi_squared_and_noise_normalization`). The memoised value is reset whenever a new noise-map is set.
+
+        For a complex noise-map (e.g. the visibilities of an `Interferometer`) the real and imaginary components are
+        summed separately.
+        """
+        if self._noise_normalization is None:
+            if np.iscomplexobj(self.noise_map):
+                self._noise_normalization = float(
+                    fit_util.noise_normalization_complex_from(noise_map=self.noise_map)
+                )
+            else:
+                self._noise_normalization = float(
+                    fit_util.noise_normalization_from(noise_map=self.noise_map)
+                )
+
+        return self._noise_normalization
+
     @property
     def grid(self):
         return self.grids.uniform
@@ -148,7 +199,18 @@ class AbstractDataset:
         """
         Returns the inverse of the noise covariance matrix, which is used when computing a chi-squared which accounts
         for covariance via a fit.
+
+        A structured noise covariance (e.g. `NoiseCovarianceSparse`) is never inverted to a dense matrix, and instead
+        computes the chi-squared via its own factorization.
         """
+        if isinstance(self.noise_covariance_matrix, AbstractNoiseCovariance):
+            raise exc.DatasetException(
+                """
+                The dense inverse of a structured noise covariance (e.g. `NoiseCovarianceSparse`) is not computed, 
+                use its `inverse_dot_from` method instead.
+                """
+            )
+
         return np.linalg.inv(self.noise_covariance_matrix)
 
     def trimmed_after_convolution_from(self, kernel_shape) -> "AbstractDataset":
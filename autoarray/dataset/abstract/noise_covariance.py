@@ -0,0 +1,190 @@
+from abc import ABC, abstractmethod
+import numpy as np
+from scipy import linalg
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from autoconf import cached_property
+
+
+class AbstractNoiseCovariance(ABC):
+    """
+    A noise covariance matrix `C` describing the covariance between the noise in every (unmasked) `data` value,
+    stored in a structured form which is never inverted to a dense `[N, N]` matrix.
+
+    A dense noise covariance matrix (input as an `ndarray`) is inverted in full, which is O(N^2) in memory and
+    compute and therefore unusable for datasets beyond about 20000 pixels. Structured noise covariances instead
+    precompute a factorization once, which every fit then uses to evaluate `C^-1` applied to a vector:
+
+    - The chi-squared of a fit is `r^T C^-1 r` (see `chi_squared_from`).
+    - The data vector and curvature matrix of an inversion are `f^T C^-1 d` and `f^T C^-1 f`
+      (see `inversion_util.data_vector_via_noise_covariance_from`).
+    """
+
+    @property
+    @abstractmethod
+    def matrix_diagonal(self) -> np.ndarray:
+        """
+        The diagonal of the noise covariance matrix, of shape [total_data_points].
+        """
+
+    @abstractmethod
+    def inverse_dot_from(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Returns `C^-1 v` for a vector `v` of shape [total_data_points], or for every column of a matrix of shape
+        [total_data_points, total_columns].
+
+        Parameters
+        ----------
+        vector
+            The vector (or matrix) which the inverse of the noise covariance matrix is applied to.
+        """
+
+    @abstractmethod
+    def masked_from(self, unmasked_indexes: np.ndarray) -> "AbstractNoiseCovariance":
+        """
+        Returns the noise covariance of a subset of the data values, for example the unmasked pixels of an image
+        after a mask is applied to it.
+
+        Parameters
+        ----------
+        unmasked_indexes
+            The indexes of the data values which are retained, for example the `unmasked_slim` indexes of a mask.
+        """
+
+    @property
+    def shape_slim(self) -> int:
+        return self.matrix_diagonal.shape[0]
+
+    def chi_squared_from(self, residual_map: np.ndarray) -> float:
+        """
+        Returns the chi-squared value of a fit with residuals `r`, given by:
+
+        Chi_Squared = r^T C^-1 r
+
+        Parameters
+        ----------
+        residual_map
+            The residual-map of the model-data fit to the dataset.
+        """
+        residual_map = np.asarray(residual_map).astype("float", copy=False)
+
+        return float(residual_map @ self.inverse_dot_from(residual_map))
+
+
+class NoiseCovarianceSparse(AbstractNoiseCovariance):
+    def __init__(self, matrix):
+        """
+        A noise covariance matrix which is sparse, for example a banded matrix where the noise of every pixel
+        correlates only with that of its neighbors.
+
+        The matrix is stored in compressed sparse column format and factorized once via a sparse LU decomposition
+        (`scipy.sparse.linalg.splu`), which for a banded matrix has fill-in limited to its bandwidth. Every
+        evaluation of `C^-1 v` is then a pair of sparse triangular solves.
+
+        A banded matrix can be created via `scipy.sparse.diags`, for example:
+
+        .. code-block:: python
+
+            from scipy import sparse
+
+            noise_covariance = aa.NoiseCovarianceSparse(
+                matrix=sparse.diags([0.1, 1.0, 0.1], offsets=[-1, 0, 1], shape=(100, 100))
+            )
+
+        Parameters
+        ----------
+        matrix
+            The noise covariance matrix as a `scipy.sparse` matrix, or a dense `ndarray` which is converted to one.
+        """
+        self.matrix = sparse.csc_matrix(matrix, dtype="float")
+
+    @cached_property
+    def factor(self):
+        """
+        The sparse LU factorization of the noise covariance matrix, which is computed once.
+        """
+        return splu(self.matrix)
+
+    @property
+    def matrix_diagonal(self) -> np.ndarray:
+        return self.matrix.diagonal()
+
+    def inverse_dot_from(self, vector: np.ndarray) -> np.ndarray:
+        return self.factor.solve(np.asarray(vector).astype("float", copy=False))
+
+    def masked_from(self, unmasked_indexes: np.ndarray) -> "NoiseCovarianceSparse":
+        return NoiseCovarianceSparse(
+            matrix=self.matrix[unmasked_indexes, :][:, unmasked_indexes]
+        )
+
+
+class NoiseCovarianceLowRank(AbstractNoiseCovariance):
+    def __init__(self, diagonal: np.ndarray, low_rank: np.ndarray):
+        """
+        A noise covariance matrix which is the sum of a diagonal matrix and a low-rank matrix:
+
+        C = D + U U^T
+
+        where `D` is the independent noise of every pixel and the `K` columns of `U` describe large scale correlated
+        noise (e.g. a small number of correlated modes across the whole image).
+
+        The inverse is evaluated via the Woodbury matrix identity:
+
+        C^-1 = D^-1 - D^-1 U (I + U^T D^-1 U)^-1 U^T D^-1
+
+        where the `[K, K]` capacitance matrix `I + U^T D^-1 U` is Cholesky factorized once, such that every
+        evaluation of `C^-1 v` is O(N K) in compute and the `[N, N]` matrix is never created.
+
+        Parameters
+        ----------
+        diagonal
+            The diagonal matrix `D`, of shape [total_data_points].
+        low_rank
+            The low rank matrix `U`, of shape [total_data_points, K].
+        """
+        self.diagonal = np.asarray(diagonal).astype("float")
+        self.low_rank = np.asarray(low_rank).astype("float").reshape(
+            (self.diagonal.shape[0], -1)
+        )
+
+    @cached_property
+    def _woodbury(self):
+        """
+        The inverse of the diagonal matrix `D^-1`, the matrix `D^-1 U` and the Cholesky factorization of the
+        capacitance matrix `I + U^T D^-1 U`, which are computed once.
+        """
+        diagonal_inv = 1.0 / self.diagonal
+
+        diagonal_inv_low_rank = self.low_rank * diagonal_inv[:, None]
+
+        capacitance_matrix = np.eye(self.low_rank.shape[1]) + (
+            self.low_rank.T @ diagonal_inv_low_rank
+        )
+
+        return (
+            diagonal_inv,
+            diagonal_inv_low_rank,
+            linalg.cho_factor(capacitance_matrix, lower=True),
+        )
+
+    @property
+    def matrix_diagonal(self) -> np.ndarray:
+        return self.diagonal + np.sum(self.low_rank**2.0, axis=1)
+
+    def inverse_dot_from(self, vector: np.ndarray) -> np.ndarray:
+        diagonal_inv, diagonal_inv_low_rank, capacitance_factor = self._woodbury
+
+        vector = np.asarray(vector).astype("float", copy=False)
+
+        diagonal_inv = diagonal_inv.reshape((-1,) + (1,) * (vector.ndim - 1))
+
+        return diagonal_inv * vector - diagonal_inv_low_rank @ linalg.cho_solve(
+            capacitance_factor, diagonal_inv_low_rank.T @ vector
+        )
+
+    def masked_from(self, unmasked_indexes: np.ndarray) -> "NoiseCovarianceLowRank":
+        return NoiseCovarianceLowRank(
+            diagonal=self.diagonal[unmasked_indexes],
+            low_rank=self.low_rank[unmasked_indexes],
+        )
@@ -0,0 +1,124 @@
+import json
+import numpy as np
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from autoarray import exc
+
+"""
+The version of the bundle format, which is stored in the manifest of every bundle and checked when it is loaded.
+"""
+bundle_version = 1
+
+manifest_file = "manifest.json"
+
+
+def output_to_bundle(
+    directory: Union[Path, str],
+    array_dict: Dict[str, np.ndarray],
+    info_dict: Optional[Dict] = None,
+    overwrite: bool = False,
+):
+    """
+    Output a dictionary of arrays to a bundle, which is a directory containing every array as a `.npy` file and a
+    `manifest.json` file describing them.
+
+    The `.npy` format stores the raw bytes of an array after a header which numpy pads to a multiple of 64 bytes, such
+    that every array is aligned and can be memory mapped when the bundle is loaded via `bundle_from`. The manifest
+    is written after all arrays, such that a process loading the bundle whilst it is being output never sees a
+    bundle which is only partially written.
+
+    Parameters
+    ----------
+    directory
+        The directory the bundle is output to, which is created if it does not exist.
+    array_dict
+        The arrays which are output, where every key is the name of an array and its `.npy` file.
+    info_dict
+        A dictionary of information describing the arrays (e.g. the `pixel_scales` of a mask) which is stored in the
+        manifest, and must therefore be serializable to .json.
+    overwrite
+        If `True`, an existing bundle in the directory is overwritten, if `False` an exception is raised.
+    """
+    manifest_path = os.path.join(directory, manifest_file)
+
+    if os.path.exists(manifest_path) and not overwrite:
+        raise exc.DatasetException(
+            f"A bundle already exists at {directory} and overwrite is False."
+        )
+
+    os.makedirs(directory, exist_ok=True)
+
+    array_info_dict = {}
+
+    for name, array in array_dict.items():
+        array = np.ascontiguousarray(array)
+
+        np.save(os.path.join(directory, f"{name}.npy"), array, allow_pickle=False)
+
+        array_info_dict[name] = {
+            "file": f"{name}.npy",
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+
+    manifest = {
+        "version": bundle_version,
+        "arrays": array_info_dict,
+        "info": info_dict or {},
+    }
+
+    with open(f"{manifest_path}.tmp", "w+") as f:
+        json.dump(manifest, f, indent=4)
+
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+
+def bundle_from(
+    directory: Union[Path, str], mmap_mode: Optional[str] = "r"
+) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """
+    Load the arrays and information of a bundle output via `output_to_bundle`.
+
+    The arrays are memory mapped by default, such that loading a bundle reads only its manifest and the headers of
+    its `.npy` files, with the values of every array read from disk when they are first used. Every process which
+    loads the same bundle shares the same pages of the operating system's page cache, rather than each holding its
+    own copy of the arrays in memory.
+
+    Parameters
+    ----------
+    directory
+        The directory of the bundle.
+    mmap_mode
+        The `mmap_mode` of `np.load`, where `"r"` returns read-only arrays, `"c"` returns copy-on-write arrays which
+        may be modified in memory and `None` reads every array fully into memory.
+
+    Returns
+    -------
+    The dictionary of arrays and the dictionary of information stored in the manifest of the bundle.
+    """
+    try:
+        with open(os.path.join(directory, manifest_file)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError as e:
+        raise exc.DatasetException(
+            f"No bundle manifest was found in the directory {directory}."
+        ) from e
+
+    if manifest["version"] != bundle_version:
+        raise exc.DatasetException(
+            f"The bundle at {directory} has version {manifest['version']}, but this version of autoarray "
+            f"loads bundles of version {bundle_version}."
+        )
+
+    array_dict = {
+        name: np.load(
+            os.path.join(directory, array_info["file"]),
+            mmap_mode=mmap_mode,
+            allow_pickle=False,
+        )
+        for name, array_info in manifest["arrays"].items()
+    }
+
+    return array_dict, manifest["info"]
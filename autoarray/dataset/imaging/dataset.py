@@ -5,13 +5,17 @@ from typing import Optional, Union
 
 from autoconf import cached_property
 
+from autoarray.dataset import bundle_util
 from autoarray.dataset.abstract.dataset import AbstractDataset
+from autoarray.dataset.abstract.noise_covariance import AbstractNoiseCovariance
 from autoarray.dataset.grids import GridsDataset
 from autoarray.dataset.imaging.w_tilde import WTildeImaging
 from autoarray.dataset.over_sampling import OverSamplingDataset
 from autoarray.structures.arrays.uniform_2d import Array2D
 from autoarray.operators.convolver import Convolver
 from autoarray.structures.arrays.kernel_2d import Kernel2D
+from autoarray.mask.derive.cache import derived_dict_from
+from autoarray.mask.derive.cache import derived_dict_to_cache
 from autoarray.mask.mask_2d import Mask2D
 from autoarray import type as ty
 
@@ -32,6 +36,8 @@ class Imaging(AbstractDataset):
         pad_for_convolver: bool = False,
         use_normalized_psf: Optional[bool] = True,
         check_noise_map: bool = True,
+        w_tilde: Optional[WTildeImaging] = None,
+        convolver: Optional[Convolver] = None,
     ):
         """
         An imaging dataset, containing the image data, noise-map, PSF and associated quantities
@@ -82,10 +88,19 @@ class Imaging(AbstractDataset):
             the PSF kernel does not change the overall normalization of the image when it is convolved with it.
         check_noise_map
             If True, the noise-map is checked to ensure all values are above zero.
+        w_tilde
+            The precomputed w-tilde matrices of the dataset (e.g. loaded from a bundle), which are used instead of
+            computing them from the noise-map and PSF (see `w_tilde`).
+        convolver
+            A precomputed convolver of the dataset's mask and PSF (e.g. loaded from a bundle), which is used instead
+            of computing it (see `convolver`).
         """
 
         self.unmasked = None
 
+        self._w_tilde = w_tilde
+        self._convolver = convolver
+
         self.pad_for_convolver = pad_for_convolver
 
         if pad_for_convolver and psf is not None:
@@ -162,6 +177,8 @@ class Imaging(AbstractDataset):
         Convolver
             The convolver given the masked imaging data's mask and PSF.
         """
+        if self._convolver is not None:
+            return self._convolver
 
         return Convolver(mask=self.mask, kernel=self.psf)
 
@@ -182,6 +199,8 @@ class Imaging(AbstractDataset):
         WTildeImaging
             Precomputed values used for the w tilde formalism of linear algebra calculations.
         """
+        if self._w_tilde is not None:
+            return self._w_tilde
 
         logger.info("IMAGING - Computing W-Tilde... May take a moment.")
 
@@ -302,11 +321,29 @@ class Imaging(AbstractDataset):
         else:
             unmasked_dataset = self.unmasked
 
+        if unmasked_dataset is None:
+            raise exc.DatasetException(
+                """
+                A mask cannot be applied to this imaging dataset, because its data is already masked and it does
+                not have the unmasked dataset the mask was originally applied to (e.g. because it was loaded via
+                `from_bundle`).
+                """
+            )
+
         data = Array2D(values=unmasked_dataset.data.native, mask=mask)
 
         noise_map = Array2D(values=unmasked_dataset.noise_map.native, mask=mask)
 
-        if unmasked_dataset.noise_covariance_matrix is not None:
+        if isinstance(
+            unmasked_dataset.noise_covariance_matrix, AbstractNoiseCovariance
+        ):
+            noise_covariance_matrix = (
+                unmasked_dataset.noise_covariance_matrix.masked_from(
+                    unmasked_indexes=mask.derive_indexes.unmasked_slim
+                )
+            )
+
+        elif unmasked_dataset.noise_covariance_matrix is not None:
             noise_covariance_matrix = unmasked_dataset.noise_covariance_matrix
 
             noise_covariance_matrix = np.delete(
@@ -417,3 +454,185 @@ class Imaging(AbstractDataset):
 
         if self.noise_map is not None and noise_map_path is not None:
             self.noise_map.output_to_fits(file_path=noise_map_path, overwrite=overwrite)
+
+    def output_to_bundle(
+        self,
+        directory: Union[Path, str],
+        derived: bool = False,
+        overwrite: bool = False,
+    ):
+        """
+        Output the imaging dataset to a bundle, which is a directory containing every array of the dataset as an
+        aligned `.npy` file and a `manifest.json` file describing them (see `bundle_util.output_to_bundle`).
+
+        The bundle is loaded via `from_bundle`, which memory maps every array such that loading the dataset takes
+        milliseconds and every process loading it (e.g. the workers of a job on a cluster) shares the same memory.
+
+        The data, noise-map, PSF, mask and noise covariance matrix are output. If the dataset is masked only the
+        unmasked values of the data and noise-map are output, therefore a new mask cannot be applied to the loaded
+        dataset.
+
+        If `derived=True`, the quantities derived from the dataset which otherwise take time to compute after it is
+        loaded are also output: the frames of its `convolver`, its `w_tilde` matrices, its noise normalization and
+        the indexes derived from its mask which have been computed.
+
+        Parameters
+        ----------
+        directory
+            The directory the bundle is output to.
+        derived
+            If `True`, the quantities derived from the dataset are output with it.
+        overwrite
+            If `True`, an existing bundle in the directory is overwritten, if `False` an exception is raised.
+        """
+        if isinstance(self.noise_covariance_matrix, AbstractNoiseCovariance):
+            raise exc.DatasetException(
+                "An imaging dataset with a structured noise covariance cannot be output to a bundle."
+            )
+
+        array_dict = {
+            "mask": np.array(self.mask),
+            "data": np.array(self.data.slim),
+            "noise_map": np.array(self.noise_map.slim),
+        }
+
+        info_dict = {
+            "pixel_scales": list(self.mask.pixel_scales),
+            "origin": list(self.mask.origin),
+            "use_normalized_psf": self.use_normalized_psf,
+        }
+
+        if self.psf is not None:
+            array_dict["psf"] = np.array(self.psf.native)
+            info_dict["psf_pixel_scales"] = list(self.psf.pixel_scales)
+
+        if self.noise_covariance_matrix is not None:
+            array_dict["noise_covariance_matrix"] = np.array(
+                self.noise_covariance_matrix
+            )
+
+        if derived:
+            info_dict["noise_normalization"] = self.noise_normalization
+
+            if self.psf is not None:
+                for name, array in self.convolver.frame_dict.items():
+                    array_dict[f"derived_convolver_{name}"] = array
+
+                array_dict["derived_w_tilde_curvature_preload"] = (
+                    self.w_tilde.curvature_preload
+                )
+                array_dict["derived_w_tilde_indexes"] = self.w_tilde.indexes
+                array_dict["derived_w_tilde_lengths"] = self.w_tilde.lengths
+                info_dict["w_tilde_noise_map_value"] = float(
+                    self.w_tilde.noise_map_value
+                )
+
+            derived_mask_dict = derived_dict_from(mask=self.mask)
+            derived_mask_dict["native_for_slim"] = (
+                self.mask.derive_indexes.native_for_slim
+            )
+
+            for name, array in derived_mask_dict.items():
+                array_dict[f"derived_mask_{name}"] = array
+
+        bundle_util.output_to_bundle(
+            directory=directory,
+            array_dict=array_dict,
+            info_dict=info_dict,
+            overwrite=overwrite,
+        )
+
+    @classmethod
+    def from_bundle(
+        cls,
+        directory: Union[Path, str],
+        over_sampling: Optional[OverSamplingDataset] = OverSamplingDataset(),
+        mmap_mode: Optional[str] = "r",
+    ) -> "Imaging":
+        """
+        Load an imaging dataset from a bundle output via `output_to_bundle`.
+
+        Every array is memory mapped and used by the dataset without being copied, such that its values are only
+        read from disk when they are used. Any derived quantities in the bundle (e.g. the `w_tilde` matrices) are
+        used instead of being recomputed.
+
+        With the default `mmap_mode="r"` the arrays of the dataset are read-only.
+
+        Parameters
+        ----------
+        directory
+            The directory of the bundle.
+        over_sampling
+            The over sampling schemes of the dataset, which are not stored in the bundle.
+        mmap_mode
+            The `mmap_mode` the arrays are loaded with (see `bundle_util.bundle_from`).
+        """
+        array_dict, info_dict = bundle_util.bundle_from(
+            directory=directory, mmap_mode=mmap_mode
+        )
+
+        mask = Mask2D(
+            mask=array_dict["mask"],
+            pixel_scales=tuple(info_dict["pixel_scales"]),
+            origin=tuple(info_dict["origin"]),
+        )
+
+        derived_dict_to_cache(
+            mask=mask,
+            derived_dict={
+                name[len("derived_mask_") :]: array
+                for name, array in array_dict.items()
+                if name.startswith("derived_mask_")
+            },
+        )
+
+        if "psf" in array_dict:
+            psf = Kernel2D.no_mask(
+                values=array_dict["psf"],
+                pixel_scales=tuple(info_dict["psf_pixel_scales"]),
+            )
+        else:
+            psf = None
+
+        if "derived_w_tilde_curvature_preload" in array_dict:
+            w_tilde = WTildeImaging(
+                curvature_preload=array_dict["derived_w_tilde_curvature_preload"],
+                indexes=array_dict["derived_w_tilde_indexes"],
+                lengths=array_dict["derived_w_tilde_lengths"],
+                noise_map_value=info_dict["w_tilde_noise_map_value"],
+            )
+        else:
+            w_tilde = None
+
+        frame_dict = {
+            name[len("derived_convolver_") :]: array
+            for name, array in array_dict.items()
+            if name.startswith("derived_convolver_")
+        }
+
+        if frame_dict:
+            convolver = Convolver.from_frame_dict(
+                mask=mask, kernel=psf, frame_dict=frame_dict
+            )
+        else:
+            convolver = None
+
+        dataset = Imaging(
+            data=Array2D._from_slim_unchecked(values=array_dict["data"], mask=mask),
+            noise_map=Array2D._from_slim_unchecked(
+                values=array_dict["noise_map"], mask=mask
+            ),
+            psf=psf,
+            noise_covariance_matrix=array_dict.get("noise_covariance_matrix"),
+            over_sampling=over_sampling,
+            pad_for_convolver=False,
+            use_normalized_psf=info_dict["use_normalized_psf"],
+            check_noise_map=False,
+            w_tilde=w_tilde,
+            convolver=convolver,
+        )
+
+        if "noise_normalization" in info_dict:
+            dataset._noise_normalization = info_dict["noise_normalization"]
+
+        return dataset
@@ -1,13 +1,18 @@
 import logging
 import numpy as np
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from autoconf import cached_property
 
+from autoarray.dataset import bundle_util
 from autoarray.dataset.abstract.dataset import AbstractDataset
 from autoarray.dataset.interferometer.w_tilde import WTildeInterferometer
 from autoarray.dataset.grids import GridsDataset
 from autoarray.dataset.over_sampling import OverSamplingDataset
+from autoarray.mask.derive.cache import derived_dict_from
+from autoarray.mask.derive.cache import derived_dict_to_cache
+from autoarray.mask.mask_2d import Mask2D
 from autoarray.operators.transformer import TransformerNUFFT
 from autoarray.structures.visibilities import Visibilities
 from autoarray.structures.visibilities import VisibilitiesNoiseMap
@@ -26,6 +31,7 @@ class Interferometer(AbstractDataset):
         real_space_mask,
         transformer_class=TransformerNUFFT,
         over_sampling: Optional[OverSamplingDataset] = OverSamplingDataset(),
+        w_tilde: Optional[WTildeInterferometer] = None,
     ):
         """
         An interferometer dataset, containing the visibilities data, noise-map, real-space msk, Fourier transformer and
@@ -75,9 +81,14 @@ class Interferometer(AbstractDataset):
         transformer_class
             The class of the Fourier Transform which maps images from real space to Fourier space visibilities and
             the uv-plane.
+        w_tilde
+            The precomputed w-tilde matrices of the dataset (e.g. loaded from a bundle), which are used instead of
+            computing them from the noise-map and uv-wavelengths (see `w_tilde`).
         """
         self.real_space_mask = real_space_mask
 
+        self._w_tilde = w_tilde
+
         super().__init__(
             data=data,
             noise_map=noise_map,
@@ -198,6 +209,8 @@ class Interferometer(AbstractDataset):
         WTildeInterferometer
             Precomputed values used for the w tilde formalism of linear algebra calculations.
         """
+        if self._w_tilde is not None:
+            return self._w_tilde
 
         logger.info("INTERFEROMETER - Computing W-Tilde... May take a moment.")
 
@@ -300,6 +313,140 @@ class Interferometer(AbstractDataset):
                 overwrite=overwrite,
             )
 
+    def output_to_bundle(
+        self,
+        directory: Union[Path, str],
+        derived: bool = False,
+        overwrite: bool = False,
+    ):
+        """
+        Output the interferometer dataset to a bundle, which is a directory containing every array of the dataset as
+        an aligned `.npy` file and a `manifest.json` file describing them (see `bundle_util.output_to_bundle`).
+
+        The bundle is loaded via `from_bundle`, which memory maps every array such that loading the dataset takes
+        milliseconds and every process loading it (e.g. the workers of a job on a cluster) shares the same memory.
+
+        The visibilities, noise-map, uv-wavelengths and real-space mask are output. If `derived=True`, the
+        `w_tilde` matrices and noise normalization of the dataset and the indexes derived from its real-space mask
+        which have been computed are also output.
+
+        Parameters
+        ----------
+        directory
+            The directory the bundle is output to.
+        derived
+            If `True`, the quantities derived from the dataset are output with it.
+        overwrite
+            If `True`, an existing bundle in the directory is overwritten, if `False` an exception is raised.
+        """
+        array_dict = {
+            "real_space_mask": np.array(self.real_space_mask),
+            "data": np.array(self.data),
+            "noise_map": np.array(self.noise_map),
+            "uv_wavelengths": np.array(self.uv_wavelengths),
+        }
+
+        info_dict = {
+            "pixel_scales": list(self.real_space_mask.pixel_scales),
+            "origin": list(self.real_space_mask.origin),
+        }
+
+        if derived:
+            info_dict["noise_normalization"] = self.noise_normalization
+
+            array_dict["derived_w_tilde_w_matrix"] = self.w_tilde.w_matrix
+            array_dict["derived_w_tilde_curvature_preload"] = (
+                self.w_tilde.curvature_preload
+            )
+            array_dict["derived_w_tilde_dirty_image"] = np.array(
+                self.w_tilde.dirty_image
+            )
+            info_dict["w_tilde_noise_map_value"] = [
+                float(np.real(self.w_tilde.noise_map_value)),
+                float(np.imag(self.w_tilde.noise_map_value)),
+            ]
+
+            for name, array in derived_dict_from(mask=self.real_space_mask).items():
+                array_dict[f"derived_mask_{name}"] = array
+
+        bundle_util.output_to_bundle(
+            directory=directory,
+            array_dict=array_dict,
+            info_dict=info_dict,
+            overwrite=overwrite,
+        )
+
+    @classmethod
+    def from_bundle(
+        cls,
+        directory: Union[Path, str],
+        transformer_class=TransformerNUFFT,
+        over_sampling: Optional[OverSamplingDataset] = OverSamplingDataset(),
+        mmap_mode: Optional[str] = "r",
+    ) -> "Interferometer":
+        """
+        Load an interferometer dataset from a bundle output via `output_to_bundle`.
+
+        Every array is memory mapped, such that its values are only read from disk when they are used. Any derived
+        quantities in the bundle (e.g. the `w_tilde` matrices) are used instead of being recomputed.
+
+        Parameters
+        ----------
+        directory
+            The directory of the bundle.
+        transformer_class
+            The class of the Fourier Transform which maps images from real space to Fourier space visibilities and
+            the uv-plane.
+        over_sampling
+            The over sampling schemes of the dataset, which are not stored in the bundle.
+        mmap_mode
+            The `mmap_mode` the arrays are loaded with (see `bundle_util.bundle_from`).
+        """
+        array_dict, info_dict = bundle_util.bundle_from(
+            directory=directory, mmap_mode=mmap_mode
+        )
+
+        real_space_mask = Mask2D(
+            mask=array_dict["real_space_mask"],
+            pixel_scales=tuple(info_dict["pixel_scales"]),
+            origin=tuple(info_dict["origin"]),
+        )
+
+        derived_dict_to_cache(
+            mask=real_space_mask,
+            derived_dict={
+                name[len("derived_mask_") :]: array
+                for name, array in array_dict.items()
+                if name.startswith("derived_mask_")
+            },
+        )
+
+        if "derived_w_tilde_w_matrix" in array_dict:
+            w_tilde = WTildeInterferometer(
+                w_matrix=array_dict["derived_w_tilde_w_matrix"],
+                curvature_preload=array_dict["derived_w_tilde_curvature_preload"],
+                dirty_image=array_dict["derived_w_tilde_dirty_image"],
+                real_space_mask=real_space_mask,
+                noise_map_value=complex(*info_dict["w_tilde_noise_map_value"]),
+            )
+        else:
+            w_tilde = None
+
+        dataset = Interferometer(
+            data=Visibilities(visibilities=array_dict["data"]),
+            noise_map=VisibilitiesNoiseMap(visibilities=array_dict["noise_map"]),
+            uv_wavelengths=array_dict["uv_wavelengths"],
+            real_space_mask=real_space_mask,
+            transformer_class=transformer_class,
+            over_sampling=over_sampling,
+            w_tilde=w_tilde,
+        )
+
+        if "noise_normalization" in info_dict:
+            dataset._noise_normalization = info_dict["noise_normalization"]
+
+        return dataset
+
     @property
     def convolver(self):
         return None
@@ -58,6 +58,16 @@ class RegionException(Exception):
     pass
 
 
+class FitException(Exception):
+    """
+    Raises exceptions associated with the `fit` modules and `fit_util` functions.
+
+    For example if the mask of a fit does not have the same layout as the data it is applied to.
+    """
+
+    pass
+
+
 class DatasetException(Exception):
     """
     Raises exceptions associated with the `dataset` modules and `Imaging` / `Interferometer` classes.
@@ -123,3 +133,12 @@ class ProfilingException(Exception):
     """
 
     pass
+
+
+class NumbaException(Exception):
+    """
+    Raises exceptions associated with the `numba_util.py` module, for example if a function input to
+    `numba_util.precompile` cannot be imported.
+    """
+
+    pass
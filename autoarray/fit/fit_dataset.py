@@ -1,12 +1,13 @@
 import warnings
 from abc import ABC
 from abc import abstractmethod
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
 from autoconf import cached_property
 
+from autoarray.dataset.abstract.noise_covariance import AbstractNoiseCovariance
 from autoarray.dataset.grids import GridsInterface
 from autoarray.dataset.dataset_model import DatasetModel
 from autoarray.fit import fit_util
@@ -81,12 +82,25 @@ class AbstractFit(ABC):
             residual_map=self.residual_map, noise_map=self.noise_map
         )
 
+    @cached_property
+    def chi_squared_and_noise_normalization(self) -> Tuple[float, float]:
+        """
+        Returns the chi-squared and noise normalization terms of the model data's fit to the dataset, which are
+        computed in a single pass over the data, model-data and noise-map.
+
+        The `residual_map`, `chi_squared_map` and other maps of the fit are not created by this calculation, and
+        are only computed if they are accessed (e.g. for plotting).
+        """
+        return fit_util.chi_squared_and_noise_normalization_from(
+            data=self.data, model_data=self.model_data, noise_map=self.noise_map
+        )
+
     @property
     def chi_squared(self) -> float:
         """
         Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
         """
-        return fit_util.chi_squared_from(chi_squared_map=self.chi_squared_map)
+        return self.chi_squared_and_noise_normalization[0]
 
     @property
     def noise_normalization(self) -> float:
@@ -95,7 +109,7 @@ class AbstractFit(ABC):
 
         [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
         """
-        return fit_util.noise_normalization_from(noise_map=self.noise_map)
+        return self.chi_squared_and_noise_normalization[1]
 
     @property
     def log_likelihood(self) -> float:
@@ -249,33 +263,55 @@ class FitDataset(AbstractFit):
         Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
 
         If the dataset includes a noise covariance matrix, this is used instead to account for covariance in the
-        goodness-of-fit.
+        goodness-of-fit. A structured noise covariance (e.g. `NoiseCovarianceSparse`) computes this via its own
+        factorization, without a dense inverse.
         """
 
+        if isinstance(self.dataset.noise_covariance_matrix, AbstractNoiseCovariance):
+            return self.dataset.noise_covariance_matrix.chi_squared_from(
+                residual_map=self.residual_map
+            )
+
         if self.dataset.noise_covariance_matrix is not None:
             return fit_util.chi_squared_with_noise_covariance_from(
                 residual_map=self.residual_map,
                 noise_covariance_matrix_inv=self.dataset.noise_covariance_matrix_inv,
             )
 
-        if self.use_mask_in_fit:
-            return fit_util.chi_squared_with_mask_from(
-                chi_squared_map=self.chi_squared_map, mask=self.mask
-            )
         return super().chi_squared
 
-    @property
-    def noise_normalization(self) -> float:
+    @cached_property
+    def chi_squared_and_noise_normalization(self) -> Tuple[float, float]:
         """
-        Returns the noise-map normalization term of the noise-map, summing the noise_map value in every pixel as:
+        Returns the chi-squared and noise normalization terms of the model data's fit to the dataset, which are
+        computed in a single pass over the data, model-data and noise-map.
 
-        [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+        If `use_mask_in_fit` is `True`, masked data points are omitted from both terms.
+
+        If the fit uses the dataset's noise-map, the noise normalization memoised by the dataset is used and only
+        the chi-squared is computed.
         """
         if self.use_mask_in_fit:
-            return fit_util.noise_normalization_with_mask_from(
-                noise_map=self.noise_map, mask=self.mask
+            return fit_util.chi_squared_and_noise_normalization_from(
+                data=self.data,
+                model_data=self.model_data,
+                noise_map=self.noise_map,
+                mask=self.mask,
             )
-        return super().noise_normalization
+
+        if self.noise_map is self.dataset.noise_map:
+            try:
+                noise_normalization = self.dataset.noise_normalization
+            except AttributeError:
+                return super().chi_squared_and_noise_normalization
+
+            chi_squared = fit_util.chi_squared_fast_from(
+                data=self.data, model_data=self.model_data, noise_map=self.noise_map
+            )
+
+            return chi_squared, noise_normalization
+
+        return super().chi_squared_and_noise_normalization
 
     @property
     def log_likelihood_with_regularization(self) -> float:
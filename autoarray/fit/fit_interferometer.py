@@ -112,9 +112,7 @@ class FitInterferometer(FitDataset):
         """
         Returns the chi-squared terms of the model data's fit to an dataset, by summing the chi-squared-map.
         """
-        return fit_util.chi_squared_complex_from(
-            chi_squared_map=self.chi_squared_map,
-        )
+        return self.chi_squared_and_noise_normalization[0]
 
     @property
     def noise_normalization(self) -> float:
@@ -123,9 +121,7 @@ class FitInterferometer(FitDataset):
 
         [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
         """
-        return fit_util.noise_normalization_complex_from(
-            noise_map=self.noise_map,
-        )
+        return self.chi_squared_and_noise_normalization[1]
 
     @property
     def dirty_image(self) -> Array2D:
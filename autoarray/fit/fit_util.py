@@ -1,8 +1,12 @@
 from functools import wraps
+from typing import Tuple
 
 import numpy as np
 
 from autoarray.numpy_wrapper import numpy as npw
+from autoarray.numpy_wrapper import use_jax
+from autoarray import exc
+from autoarray import numba_util
 from autoarray.mask.abstract_mask import Mask
 
 from autoarray import type as ty
@@ -336,6 +340,316 @@ def noise_normalization_with_mask_from(*, noise_map: ty.DataLike, mask: Mask) ->
     return float(np.sum(np.log(2 * np.pi * noise_map[np.asarray(mask) == 0] ** 2.0)))
 
 
+@numba_util.jit()
+def chi_squared_and_noise_normalization_jit_from(
+    data: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Returns the chi-squared and noise normalization terms of a fit of model-data to a dataset in a single pass over
+    the data, model-data and noise-map, without creating any intermediate arrays.
+
+    See `chi_squared_and_noise_normalization_from` for a full description.
+
+    Parameters
+    ----------
+    data
+        The 1D data that is fitted.
+    model_data
+        The 1D model data used to fit the data.
+    noise_map
+        The 1D noise-map of the dataset.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for i in range(data.shape[0]):
+        chi = (data[i] - model_data[i]) / noise_map[i]
+        chi_squared += chi * chi
+        noise_normalization += np.log(2.0 * np.pi * noise_map[i] * noise_map[i])
+
+    return chi_squared, noise_normalization
+
+
+@numba_util.jit()
+def chi_squared_and_noise_normalization_with_mask_jit_from(
+    data: np.ndarray, mask: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Returns the chi-squared and noise normalization terms of a fit of model-data to a masked dataset in a single pass
+    over the data, model-data and noise-map, without creating any intermediate arrays.
+
+    Values in masked pixels are omitted from the calculation.
+
+    Parameters
+    ----------
+    data
+        The 1D data that is fitted.
+    mask
+        The 1D mask applied to the dataset, where `False` entries are included in the calculation.
+    model_data
+        The 1D model data used to fit the data.
+    noise_map
+        The 1D noise-map of the dataset.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for i in range(data.shape[0]):
+        if not mask[i]:
+            chi = (data[i] - model_data[i]) / noise_map[i]
+            chi_squared += chi * chi
+            noise_normalization += np.log(2.0 * np.pi * noise_map[i] * noise_map[i])
+
+    return chi_squared, noise_normalization
+
+
+@numba_util.jit()
+def chi_squared_and_noise_normalization_complex_jit_from(
+    data: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> Tuple[float, float]:
+    """
+    Returns the chi-squared and noise normalization terms of a fit of complex model-data to a complex dataset in a
+    single pass over the data, model-data and noise-map, without creating any intermediate arrays.
+
+    The real and imaginary components are treated as independent data points, as in `chi_squared_complex_from`
+    and `noise_normalization_complex_from`.
+
+    Parameters
+    ----------
+    data
+        The 1D complex data that is fitted.
+    model_data
+        The 1D complex model data used to fit the data.
+    noise_map
+        The 1D complex noise-map of the dataset.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for i in range(data.shape[0]):
+        noise_real = noise_map[i].real
+        noise_imag = noise_map[i].imag
+
+        chi_real = (data[i].real - model_data[i].real) / noise_real
+        chi_imag = (data[i].imag - model_data[i].imag) / noise_imag
+
+        chi_squared += chi_real * chi_real + chi_imag * chi_imag
+        noise_normalization += np.log(2.0 * np.pi * noise_real * noise_real) + np.log(
+            2.0 * np.pi * noise_imag * noise_imag
+        )
+
+    return chi_squared, noise_normalization
+
+
+@numba_util.jit()
+def chi_squared_jit_from(
+    data: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> float:
+    """
+    Returns the chi-squared of a fit of model-data to a dataset in a single pass over the data, model-data and
+    noise-map, without creating any intermediate arrays.
+
+    Parameters
+    ----------
+    data
+        The 1D data that is fitted.
+    model_data
+        The 1D model data used to fit the data.
+    noise_map
+        The 1D noise-map of the dataset.
+    """
+    chi_squared = 0.0
+
+    for i in range(data.shape[0]):
+        chi = (data[i] - model_data[i]) / noise_map[i]
+        chi_squared += chi * chi
+
+    return chi_squared
+
+
+@numba_util.jit()
+def chi_squared_complex_jit_from(
+    data: np.ndarray, model_data: np.ndarray, noise_map: np.ndarray
+) -> float:
+    """
+    Returns the chi-squared of a fit of complex model-data to a complex dataset in a single pass over the data,
+    model-data and noise-map, without creating any intermediate arrays.
+
+    Parameters
+    ----------
+    data
+        The 1D complex data that is fitted.
+    model_data
+        The 1D complex model data used to fit the data.
+    noise_map
+        The 1D complex noise-map of the dataset.
+    """
+    chi_squared = 0.0
+
+    for i in range(data.shape[0]):
+        chi_real = (data[i].real - model_data[i].real) / noise_map[i].real
+        chi_imag = (data[i].imag - model_data[i].imag) / noise_map[i].imag
+
+        chi_squared += chi_real * chi_real + chi_imag * chi_imag
+
+    return chi_squared
+
+
+def chi_squared_fast_from(
+    *, data: ty.DataLike, model_data: ty.DataLike, noise_map: ty.DataLike
+) -> float:
+    """
+    Returns the chi-squared of the fit of model-data to a dataset, where:
+
+    Chi_Squared = sum(((Data - Model_Data) / Noise) ** 2.0)
+
+    This is computed in a single pass over the data without creating the `residual_map` and `chi_squared_map`, and
+    is used when the noise normalization is already known (e.g. it is memoised by the dataset).
+
+    If the data, model-data and noise-map are complex, the real and imaginary components are treated as independent
+    data points (see `chi_squared_complex_from`).
+
+    Parameters
+    ----------
+    data
+        The data that is fitted.
+    model_data
+        The model data used to fit the data.
+    noise_map
+        The noise-map of the dataset.
+    """
+    if use_jax:
+        return chi_squared_and_noise_normalization_from(
+            data=data, model_data=model_data, noise_map=noise_map
+        )[0]
+
+    dtype = "complex128" if np.iscomplexobj(data) else "float"
+
+    data = np.asarray(data).astype(dtype, copy=False).ravel()
+    model_data = np.asarray(model_data).astype(dtype, copy=False).ravel()
+    noise_map = np.asarray(noise_map).astype(dtype, copy=False).ravel()
+
+    if dtype == "complex128":
+        return float(
+            chi_squared_complex_jit_from(
+                data=data, model_data=model_data, noise_map=noise_map
+            )
+        )
+
+    return float(
+        chi_squared_jit_from(data=data, model_data=model_data, noise_map=noise_map)
+    )
+
+
+def chi_squared_and_noise_normalization_from(
+    *,
+    data: ty.DataLike,
+    model_data: ty.DataLike,
+    noise_map: ty.DataLike,
+    mask: Mask = None,
+) -> Tuple[float, float]:
+    """
+    Returns the chi-squared and noise normalization terms of the fit of model-data to a dataset, where:
+
+    Chi_Squared = sum(((Data - Model_Data) / Noise) ** 2.0)
+
+    [Noise_Term] = sum(log(2*pi*[Noise]**2.0))
+
+    Other methods in `fit_util` compute these terms from the `residual_map` and `chi_squared_map`, which creates a
+    new array for every step of the calculation. When only the log likelihood of a fit is required (e.g. during
+    a model-fit) these arrays are never used, therefore this function computes both terms in a single pass over
+    the data without creating them.
+
+    If the data, model-data and noise-map are complex, the real and imaginary components are treated as independent
+    data points (see `chi_squared_complex_from`).
+
+    If JAX is used the terms are computed via the functions which create the arrays, which JAX can trace.
+
+    Parameters
+    ----------
+    data
+        The data that is fitted.
+    model_data
+        The model data used to fit the data.
+    noise_map
+        The noise-map of the dataset.
+    mask
+        The mask applied to the dataset, where `False` entries are included in the calculation. If `None` all
+        values are included. If the data is slimmed (it only contains the unmasked values) and the mask is native,
+        the mask is slimmed to the data first, such that all values of the data are included.
+    """
+    if use_jax:
+        residual_map = residual_map_from(data=data, model_data=model_data)
+
+        if mask is not None:
+            chi_squared_map = chi_squared_map_with_mask_from(
+                residual_map=residual_map, noise_map=noise_map, mask=mask
+            )
+            return (
+                chi_squared_with_mask_from(chi_squared_map=chi_squared_map, mask=mask),
+                noise_normalization_with_mask_from(noise_map=noise_map, mask=mask),
+            )
+
+        chi_squared_map = chi_squared_map_from(
+            residual_map=residual_map, noise_map=noise_map
+        )
+
+        return (
+            chi_squared_from(chi_squared_map=chi_squared_map),
+            noise_normalization_from(noise_map=noise_map),
+        )
+
+    dtype = "complex128" if np.iscomplexobj(data) else "float"
+
+    data = np.asarray(data).astype(dtype, copy=False).ravel()
+    model_data = np.asarray(model_data).astype(dtype, copy=False).ravel()
+    noise_map = np.asarray(noise_map).astype(dtype, copy=False).ravel()
+
+    if mask is not None:
+        mask = np.asarray(mask).astype("bool", copy=False).ravel()
+
+        if mask.shape[0] != data.shape[0]:
+            if np.count_nonzero(~mask) != data.shape[0]:
+                raise exc.FitException(
+                    f"The mask has {mask.shape[0]} values ({np.count_nonzero(~mask)} unmasked), which does not "
+                    f"match the {data.shape[0]} values of the data in either its native or slim layout."
+                )
+
+            # The data is slimmed and therefore only contains unmasked values, which are all included.
+            mask = None
+
+    if dtype == "complex128":
+        if mask is not None:
+            unmasked = ~mask
+
+            data = data[unmasked]
+            model_data = model_data[unmasked]
+            noise_map = noise_map[unmasked]
+
+        chi_squared, noise_normalization = (
+            chi_squared_and_noise_normalization_complex_jit_from(
+                data=data, model_data=model_data, noise_map=noise_map
+            )
+        )
+    elif mask is not None:
+        chi_squared, noise_normalization = (
+            chi_squared_and_noise_normalization_with_mask_jit_from(
+                data=data,
+                mask=mask,
+                model_data=model_data,
+                noise_map=noise_map,
+            )
+        )
+    else:
+        chi_squared, noise_normalization = (
+            chi_squared_and_noise_normalization_jit_from(
+                data=data, model_data=model_data, noise_map=noise_map
+            )
+        )
+
+    return float(chi_squared), float(noise_normalization)
+
+
 def chi_squared_with_noise_covariance_from(
     *, residual_map: ty.DataLike, noise_covariance_matrix_inv: np.ndarray
 ) -> float:
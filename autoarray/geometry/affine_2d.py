@@ -0,0 +1,162 @@
+import functools
+import numpy as np
+from typing import Optional, Tuple
+
+from autoarray.geometry import geometry_util
+
+
+class AffineTransform2D:
+    def __init__(
+        self,
+        shape_native: Tuple[int, int],
+        pixel_scales: Tuple[float, float],
+        origin: Tuple[float, float] = (0.0, 0.0),
+    ):
+        """
+        The affine transform between the (y,x) scaled coordinates and (y,x) pixel coordinates of a uniform 2D grid,
+        with the scale and offset of the transform computed once when it is created.
+
+        The functions in `geometry_util` (e.g. `grid_pixels_2d_slim_from`) recompute the central pixel of the grid
+        and loop over every coordinate on each call. This object instead stores the divisor and offset of every
+        axis, such that converting a grid is a few vectorized array operations which can write to an input buffer
+        (including the input grid itself) via the `out` parameter of every method.
+
+        The arithmetic is performed in the same order as the `geometry_util` functions, so that the transforms give
+        identical results.
+
+        Parameters
+        ----------
+        shape_native
+            The (y,x) shape of the uniform 2D grid.
+        pixel_scales
+            The (y,x) scaled units to pixel units conversion factor of the grid.
+        origin
+            The (y,x) scaled units origin of the grid.
+        """
+        self.shape_native = (int(shape_native[0]), int(shape_native[1]))
+        self.pixel_scales = (float(pixel_scales[0]), float(pixel_scales[1]))
+        self.origin = (float(origin[0]), float(origin[1]))
+
+        centres_scaled = geometry_util.central_scaled_coordinate_2d_from(
+            shape_native=self.shape_native,
+            pixel_scales=self.pixel_scales,
+            origin=self.origin,
+        )
+
+        # The y axis is flipped, such that pixel [0,0] is at the highest y and lowest x scaled coordinate.
+        self.divisors = np.array([-self.pixel_scales[0], self.pixel_scales[1]])
+        self.offsets = np.array([centres_scaled[0], centres_scaled[1]])
+
+        self.divisors.setflags(write=False)
+        self.offsets.setflags(write=False)
+
+    def pixels_from(
+        self, grid_scaled_2d_slim: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert a slimmed grid of 2D (y,x) scaled coordinates to a slimmed grid of 2D (y,x) pixel coordinates, which
+        are floats that include the decimal offset from each pixel's top-left corner (see
+        `geometry_util.grid_pixels_2d_slim_from`).
+
+        Parameters
+        ----------
+        grid_scaled_2d_slim
+            The slimmed grid of (y,x) coordinates in scaled units, of shape [total_coordinates, 2].
+        out
+            A float array of shape [total_coordinates, 2] the pixel coordinates are written to, which may be the
+            input grid itself to convert it in place.
+        """
+        out = np.divide(grid_scaled_2d_slim, self.divisors, out=out)
+        out += self.offsets
+        out += 0.5
+
+        return out
+
+    def pixel_centres_from(
+        self, grid_scaled_2d_slim: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert a slimmed grid of 2D (y,x) scaled coordinates to a slimmed grid of 2D (y,x) pixel coordinates of the
+        pixels they are contained within, which are integer values stored as floats (see
+        `geometry_util.grid_pixel_centres_2d_slim_from`).
+
+        Parameters
+        ----------
+        grid_scaled_2d_slim
+            The slimmed grid of (y,x) coordinates in scaled units, of shape [total_coordinates, 2].
+        out
+            A float array of shape [total_coordinates, 2] the pixel coordinates are written to, which may be the
+            input grid itself to convert it in place.
+        """
+        out = self.pixels_from(grid_scaled_2d_slim=grid_scaled_2d_slim, out=out)
+
+        return np.trunc(out, out=out)
+
+    def pixel_indexes_from(
+        self, grid_scaled_2d_slim: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert a slimmed grid of 2D (y,x) scaled coordinates to the slimmed indexes of the pixels they are
+        contained within, which are integer values stored as floats (see
+        `geometry_util.grid_pixel_indexes_2d_slim_from`).
+
+        Parameters
+        ----------
+        grid_scaled_2d_slim
+            The slimmed grid of (y,x) coordinates in scaled units, of shape [total_coordinates, 2].
+        out
+            A float array of shape [total_coordinates] the pixel indexes are written to.
+        """
+        pixel_centres = self.pixel_centres_from(
+            grid_scaled_2d_slim=grid_scaled_2d_slim
+        )
+
+        out = np.multiply(pixel_centres[:, 0], self.shape_native[1], out=out)
+        out += pixel_centres[:, 1]
+
+        return out
+
+    def scaled_from(
+        self, grid_pixels_2d_slim: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert a slimmed grid of 2D (y,x) pixel coordinates to a slimmed grid of 2D (y,x) scaled coordinates, which
+        is the inverse of `pixels_from` (see `geometry_util.grid_scaled_2d_slim_from`).
+
+        Parameters
+        ----------
+        grid_pixels_2d_slim
+            The slimmed grid of (y,x) coordinates in pixels, of shape [total_coordinates, 2].
+        out
+            A float array of shape [total_coordinates, 2] the scaled coordinates are written to, which may be the
+            input grid itself to convert it in place.
+        """
+        out = np.subtract(grid_pixels_2d_slim, self.offsets, out=out)
+        out -= 0.5
+        out *= self.divisors
+
+        return out
+
+
+@functools.lru_cache(maxsize=32)
+def affine_transform_2d_cached_from(
+    shape_native: Tuple[int, int],
+    pixel_scales: Tuple[float, float],
+    origin: Tuple[float, float],
+) -> AffineTransform2D:
+    """
+    Returns the `AffineTransform2D` of a uniform 2D grid, memoised per `shape_native`, `pixel_scales` and `origin`
+    such that every geometry with the same grid shares the same transform.
+
+    Parameters
+    ----------
+    shape_native
+        The (y,x) shape of the uniform 2D grid, which must be a tuple of ints so that it is hashable.
+    pixel_scales
+        The (y,x) scaled units to pixel units conversion factor of the grid, which must be a tuple of floats.
+    origin
+        The (y,x) scaled units origin of the grid, which must be a tuple of floats.
+    """
+    return AffineTransform2D(
+        shape_native=shape_native, pixel_scales=pixel_scales, origin=origin
+    )
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 import numpy as np
 
 from autoarray.geometry.abstract_2d import AbstractGeometry2D
+from autoarray.geometry.affine_2d import AffineTransform2D
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
 
 from autoarray import type as ty
 from autoarray.geometry import geometry_util
@@ -130,6 +132,21 @@ class Geometry2D(AbstractGeometry2D):
             origin=self.origin,
         )
 
+    @property
+    def affine(self) -> AffineTransform2D:
+        """
+        The affine transform between the (y,x) scaled coordinates and (y,x) pixel coordinates of the 2D geometry,
+        which converts grids of coordinates via vectorized array operations.
+
+        The transform is computed once for every ``shape_native``, ``pixel_scales`` and ``origin`` and shared by all
+        geometries with the same values, such that repeated conversions perform no setup.
+        """
+        return affine_transform_2d_cached_from(
+            shape_native=(int(self.shape_native[0]), int(self.shape_native[1])),
+            pixel_scales=(float(self.pixel_scales[0]), float(self.pixel_scales[1])),
+            origin=(float(self.origin[0]), float(self.origin[1])),
+        )
+
     def pixel_coordinates_2d_from(
         self, scaled_coordinates_2d: Tuple[float, float]
     ) -> Tuple[float, float]:
@@ -233,11 +250,8 @@ class Geometry2D(AbstractGeometry2D):
         """
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        grid_pixels_2d = geometry_util.grid_pixels_2d_slim_from(
-            grid_scaled_2d_slim=np.array(grid_scaled_2d),
-            shape_native=self.shape_native,
-            pixel_scales=self.pixel_scales,
-            origin=self.origin,
+        grid_pixels_2d = self.affine.pixels_from(
+            grid_scaled_2d_slim=np.array(grid_scaled_2d)
         )
         return Grid2D(values=grid_pixels_2d, mask=grid_scaled_2d.mask)
 
@@ -259,11 +273,8 @@ class Geometry2D(AbstractGeometry2D):
         """
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        grid_pixel_centres_1d = geometry_util.grid_pixel_centres_2d_slim_from(
-            grid_scaled_2d_slim=np.array(grid_scaled_2d),
-            shape_native=self.shape_native,
-            pixel_scales=self.pixel_scales,
-            origin=self.origin,
+        grid_pixel_centres_1d = self.affine.pixel_centres_from(
+            grid_scaled_2d_slim=np.array(grid_scaled_2d)
         ).astype("int")
 
         return Grid2D(values=grid_pixel_centres_1d, mask=grid_scaled_2d.mask)
@@ -292,11 +303,8 @@ class Geometry2D(AbstractGeometry2D):
 
         from autoarray.structures.arrays.uniform_2d import Array2D
 
-        grid_pixel_indexes_2d = geometry_util.grid_pixel_indexes_2d_slim_from(
-            grid_scaled_2d_slim=np.array(grid_scaled_2d),
-            shape_native=self.shape_native,
-            pixel_scales=self.pixel_scales,
-            origin=self.origin,
+        grid_pixel_indexes_2d = self.affine.pixel_indexes_from(
+            grid_scaled_2d_slim=np.array(grid_scaled_2d)
         ).astype("int")
 
         return Array2D(values=grid_pixel_indexes_2d, mask=grid_scaled_2d.mask)
@@ -318,10 +326,7 @@ class Geometry2D(AbstractGeometry2D):
         """
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        grid_scaled_1d = geometry_util.grid_scaled_2d_slim_from(
-            grid_pixels_2d_slim=np.array(grid_pixels_2d),
-            shape_native=self.shape_native,
-            pixel_scales=self.pixel_scales,
-            origin=self.origin,
+        grid_scaled_1d = self.affine.scaled_from(
+            grid_pixels_2d_slim=np.array(grid_pixels_2d)
         )
         return Grid2D(values=grid_scaled_1d, mask=grid_pixels_2d.mask)
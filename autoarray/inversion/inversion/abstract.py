@@ -1,7 +1,6 @@
 import copy
 
 import numpy as np
-from scipy.linalg import block_diag
 from scipy.sparse import csc_matrix
 from scipy.sparse.linalg import splu
 from typing import Dict, List, Optional, Tuple, Type, Union
@@ -285,6 +284,105 @@ class AbstractInversion:
     def mask(self) -> Array2D:
         return self.data.mask
 
+    def _array_from(
+        self,
+        name: str,
+        shape: Tuple[int, ...],
+        dtype: Union[str, np.dtype] = "float",
+        zeroed: bool = True,
+    ) -> np.ndarray:
+        """
+        Returns the array a matrix or vector of the inversion is written into.
+
+        If the `preloads` have an `InversionWorkspace`, the array is the workspace's buffer of this name, which is
+        reused by every inversion sharing the workspace instead of being allocated for every inversion. Otherwise a
+        new array is allocated.
+
+        Parameters
+        ----------
+        name
+            The name of the matrix or vector (e.g. `curvature_matrix`) in the workspace.
+        shape
+            The shape of the array.
+        dtype
+            The type of the array.
+        zeroed
+            If `True` the values of the array are zero, otherwise every value must be overwritten by the caller.
+        """
+        if self.preloads.workspace is not None:
+            return self.preloads.workspace.array_from(
+                name=name, shape=shape, dtype=dtype, zeroed=zeroed
+            )
+
+        if zeroed:
+            return np.zeros(shape, dtype=dtype)
+
+        return np.empty(shape, dtype=dtype)
+
+    def _stacked_matrix_from(
+        self, name: str, matrix_list: List[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Stack the matrices of every linear object (e.g. their `mapping_matrix`) column-wise, writing them into the
+        array returned by `_array_from` instead of a new array allocated by `np.hstack`.
+
+        Parameters
+        ----------
+        name
+            The name of the stacked matrix in the workspace.
+        matrix_list
+            The matrices of every linear object, which all have the same number of rows.
+        """
+        stacked_matrix = self._array_from(
+            name=name,
+            shape=(
+                matrix_list[0].shape[0],
+                sum(matrix.shape[1] for matrix in matrix_list),
+            ),
+            dtype=np.result_type(*matrix_list),
+            zeroed=False,
+        )
+
+        column = 0
+
+        for matrix in matrix_list:
+            stacked_matrix[:, column : column + matrix.shape[1]] = matrix
+            column += matrix.shape[1]
+
+        return stacked_matrix
+
+    def _reduced_matrix_from(self, name: str, matrix: np.ndarray) -> np.ndarray:
+        """
+        Returns a square matrix of the inversion (e.g. the `regularization_matrix`) with the rows and columns of the
+        linear objects without regularization removed, which are the entries of `no_regularization_index_list`.
+
+        This gives the same matrix as calling `np.delete` on each axis, but writes it into arrays returned by
+        `_array_from`.
+
+        Parameters
+        ----------
+        name
+            The name of the reduced matrix in the workspace.
+        matrix
+            The square matrix of shape [total_params, total_params] which is reduced.
+        """
+        index_list = np.delete(
+            np.arange(matrix.shape[0]), self.no_regularization_index_list
+        )
+
+        matrix_rows = self._array_from(
+            name=f"{name}_rows",
+            shape=(index_list.shape[0], matrix.shape[1]),
+            zeroed=False,
+        )
+        np.take(matrix, index_list, axis=0, out=matrix_rows)
+
+        reduced_matrix = self._array_from(
+            name=name, shape=(index_list.shape[0], index_list.shape[0]), zeroed=False
+        )
+
+        return np.take(matrix_rows, index_list, axis=1, out=reduced_matrix)
+
     @cached_property
     @profile_func
     def mapping_matrix(self) -> np.ndarray:
@@ -302,8 +400,11 @@ class AbstractInversion:
         If there are multiple linear objects, the mapping matrices are stacked such that their simultaneous linear
         equations are solved simultaneously. This property returns the stacked mapping matrix.
         """
-        return np.hstack(
-            [linear_obj.mapping_matrix for linear_obj in self.linear_obj_list]
+        return self._stacked_matrix_from(
+            name="mapping_matrix",
+            matrix_list=[
+                linear_obj.mapping_matrix for linear_obj in self.linear_obj_list
+            ],
         )
 
     @property
@@ -326,7 +427,10 @@ class AbstractInversion:
         if self.preloads.operated_mapping_matrix is not None:
             return self.preloads.operated_mapping_matrix
 
-        return np.hstack(self.operated_mapping_matrix_list)
+        return self._stacked_matrix_from(
+            name="operated_mapping_matrix",
+            matrix_list=self.operated_mapping_matrix_list,
+        )
 
     @cached_property
     @profile_func
@@ -349,9 +453,8 @@ class AbstractInversion:
         A complete description of regularization is given in the `regularization.py` and `regularization_util.py`
         modules.
 
-        For multiple mappers, the regularization matrix is computed as the block diagonal of each individual mapper.
-        The scipy function `block_diag` has an overhead associated with it and if there is only one mapper and
-        regularization it is bypassed.
+        For multiple mappers, the regularization matrix is computed as the block diagonal of each individual mapper,
+        which are written into a single matrix (giving the same matrix as the scipy function `block_diag`).
 
         If the `settings.force_edge_pixels_to_zeros` is `True`, the edge pixels of each mapper in the inversion
         are regularized so high their value is forced to zero.
@@ -359,10 +462,27 @@ class AbstractInversion:
         if self.preloads.regularization_matrix is not None:
             return self.preloads.regularization_matrix
 
-        return block_diag(
-            *[linear_obj.regularization_matrix for linear_obj in self.linear_obj_list]
+        regularization_matrix_list = [
+            linear_obj.regularization_matrix for linear_obj in self.linear_obj_list
+        ]
+
+        total_params = sum(matrix.shape[0] for matrix in regularization_matrix_list)
+
+        regularization_matrix = self._array_from(
+            name="regularization_matrix", shape=(total_params, total_params)
         )
 
+        param = 0
+
+        for matrix in regularization_matrix_list:
+            params = matrix.shape[0]
+            regularization_matrix[
+                param : param + params, param : param + params
+            ] = matrix
+            param += params
+
+        return regularization_matrix
+
     @cached_property
     @profile_func
     def regularization_matrix_reduced(self) -> Optional[np.ndarray]:
@@ -374,9 +494,7 @@ class AbstractInversion:
         A complete description of regularization is given in the `regularization.py` and `regularization_util.py`
         modules.
 
-        For multiple mappers, the regularization matrix is computed as the block diagonal of each individual mapper.
-        The scipy function `block_diag` has an overhead associated with it and if there is only one mapper and
-        regularization it is bypassed.
+        This matrix only contains the rows and columns of the linear objects which have regularization.
         """
 
         regularization_matrix = self.regularization_matrix
@@ -384,15 +502,10 @@ class AbstractInversion:
         if self.all_linear_obj_have_regularization:
             return regularization_matrix
 
-        regularization_matrix = np.delete(
-            regularization_matrix, self.no_regularization_index_list, 0
-        )
-        regularization_matrix = np.delete(
-            regularization_matrix, self.no_regularization_index_list, 1
+        return self._reduced_matrix_from(
+            name="regularization_matrix_reduced", matrix=regularization_matrix
         )
 
-        return regularization_matrix
-
     @cached_property
     @profile_func
     def curvature_reg_matrix(self) -> np.ndarray:
@@ -403,10 +516,26 @@ class AbstractInversion:
         avoids overheads in memory allocation. The `curvature_matrix` is removed as a cached property as a result,
         to ensure if we access it after computing the `curvature_reg_matrix` it is correctly recalculated in a new
         array of memory.
+
+        If the `preloads` have an `InversionWorkspace` the sum is instead written into the workspace, because a
+        recalculated `curvature_matrix` would be written into the same memory as the `curvature_reg_matrix`.
         """
         if not self.has(cls=AbstractRegularization):
             return self.curvature_matrix
 
+        if self.preloads.workspace is not None:
+            curvature_reg_matrix = self._array_from(
+                name="curvature_reg_matrix",
+                shape=self.curvature_matrix.shape,
+                zeroed=False,
+            )
+
+            return np.add(
+                self.curvature_matrix,
+                self.regularization_matrix,
+                out=curvature_reg_matrix,
+            )
+
         if len(self.regularization_list) == 1:
             curvature_matrix = self.curvature_matrix
             curvature_matrix += self.regularization_matrix
@@ -429,17 +558,10 @@ class AbstractInversion:
         if self.all_linear_obj_have_regularization:
             return self.curvature_reg_matrix
 
-        curvature_reg_matrix = self.curvature_reg_matrix
-
-        curvature_reg_matrix = np.delete(
-            curvature_reg_matrix, self.no_regularization_index_list, 0
-        )
-        curvature_reg_matrix = np.delete(
-            curvature_reg_matrix, self.no_regularization_index_list, 1
+        return self._reduced_matrix_from(
+            name="curvature_reg_matrix_reduced", matrix=self.curvature_reg_matrix
         )
 
-        return curvature_reg_matrix
-
     @property
     def mapper_zero_pixel_list(self) -> np.ndarray:
         mapper_zero_pixel_list = []
@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Union
 
+from autoarray.dataset.abstract.noise_covariance import AbstractNoiseCovariance
 from autoarray.dataset.imaging.dataset import Imaging
 from autoarray.dataset.interferometer.dataset import Interferometer
 from autoarray.inversion.inversion.imaging.mapping import InversionImagingMapping
@@ -20,6 +21,8 @@ from autoarray.inversion.inversion.settings import SettingsInversion
 from autoarray.structures.arrays.uniform_2d import Array2D
 from autoarray.preloads import Preloads
 
+from autoarray import exc
+
 
 def inversion_from(
     dataset: Union[Imaging, Interferometer, DatasetInterface],
@@ -135,6 +138,11 @@ def inversion_imaging_from(
     if not settings.use_w_tilde:
         use_w_tilde = False
 
+    if isinstance(
+        getattr(dataset, "noise_covariance_matrix", None), AbstractNoiseCovariance
+    ):
+        use_w_tilde = False
+
     if use_w_tilde:
         if preloads.w_tilde is not None:
             w_tilde = preloads.w_tilde
@@ -207,6 +215,14 @@ def inversion_interferometer_from(
     -------
     An `Inversion` whose type is determined by the input `dataset` and `settings`.
     """
+    if isinstance(
+        getattr(dataset, "noise_covariance_matrix", None), AbstractNoiseCovariance
+    ):
+        raise exc.InversionException(
+            "An inversion of an interferometer dataset does not support a structured noise covariance "
+            "(e.g. `NoiseCovarianceSparse`), which is only supported by imaging inversions."
+        )
+
     try:
         from autoarray.inversion.inversion import inversion_util_secret
     except ImportError:
@@ -6,9 +6,17 @@ from autoarray.inversion.inversion.settings import SettingsInversion
 
 from autoarray import numba_util
 from autoarray import exc
+from autoarray.inversion.pixelization.mappers import mapper_util
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        (
+            "(float64[:, ::1], float64[:, ::1], float64[:, ::1], "
+            "Array(int64, 2, 'C', readonly=True))"
+        ),
+    ],
+)
 def w_tilde_data_imaging_from(
     image_native: np.ndarray,
     noise_map_native: np.ndarray,
@@ -133,7 +141,11 @@ def w_tilde_curvature_imaging_from(
     return w_tilde_curvature
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[:, ::1], float64[:, ::1], Array(int64, 2, 'C', readonly=True))",
+    ],
+)
 def w_tilde_curvature_preload_imaging_from(
     noise_map_native: np.ndarray, kernel_native: np.ndarray, native_index_for_slim_index
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -343,7 +355,6 @@ def w_tilde_curvature_value_from(
     return curvature_value
 
 
-@numba_util.jit()
 def data_vector_via_w_tilde_data_imaging_from(
     w_tilde_data: np.ndarray,
     data_to_pix_unique: np.ndarray,
@@ -359,6 +370,10 @@ def data_vector_via_w_tilde_data_imaging_from(
     pixelization pixels and `data_weights`, which describes how many sub-pixels uniquely map to each pixelization
     pixels (see `data_slim_to_pixelization_unique_from`).
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the data vector is computed via
+    `data_vector_via_w_tilde_data_imaging_csr_from`.
+
     Parameters
     ----------
     w_tilde_data
@@ -377,21 +392,74 @@ def data_vector_via_w_tilde_data_imaging_from(
         The total number of pixels in the pixelization that reconstructs the data.
     """
 
+    offsets, indexes, weights = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+    )
+
+    return data_vector_via_w_tilde_data_imaging_csr_from(
+        w_tilde_data=w_tilde_data,
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+        pix_pixels=pix_pixels,
+    )
+
+
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[::1], int64[::1], int64[::1], float64[::1], int64)",
+    ],
+)
+def data_vector_via_w_tilde_data_imaging_csr_from(
+    w_tilde_data: np.ndarray,
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+    pix_pixels: int,
+) -> np.ndarray:
+    """
+    Returns the data vector `D` from the `w_tilde_data` matrix (see `w_tilde_data_imaging_from`), using the unique
+    mappings of every set of image sub-pixels to pixelization pixels in compressed sparse row (CSR) format.
+
+    This computes the same quantity as `data_vector_via_w_tilde_data_imaging_from`, but iterates over the contiguous
+    CSR arrays as opposed to padded 2D arrays.
+
+    Parameters
+    ----------
+    w_tilde_data
+        A matrix that encodes the PSF convolution values between the imaging divided by the noise map**2 that enables
+        efficient calculation of the data vector.
+    offsets
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`
+        (see `data_slim_to_pixelization_unique_csr_from`).
+    indexes
+        The pixelization pixel index of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+    weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_pixels
+        The total number of pixels in the pixelization that reconstructs the data.
+    """
+
     data_pixels = w_tilde_data.shape[0]
 
     data_vector = np.zeros(pix_pixels)
 
     for data_0 in range(data_pixels):
-        for pix_0_index in range(pix_lengths[data_0]):
-            data_0_weight = data_weights[data_0, pix_0_index]
-            pix_0 = data_to_pix_unique[data_0, pix_0_index]
-
-            data_vector[pix_0] += data_0_weight * w_tilde_data[data_0]
+        for index in range(offsets[data_0], offsets[data_0 + 1]):
+            data_vector[indexes[index]] += weights[index] * w_tilde_data[data_0]
 
     return data_vector
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[:, ::1], float64[::1], float64[::1])",
+    ],
+)
 def data_vector_via_blurred_mapping_matrix_from(
     blurred_mapping_matrix: np.ndarray, image: np.ndarray, noise_map: np.ndarray
 ) -> np.ndarray:
@@ -424,7 +492,6 @@ def data_vector_via_blurred_mapping_matrix_from(
     return data_vector
 
 
-@numba_util.jit()
 def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
     curvature_preload: np.ndarray,
     curvature_indexes: np.ndarray,
@@ -452,6 +519,10 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
     pixel `native_index_for_slim_index`. This exploits the sparsity in the `mapping_matrix` to directly
     compute the `curvature_matrix` (e.g. it condenses the triple matrix multiplication into a double for loop!).
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the curvature matrix is computed via
+    `curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from`.
+
     Parameters
     ----------
     curvature_preload
@@ -480,9 +551,134 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
         The curvature matrix `F` (see Warren & Dye 2003).
     """
 
-    data_pixels = curvature_lengths.shape[0]
+    offsets, indexes, weights = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+    )
+
+    return curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from(
+        curvature_preload=curvature_preload,
+        curvature_indexes=curvature_indexes,
+        curvature_lengths=curvature_lengths,
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+        pix_pixels=pix_pixels,
+    )
 
-    curvature_matrix = np.zeros((pix_pixels, pix_pixels))
+
+@numba_util.jit(nogil=True)
+def curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from(
+    curvature_preload: np.ndarray,
+    curvature_indexes: np.ndarray,
+    curvature_lengths: np.ndarray,
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+    pix_pixels: int,
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` (see Warren & Dye 2003) by computing it using `w_tilde_preload` for an imaging
+    inversion, using the unique mappings of every set of image sub-pixels to pixelization pixels in compressed
+    sparse row (CSR) format.
+
+    This computes the same quantity as `curvature_matrix_via_w_tilde_curvature_preload_imaging_from`, but iterates
+    over the contiguous CSR arrays as opposed to padded 2D arrays.
+
+    The matrix is computed by `curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_in_place_from`, which
+    can instead write it into an existing array.
+
+    Parameters
+    ----------
+    curvature_preload
+        A matrix that precomputes the values for fast computation of the curvature matrix in a memory efficient way.
+    curvature_indexes
+        The image-pixel indexes of the values stored in the w tilde preload matrix, which are used to compute
+        the weights of the data values when computing the curvature matrix.
+    curvature_lengths
+        The number of image pixels in every row of `w_tilde_curvature`, which is iterated over when computing the
+        curvature matrix.
+    offsets
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`
+        (see `data_slim_to_pixelization_unique_csr_from`).
+    indexes
+        The pixelization pixel index of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+    weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_pixels
+        The total number of pixels in the pixelization that reconstructs the data.
+
+    Returns
+    -------
+    ndarray
+        The curvature matrix `F` (see Warren & Dye 2003).
+    """
+    return curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_in_place_from(
+        curvature_matrix=np.zeros((pix_pixels, pix_pixels)),
+        curvature_preload=curvature_preload,
+        curvature_indexes=curvature_indexes,
+        curvature_lengths=curvature_lengths,
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+    )
+
+
+@numba_util.jit(
+    nogil=True,
+    hot_signatures=[
+        (
+            "(float64[:, ::1], float64[::1], int64[::1], int64[::1], int64[::1], "
+            "int64[::1], float64[::1])"
+        ),
+    ],
+)
+def curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_in_place_from(
+    curvature_matrix: np.ndarray,
+    curvature_preload: np.ndarray,
+    curvature_indexes: np.ndarray,
+    curvature_lengths: np.ndarray,
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """
+    Computes the curvature matrix `F` (see Warren & Dye 2003) in the same way as
+    `curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from`, but writes it into an input array instead of
+    a new array.
+
+    The input array may be a view of a larger matrix (e.g. the diagonal block of a single mapper in the
+    `curvature_matrix` of an inversion with multiple mappers), such that the matrix is computed without allocating
+    any memory.
+
+    Parameters
+    ----------
+    curvature_matrix
+        The array of shape [pix_pixels, pix_pixels] the curvature matrix is written into, which must be all zeros.
+    curvature_preload
+        A matrix that precomputes the values for fast computation of the curvature matrix in a memory efficient way.
+    curvature_indexes
+        The image-pixel indexes of the values stored in the w tilde preload matrix.
+    curvature_lengths
+        The number of image pixels in every row of `w_tilde_curvature`.
+    offsets
+        The CSR row offsets of the unique mappings of every data pixel.
+    indexes
+        The pixelization pixel index of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+    weights
+        The weight of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+
+    Returns
+    -------
+    ndarray
+        The input array, which contains the curvature matrix `F`.
+    """
+
+    data_pixels = curvature_lengths.shape[0]
+    pix_pixels = curvature_matrix.shape[0]
 
     curvature_index = 0
 
@@ -491,16 +687,13 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
             data_1 = curvature_indexes[curvature_index]
             w_tilde_value = curvature_preload[curvature_index]
 
-            for pix_0_index in range(pix_lengths[data_0]):
-                data_0_weight = data_weights[data_0, pix_0_index]
-                pix_0 = data_to_pix_unique[data_0, pix_0_index]
-
-                for pix_1_index in range(pix_lengths[data_1]):
-                    data_1_weight = data_weights[data_1, pix_1_index]
-                    pix_1 = data_to_pix_unique[data_1, pix_1_index]
+            for index_0 in range(offsets[data_0], offsets[data_0 + 1]):
+                pix_0 = indexes[index_0]
+                data_0_weight = weights[index_0] * w_tilde_value
 
-                    curvature_matrix[pix_0, pix_1] += (
-                        data_0_weight * data_1_weight * w_tilde_value
+                for index_1 in range(offsets[data_1], offsets[data_1 + 1]):
+                    curvature_matrix[pix_0, indexes[index_1]] += (
+                        data_0_weight * weights[index_1]
                     )
 
             curvature_index += 1
@@ -516,7 +709,6 @@ def curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
     return curvature_matrix
 
 
-@numba_util.jit()
 def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
     curvature_preload: np.ndarray,
     curvature_indexes: np.ndarray,
@@ -550,6 +742,10 @@ def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
     data-to-pixelization mappings of each mapper. It behaves analogous to the
     function `curvature_matrix_via_w_tilde_curvature_preload_imaging_from`.
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the off diagonal terms are computed via
+    `curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_csr_from`.
+
     Parameters
     ----------
     curvature_preload
@@ -578,6 +774,88 @@ def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
         The curvature matrix `F` (see Warren & Dye 2003).
     """
 
+    offsets_0, indexes_0, weights_0 = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique_0,
+        data_weights=data_weights_0,
+        pix_lengths=pix_lengths_0,
+    )
+
+    offsets_1, indexes_1, weights_1 = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique_1,
+        data_weights=data_weights_1,
+        pix_lengths=pix_lengths_1,
+    )
+
+    return curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_csr_from(
+        curvature_preload=curvature_preload,
+        curvature_indexes=curvature_indexes,
+        curvature_lengths=curvature_lengths,
+        offsets_0=offsets_0,
+        indexes_0=indexes_0,
+        weights_0=weights_0,
+        pix_pixels_0=pix_pixels_0,
+        offsets_1=offsets_1,
+        indexes_1=indexes_1,
+        weights_1=weights_1,
+        pix_pixels_1=pix_pixels_1,
+    )
+
+
+@numba_util.jit(nogil=True)
+def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_csr_from(
+    curvature_preload: np.ndarray,
+    curvature_indexes: np.ndarray,
+    curvature_lengths: np.ndarray,
+    offsets_0: np.ndarray,
+    indexes_0: np.ndarray,
+    weights_0: np.ndarray,
+    pix_pixels_0: int,
+    offsets_1: np.ndarray,
+    indexes_1: np.ndarray,
+    weights_1: np.ndarray,
+    pix_pixels_1: int,
+) -> np.ndarray:
+    """
+    Returns the off diagonal terms in the curvature matrix `F` (see Warren & Dye 2003) between two mappers by
+    computing them using `w_tilde_preload` for an imaging inversion, using the unique mappings of every set of image
+    sub-pixels to pixelization pixels of each mapper in compressed sparse row (CSR) format.
+
+    This computes the same quantity as `curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from`, but
+    iterates over the contiguous CSR arrays as opposed to padded 2D arrays.
+
+    Parameters
+    ----------
+    curvature_preload
+        A matrix that precomputes the values for fast computation of the curvature matrix in a memory efficient way.
+    curvature_indexes
+        The image-pixel indexes of the values stored in the w tilde preload matrix, which are used to compute
+        the weights of the data values when computing the curvature matrix.
+    curvature_lengths
+        The number of image pixels in every row of `w_tilde_curvature`, which is iterated over when computing the
+        curvature matrix.
+    offsets_0
+        The CSR row offsets of the unique mappings of the first mapper.
+    indexes_0
+        The pixelization pixel index of every unique mapping of the first mapper.
+    weights_0
+        The weight of every unique mapping of the first mapper.
+    pix_pixels_0
+        The total number of pixels in the pixelization of the first mapper.
+    offsets_1
+        The CSR row offsets of the unique mappings of the second mapper.
+    indexes_1
+        The pixelization pixel index of every unique mapping of the second mapper.
+    weights_1
+        The weight of every unique mapping of the second mapper.
+    pix_pixels_1
+        The total number of pixels in the pixelization of the second mapper.
+
+    Returns
+    -------
+    ndarray
+        The off-diagonal terms of the curvature matrix `F` (see Warren & Dye 2003).
+    """
+
     data_pixels = curvature_lengths.shape[0]
 
     curvature_matrix = np.zeros((pix_pixels_0, pix_pixels_1))
@@ -589,16 +867,13 @@ def curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
             data_1 = curvature_indexes[curvature_index]
             w_tilde_value = curvature_preload[curvature_index]
 
-            for pix_0_index in range(pix_lengths_0[data_0]):
-                data_0_weight = data_weights_0[data_0, pix_0_index]
-                pix_0 = data_to_pix_unique_0[data_0, pix_0_index]
-
-                for pix_1_index in range(pix_lengths_1[data_1]):
-                    data_1_weight = data_weights_1[data_1, pix_1_index]
-                    pix_1 = data_to_pix_unique_1[data_1, pix_1_index]
+            for index_0 in range(offsets_0[data_0], offsets_0[data_0 + 1]):
+                pix_0 = indexes_0[index_0]
+                data_0_weight = weights_0[index_0] * w_tilde_value
 
-                    curvature_matrix[pix_0, pix_1] += (
-                        data_0_weight * data_1_weight * w_tilde_value
+                for index_1 in range(offsets_1[data_1], offsets_1[data_1 + 1]):
+                    curvature_matrix[pix_0, indexes_1[index_1]] += (
+                        data_0_weight * weights_1[index_1]
                     )
 
             curvature_index += 1
@@ -671,7 +946,6 @@ def data_linear_func_matrix_from(
     return data_linear_func_matrix_dict
 
 
-@numba_util.jit()
 def curvature_matrix_off_diags_via_data_linear_func_matrix_from(
     data_linear_func_matrix: np.ndarray,
     data_to_pix_unique: np.ndarray,
@@ -693,6 +967,10 @@ def curvature_matrix_off_diags_via_data_linear_func_matrix_from(
 
     This function performs this efficient calcluation via the preloaded `data_linear_func_matrix`.
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the off diagonal terms are computed via
+    `curvature_matrix_off_diags_via_data_linear_func_matrix_csr_from`.
+
     Parameters
     ----------
     data_linear_func_matrix
@@ -708,16 +986,65 @@ def curvature_matrix_off_diags_via_data_linear_func_matrix_from(
         The number of pixelization pixels in the pixelization (see the `Mapper` object).
     """
 
+    offsets, indexes, weights = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+    )
+
+    return curvature_matrix_off_diags_via_data_linear_func_matrix_csr_from(
+        data_linear_func_matrix=data_linear_func_matrix,
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+        pix_pixels=pix_pixels,
+    )
+
+
+@numba_util.jit(nogil=True)
+def curvature_matrix_off_diags_via_data_linear_func_matrix_csr_from(
+    data_linear_func_matrix: np.ndarray,
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+    pix_pixels: int,
+):
+    """
+    Returns the off diagonal terms in the curvature matrix `F` (see Warren & Dye 2003) between a mapper object
+    and a linear func object, using the preloaded `data_linear_func_matrix` of the values of the linear functions
+    and the mapper's unique mappings in compressed sparse row (CSR) format.
+
+    This computes the same quantity as `curvature_matrix_off_diags_via_data_linear_func_matrix_from`, but iterates
+    over the contiguous CSR arrays as opposed to padded 2D arrays.
+
+    Parameters
+    ----------
+    data_linear_func_matrix
+        A matrix of shape [data_pixels, total_fixed_linear_functions] that for each data pixel, maps it to the sum of
+        the values of a linear object function convolved with the PSF kernel at the data pixel.
+    offsets
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`
+        (see `data_slim_to_pixelization_unique_csr_from`).
+    indexes
+        The pixelization pixel index of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+    weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_pixels
+        The number of pixelization pixels in the pixelization (see the `Mapper` object).
+    """
+
     linear_func_pixels = data_linear_func_matrix.shape[1]
 
     off_diag = np.zeros((pix_pixels, linear_func_pixels))
 
-    data_pixels = data_weights.shape[0]
+    data_pixels = offsets.shape[0] - 1
 
     for data_0 in range(data_pixels):
-        for pix_0_index in range(pix_lengths[data_0]):
-            data_0_weight = data_weights[data_0, pix_0_index]
-            pix_0 = data_to_pix_unique[data_0, pix_0_index]
+        for index in range(offsets[data_0], offsets[data_0 + 1]):
+            data_0_weight = weights[index]
+            pix_0 = indexes[index]
 
             for linear_index in range(linear_func_pixels):
                 off_diag[pix_0, linear_index] += (
@@ -727,7 +1054,6 @@ def curvature_matrix_off_diags_via_data_linear_func_matrix_from(
     return off_diag
 
 
-@numba_util.jit()
 def curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_from(
     data_to_pix_unique: np.ndarray,
     data_weights: np.ndarray,
@@ -752,6 +1078,10 @@ def curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_from(
     This is done for every unique mapping of a data pixel to a pixelization pixel, giving the off-diagonal terms in
     the curvature matrix.
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the off diagonal terms are computed via
+    `curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_csr_from`.
+
     Parameters
     ----------
     data_to_pix_unique
@@ -780,15 +1110,81 @@ def curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_from(
         The curvature matrix `F` (see Warren & Dye 2003).
     """
 
-    data_pixels = data_weights.shape[0]
+    offsets, indexes, weights = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+    )
+
+    return curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_csr_from(
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+        pix_pixels=pix_pixels,
+        curvature_weights=curvature_weights,
+        image_frame_1d_lengths=image_frame_1d_lengths,
+        image_frame_1d_indexes=image_frame_1d_indexes,
+        image_frame_1d_kernels=image_frame_1d_kernels,
+    )
+
+
+@numba_util.jit(nogil=True)
+def curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_csr_from(
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+    pix_pixels: int,
+    curvature_weights: np.ndarray,
+    image_frame_1d_lengths: np.ndarray,
+    image_frame_1d_indexes: np.ndarray,
+    image_frame_1d_kernels: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the off diagonal terms in the curvature matrix `F` (see Warren & Dye 2003) between a mapper object
+    and a linear func object, using the unique mappings between data pixels and pixelization pixels in compressed
+    sparse row (CSR) format.
+
+    This computes the same quantity as
+    `curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_from`, but iterates over the contiguous
+    CSR arrays as opposed to padded 2D arrays.
+
+    Parameters
+    ----------
+    offsets
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`
+        (see `data_slim_to_pixelization_unique_csr_from`).
+    indexes
+        The pixelization pixel index of every unique mapping between a set of data sub-pixels and a pixelization pixel.
+    weights
+        For every unique mapping between a set of data sub-pixels and a pixelization pixel, the weight of these mapping
+        based on the number of sub-pixels that map to pixelization pixel.
+    pix_pixels
+        The total number of pixels in the pixelization that reconstructs the data.
+    curvature_weights
+        The operated values of the linear func divided by the noise-map squared.
+    image_frame_indexes
+        The indexes of all masked pixels that the PSF blurs light into (see the `Convolver` object).
+    image_frame_kernels
+        The kernel values of all masked pixels that the PSF blurs light into (see the `Convolver` object).
+    image_frame_length
+        The number of masked pixels it will blur light into (unmasked pixels are excluded, see the `Convolver` object).
+
+    Returns
+    -------
+    ndarray
+        The curvature matrix `F` (see Warren & Dye 2003).
+    """
+
+    data_pixels = offsets.shape[0] - 1
     linear_func_pixels = curvature_weights.shape[1]
 
     off_diag = np.zeros((pix_pixels, linear_func_pixels))
 
     for data_0 in range(data_pixels):
-        for pix_0_index in range(pix_lengths[data_0]):
-            data_0_weight = data_weights[data_0, pix_0_index]
-            pix_0 = data_to_pix_unique[data_0, pix_0_index]
+        for index in range(offsets[data_0], offsets[data_0 + 1]):
+            data_0_weight = weights[index]
+            pix_0 = indexes[index]
 
             for psf_index in range(image_frame_1d_lengths[data_0]):
                 data_index = image_frame_1d_indexes[data_0, psf_index]
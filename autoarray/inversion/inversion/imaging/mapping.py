@@ -2,10 +2,12 @@ import copy
 import numpy as np
 from typing import Dict, List, Optional, Union
 
+from autoconf import conf
 from autoconf import cached_property
 
 from autoarray.numba_util import profile_func
 
+from autoarray.dataset.abstract.noise_covariance import AbstractNoiseCovariance
 from autoarray.dataset.imaging.dataset import Imaging
 from autoarray.inversion.inversion.dataset_interface import DatasetInterface
 from autoarray.inversion.inversion.imaging.abstract import AbstractInversionImaging
@@ -59,6 +61,19 @@ class InversionImagingMapping(AbstractInversionImaging):
             run_time_dict=run_time_dict,
         )
 
+    @property
+    def noise_covariance(self) -> Optional[AbstractNoiseCovariance]:
+        """
+        The structured noise covariance of the dataset (e.g. `NoiseCovarianceSparse`), if it has one.
+
+        If so, the `data_vector` and `curvature_matrix` account for the covariance between the noise of every
+        image pixel, via `C^-1` computed from its factorization, instead of using the noise-map.
+        """
+        noise_covariance_matrix = getattr(self.dataset, "noise_covariance_matrix", None)
+
+        if isinstance(noise_covariance_matrix, AbstractNoiseCovariance):
+            return noise_covariance_matrix
+
     @property
     @profile_func
     def _data_vector_mapper(self) -> np.ndarray:
@@ -76,7 +91,7 @@ class InversionImagingMapping(AbstractInversionImaging):
         if not self.has(cls=AbstractMapper):
             return None
 
-        data_vector = np.zeros(self.total_params)
+        data_vector = self._array_from(name="data_vector", shape=(self.total_params,))
 
         mapper_list = self.cls_list_from(cls=AbstractMapper)
         mapper_param_range_list = self.param_range_list_from(cls=AbstractMapper)
@@ -89,13 +104,22 @@ class InversionImagingMapping(AbstractInversionImaging):
                 mapping_matrix=mapper.mapping_matrix
             )
 
-            data_vector_mapper = (
-                inversion_imaging_util.data_vector_via_blurred_mapping_matrix_from(
-                    blurred_mapping_matrix=operated_mapping_matrix,
-                    image=self.data,
-                    noise_map=self.noise_map,
+            if self.noise_covariance is not None:
+                data_vector_mapper = (
+                    inversion_util.data_vector_via_noise_covariance_from(
+                        mapping_matrix=operated_mapping_matrix,
+                        data=np.array(self.data),
+                        noise_covariance=self.noise_covariance,
+                    )
+                )
+            else:
+                data_vector_mapper = (
+                    inversion_imaging_util.data_vector_via_blurred_mapping_matrix_from(
+                        blurred_mapping_matrix=operated_mapping_matrix,
+                        image=self.data,
+                        noise_map=self.noise_map,
+                    )
                 )
-            )
 
             data_vector[param_range[0] : param_range[1],] = data_vector_mapper
 
@@ -125,6 +149,13 @@ class InversionImagingMapping(AbstractInversionImaging):
         else:
             operated_mapping_matrix = self.operated_mapping_matrix
 
+        if self.noise_covariance is not None:
+            return inversion_util.data_vector_via_noise_covariance_from(
+                mapping_matrix=operated_mapping_matrix,
+                data=np.array(self.data),
+                noise_covariance=self.noise_covariance,
+            )
+
         return inversion_imaging_util.data_vector_via_blurred_mapping_matrix_from(
             blurred_mapping_matrix=operated_mapping_matrix,
             image=np.array(self.data),
@@ -149,7 +180,10 @@ class InversionImagingMapping(AbstractInversionImaging):
         if not self.has(cls=AbstractMapper):
             return None
 
-        curvature_matrix = np.zeros((self.total_params, self.total_params))
+        curvature_matrix = self._array_from(
+            name="curvature_matrix_mapper_diag",
+            shape=(self.total_params, self.total_params),
+        )
 
         mapper_list = self.cls_list_from(cls=AbstractMapper)
         mapper_param_range_list = self.param_range_list_from(cls=AbstractMapper)
@@ -162,20 +196,29 @@ class InversionImagingMapping(AbstractInversionImaging):
                 mapping_matrix=mapper_i.mapping_matrix
             )
 
-            diag = inversion_util.curvature_matrix_via_mapping_matrix_from(
-                mapping_matrix=operated_mapping_matrix,
-                noise_map=self.noise_map,
-                settings=self.settings,
-                add_to_curvature_diag=True,
-                no_regularization_index_list=self.no_regularization_index_list,
-            )
+            if self.noise_covariance is not None:
+                diag = inversion_util.curvature_matrix_via_noise_covariance_from(
+                    mapping_matrix=operated_mapping_matrix,
+                    noise_covariance=self.noise_covariance,
+                    settings=self.settings,
+                    add_to_curvature_diag=True,
+                    no_regularization_index_list=self.no_regularization_index_list,
+                )
+            else:
+                diag = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                    mapping_matrix=operated_mapping_matrix,
+                    noise_map=self.noise_map,
+                    settings=self.settings,
+                    add_to_curvature_diag=True,
+                    no_regularization_index_list=self.no_regularization_index_list,
+                )
 
             curvature_matrix[
                 mapper_param_range_i[0] : mapper_param_range_i[1],
                 mapper_param_range_i[0] : mapper_param_range_i[1],
             ] = diag
 
-        curvature_matrix = inversion_util.curvature_matrix_mirrored_from(
+        curvature_matrix = inversion_util.curvature_matrix_mirrored_in_place_from(
             curvature_matrix=curvature_matrix
         )
 
@@ -206,12 +249,28 @@ class InversionImagingMapping(AbstractInversionImaging):
 
             return copy.copy(self.preloads.curvature_matrix)
 
+        if self.noise_covariance is not None:
+            return inversion_util.curvature_matrix_via_noise_covariance_from(
+                mapping_matrix=self.operated_mapping_matrix,
+                noise_covariance=self.noise_covariance,
+                settings=self.settings,
+                add_to_curvature_diag=True,
+                no_regularization_index_list=self.no_regularization_index_list,
+            )
+
+        operated_mapping_matrix = self.operated_mapping_matrix
+
         return inversion_util.curvature_matrix_via_mapping_matrix_from(
-            mapping_matrix=self.operated_mapping_matrix,
+            mapping_matrix=operated_mapping_matrix,
             noise_map=self.noise_map,
             settings=self.settings,
             add_to_curvature_diag=True,
             no_regularization_index_list=self.no_regularization_index_list,
+            curvature_matrix=self._array_from(
+                name="curvature_matrix",
+                shape=(operated_mapping_matrix.shape[1],) * 2,
+                zeroed=False,
+            ),
         )
 
     @property
@@ -248,6 +307,8 @@ class InversionImagingMapping(AbstractInversionImaging):
 
         operated_mapping_matrix_list = self.operated_mapping_matrix_list
 
+        store_native = conf.instance["general"]["structures"]["native_binned_only"]
+
         for index, linear_obj in enumerate(self.linear_obj_list):
             reconstruction = reconstruction_dict[linear_obj]
 
@@ -258,8 +319,10 @@ class InversionImagingMapping(AbstractInversionImaging):
                 )
             )
 
-            mapped_reconstructed_image = Array2D(
-                values=mapped_reconstructed_image, mask=self.mask
+            mapped_reconstructed_image = Array2D._from_slim_unchecked(
+                values=mapped_reconstructed_image,
+                mask=self.mask,
+                store_native=store_native,
             )
 
             mapped_reconstructed_data_dict[linear_obj] = mapped_reconstructed_image
@@ -1,7 +1,10 @@
 import copy
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import numpy as np
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from autoconf import conf
 from autoconf import cached_property
 
 from autoarray.numba_util import profile_func
@@ -13,6 +16,7 @@ from autoarray.inversion.inversion.imaging.abstract import AbstractInversionImag
 from autoarray.inversion.linear_obj.linear_obj import LinearObj
 from autoarray.inversion.inversion.settings import SettingsInversion
 from autoarray.inversion.linear_obj.func_list import AbstractLinearObjFuncList
+from autoarray.inversion.linear_obj.unique_mappings import UniqueMappings
 from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
 from autoarray.preloads import Preloads
 from autoarray.structures.arrays.uniform_2d import Array2D
@@ -100,18 +104,18 @@ class InversionImagingWTilde(AbstractInversionImaging):
         if not self.has(cls=AbstractMapper):
             return None
 
-        data_vector = np.zeros(self.total_params)
+        data_vector = self._array_from(name="data_vector", shape=(self.total_params,))
 
         mapper_list = self.cls_list_from(cls=AbstractMapper)
         mapper_param_range = self.param_range_list_from(cls=AbstractMapper)
 
         for mapper_index, mapper in enumerate(mapper_list):
             data_vector_mapper = (
-                inversion_imaging_util.data_vector_via_w_tilde_data_imaging_from(
+                inversion_imaging_util.data_vector_via_w_tilde_data_imaging_csr_from(
                     w_tilde_data=self.w_tilde_data,
-                    data_to_pix_unique=mapper.unique_mappings.data_to_pix_unique,
-                    data_weights=mapper.unique_mappings.data_weights,
-                    pix_lengths=mapper.unique_mappings.pix_lengths,
+                    offsets=mapper.unique_mappings.offsets,
+                    indexes=mapper.unique_mappings.indexes,
+                    weights=mapper.unique_mappings.weights,
                     pix_pixels=mapper.params,
                 )
             )
@@ -158,11 +162,11 @@ class InversionImagingWTilde(AbstractInversionImaging):
 
         linear_obj = self.linear_obj_list[0]
 
-        return inversion_imaging_util.data_vector_via_w_tilde_data_imaging_from(
+        return inversion_imaging_util.data_vector_via_w_tilde_data_imaging_csr_from(
             w_tilde_data=self.w_tilde_data,
-            data_to_pix_unique=linear_obj.unique_mappings.data_to_pix_unique,
-            data_weights=linear_obj.unique_mappings.data_weights,
-            pix_lengths=linear_obj.unique_mappings.pix_lengths,
+            offsets=linear_obj.unique_mappings.offsets,
+            indexes=linear_obj.unique_mappings.indexes,
+            weights=linear_obj.unique_mappings.weights,
             pix_pixels=linear_obj.params,
         )
 
@@ -182,11 +186,11 @@ class InversionImagingWTilde(AbstractInversionImaging):
 
         return np.concatenate(
             [
-                inversion_imaging_util.data_vector_via_w_tilde_data_imaging_from(
+                inversion_imaging_util.data_vector_via_w_tilde_data_imaging_csr_from(
                     w_tilde_data=self.w_tilde_data,
-                    data_to_pix_unique=linear_obj.unique_mappings.data_to_pix_unique,
-                    data_weights=linear_obj.unique_mappings.data_weights,
-                    pix_lengths=linear_obj.unique_mappings.pix_lengths,
+                    offsets=linear_obj.unique_mappings.offsets,
+                    indexes=linear_obj.unique_mappings.indexes,
+                    weights=linear_obj.unique_mappings.weights,
                     pix_pixels=linear_obj.params,
                 )
                 for linear_obj in self.linear_obj_list
@@ -267,7 +271,7 @@ class InversionImagingWTilde(AbstractInversionImaging):
         else:
             curvature_matrix = self._curvature_matrix_multi_mapper
 
-        curvature_matrix = inversion_util.curvature_matrix_mirrored_from(
+        curvature_matrix = inversion_util.curvature_matrix_mirrored_in_place_from(
             curvature_matrix=curvature_matrix
         )
 
@@ -290,46 +294,175 @@ class InversionImagingWTilde(AbstractInversionImaging):
 
         This method computes the diagonal entries of all mapper objects in the `curvature_matrix`. It is separate from
         other calculations to enable preloading of this calculation.
+
+        The matrix is computed in its own buffer, as opposed to the buffer of the `curvature_matrix`, so that
+        accessing it (e.g. via `Preloads.set_curvature_matrix_mapper_diag`) does not overwrite the inversion's
+        `curvature_matrix`.
+        """
+        return self._curvature_matrix_mapper_diag_from(
+            name="curvature_matrix_mapper_diag"
+        )
+
+    def _curvature_matrix_mapper_diag_from(self, name: str) -> Optional[np.ndarray]:
+        """
+        Returns the diagonal regions of the `curvature_matrix` (see `_curvature_matrix_mapper_diag`), computed in
+        the preallocated buffer of shape [total_params, total_params] of the input name.
+
+        The `curvature_matrix` is computed by inputting the name `curvature_matrix`, such that the off-diagonal blocks
+        are subsequently written into the same buffer. The diagonal block of every mapper is computed directly in this
+        buffer, which is reused between inversions if the `preloads` have an `InversionWorkspace`.
+
+        A preloaded `curvature_matrix_mapper_diag` is copied into this buffer, because the buffer is subsequently
+        modified in place.
+
+        Parameters
+        ----------
+        name
+            The name of the buffer of the inversion's workspace the matrix is computed in.
         """
 
         if self.preloads.curvature_matrix_mapper_diag is not None:
-            return self.preloads.curvature_matrix_mapper_diag
+            curvature_matrix = self._array_from(
+                name=name,
+                shape=self.preloads.curvature_matrix_mapper_diag.shape,
+                zeroed=False,
+            )
+            np.copyto(curvature_matrix, self.preloads.curvature_matrix_mapper_diag)
+
+            return curvature_matrix
 
         if not self.has(cls=AbstractMapper):
             return None
 
-        curvature_matrix = np.zeros((self.total_params, self.total_params))
+        curvature_matrix = self._array_from(
+            name=name, shape=(self.total_params, self.total_params)
+        )
 
         mapper_list = self.cls_list_from(cls=AbstractMapper)
         mapper_param_range_list = self.param_range_list_from(cls=AbstractMapper)
 
-        for i in range(len(mapper_list)):
-            mapper_i = mapper_list[i]
-            mapper_param_range_i = mapper_param_range_list[i]
+        unique_mappings_list = [mapper.unique_mappings for mapper in mapper_list]
+
+        block_list = [
+            (
+                mapper_param_range,
+                mapper_param_range,
+                functools.partial(
+                    self._curvature_matrix_diag_from,
+                    unique_mappings=unique_mappings,
+                    pix_pixels=mapper.params,
+                    curvature_matrix=curvature_matrix[
+                        mapper_param_range[0] : mapper_param_range[1],
+                        mapper_param_range[0] : mapper_param_range[1],
+                    ],
+                ),
+            )
+            for mapper, unique_mappings, mapper_param_range in zip(
+                mapper_list, unique_mappings_list, mapper_param_range_list
+            )
+        ]
+
+        self._curvature_matrix_blocks_fill(
+            curvature_matrix=curvature_matrix, block_list=block_list
+        )
 
-            diag = inversion_imaging_util.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+        return curvature_matrix
+
+    def _curvature_matrix_diag_from(
+        self,
+        unique_mappings: UniqueMappings,
+        pix_pixels: int,
+        curvature_matrix: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        The `curvature_matrix` is a 2D matrix which uses the mappings between the data and the linear objects to
+        construct the simultaneous linear equations.
+
+        This function computes the diagonal block of F corresponding to a single mapper using the w_tilde formalism,
+        from the mapper's `unique_mappings` and number of pixels.
+
+        If the region of the `curvature_matrix` the block belongs in is input, the block is computed in place in this
+        region and `None` is returned, such that `_curvature_matrix_blocks_fill` does not copy it.
+        """
+        if curvature_matrix is None:
+            return inversion_imaging_util.curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from(
                 curvature_preload=self.w_tilde.curvature_preload,
                 curvature_indexes=self.w_tilde.indexes,
                 curvature_lengths=self.w_tilde.lengths,
-                data_to_pix_unique=mapper_i.unique_mappings.data_to_pix_unique,
-                data_weights=mapper_i.unique_mappings.data_weights,
-                pix_lengths=mapper_i.unique_mappings.pix_lengths,
-                pix_pixels=mapper_i.params,
+                offsets=unique_mappings.offsets,
+                indexes=unique_mappings.indexes,
+                weights=unique_mappings.weights,
+                pix_pixels=pix_pixels,
             )
 
+        inversion_imaging_util.curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_in_place_from(
+            curvature_matrix=curvature_matrix,
+            curvature_preload=self.w_tilde.curvature_preload,
+            curvature_indexes=self.w_tilde.indexes,
+            curvature_lengths=self.w_tilde.lengths,
+            offsets=unique_mappings.offsets,
+            indexes=unique_mappings.indexes,
+            weights=unique_mappings.weights,
+        )
+
+    def _curvature_matrix_blocks_fill(
+        self,
+        curvature_matrix: np.ndarray,
+        block_list: List[Tuple[Tuple[int, int], Tuple[int, int], Callable]],
+    ):
+        """
+        Computes blocks of the `curvature_matrix` and writes each into its region of the preallocated
+        `curvature_matrix` buffer in place.
+
+        Every entry of `block_list` is a tuple containing the parameter range of the block's rows, the parameter range
+        of its columns and a function which computes the block. Only one block of every symmetric pair of blocks
+        is passed to this function, the other being filled in afterwards when the `curvature_matrix` is mirrored.
+        A function which writes its block into the `curvature_matrix` itself returns `None`.
+
+        Blocks cover disjoint regions of the buffer, therefore if `settings.curvature_matrix_workers` is above 1 they
+        are computed concurrently in a thread pool. The numba functions which compute each block release the GIL,
+        such that the blocks are computed in parallel.
+
+        Blocks are always computed serially when profiling, because `profile_func` is not thread safe.
+
+        Parameters
+        ----------
+        curvature_matrix
+            The preallocated buffer of shape [total_params, total_params] the blocks are written into.
+        block_list
+            The row parameter range, column parameter range and function computing every block.
+        """
+
+        def block_fill(block):
+            param_range_0, param_range_1, block_func = block
+
+            values = block_func()
+
+            if values is None:
+                return
+
             curvature_matrix[
-                mapper_param_range_i[0] : mapper_param_range_i[1],
-                mapper_param_range_i[0] : mapper_param_range_i[1],
-            ] = diag
+                param_range_0[0] : param_range_0[1],
+                param_range_1[0] : param_range_1[1],
+            ] = values
 
-            if self.total(cls=AbstractMapper) == 1:
-                return curvature_matrix
+        workers = min(self.settings.curvature_matrix_workers, len(block_list))
 
-        return curvature_matrix
+        if workers <= 1 or self.run_time_dict is not None:
+            for block in block_list:
+                block_fill(block)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(block_fill, block_list))
 
     @profile_func
     def _curvature_matrix_off_diag_from(
-        self, mapper_0: AbstractMapper, mapper_1: AbstractMapper
+        self,
+        unique_mappings_0: UniqueMappings,
+        pix_pixels_0: int,
+        unique_mappings_1: UniqueMappings,
+        pix_pixels_1: int,
     ) -> np.ndarray:
         """
         The `curvature_matrix` is a 2D matrix which uses the mappings between the data and the linear objects to
@@ -338,35 +471,36 @@ class InversionImagingWTilde(AbstractInversionImaging):
         The linear algebra is described in the paper https://arxiv.org/pdf/astro-ph/0302587.pdf, where the
         curvature matrix given by equation (4) and the letter F.
 
-        This function computes the off-diagonal terms of F using the w_tilde formalism.
+        This function computes the off-diagonal terms of F between two mappers using the w_tilde formalism, from
+        each mapper's `unique_mappings` and number of pixels.
         """
 
-        curvature_matrix_off_diag_0 = inversion_imaging_util.curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
+        curvature_matrix_off_diag_0 = inversion_imaging_util.curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_csr_from(
             curvature_preload=self.w_tilde.curvature_preload,
             curvature_indexes=self.w_tilde.indexes,
             curvature_lengths=self.w_tilde.lengths,
-            data_to_pix_unique_0=mapper_0.unique_mappings.data_to_pix_unique,
-            data_weights_0=mapper_0.unique_mappings.data_weights,
-            pix_lengths_0=mapper_0.unique_mappings.pix_lengths,
-            pix_pixels_0=mapper_0.params,
-            data_to_pix_unique_1=mapper_1.unique_mappings.data_to_pix_unique,
-            data_weights_1=mapper_1.unique_mappings.data_weights,
-            pix_lengths_1=mapper_1.unique_mappings.pix_lengths,
-            pix_pixels_1=mapper_1.params,
+            offsets_0=unique_mappings_0.offsets,
+            indexes_0=unique_mappings_0.indexes,
+            weights_0=unique_mappings_0.weights,
+            pix_pixels_0=pix_pixels_0,
+            offsets_1=unique_mappings_1.offsets,
+            indexes_1=unique_mappings_1.indexes,
+            weights_1=unique_mappings_1.weights,
+            pix_pixels_1=pix_pixels_1,
         )
 
-        curvature_matrix_off_diag_1 = inversion_imaging_util.curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_from(
+        curvature_matrix_off_diag_1 = inversion_imaging_util.curvature_matrix_off_diags_via_w_tilde_curvature_preload_imaging_csr_from(
             curvature_preload=self.w_tilde.curvature_preload,
             curvature_indexes=self.w_tilde.indexes,
             curvature_lengths=self.w_tilde.lengths,
-            data_to_pix_unique_0=mapper_1.unique_mappings.data_to_pix_unique,
-            data_weights_0=mapper_1.unique_mappings.data_weights,
-            pix_lengths_0=mapper_1.unique_mappings.pix_lengths,
-            pix_pixels_0=mapper_1.params,
-            data_to_pix_unique_1=mapper_0.unique_mappings.data_to_pix_unique,
-            data_weights_1=mapper_0.unique_mappings.data_weights,
-            pix_lengths_1=mapper_0.unique_mappings.pix_lengths,
-            pix_pixels_1=mapper_0.params,
+            offsets_0=unique_mappings_1.offsets,
+            indexes_0=unique_mappings_1.indexes,
+            weights_0=unique_mappings_1.weights,
+            pix_pixels_0=pix_pixels_1,
+            offsets_1=unique_mappings_0.offsets,
+            indexes_1=unique_mappings_0.indexes,
+            weights_1=unique_mappings_0.weights,
+            pix_pixels_1=pix_pixels_0,
         )
 
         return curvature_matrix_off_diag_0 + curvature_matrix_off_diag_1.T
@@ -381,7 +515,7 @@ class InversionImagingWTilde(AbstractInversionImaging):
         This method computes the `curvature_matrix` when there is a single mapper object in the `Inversion`,
         which circumvents `block_diag` for speed up.
         """
-        return self._curvature_matrix_mapper_diag
+        return self._curvature_matrix_mapper_diag_from(name="curvature_matrix")
 
     @property
     @profile_func
@@ -391,10 +525,14 @@ class InversionImagingWTilde(AbstractInversionImaging):
         construct the simultaneous linear equations. The object is described in full in the method `curvature_matrix`.
 
         This method computes the `curvature_matrix` when there are multiple mapper objects in the `Inversion`,
-        by computing each one (and their off-diagonal matrices) and combining them via the `block_diag` method.
+        by computing each one (and their off-diagonal matrices) and writing them into a single matrix. Only the
+        off-diagonal blocks above the diagonal are computed, which may be computed concurrently
+        (see `_curvature_matrix_blocks_fill`).
         """
 
-        curvature_matrix = self._curvature_matrix_mapper_diag
+        curvature_matrix = self._curvature_matrix_mapper_diag_from(
+            name="curvature_matrix"
+        )
 
         if self.total(cls=AbstractMapper) == 1:
             return curvature_matrix
@@ -402,22 +540,27 @@ class InversionImagingWTilde(AbstractInversionImaging):
         mapper_list = self.cls_list_from(cls=AbstractMapper)
         mapper_param_range_list = self.param_range_list_from(cls=AbstractMapper)
 
-        for i in range(len(mapper_list)):
-            mapper_i = mapper_list[i]
-            mapper_param_range_i = mapper_param_range_list[i]
-
-            for j in range(i + 1, len(mapper_list)):
-                mapper_j = mapper_list[j]
-                mapper_param_range_j = mapper_param_range_list[j]
-
-                off_diag = self._curvature_matrix_off_diag_from(
-                    mapper_0=mapper_i, mapper_1=mapper_j
-                )
+        unique_mappings_list = [mapper.unique_mappings for mapper in mapper_list]
+
+        block_list = [
+            (
+                mapper_param_range_list[i],
+                mapper_param_range_list[j],
+                functools.partial(
+                    self._curvature_matrix_off_diag_from,
+                    unique_mappings_0=unique_mappings_list[i],
+                    pix_pixels_0=mapper_list[i].params,
+                    unique_mappings_1=unique_mappings_list[j],
+                    pix_pixels_1=mapper_list[j].params,
+                ),
+            )
+            for i in range(len(mapper_list))
+            for j in range(i + 1, len(mapper_list))
+        ]
 
-                curvature_matrix[
-                    mapper_param_range_i[0] : mapper_param_range_i[1],
-                    mapper_param_range_j[0] : mapper_param_range_j[1],
-                ] = off_diag
+        self._curvature_matrix_blocks_fill(
+            curvature_matrix=curvature_matrix, block_list=block_list
+        )
 
         return curvature_matrix
 
@@ -444,84 +587,111 @@ class InversionImagingWTilde(AbstractInversionImaging):
             cls=AbstractLinearObjFuncList
         )
 
-        for i in range(len(mapper_list)):
-            mapper = mapper_list[i]
-            mapper_param_range = mapper_param_range_list[i]
-
-            for func_index, linear_func in enumerate(linear_func_list):
-                linear_func_param_range = linear_func_param_range_list[func_index]
-
-                if self.preloads.data_linear_func_matrix_dict is not None:
-                    off_diag = inversion_imaging_util.curvature_matrix_off_diags_via_data_linear_func_matrix_from(
-                        data_linear_func_matrix=self.data_linear_func_matrix_dict[
-                            linear_func
-                        ],
-                        data_to_pix_unique=mapper.unique_mappings.data_to_pix_unique,
-                        data_weights=mapper.unique_mappings.data_weights,
-                        pix_lengths=mapper.unique_mappings.pix_lengths,
-                        pix_pixels=mapper.params,
-                    )
-
-                elif self.preloads.mapper_operated_mapping_matrix_dict is not None:
-                    operated_mapping_matrix = self.mapper_operated_mapping_matrix_dict[
-                        mapper
-                    ]
-
-                    curvature_weights = (
-                        self.linear_func_operated_mapping_matrix_dict[linear_func]
-                    ) / self.noise_map[:, None] ** 2
+        data_linear_func_matrix_dict = (
+            self.data_linear_func_matrix_dict
+            if self.preloads.data_linear_func_matrix_dict is not None
+            else None
+        )
 
-                    off_diag = np.dot(operated_mapping_matrix.T, curvature_weights)
+        mapper_operated_mapping_matrix_dict = (
+            self.mapper_operated_mapping_matrix_dict
+            if self.preloads.mapper_operated_mapping_matrix_dict is not None
+            else None
+        )
 
-                else:
-                    curvature_weights = (
-                        self.linear_func_operated_mapping_matrix_dict[linear_func]
-                        / self.noise_map[:, None] ** 2
+        unique_mappings_list = [mapper.unique_mappings for mapper in mapper_list]
+
+        block_list = [
+            (
+                mapper_param_range,
+                linear_func_param_range,
+                functools.partial(
+                    self._curvature_matrix_mapper_func_off_diag_from,
+                    mapper=mapper,
+                    unique_mappings=unique_mappings,
+                    linear_func=linear_func,
+                    data_linear_func_matrix_dict=data_linear_func_matrix_dict,
+                    mapper_operated_mapping_matrix_dict=mapper_operated_mapping_matrix_dict,
+                ),
+            )
+            for mapper, unique_mappings, mapper_param_range in zip(
+                mapper_list, unique_mappings_list, mapper_param_range_list
+            )
+            for linear_func, linear_func_param_range in zip(
+                linear_func_list, linear_func_param_range_list
+            )
+        ]
+
+        weighted_vector_list = [
+            self.linear_func_operated_mapping_matrix_dict[linear_func]
+            / self.noise_map[:, None]
+            for linear_func in linear_func_list
+        ]
+
+        for index_0 in range(len(linear_func_list)):
+            for index_1 in range(index_0, len(linear_func_list)):
+                block_list.append(
+                    (
+                        linear_func_param_range_list[index_0],
+                        linear_func_param_range_list[index_1],
+                        functools.partial(
+                            np.dot,
+                            weighted_vector_list[index_0].T,
+                            weighted_vector_list[index_1],
+                        ),
                     )
+                )
 
-                    off_diag = inversion_imaging_util.curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_from(
-                        data_to_pix_unique=mapper.unique_mappings.data_to_pix_unique,
-                        data_weights=mapper.unique_mappings.data_weights,
-                        pix_lengths=mapper.unique_mappings.pix_lengths,
-                        pix_pixels=mapper.params,
-                        curvature_weights=curvature_weights,
-                        image_frame_1d_lengths=self.convolver.image_frame_1d_lengths,
-                        image_frame_1d_indexes=self.convolver.image_frame_1d_indexes,
-                        image_frame_1d_kernels=self.convolver.image_frame_1d_kernels,
-                    )
+        self._curvature_matrix_blocks_fill(
+            curvature_matrix=curvature_matrix, block_list=block_list
+        )
 
-                curvature_matrix[
-                    mapper_param_range[0] : mapper_param_range[1],
-                    linear_func_param_range[0] : linear_func_param_range[1],
-                ] = off_diag
+        return curvature_matrix
 
-        for index_0, linear_func_0 in enumerate(linear_func_list):
-            linear_func_param_range_0 = linear_func_param_range_list[index_0]
+    def _curvature_matrix_mapper_func_off_diag_from(
+        self,
+        mapper: AbstractMapper,
+        unique_mappings: UniqueMappings,
+        linear_func: AbstractLinearObjFuncList,
+        data_linear_func_matrix_dict: Optional[Dict] = None,
+        mapper_operated_mapping_matrix_dict: Optional[Dict] = None,
+    ) -> np.ndarray:
+        """
+        The `curvature_matrix` is a 2D matrix which uses the mappings between the data and the linear objects to
+        construct the simultaneous linear equations.
 
-            weighted_vector_0 = (
-                self.linear_func_operated_mapping_matrix_dict[linear_func_0]
-                / self.noise_map[:, None]
+        This function computes the off-diagonal block of F between a mapper and a linear func object, using the
+        preloaded `data_linear_func_matrix_dict` or `mapper_operated_mapping_matrix_dict` if they are input.
+        """
+        if data_linear_func_matrix_dict is not None:
+            return inversion_imaging_util.curvature_matrix_off_diags_via_data_linear_func_matrix_csr_from(
+                data_linear_func_matrix=data_linear_func_matrix_dict[linear_func],
+                offsets=unique_mappings.offsets,
+                indexes=unique_mappings.indexes,
+                weights=unique_mappings.weights,
+                pix_pixels=mapper.params,
             )
 
-            for index_1, linear_func_1 in enumerate(linear_func_list):
-                linear_func_param_range_1 = linear_func_param_range_list[index_1]
-
-                weighted_vector_1 = (
-                    self.linear_func_operated_mapping_matrix_dict[linear_func_1]
-                    / self.noise_map[:, None]
-                )
+        curvature_weights = (
+            self.linear_func_operated_mapping_matrix_dict[linear_func]
+            / self.noise_map[:, None] ** 2
+        )
 
-                diag = np.dot(
-                    weighted_vector_0.T,
-                    weighted_vector_1,
-                )
+        if mapper_operated_mapping_matrix_dict is not None:
+            operated_mapping_matrix = mapper_operated_mapping_matrix_dict[mapper]
 
-                curvature_matrix[
-                    linear_func_param_range_0[0] : linear_func_param_range_0[1],
-                    linear_func_param_range_1[0] : linear_func_param_range_1[1],
-                ] = diag
+            return np.dot(operated_mapping_matrix.T, curvature_weights)
 
-        return curvature_matrix
+        return inversion_imaging_util.curvature_matrix_off_diags_via_mapper_and_linear_func_curvature_vector_csr_from(
+            offsets=unique_mappings.offsets,
+            indexes=unique_mappings.indexes,
+            weights=unique_mappings.weights,
+            pix_pixels=mapper.params,
+            curvature_weights=curvature_weights,
+            image_frame_1d_lengths=self.convolver.image_frame_1d_lengths,
+            image_frame_1d_indexes=self.convolver.image_frame_1d_indexes,
+            image_frame_1d_kernels=self.convolver.image_frame_1d_kernels,
+        )
 
     @property
     @profile_func
@@ -556,19 +726,23 @@ class InversionImagingWTilde(AbstractInversionImaging):
             source_quantity=self.reconstruction
         )
 
+        store_native = conf.instance["general"]["structures"]["native_binned_only"]
+
         for linear_obj in self.linear_obj_list:
             reconstruction = reconstruction_dict[linear_obj]
 
             if isinstance(linear_obj, AbstractMapper):
-                mapped_reconstructed_image = inversion_util.mapped_reconstructed_data_via_image_to_pix_unique_from(
-                    data_to_pix_unique=linear_obj.unique_mappings.data_to_pix_unique,
-                    data_weights=linear_obj.unique_mappings.data_weights,
-                    pix_lengths=linear_obj.unique_mappings.pix_lengths,
+                mapped_reconstructed_image = inversion_util.mapped_reconstructed_data_via_image_to_pix_unique_csr_from(
+                    offsets=linear_obj.unique_mappings.offsets,
+                    indexes=linear_obj.unique_mappings.indexes,
+                    weights=linear_obj.unique_mappings.weights,
                     reconstruction=reconstruction,
                 )
 
-                mapped_reconstructed_image = Array2D(
-                    values=mapped_reconstructed_image, mask=self.mask
+                mapped_reconstructed_image = Array2D._from_slim_unchecked(
+                    values=mapped_reconstructed_image,
+                    mask=self.mask,
+                    store_native=store_native,
                 )
 
                 mapped_reconstructed_image = self.convolver.convolve_image_no_blurring(
@@ -584,8 +758,10 @@ class InversionImagingWTilde(AbstractInversionImaging):
                     reconstruction * operated_mapping_matrix, axis=1
                 )
 
-                mapped_reconstructed_image = Array2D(
-                    values=mapped_reconstructed_image, mask=self.mask
+                mapped_reconstructed_image = Array2D._from_slim_unchecked(
+                    values=mapped_reconstructed_image,
+                    mask=self.mask,
+                    store_native=store_native,
                 )
 
             mapped_reconstructed_data_dict[linear_obj] = mapped_reconstructed_image
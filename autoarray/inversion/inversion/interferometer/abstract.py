@@ -1,6 +1,8 @@
 import numpy as np
 from typing import Dict, List, Optional, Union
 
+from autoconf import conf
+
 from autoarray.dataset.interferometer.dataset import Interferometer
 from autoarray.inversion.inversion.dataset_interface import DatasetInterface
 from autoarray.inversion.inversion.abstract import AbstractInversion
@@ -114,6 +116,8 @@ class AbstractInversionInterferometer(AbstractInversion):
             source_quantity=self.reconstruction
         )
 
+        store_native = conf.instance["general"]["structures"]["native_binned_only"]
+
         for linear_obj in self.linear_obj_list:
             reconstruction = reconstruction_dict[linear_obj]
 
@@ -124,8 +128,10 @@ class AbstractInversionInterferometer(AbstractInversion):
                 )
             )
 
-            mapped_reconstructed_image = Array2D(
-                values=mapped_reconstructed_image, mask=self.mask
+            mapped_reconstructed_image = Array2D._from_slim_unchecked(
+                values=mapped_reconstructed_image,
+                mask=self.mask,
+                store_native=store_native,
             )
 
             mapped_reconstructed_image_dict[linear_obj] = mapped_reconstructed_image
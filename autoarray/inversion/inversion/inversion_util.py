@@ -8,6 +8,7 @@ from autoarray.inversion.inversion.settings import SettingsInversion
 
 from autoarray import numba_util
 from autoarray import exc
+from autoarray.inversion.pixelization.mappers import mapper_util
 from autoarray.util.fnnls import fnnls_cholesky
 
 
@@ -86,12 +87,46 @@ def curvature_matrix_mirrored_from(
     return curvature_matrix_mirrored
 
 
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[:, ::1],)",
+    ],
+)
+def curvature_matrix_mirrored_in_place_from(
+    curvature_matrix: np.ndarray,
+) -> np.ndarray:
+    """
+    Mirror the entries of a curvature matrix whose blocks have only been computed on one side of the diagonal,
+    writing them into the input matrix instead of a new matrix.
+
+    This gives the same matrix as `curvature_matrix_mirrored_from`, where for every pair of entries `[i, j]` and
+    `[j, i]` the non-zero value of entry `[i, j]` takes precedence.
+
+    Parameters
+    ----------
+    curvature_matrix
+        The curvature matrix which is mirrored in place.
+    """
+    for i in range(curvature_matrix.shape[0]):
+        for j in range(i + 1, curvature_matrix.shape[1]):
+            value = curvature_matrix[i, j]
+
+            if value == 0:
+                value = curvature_matrix[j, i]
+
+            curvature_matrix[i, j] = value
+            curvature_matrix[j, i] = value
+
+    return curvature_matrix
+
+
 def curvature_matrix_via_mapping_matrix_from(
     mapping_matrix: np.ndarray,
     noise_map: np.ndarray,
     add_to_curvature_diag: bool = False,
     no_regularization_index_list: Optional[List] = None,
     settings: SettingsInversion = SettingsInversion(),
+    curvature_matrix: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Returns the curvature matrix `F` from a blurred mapping matrix `f` and the 1D noise-map $\sigma$
@@ -104,9 +139,12 @@ def curvature_matrix_via_mapping_matrix_from(
         pixelization pixels.
     noise_map
         Flattened 1D array of the noise-map used by the inversion during the fit.
+    curvature_matrix
+        A C-contiguous float array of shape [pixels, pixels] the curvature matrix is written into (e.g. the buffer
+        of an `InversionWorkspace`), instead of a new array.
     """
     array = mapping_matrix / noise_map[:, None]
-    curvature_matrix = np.dot(array.T, array)
+    curvature_matrix = np.dot(array.T, array, out=curvature_matrix)
 
     if add_to_curvature_diag and len(no_regularization_index_list) > 0:
         curvature_matrix = curvature_matrix_with_added_to_diag_from(
@@ -118,7 +156,74 @@ def curvature_matrix_via_mapping_matrix_from(
     return curvature_matrix
 
 
-@numba_util.jit()
+def curvature_matrix_via_noise_covariance_from(
+    mapping_matrix: np.ndarray,
+    noise_covariance,
+    add_to_curvature_diag: bool = False,
+    no_regularization_index_list: Optional[List] = None,
+    settings: SettingsInversion = SettingsInversion(),
+) -> np.ndarray:
+    """
+    Returns the curvature matrix `F` from a blurred mapping matrix `f` and a noise covariance matrix `C`, which
+    accounts for covariance between the noise of every data value:
+
+    F = f^T C^-1 f
+
+    This reduces to `curvature_matrix_via_mapping_matrix_from` for a diagonal noise covariance matrix.
+
+    Parameters
+    ----------
+    mapping_matrix
+        The matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels.
+    noise_covariance
+        The structured noise covariance (e.g. `NoiseCovarianceSparse`) of the data used by the inversion during the
+        fit, which computes `C^-1 f` via its factorization.
+    add_to_curvature_diag
+        If `True`, a small value is added to the diagonal of the curvature matrix for the parameters which are not
+        regularized (see `curvature_matrix_with_added_to_diag_from`).
+    no_regularization_index_list
+        The indexes of the parameters which are not regularized, where `None` is equivalent to an empty list.
+    settings
+        The settings of the inversion, which give the value added to the diagonal of the curvature matrix.
+    """
+    curvature_matrix = np.dot(
+        mapping_matrix.T, noise_covariance.inverse_dot_from(mapping_matrix)
+    )
+
+    if add_to_curvature_diag and no_regularization_index_list:
+        curvature_matrix = curvature_matrix_with_added_to_diag_from(
+            curvature_matrix=curvature_matrix,
+            value=settings.no_regularization_add_to_curvature_diag_value,
+            no_regularization_index_list=no_regularization_index_list,
+        )
+
+    return curvature_matrix
+
+
+def data_vector_via_noise_covariance_from(
+    mapping_matrix: np.ndarray, data: np.ndarray, noise_covariance
+) -> np.ndarray:
+    """
+    Returns the data vector `D` from a blurred mapping matrix `f`, the 1D data `d` and a noise covariance matrix `C`,
+    which accounts for covariance between the noise of every data value:
+
+    D = f^T C^-1 d
+
+    Parameters
+    ----------
+    mapping_matrix
+        The matrix representing the mappings (these could be blurred or transfomed) between sub-grid pixels and
+        pixelization pixels.
+    data
+        Flattened 1D array of the data the inversion is fitting.
+    noise_covariance
+        The structured noise covariance (e.g. `NoiseCovarianceSparse`) of the data used by the inversion during the
+        fit, which computes `C^-1 d` via its factorization.
+    """
+    return np.dot(mapping_matrix.T, noise_covariance.inverse_dot_from(data))
+
+
 def mapped_reconstructed_data_via_image_to_pix_unique_from(
     data_to_pix_unique: np.ndarray,
     data_weights: np.ndarray,
@@ -128,6 +233,10 @@ def mapped_reconstructed_data_via_image_to_pix_unique_from(
     """
     Returns the reconstructed data vector from the blurred mapping matrix `f` and solution vector *S*.
 
+    The unique mappings are converted to their compressed sparse row (CSR) format (see
+    `mapper_util.unique_mappings_csr_from`) and the mapped reconstructed data is computed via
+    `mapped_reconstructed_data_via_image_to_pix_unique_csr_from`.
+
     Parameters
     ----------
     mapping_matrix
@@ -135,22 +244,66 @@ def mapped_reconstructed_data_via_image_to_pix_unique_from(
 
     """
 
-    data_pixels = data_to_pix_unique.shape[0]
+    offsets, indexes, weights = mapper_util.unique_mappings_csr_from(
+        data_to_pix_unique=data_to_pix_unique,
+        data_weights=data_weights,
+        pix_lengths=pix_lengths,
+    )
+
+    return mapped_reconstructed_data_via_image_to_pix_unique_csr_from(
+        offsets=offsets,
+        indexes=indexes,
+        weights=weights,
+        reconstruction=reconstruction,
+    )
+
+
+@numba_util.jit(
+    hot_signatures=[
+        "(int64[::1], int64[::1], float64[::1], float64[::1])",
+    ],
+)
+def mapped_reconstructed_data_via_image_to_pix_unique_csr_from(
+    offsets: np.ndarray,
+    indexes: np.ndarray,
+    weights: np.ndarray,
+    reconstruction: np.ndarray,
+) -> np.ndarray:
+    """
+    Returns the reconstructed data vector from the unique mappings of every data pixel to pixelization pixels, stored
+    in compressed sparse row (CSR) format, and solution vector *S*.
+
+    Parameters
+    ----------
+    offsets
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`.
+    indexes
+        The pixelization pixel index of every unique mapping.
+    weights
+        The weight of every unique mapping.
+    reconstruction
+        The solution vector of the linear inversion.
+    """
+
+    data_pixels = offsets.shape[0] - 1
 
     mapped_reconstructed_data = np.zeros(data_pixels)
 
     for data_0 in range(data_pixels):
-        for pix_0 in range(pix_lengths[data_0]):
-            pix_for_data = data_to_pix_unique[data_0, pix_0]
-
+        for index in range(offsets[data_0], offsets[data_0 + 1]):
             mapped_reconstructed_data[data_0] += (
-                data_weights[data_0, pix_0] * reconstruction[pix_for_data]
+                weights[index] * reconstruction[indexes[index]]
             )
 
     return mapped_reconstructed_data
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[:, ::1], float64[::1])",
+    ],
+)
 def mapped_reconstructed_data_via_mapping_matrix_from(
     mapping_matrix: np.ndarray, reconstruction: np.ndarray
 ) -> np.ndarray:
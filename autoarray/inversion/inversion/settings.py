@@ -27,6 +27,7 @@ class SettingsInversion:
         image_mesh_adapt_background_percent_check: float = 0.8,
         tolerance: float = 1e-8,
         maxiter: int = 250,
+        curvature_matrix_workers: int = 1,
     ):
         """
         The settings of an Inversion, customizing how a linear set of equations are solved for.
@@ -76,6 +77,10 @@ class SettingsInversion:
         maxiter
             For an interferometer inversion using the linear operators method, sets the maximum number of iterations
             of the solver (this input does nothing for dataset data and other interferometer methods).
+        curvature_matrix_workers
+            For an imaging inversion using the w-tilde formalism with multiple linear objects, the number of threads
+            used to compute the blocks of the curvature matrix concurrently (e.g. the diagonal and off-diagonal blocks
+            of multiple mappers). The default of 1 computes every block serially.
         """
 
         self.use_w_tilde = use_w_tilde
@@ -102,6 +107,7 @@ class SettingsInversion:
         self.maxiter = maxiter
         self.use_w_tilde_numpy = use_w_tilde_numpy
         self.use_source_loop = use_source_loop
+        self.curvature_matrix_workers = curvature_matrix_workers
 
     @property
     def use_positive_only_solver(self):
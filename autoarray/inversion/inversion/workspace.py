@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Dict, Tuple, Union
+
+
+class InversionWorkspace:
+    def __init__(self):
+        """
+        Owns the memory of the large matrices and vectors of an inversion (e.g. the `operated_mapping_matrix`,
+        `curvature_matrix` and `regularization_matrix`), such that they are reused by every inversion which shares
+        the workspace rather than being allocated for every inversion.
+
+        During a model-fit, the matrices of every likelihood evaluation have the same shapes, therefore passing the
+        same workspace to every inversion (via `Preloads`) removes the cost of allocating (and page faulting) these
+        matrices on every call. Each matrix is stored under a name and is only reallocated if its shape or type
+        changes.
+
+        Because the memory is reused, the matrices of an inversion are overwritten by the next inversion which uses
+        the workspace. A workspace should therefore only be shared by inversions which are evaluated one after the
+        other and whose matrices are not used after the next inversion is created (e.g. the fits of a
+        non-linear search). It must not be shared by inversions evaluated concurrently in different threads, or by
+        two fits whose matrices are compared with one another (e.g. the fits input into the `Preloads.set_`
+        methods).
+
+        By default no workspace is used and every inversion allocates its own matrices.
+        """
+        self._array_dict: Dict[str, np.ndarray] = {}
+
+    def array_from(
+        self,
+        name: str,
+        shape: Union[int, Tuple[int, ...]],
+        dtype: Union[str, np.dtype] = "float",
+        zeroed: bool = True,
+    ) -> np.ndarray:
+        """
+        Returns the array of the workspace stored under an input name, which is allocated if the workspace does not
+        have an array of this name, shape and type.
+
+        Parameters
+        ----------
+        name
+            The name of the array (e.g. `curvature_matrix`), which must be unique to every matrix of an inversion
+            that is used at the same time.
+        shape
+            The shape of the array.
+        dtype
+            The type of the array.
+        zeroed
+            If `True` the values of the array are set to zero before it is returned, otherwise it contains the values
+            of the previous inversion which used it and every value must be overwritten.
+        """
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        dtype = np.dtype(dtype)
+
+        array = self._array_dict.get(name)
+
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = np.zeros(shape, dtype=dtype)
+            self._array_dict[name] = array
+
+            return array
+
+        if zeroed:
+            array.fill(0)
+
+        return array
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The total number of bytes of memory held by the arrays of the workspace.
+        """
+        return sum(array.nbytes for array in self._array_dict.values())
+
+    def clear(self):
+        """
+        Release the memory of every array in the workspace.
+        """
+        self._array_dict = {}
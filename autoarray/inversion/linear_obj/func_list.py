@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Optional, Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from autoconf import cached_property
 
@@ -7,6 +7,7 @@ from autoarray.inversion.linear_obj.linear_obj import LinearObj
 from autoarray.inversion.linear_obj.neighbors import Neighbors
 from autoarray.inversion.linear_obj.unique_mappings import UniqueMappings
 from autoarray.inversion.regularization.abstract import AbstractRegularization
+from autoarray.operators.over_sampling import decorator as over_sample_decorator
 from autoarray.type import Grid1D2DLike
 
 from autoarray.numba_util import profile_func
@@ -50,6 +51,34 @@ class AbstractLinearObjFuncList(LinearObj):
 
         self.grid = grid
 
+    def mapping_matrix_via_func_list_from(
+        self, func_list: List[Tuple[object, Callable]], workers: int = 1
+    ) -> np.ndarray:
+        """
+        Returns a `mapping_matrix` whose columns are the values of a list of analytic functions evaluated on the
+        linear object's grid, for example the images of the light profiles whose intensities are solved for.
+
+        The functions are independent of one another, so they are evaluated concurrently by a thread pool on the
+        same over-sampled grid and binned via the same over-sampling plan (see
+        `over_sample_decorator.array_via_func_list_from`). A child class's `mapping_matrix` can therefore be
+        computed via this method, as opposed to evaluating every function in turn.
+
+        Parameters
+        ----------
+        func_list
+            The (obj, func) pairs whose values are the columns of the mapping matrix, where `func` is called as
+            `func(obj, grid)` (e.g. a light profile and its `image_2d_from` method).
+        workers
+            The number of threads the functions are evaluated over.
+
+        Returns
+        -------
+        The mapping matrix, of shape [total_unmasked_pixels, total_functions].
+        """
+        return over_sample_decorator.array_via_func_list_from(
+            grid=self.grid, func_list=func_list, workers=workers
+        )
+
     @cached_property
     def neighbors(self) -> Neighbors:
         """
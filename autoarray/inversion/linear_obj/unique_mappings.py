@@ -1,5 +1,7 @@
 import numpy as np
 
+from autoconf import cached_property
+
 
 class UniqueMappings:
     def __init__(
@@ -22,6 +24,9 @@ class UniqueMappings:
         The need to store separately the mappings and mesh lengths is so that they be easily iterated over when
         perform calculations for efficiency.
 
+        The same mappings are also available in a compressed sparse row (CSR) format via the properties `offsets`,
+        `indexes` and `weights` (see `UniqueMappingsCSR`), which is the format used by the w-tilde inversion kernels.
+
         See the mapper properties `unique_mappings()` for a description of the use of this object in mappers.
 
         Parameters
@@ -36,3 +41,123 @@ class UniqueMappings:
         self.data_to_pix_unique = data_to_pix_unique.astype("int")
         self.data_weights = data_weights
         self.pix_lengths = pix_lengths.astype("int")
+
+    @cached_property
+    def _unique_mask(self) -> np.ndarray:
+        """
+        A boolean mask of shape `data_to_pix_unique.shape` which is `True` for every entry which is an unique mapping
+        (as opposed to padding).
+        """
+        return (
+            np.arange(self.data_to_pix_unique.shape[1])[None, :]
+            < self.pix_lengths[:, None]
+        )
+
+    @cached_property
+    def offsets(self) -> np.ndarray:
+        """
+        The CSR row offsets of the unique mappings, where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of the `indexes` and `weights` arrays.
+        """
+        return np.concatenate((np.zeros(1, dtype="int"), np.cumsum(self.pix_lengths)))
+
+    @cached_property
+    def indexes(self) -> np.ndarray:
+        """
+        The mesh pixel index of every unique mapping, stored contiguously in CSR format.
+        """
+        return self.data_to_pix_unique[self._unique_mask]
+
+    @cached_property
+    def weights(self) -> np.ndarray:
+        """
+        The weight of every unique mapping, stored contiguously in CSR format.
+        """
+        return np.asarray(self.data_weights)[self._unique_mask]
+
+
+class UniqueMappingsCSR:
+    def __init__(self, offsets: np.ndarray, indexes: np.ndarray, weights: np.ndarray):
+        """
+        Packages the unique mappings of every unmasked data pixel's (e.g. `grid_slim`) sub-pixels (e.g. `grid_sub_slim`)
+        to their corresponding mesh pixels (e.g. `mesh_grid`) in a compressed sparse row (CSR) format.
+
+        This contains the same information as `UniqueMappings`, but stores only the unique mappings themselves
+        contiguously in memory, as opposed to padded 2D arrays of shape [data_pixels, max_unique_mappings]. This
+        reduces memory use and cache misses in the w-tilde inversion kernels which iterate over these mappings.
+
+        The following quantities are packaged in this class as ndarray:
+
+        - `offsets`: of shape [data_pixels + 1], where the unique mappings of data pixel `i` are stored in
+        entries `offsets[i]` to `offsets[i + 1]` of `indexes` and `weights`.
+        - `indexes`: the mesh pixel index of every unique mapping.
+        - `weights`: the weight of every unique mapping (e.g. determined via their sub-size fractional mappings and
+        interpolation weights).
+
+        The padded arrays `data_to_pix_unique`, `data_weights` and `pix_lengths` of `UniqueMappings` can be computed
+        from these arrays via the properties of the same name.
+
+        See the mapper properties `unique_mappings()` for a description of the use of this object in mappers.
+
+        Parameters
+        ----------
+        offsets
+            The CSR row offsets of the unique mappings of every data pixel.
+        indexes
+            The mesh pixel index of every unique mapping.
+        weights
+            The weight of every unique mapping.
+        """
+        self.offsets = offsets.astype("int")
+        self.indexes = indexes.astype("int")
+        self.weights = weights
+
+    @property
+    def pix_lengths(self) -> np.ndarray:
+        """
+        The number of unique mesh pixels each data pixel's grouped sub-pixels map too.
+        """
+        return np.diff(self.offsets)
+
+    @cached_property
+    def _padded_index(self):
+        """
+        The (row, column) indexes of every unique mapping in the padded 2D arrays `data_to_pix_unique`
+        and `data_weights`, alongside the shape of these arrays.
+        """
+        pix_lengths = self.pix_lengths
+
+        rows = np.repeat(np.arange(pix_lengths.shape[0]), pix_lengths)
+        columns = np.arange(self.indexes.shape[0]) - np.repeat(
+            self.offsets[:-1], pix_lengths
+        )
+
+        shape = (pix_lengths.shape[0], max(int(np.max(pix_lengths, initial=0)), 1))
+
+        return rows, columns, shape
+
+    @cached_property
+    def data_to_pix_unique(self) -> np.ndarray:
+        """
+        The unique mapping of every data pixel's grouped sub-pixels to mesh pixels, padded with -1 to a 2D array of
+        shape [data_pixels, max_unique_mappings].
+        """
+        rows, columns, shape = self._padded_index
+
+        data_to_pix_unique = -1 * np.ones(shape, dtype="int")
+        data_to_pix_unique[rows, columns] = self.indexes
+
+        return data_to_pix_unique
+
+    @cached_property
+    def data_weights(self) -> np.ndarray:
+        """
+        The weights of each data pixel's grouped sub-pixels to mesh pixels, padded with 0.0 to a 2D array of
+        shape [data_pixels, max_unique_mappings].
+        """
+        rows, columns, shape = self._padded_index
+
+        data_weights = np.zeros(shape)
+        data_weights[rows, columns] = self.weights
+
+        return data_weights
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import numpy as np
-from typing import Union
+from scipy.spatial import cKDTree
+from typing import Optional, Union
 
 from autoconf import cached_property
 
@@ -129,7 +130,40 @@ def sub_border_pixel_slim_indexes_from(
 
 
 class BorderRelocator:
-    def __init__(self, mask: Mask2D, sub_size: Union[int, Array2D]):
+    def __init__(
+        self,
+        mask: Mask2D,
+        sub_size: Union[int, Array2D],
+        workers: int = 1,
+        angle_tolerance: Optional[float] = None,
+    ):
+        """
+        Relocates coordinates of a grid which are outside the border of a mask to its edge.
+
+        The border pixel indexes of the mask are computed once and cached. When a grid is relocated, only the
+        coordinates whose radial distance from the border's origin exceeds the minimum border radius are paired
+        with their nearest border coordinate, which is found via a KD-tree over the border coordinates. The KD-tree
+        is reused for every relocation performed with the same border coordinates (for example relocating the
+        source-plane data grid and then the source-plane mesh grid of the same mapper).
+
+        If an `angle_tolerance` is input, nearest border coordinates are instead found by a binary search on the
+        polar angles of the border coordinates about the border origin, comparing every coordinate only with the
+        border coordinates within this angle of it (see `grid_2d_util.relocated_grid_via_angle_sort_from`).
+
+        Parameters
+        ----------
+        mask
+            The mask whose border defines the edge that coordinates are relocated to.
+        sub_size
+            The size of the sub-grid in each mask pixel.
+        workers
+            The number of workers used to query the KD-tree of border coordinates in parallel (-1 uses all
+            available CPUs), or the number of threads coordinates are relocated over if an `angle_tolerance` is input.
+        angle_tolerance
+            If `None`, nearest border coordinates are found via a KD-tree. If input, they are found via the sorted
+            polar angles of the border coordinates, comparing every coordinate only with border coordinates within
+            this angle (in radians) of it, where a value of `np.pi` gives the exact nearest border coordinate.
+        """
         self.mask = mask
 
         if isinstance(sub_size, int):
@@ -138,6 +172,11 @@ class BorderRelocator:
             )
 
         self.sub_size = sub_size
+        self.workers = workers
+        self.angle_tolerance = angle_tolerance
+
+        self._border_grid = None
+        self._border_tree = None
 
     @cached_property
     def sub_border_slim(self) -> np.ndarray:
@@ -208,6 +247,58 @@ class BorderRelocator:
         """
         return self.sub_grid[self.sub_border_slim]
 
+    def border_tree_from(self, border_grid: np.ndarray) -> cKDTree:
+        """
+        Returns a KD-tree of the input (y,x) border coordinates, which is used to find the nearest border coordinate
+        of every coordinate being relocated.
+
+        The most recently built KD-tree is stored and returned again if the same border coordinates are input,
+        which is the case when a mapper relocates both its source-plane data grid and source-plane mesh grid.
+
+        Parameters
+        ----------
+        border_grid
+            The (y,x) coordinates of the border which the KD-tree is built from.
+        """
+        if self._border_grid is not None and np.array_equal(
+            self._border_grid, border_grid
+        ):
+            return self._border_tree
+
+        self._border_grid = border_grid
+        self._border_tree = cKDTree(border_grid)
+
+        return self._border_tree
+
+    def _relocated_grid_from(
+        self, grid: np.ndarray, border_grid: np.ndarray
+    ) -> np.ndarray:
+        """
+        Relocate the (y,x) coordinates of a grid which are outside the input border coordinates to the border, using
+        a KD-tree or the sorted polar angles of the border coordinates depending on the `angle_tolerance`.
+
+        Parameters
+        ----------
+        grid
+            The (y,x) coordinates which are relocated to the border edge if outside it.
+        border_grid
+            The (y,x) coordinates of the border.
+        """
+        if self.angle_tolerance is not None:
+            return grid_2d_util.relocated_grid_via_angle_sort_from(
+                grid=grid,
+                border_grid=border_grid,
+                angle_tolerance=self.angle_tolerance,
+                workers=self.workers,
+            )
+
+        return grid_2d_util.relocated_grid_via_kdtree_from(
+            grid=grid,
+            border_grid=border_grid,
+            border_tree=self.border_tree_from(border_grid=border_grid),
+            workers=self.workers,
+        )
+
     def relocated_grid_from(self, grid: Grid2DIrregular) -> Grid2DIrregular:
         """
         Relocate the coordinates of a grid to the border of this grid if they are outside the border, where the
@@ -223,6 +314,11 @@ class BorderRelocator:
         5: If its radial distance is larger, use the ratio of radial distances to move the coordinate to the
         border (if its inside the border, do nothing).
 
+        Steps 3-5 are only performed for coordinates whose radial distance exceeds the minimum radial distance of
+        the border, with nearest border pixels found via a KD-tree (see `grid_2d_util.relocated_grid_via_kdtree_from`)
+        or, if an `angle_tolerance` is input, a binary search on the sorted polar angles of the border pixels (see
+        `grid_2d_util.relocated_grid_via_angle_sort_from`).
+
         The method can be used on uniform or irregular grids, however for irregular grids the border of the
         'image-plane' mask is used to define border pixels.
 
@@ -236,7 +332,7 @@ class BorderRelocator:
             return grid
 
         return Grid2DIrregular(
-            values=grid_2d_util.relocated_grid_via_jit_from(
+            values=self._relocated_grid_from(
                 grid=np.array(grid),
                 border_grid=np.array(grid[self.sub_border_slim]),
             ),
@@ -259,7 +355,7 @@ class BorderRelocator:
             return mesh_grid
 
         return Grid2DIrregular(
-            values=grid_2d_util.relocated_grid_via_jit_from(
+            values=self._relocated_grid_from(
                 grid=np.array(mesh_grid),
                 border_grid=np.array(grid[self.sub_border_slim]),
             ),
@@ -1,9 +1,23 @@
 import numpy as np
+from typing import Callable, Optional
 
+from autoarray.mask.mask_2d import Mask2D
 from autoarray.inversion.pixelization.image_mesh.abstract import AbstractImageMesh
+from autoarray.cache_util import LRUCache
+from autoarray.cache_util import mask_cache_key_from
+
+"""
+The image-mesh grids computed by weighted image-meshes, memoised on a hash of the image-mesh's class and attributes,
+the mask and the adapt data (see `AbstractImageMeshWeighted.mesh_grid_cached_from`).
+"""
+mesh_grid_cache = LRUCache(size=32)
 
 
 class AbstractImageMeshWeighted(AbstractImageMesh):
+    # The attributes which determine the image-mesh grid, which are included in the hash used to memoise it.
+
+    cache_key_attributes = ("pixels", "weight_floor", "weight_power")
+
     def __init__(
         self,
         pixels=10.0,
@@ -63,3 +77,70 @@ class AbstractImageMeshWeighted(AbstractImageMesh):
         weight_map[weight_map < self.weight_floor] = self.weight_floor
 
         return weight_map
+
+    def cache_key_from(self, mask: Mask2D, adapt_data: Optional[np.ndarray]) -> str:
+        """
+        Returns a hash of the inputs which uniquely determine the image-mesh grid computed by this image-mesh, which
+        is used to memoise the grid (see `mesh_grid_cached_from`).
+
+        The hash is computed from the image-mesh's class and the attributes in `cache_key_attributes` (e.g. `pixels`,
+        `weight_floor` and `weight_power`), the mask's `content_hash` and the values of the adapt data.
+
+        Parameters
+        ----------
+        mask
+            The mask of the data the image-mesh adapts to.
+        adapt_data
+            The image which the image-mesh adapts to.
+
+        Returns
+        -------
+        The hexadecimal hash of the inputs.
+        """
+        if adapt_data is not None:
+            adapt_data = np.asarray(adapt_data, dtype="float")
+
+        return mask_cache_key_from(
+            mask,
+            self.__class__.__name__,
+            [getattr(self, attribute) for attribute in self.cache_key_attributes],
+            adapt_data,
+        )
+
+    def mesh_grid_cached_from(
+        self,
+        mask: Mask2D,
+        adapt_data: Optional[np.ndarray],
+        mesh_grid_func: Callable[[], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns the (y,x) coordinates of the image-mesh, memoised on a hash of the image-mesh, mask and adapt data.
+
+        Computing the image-mesh (e.g. via KMeans clustering or a Hilbert curve) can take seconds, and during a
+        model-fit the same image-mesh is often recomputed for an unchanged mask and adapt data. The most recently
+        computed image-mesh grids are therefore stored in a module level least-recently-used cache, which stores up
+        to `mesh_grid_cache.size` grids.
+
+        The settings of an inversion only determine whether an image-mesh is checked to be valid (e.g.
+        `check_mesh_pixels_per_image_pixels`), not the image-mesh itself, so they are not part of the hash and these
+        checks are still performed every time an image-mesh is returned.
+
+        Parameters
+        ----------
+        mask
+            The mask of the data the image-mesh adapts to.
+        adapt_data
+            The image which the image-mesh adapts to.
+        mesh_grid_func
+            A function which computes the (y,x) coordinates of the image-mesh if they are not cached.
+
+        Returns
+        -------
+        The (y,x) coordinates of the image-mesh.
+        """
+        mesh_grid = mesh_grid_cache.value_from(
+            key=self.cache_key_from(mask=mask, adapt_data=adapt_data),
+            func=lambda: np.array(mesh_grid_func()),
+        )
+
+        return np.array(mesh_grid)
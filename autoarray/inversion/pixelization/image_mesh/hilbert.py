@@ -1,8 +1,10 @@
 from __future__ import annotations
+import functools
 import numpy as np
 from scipy.interpolate import interp1d, griddata
 from typing import Optional
 
+from autoarray import numba_util
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.structures.grids.uniform_2d import Grid2D
 from autoarray.mask.mask_2d import Mask2D
@@ -16,75 +18,126 @@ from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 from autoarray import exc
 
 
-def gilbert2d(width, height):
+@numba_util.jit()
+def gilbert2d_indexes_jit_from(width: int, height: int) -> np.ndarray:
     """
-    Generalized Hilbert ('gilbert') space-filling curve for arbitrary-sized
-    2D rectangular grids. Generates discrete 2D coordinates to fill a rectangle
-    of size (width x height).
+    Returns the discrete (x,y) coordinates of the generalized Hilbert ('gilbert') space-filling curve of a
+    (width x height) rectangle, as an ndarray of shape [width * height, 2] in the order the curve visits them.
+
+    The curve recursively splits the rectangle into sub-rectangles, which are tracked via an explicit stack such that
+    the function can be compiled with numba. Sub-rectangles are pushed to the stack in reverse, so they are popped
+    in the order the curve visits them.
+
+    Parameters
+    ----------
+    width
+        The width of the rectangle the curve fills.
+    height
+        The height of the rectangle the curve fills.
     """
 
-    if width >= height:
-        yield from generate2d(0, 0, width, 0, 0, height)
-    else:
-        yield from generate2d(0, 0, 0, height, width, 0)
-
-
-def sgn(x):
-    return -1 if x < 0 else (1 if x > 0 else 0)
+    indexes = np.zeros((width * height, 2), dtype=np.int64)
 
+    stack = np.zeros((3 * (width + height) + 16, 6), dtype=np.int64)
 
-def generate2d(x, y, ax, ay, bx, by):
-    w = abs(ax + ay)
-    h = abs(bx + by)
-
-    (dax, day) = (sgn(ax), sgn(ay))  # unit major direction
-    (dbx, dby) = (sgn(bx), sgn(by))  # unit orthogonal direction
+    if width >= height:
+        stack[0, :] = (0, 0, width, 0, 0, height)
+    else:
+        stack[0, :] = (0, 0, 0, height, width, 0)
 
-    if h == 1:
-        # trivial row fill
-        for i in range(0, w):
-            yield (x, y)
-            (x, y) = (x + dax, y + day)
-        return
+    stack_size = 1
+    count = 0
 
-    if w == 1:
-        # trivial column fill
-        for i in range(0, h):
-            yield (x, y)
-            (x, y) = (x + dbx, y + dby)
-        return
+    while stack_size > 0:
+        stack_size -= 1
+
+        x = stack[stack_size, 0]
+        y = stack[stack_size, 1]
+        ax = stack[stack_size, 2]
+        ay = stack[stack_size, 3]
+        bx = stack[stack_size, 4]
+        by = stack[stack_size, 5]
+
+        w = abs(ax + ay)
+        h = abs(bx + by)
+
+        dax = np.sign(ax)
+        day = np.sign(ay)
+        dbx = np.sign(bx)
+        dby = np.sign(by)
+
+        if h == 1:
+            for i in range(w):
+                indexes[count, 0] = x + i * dax
+                indexes[count, 1] = y + i * day
+                count += 1
+            continue
+
+        if w == 1:
+            for i in range(h):
+                indexes[count, 0] = x + i * dbx
+                indexes[count, 1] = y + i * dby
+                count += 1
+            continue
+
+        ax2 = ax // 2
+        ay2 = ay // 2
+        bx2 = bx // 2
+        by2 = by // 2
+
+        w2 = abs(ax2 + ay2)
+        h2 = abs(bx2 + by2)
+
+        if 2 * w > 3 * h:
+            if (w2 % 2) and (w > 2):
+                ax2 += dax
+                ay2 += day
+
+            stack[stack_size, :] = (x + ax2, y + ay2, ax - ax2, ay - ay2, bx, by)
+            stack[stack_size + 1, :] = (x, y, ax2, ay2, bx, by)
+            stack_size += 2
+
+        else:
+            if (h2 % 2) and (h > 2):
+                bx2 += dbx
+                by2 += dby
+
+            stack[stack_size, :] = (
+                x + (ax - dax) + (bx2 - dbx),
+                y + (ay - day) + (by2 - dby),
+                -bx2,
+                -by2,
+                -(ax - ax2),
+                -(ay - ay2),
+            )
+            stack[stack_size + 1, :] = (x + bx2, y + by2, ax, ay, bx - bx2, by - by2)
+            stack[stack_size + 2, :] = (x, y, bx2, by2, ax2, ay2)
+            stack_size += 3
 
-    (ax2, ay2) = (ax // 2, ay // 2)
-    (bx2, by2) = (bx // 2, by // 2)
+    return indexes
 
-    w2 = abs(ax2 + ay2)
-    h2 = abs(bx2 + by2)
 
-    if 2 * w > 3 * h:
-        if (w2 % 2) and (w > 2):
-            # prefer even steps
-            (ax2, ay2) = (ax2 + dax, ay2 + day)
+@functools.lru_cache(maxsize=8)
+def gilbert2d_indexes_from(width: int, height: int) -> np.ndarray:
+    """
+    Returns the discrete (x,y) coordinates of the generalized Hilbert ('gilbert') space-filling curve of a
+    (width x height) rectangle, as an ndarray of shape [width * height, 2] (see `gilbert2d_indexes_jit_from`).
+
+    The curve only depends on the shape of the rectangle, therefore it is memoised and the returned array is
+    read-only.
+
+    Parameters
+    ----------
+    width
+        The width of the rectangle the curve fills.
+    height
+        The height of the rectangle the curve fills.
+    """
+    indexes = gilbert2d_indexes_jit_from(width, height)
 
-        # long case: split in two parts only
-        yield from generate2d(x, y, ax2, ay2, bx, by)
-        yield from generate2d(x + ax2, y + ay2, ax - ax2, ay - ay2, bx, by)
+    indexes.setflags(write=False)
 
-    else:
-        if (h2 % 2) and (h > 2):
-            # prefer even steps
-            (bx2, by2) = (bx2 + dbx, by2 + dby)
-
-        # standard case: one step up, one long horizontal, one step down
-        yield from generate2d(x, y, bx2, by2, ax2, ay2)
-        yield from generate2d(x + bx2, y + by2, ax, ay, bx - bx2, by - by2)
-        yield from generate2d(
-            x + (ax - dax) + (bx2 - dbx),
-            y + (ay - day) + (by2 - dby),
-            -bx2,
-            -by2,
-            -(ax - ax2),
-            -(ay - ay2),
-        )
+    return indexes
 
 
 def super_resolution_grid_from(img_2d, mask, mask_radius, pixel_scales, sub_scale=11):
@@ -131,20 +184,10 @@ def grid_hilbert_order_from(length, mask_radius):
     mask_radius: the circular mask radius. This code only works with a circular mask.
     """
 
-    xy_generator = gilbert2d(length, length)
+    indexes = gilbert2d_indexes_from(length, length)
 
-    x1d_hb = np.zeros(length * length)
-    y1d_hb = np.zeros(length * length)
-
-    count = 0
-
-    for x, y in xy_generator:
-        x1d_hb[count] = x
-        y1d_hb[count] = y
-        count += 1
-
-    x1d_hb /= length
-    y1d_hb /= length
+    x1d_hb = indexes[:, 0] / length
+    y1d_hb = indexes[:, 1] / length
 
     x1d_hb -= 0.5
     y1d_hb -= 0.5
@@ -266,6 +309,9 @@ class Hilbert(AbstractImageMeshWeighted):
 
         See the `__init__` docstring for a full description of how this is performed.
 
+        The image mesh is memoised on a hash of the image mesh, mask and adapt data, such that it is only recomputed
+        when one of these changes (see `mesh_grid_cached_from`).
+
         Parameters
         ----------
         grid
@@ -287,6 +333,39 @@ class Hilbert(AbstractImageMeshWeighted):
                 """
             )
 
+        mesh_grid = Grid2DIrregular(
+            values=self.mesh_grid_cached_from(
+                mask=mask,
+                adapt_data=adapt_data,
+                mesh_grid_func=lambda: self.mesh_grid_from(
+                    mask=mask, adapt_data=adapt_data
+                ),
+            )
+        )
+
+        self.check_mesh_pixels_per_image_pixels(
+            mask=mask, mesh_grid=mesh_grid, settings=settings
+        )
+
+        self.check_adapt_background_pixels(
+            mask=mask, mesh_grid=mesh_grid, adapt_data=adapt_data, settings=settings
+        )
+
+        return mesh_grid
+
+    def mesh_grid_from(self, mask: Mask2D, adapt_data: np.ndarray) -> np.ndarray:
+        """
+        Returns the (y,x) coordinates of the image mesh computed by drawing points from the Hilbert curve of the
+        weight map, without memoisation (see `image_plane_mesh_grid_from`).
+
+        Parameters
+        ----------
+        mask
+            The circular mask of the image data the pixelization fits, which the Hilbert curve adapts to.
+        adapt_data
+            The weights defining the regions of the image the Hilbert curve adapts to.
+        """
+
         adapt_data_hb, grid_hb = image_and_grid_from(
             image=adapt_data,
             mask=mask,
@@ -310,14 +389,4 @@ class Hilbert(AbstractImageMeshWeighted):
             gridy=grid_hb[:, 0],
         )
 
-        mesh_grid = Grid2DIrregular(values=np.stack((drawn_y, drawn_x), axis=-1))
-
-        self.check_mesh_pixels_per_image_pixels(
-            mask=mask, mesh_grid=mesh_grid, settings=settings
-        )
-
-        self.check_adapt_background_pixels(
-            mask=mask, mesh_grid=mesh_grid, adapt_data=adapt_data, settings=settings
-        )
-
-        return mesh_grid
+        return np.stack((drawn_y, drawn_x), axis=-1)
@@ -1,5 +1,6 @@
 import numpy as np
 from sklearn.cluster import KMeans as ScipyKMeans
+from sklearn.cluster import MiniBatchKMeans as ScipyMiniBatchKMeans
 from typing import Optional
 import sys
 import warnings
@@ -11,16 +12,31 @@ from autoarray.inversion.pixelization.image_mesh.abstract_weighted import (
 )
 from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 from autoarray.inversion.inversion.settings import SettingsInversion
+from autoarray.cache_util import LRUCache
 
 from autoarray import exc
 
+"""
+The cluster centres of the most recent KMeans image-mesh computed for every mask and number of pixels, which are
+used to warm start the next KMeans clustering (see `KMeans.warm_start`). This is a least-recently-used cache which
+stores the cluster centres of up to `cluster_centres_cache.size` masks.
+"""
+cluster_centres_cache = LRUCache(size=32)
+
 
 class KMeans(AbstractImageMeshWeighted):
+    cache_key_attributes = AbstractImageMeshWeighted.cache_key_attributes + (
+        "mini_batch",
+        "warm_start",
+    )
+
     def __init__(
         self,
         pixels=10.0,
         weight_floor=0.0,
         weight_power=0.0,
+        mini_batch: bool = False,
+        warm_start: bool = False,
     ):
         """
         Computes an image-mesh by running a weighted KMeans clustering algorithm.
@@ -36,11 +52,22 @@ class KMeans(AbstractImageMeshWeighted):
         2) Run the KMeans algorithm on the weight map, such that the image mesh pixels cluster around the weight map
         values with higher values.
 
+        The image mesh is memoised on a hash of the image mesh, mask and adapt data, such that the KMeans algorithm
+        is only rerun when one of these changes.
+
         Parameters
         ----------
         total_pixels
             The total number of pixels in the image mesh and input into the KMeans algortihm.
         weight_power
+        mini_batch
+            If `True`, the clustering is performed using scikit-learn's `MiniBatchKMeans`, which updates the cluster
+            centres using random subsets of the grid and is much faster for large masks at the expense of slightly
+            less optimal cluster centres.
+        warm_start
+            If `True`, the KMeans algorithm is initialized from the cluster centres of the previous image mesh computed
+            for the same mask and number of pixels (e.g. for a previous adapt image), which typically requires fewer
+            iterations to converge than the default initialization.
         """
 
         super().__init__(
@@ -49,6 +76,9 @@ class KMeans(AbstractImageMeshWeighted):
             weight_power=weight_power,
         )
 
+        self.mini_batch = mini_batch
+        self.warm_start = warm_start
+
     def image_plane_mesh_grid_from(
         self,
         mask: Mask2D,
@@ -93,24 +123,67 @@ class KMeans(AbstractImageMeshWeighted):
 
             sys.exit()
 
+        return Grid2DIrregular(
+            values=self.mesh_grid_cached_from(
+                mask=mask,
+                adapt_data=adapt_data,
+                mesh_grid_func=lambda: self.mesh_grid_from(
+                    mask=mask, adapt_data=adapt_data
+                ),
+            )
+        )
+
+    def mesh_grid_from(self, mask: Mask2D, adapt_data: np.ndarray) -> np.ndarray:
+        """
+        Returns the (y,x) coordinates of the image mesh computed by running a KMeans clustering algorithm on the
+        weight map, without memoisation (see `image_plane_mesh_grid_from`).
+
+        Parameters
+        ----------
+        mask
+            The mask of the image data the pixelization fits, whose (y,x) coordinates the KMeans algorithm clusters.
+        adapt_data
+            The weights defining the regions of the image the KMeans algorithm adapts to.
+        """
+
         warnings.filterwarnings("ignore")
 
         weight_map = self.weight_map_from(adapt_data=adapt_data)
 
-        kmeans = ScipyKMeans(
-            n_clusters=int(self.pixels),
-            random_state=1,
-            n_init=1,
-            max_iter=5,
-        )
+        centres_key = self.cache_key_from(mask=mask, adapt_data=None)
+
+        init = "k-means++"
+
+        if self.warm_start:
+            init = cluster_centres_cache.get(key=centres_key, default=init)
+
+        if self.mini_batch:
+            kmeans = ScipyMiniBatchKMeans(
+                n_clusters=int(self.pixels),
+                init=init,
+                random_state=1,
+                n_init=1,
+                max_iter=5,
+            )
+        else:
+            kmeans = ScipyKMeans(
+                n_clusters=int(self.pixels),
+                init=init,
+                random_state=1,
+                n_init=1,
+                max_iter=5,
+            )
 
         grid = mask.derive_grid.unmasked
 
         try:
             kmeans = kmeans.fit(X=grid, sample_weight=weight_map)
-        except ValueError or OverflowError:
+        except (ValueError, OverflowError):
             raise exc.InversionException()
 
-        return Grid2DIrregular(
-            values=kmeans.cluster_centers_,
-        )
+        if self.warm_start:
+            cluster_centres_cache.set(
+                key=centres_key, value=np.array(kmeans.cluster_centers_)
+            )
+
+        return kmeans.cluster_centers_
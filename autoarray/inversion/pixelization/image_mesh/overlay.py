@@ -6,7 +6,7 @@ from autoarray.inversion.pixelization.image_mesh.abstract import AbstractImageMe
 from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 from autoarray.inversion.inversion.settings import SettingsInversion
 
-from autoarray.geometry import geometry_util
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
 from autoarray.structures.grids import grid_2d_util
 from autoarray import numba_util
 
@@ -220,10 +220,14 @@ class Overlay(AbstractImageMesh):
             origin=origin,
         )
 
-        overlaid_centres = geometry_util.grid_pixel_centres_2d_slim_from(
-            grid_scaled_2d_slim=unmasked_overlay_grid,
-            shape_native=mask.shape_native,
-            pixel_scales=mask.pixel_scales,
+        affine = affine_transform_2d_cached_from(
+            shape_native=(int(mask.shape_native[0]), int(mask.shape_native[1])),
+            pixel_scales=(float(mask.pixel_scales[0]), float(mask.pixel_scales[1])),
+            origin=(0.0, 0.0),
+        )
+
+        overlaid_centres = affine.pixel_centres_from(
+            grid_scaled_2d_slim=unmasked_overlay_grid
         ).astype("int")
 
         total_pixels = total_pixels_2d_from(
@@ -6,7 +6,7 @@ from autoconf import conf
 from autoconf import cached_property
 
 from autoarray.inversion.linear_obj.linear_obj import LinearObj
-from autoarray.inversion.linear_obj.func_list import UniqueMappings
+from autoarray.inversion.linear_obj.unique_mappings import UniqueMappingsCSR
 from autoarray.inversion.linear_obj.neighbors import Neighbors
 from autoarray.inversion.pixelization.border_relocator import BorderRelocator
 from autoarray.inversion.pixelization.mappers.mapper_grids import MapperGrids
@@ -239,37 +239,34 @@ class AbstractMapper(LinearObj):
 
     @cached_property
     @profile_func
-    def unique_mappings(self) -> UniqueMappings:
+    def unique_mappings(self) -> UniqueMappingsCSR:
         """
         Returns the unique mappings of every unmasked data pixel's (e.g. `grid_slim`) sub-pixels (e.g. `grid_sub_slim`)
         to their corresponding pixelization pixels (e.g. `mesh_grid`).
 
         To perform an `Inversion` efficiently the linear algebra can bypass the calculation of a `mapping_matrix` and
         instead use the w-tilde formalism, which requires these unique mappings for efficient computation. For
-        convenience, these mappings and associated metadata are packaged into the class `UniqueMappings`.
+        convenience, these mappings and associated metadata are packaged into the class `UniqueMappingsCSR`, which
+        stores them in a compact compressed sparse row (CSR) format computed in one pass from the mapper's
+        `PixSubWeights`.
 
         A full description of these mappings is given in the
-        function `mapper_util.data_slim_to_pixelization_unique_from()`.
+        functions `mapper_util.data_slim_to_pixelization_unique_from()` and
+        `mapper_util.data_slim_to_pixelization_unique_csr_from()`.
         """
 
-        (
-            data_to_pix_unique,
-            data_weights,
-            pix_lengths,
-        ) = mapper_util.data_slim_to_pixelization_unique_from(
-            data_pixels=self.over_sampler.mask.pixels_in_mask,
-            pix_indexes_for_sub_slim_index=self.pix_indexes_for_sub_slim_index,
-            pix_sizes_for_sub_slim_index=self.pix_sizes_for_sub_slim_index,
-            pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
-            pix_pixels=self.params,
-            sub_size=np.array(self.over_sampler.sub_size),
+        offsets, indexes, weights = (
+            mapper_util.data_slim_to_pixelization_unique_csr_from(
+                data_pixels=self.over_sampler.mask.pixels_in_mask,
+                pix_indexes_for_sub_slim_index=self.pix_indexes_for_sub_slim_index,
+                pix_sizes_for_sub_slim_index=self.pix_sizes_for_sub_slim_index,
+                pix_weights_for_sub_slim_index=self.pix_weights_for_sub_slim_index,
+                pix_pixels=self.params,
+                sub_size=np.array(self.over_sampler.sub_size),
+            )
         )
 
-        return UniqueMappings(
-            data_to_pix_unique=data_to_pix_unique,
-            data_weights=data_weights,
-            pix_lengths=pix_lengths,
-        )
+        return UniqueMappingsCSR(offsets=offsets, indexes=indexes, weights=weights)
 
     @cached_property
     @profile_func
@@ -6,6 +6,8 @@ from autoconf import conf
 
 from autoarray import numba_util
 from autoarray import exc
+from autoarray.geometry import geometry_util
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
 from autoarray.inversion.pixelization.mesh import mesh_util
 
 
@@ -144,7 +146,141 @@ def data_slim_to_pixelization_unique_from(
     return data_to_pix_unique, data_weights, pix_lengths
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(int64, int64[:, ::1], int64[::1], int64[:, ::1], int64, int64[::1])",
+        "(int64, int64[:, ::1], int64[::1], float64[:, ::1], int64, int64[::1])",
+    ],
+)
+def data_slim_to_pixelization_unique_csr_from(
+    data_pixels,
+    pix_indexes_for_sub_slim_index: np.ndarray,
+    pix_sizes_for_sub_slim_index: np.ndarray,
+    pix_weights_for_sub_slim_index,
+    pix_pixels: int,
+    sub_size: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Create the unique mappings between the sub-pixels of every slim data pixel and the pixelization pixels in a
+    compressed sparse row (CSR) format, in a single pass over the `PixSubWeights` of a mapper.
+
+    This computes the same quantities as `data_slim_to_pixelization_unique_from`, but rather than padding the
+    mappings of every data pixel to 2D arrays of shape [data_pixels, max_pix_mappings * max(sub_size) ** 2] they
+    are stored contiguously, where the unique mappings of data pixel `i` are stored in entries
+    `offsets[i]` to `offsets[i + 1]` of the `indexes` and `weights` arrays.
+
+    The order of the unique mappings of every data pixel is the same as `data_slim_to_pixelization_unique_from`,
+    such that `indexes[offsets[i]:offsets[i+1]] = data_to_pix_unique[i, :pix_lengths[i]]`.
+
+    Parameters
+    ----------
+    data_pixels
+        The total number of data pixels in the dataset.
+    pix_indexes_for_sub_slim_index
+        Maps an unmasked data sub pixel to its corresponding pixelization pixel.
+    pix_sizes_for_sub_slim_index
+        The number of pixelization pixels each data sub pixel maps too.
+    pix_weights_for_sub_slim_index
+        The interpolation weights of every data sub pixel's mappings to pixelization pixels.
+    pix_pixels
+        The total number of pixels in the pixelization.
+    sub_size
+        The size of the sub-grid defining the number of sub-pixels in every data pixel.
+
+    Returns
+    -------
+    ndarray
+        The CSR offsets, pixelization indexes and weights of the unique mappings between the sub-pixels of every
+        data pixel and the pixelization pixels.
+    """
+
+    sub_fraction = 1.0 / (sub_size**2.0)
+
+    total_mappings = 0
+
+    for ip_sub in range(pix_sizes_for_sub_slim_index.shape[0]):
+        total_mappings += pix_sizes_for_sub_slim_index[ip_sub]
+
+    offsets = np.zeros(data_pixels + 1, dtype=np.int64)
+    indexes = np.zeros(total_mappings, dtype=np.int64)
+    weights = np.zeros(total_mappings)
+
+    pix_check = -1 * np.ones(pix_pixels, dtype=np.int64)
+
+    ip_sub_start = 0
+    total = 0
+
+    for ip in range(data_pixels):
+        ip_sub_end = ip_sub_start + sub_size[ip] ** 2
+
+        for ip_sub in range(ip_sub_start, ip_sub_end):
+            for pix_interp_index in range(pix_sizes_for_sub_slim_index[ip_sub]):
+                pix = pix_indexes_for_sub_slim_index[ip_sub, pix_interp_index]
+                pixel_weight = pix_weights_for_sub_slim_index[ip_sub, pix_interp_index]
+
+                if pix_check[pix] > -1:
+                    weights[pix_check[pix]] += sub_fraction[ip] * pixel_weight
+
+                else:
+                    indexes[total] = pix
+                    weights[total] = sub_fraction[ip] * pixel_weight
+                    pix_check[pix] = total
+                    total += 1
+
+        for index in range(offsets[ip], total):
+            pix_check[indexes[index]] = -1
+
+        offsets[ip + 1] = total
+
+        ip_sub_start = ip_sub_end
+
+    return offsets, indexes[:total], weights[:total]
+
+
+def unique_mappings_csr_from(
+    data_to_pix_unique: np.ndarray, data_weights: np.ndarray, pix_lengths: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the unique mappings between the sub-pixels of every slim data pixel and the pixelization pixels in a
+    compressed sparse row (CSR) format, from the padded 2D arrays of these mappings computed via
+    `data_slim_to_pixelization_unique_from`.
+
+    This gives the same arrays as `data_slim_to_pixelization_unique_csr_from`, where the unique mappings of data
+    pixel `i` are stored in entries `offsets[i]` to `offsets[i + 1]` of the `indexes` and `weights` arrays.
+
+    Parameters
+    ----------
+    data_to_pix_unique
+        The unique mapping of every data pixel's grouped sub-pixels to pixelization pixels, padded to a 2D array.
+    data_weights
+        The weights of each data pixel's grouped sub-pixels to pixelization pixels, padded to a 2D array.
+    pix_lengths
+        The number of unique pixelization pixels each data pixel's grouped sub-pixels map too.
+
+    Returns
+    -------
+    ndarray
+        The CSR offsets, pixelization indexes and weights of the unique mappings between the sub-pixels of every
+        data pixel and the pixelization pixels.
+    """
+    pix_lengths = np.asarray(pix_lengths).astype("int")
+
+    unique_mask = (
+        np.arange(data_to_pix_unique.shape[1])[None, :] < pix_lengths[:, None]
+    )
+
+    offsets = np.concatenate((np.zeros(1, dtype="int"), np.cumsum(pix_lengths)))
+    indexes = np.asarray(data_to_pix_unique)[unique_mask].astype("int")
+    weights = np.asarray(data_weights)[unique_mask]
+
+    return offsets, indexes, weights
+
+
+@numba_util.jit(
+    hot_signatures=[
+        "(float64[:, ::1], int32[::1], int32[:, ::1], float64[:, ::1])",
+    ],
+)
 def pix_indexes_for_sub_slim_index_delaunay_from(
     source_plane_data_grid,
     simplex_index_for_sub_slim_index,
@@ -195,7 +331,14 @@ def nearest_pixelization_index_for_slim_index_from_kdtree(grid, mesh_grid):
     return sparse_index_for_slim_index
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        (
+            "(float64[:, ::1], float64[:, ::1], Array(int64, 1, 'C', readonly=True), "
+            "int64[:, ::1])"
+        ),
+    ],
+)
 def pixel_weights_delaunay_from(
     source_plane_data_grid,
     source_plane_mesh_grid,
@@ -260,6 +403,132 @@ def pixel_weights_delaunay_from(
     return pixel_weights
 
 
+def rectangular_pix_indexes_for_sub_slim_index_from(
+    source_plane_data_grid: np.ndarray,
+    shape_native: Tuple[int, int],
+    pixel_scales: Tuple[float, float],
+    origin: Tuple[float, float],
+) -> np.ndarray:
+    """
+    Returns the index of the rectangular mesh pixel that every (y,x) coordinate in the `source_plane_data_grid`
+    falls within, which are the nearest-pixel mappings used by a `MapperRectangular`.
+
+    The pixel coordinates are computed for the whole grid at once, floored to integer pixels and clipped to the
+    bounds of the mesh, such that coordinates on (or marginally beyond) the mesh edge map to an edge pixel.
+
+    Parameters
+    ----------
+    source_plane_data_grid
+        A 2D grid of (y,x) coordinates associated with the unmasked 2D data after it has been transformed to the
+        `source` reference frame.
+    shape_native
+        The (y,x) shape of the rectangular mesh.
+    pixel_scales
+        The (y,x) scaled units to pixel units conversion factor of the rectangular mesh.
+    origin
+        The (y,x) origin of the rectangular mesh.
+
+    Returns
+    -------
+    The 1D mesh pixel index of every data sub-pixel, with shape [total_sub_pixels].
+    """
+    affine = affine_transform_2d_cached_from(
+        shape_native=(int(shape_native[0]), int(shape_native[1])),
+        pixel_scales=(float(pixel_scales[0]), float(pixel_scales[1])),
+        origin=(float(origin[0]), float(origin[1])),
+    )
+
+    pixels = affine.pixels_from(grid_scaled_2d_slim=source_plane_data_grid)
+
+    pixel_y = np.clip(np.floor(pixels[:, 0]), 0, shape_native[0] - 1).astype("int")
+    pixel_x = np.clip(np.floor(pixels[:, 1]), 0, shape_native[1] - 1).astype("int")
+
+    return pixel_y * shape_native[1] + pixel_x
+
+
+def rectangular_pix_sub_weights_bilinear_from(
+    source_plane_data_grid: np.ndarray,
+    shape_native: Tuple[int, int],
+    pixel_scales: Tuple[float, float],
+    origin: Tuple[float, float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the mappings, sizes and weights of every (y,x) coordinate in the `source_plane_data_grid` to a
+    rectangular mesh using bilinear interpolation, which are used by a `MapperRectangular` whose mesh has
+    `interpolate=True`.
+
+    Every coordinate maps to the four rectangular pixels whose centres surround it, ordered top-left, top-right,
+    bottom-left and bottom-right. The weight of each mapping is the bilinear interpolation weight of that pixel
+    centre, such that the four weights sum to 1.
+
+    Coordinates within half a pixel of the mesh edge (where there are not four surrounding pixel centres) have their
+    fractional offsets clipped, such that all of their weight is given to the nearest edge pixels.
+
+    All calculations are performed on the whole grid at once using array operations.
+
+    Parameters
+    ----------
+    source_plane_data_grid
+        A 2D grid of (y,x) coordinates associated with the unmasked 2D data after it has been transformed to the
+        `source` reference frame.
+    shape_native
+        The (y,x) shape of the rectangular mesh.
+    pixel_scales
+        The (y,x) scaled units to pixel units conversion factor of the rectangular mesh.
+    origin
+        The (y,x) origin of the rectangular mesh.
+
+    Returns
+    -------
+    The mappings of shape [total_sub_pixels, 4], sizes of shape [total_sub_pixels] and weights of shape
+    [total_sub_pixels, 4].
+    """
+    affine = affine_transform_2d_cached_from(
+        shape_native=(int(shape_native[0]), int(shape_native[1])),
+        pixel_scales=(float(pixel_scales[0]), float(pixel_scales[1])),
+        origin=(float(origin[0]), float(origin[1])),
+    )
+
+    pixels = affine.pixels_from(grid_scaled_2d_slim=source_plane_data_grid)
+
+    pixels -= 0.5
+
+    pixels_y = pixels[:, 0]
+    pixels_x = pixels[:, 1]
+
+    pixel_y = np.clip(np.floor(pixels_y), 0, shape_native[0] - 2).astype("int")
+    pixel_x = np.clip(np.floor(pixels_x), 0, shape_native[1] - 2).astype("int")
+
+    dy = np.clip(pixels_y - pixel_y, 0.0, 1.0)
+    dx = np.clip(pixels_x - pixel_x, 0.0, 1.0)
+
+    top_left = pixel_y * shape_native[1] + pixel_x
+
+    mappings = np.stack(
+        (
+            top_left,
+            top_left + 1,
+            top_left + shape_native[1],
+            top_left + shape_native[1] + 1,
+        ),
+        axis=1,
+    )
+
+    weights = np.stack(
+        (
+            (1.0 - dy) * (1.0 - dx),
+            (1.0 - dy) * dx,
+            dy * (1.0 - dx),
+            dy * dx,
+        ),
+        axis=1,
+    )
+
+    sizes = 4 * np.ones(mappings.shape[0], dtype="int")
+
+    return mappings, sizes, weights
+
+
 def pix_size_weights_voronoi_nn_from(
     grid: np.ndarray, mesh_grid: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -469,7 +738,18 @@ def adaptive_pixel_signals_from(
     return pixel_signals**signal_scale
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        (
+            "(int64[:, ::1], int64[::1], int64[:, ::1], int64, int64, "
+            "Array(int64, 1, 'C', readonly=True), float64[::1])"
+        ),
+        (
+            "(int64[:, ::1], int64[::1], float64[:, ::1], int64, int64, "
+            "Array(int64, 1, 'C', readonly=True), float64[::1])"
+        ),
+    ],
+)
 def mapping_matrix_from(
     pix_indexes_for_sub_slim_index: np.ndarray,
     pix_size_for_sub_slim_index: np.ndarray,
@@ -605,7 +885,6 @@ def mapped_to_source_via_mapping_matrix_from(
     return mapped_to_source
 
 
-@numba_util.jit()
 def data_weight_total_for_pix_from(
     pix_indexes_for_sub_slim_index: np.ndarray,
     pix_weights_for_sub_slim_index: np.ndarray,
@@ -623,14 +902,16 @@ def data_weight_total_for_pix_from(
         The weights of the mappings of every data sub-pixel and pixelization pixel.
     pixels
         The number of pixels in the pixelization.
+
+    Entries of `pix_indexes_for_sub_slim_index` which are -1 (e.g. padding of an interpolation with fewer than
+    the maximum number of mappings) are skipped.
     """
 
-    pix_weight_total = np.zeros(pixels)
+    pix_indexes = np.asarray(pix_indexes_for_sub_slim_index).astype("int").ravel()
+    pix_weights = np.asarray(pix_weights_for_sub_slim_index).ravel()
 
-    for slim_index, pix_indexes in enumerate(pix_indexes_for_sub_slim_index):
-        for pix_index, weight in zip(
-            pix_indexes, pix_weights_for_sub_slim_index[slim_index]
-        ):
-            pix_weight_total[int(pix_index)] += weight
+    mapped = pix_indexes >= 0
 
-    return pix_weight_total
+    return np.bincount(
+        pix_indexes[mapped], weights=pix_weights[mapped], minlength=pixels
+    ).astype("float")
@@ -7,7 +7,7 @@ from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
 from autoarray.inversion.pixelization.mappers.abstract import PixSubWeights
 
 from autoarray.numba_util import profile_func
-from autoarray.geometry import geometry_util
+from autoarray.inversion.pixelization.mappers import mapper_util
 
 
 class MapperRectangular(AbstractMapper):
@@ -98,18 +98,37 @@ class MapperRectangular(AbstractMapper):
         For a Rectangular pixelization each data sub-pixel maps to a single mesh pixel, thus the second
         dimension of the array `pix_indexes_for_sub_slim_index` 1 and all entries in `pix_weights_for_sub_slim_index`
         are equal to 1.0.
-        """
-        mappings = geometry_util.grid_pixel_indexes_2d_slim_from(
-            grid_scaled_2d_slim=np.array(self.source_plane_data_grid),
-            shape_native=self.source_plane_mesh_grid.shape_native,
-            pixel_scales=self.source_plane_mesh_grid.pixel_scales,
-            origin=self.source_plane_mesh_grid.origin,
-        ).astype("int")
 
-        mappings = mappings.reshape((len(mappings), 1))
+        These mappings are computed for every sub-pixel at once via a vectorized floor and clip of the sub-pixel
+        coordinates to the rectangular mesh (see `mapper_util.rectangular_pix_indexes_for_sub_slim_index_from`).
+
+        If the mesh uses interpolation (`interpolate=True`), each data sub-pixel instead maps to the four mesh pixels
+        whose centres surround it, with bilinear interpolation weights (see
+        `mapper_util.rectangular_pix_sub_weights_bilinear_from`).
+        """
+        mesh_grid = self.source_plane_mesh_grid
+
+        if mesh_grid.interpolate:
+            mappings, sizes, weights = (
+                mapper_util.rectangular_pix_sub_weights_bilinear_from(
+                    source_plane_data_grid=np.array(self.source_plane_data_grid),
+                    shape_native=mesh_grid.shape_native,
+                    pixel_scales=mesh_grid.pixel_scales,
+                    origin=mesh_grid.origin,
+                )
+            )
+
+            return PixSubWeights(mappings=mappings, sizes=sizes, weights=weights)
+
+        mappings = mapper_util.rectangular_pix_indexes_for_sub_slim_index_from(
+            source_plane_data_grid=np.array(self.source_plane_data_grid),
+            shape_native=mesh_grid.shape_native,
+            pixel_scales=mesh_grid.pixel_scales,
+            origin=mesh_grid.origin,
+        )
 
         return PixSubWeights(
             mappings=mappings.reshape((len(mappings), 1)),
             sizes=np.ones(len(mappings), dtype="int"),
-            weights=np.ones((len(self.source_plane_data_grid), 1), dtype="int"),
+            weights=np.ones((len(mappings), 1), dtype="int"),
         )
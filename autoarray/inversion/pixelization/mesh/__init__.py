@@ -1,4 +1,31 @@
-from .abstract import AbstractMesh as Mesh
-from .rectangular import Rectangular
-from .voronoi import Voronoi
-from .delaunay import Delaunay
+import importlib
+
+"""
+The meshes are imported when they are first accessed (see `autoarray/__init__.py`), so that the mesh structures
+(e.g. `Mesh2DRectangular`) can import `mesh_util` without importing every mesh, which import these structures.
+"""
+_lazy_dict = {
+    "Mesh": (".abstract", "AbstractMesh"),
+    "Rectangular": (".rectangular", "Rectangular"),
+    "Voronoi": (".voronoi", "Voronoi"),
+    "Delaunay": (".delaunay", "Delaunay"),
+}
+
+__all__ = list(_lazy_dict)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr_name = _lazy_dict[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_dict))
@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 import scipy.spatial
 from typing import List, Tuple, Union
@@ -5,7 +6,6 @@ from typing import List, Tuple, Union
 from autoarray import numba_util
 
 
-@numba_util.jit()
 def rectangular_neighbors_from(
     shape_native: Tuple[int, int]
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -31,266 +31,83 @@ def rectangular_neighbors_from(
 
     - For pixel 4, the central pixel, neighbors[4,:] = [1, 3, 5, 7] and neighbors_sizes[4] = 4.
 
-    Parameters
-    ----------
-    shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
-
-    Returns
-    -------
-    The ndarrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
-    """
-
-    pixels = int(shape_native[0] * shape_native[1])
-
-    neighbors = -1 * np.ones(shape=(pixels, 4))
-    neighbors_sizes = np.zeros(pixels)
-
-    neighbors, neighbors_sizes = rectangular_corner_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-    neighbors, neighbors_sizes = rectangular_top_edge_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-    neighbors, neighbors_sizes = rectangular_left_edge_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-    neighbors, neighbors_sizes = rectangular_right_edge_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-    neighbors, neighbors_sizes = rectangular_bottom_edge_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-    neighbors, neighbors_sizes = rectangular_central_neighbors(
-        neighbors=neighbors, neighbors_sizes=neighbors_sizes, shape_native=shape_native
-    )
-
-    return neighbors, neighbors_sizes
-
-
-@numba_util.jit()
-def rectangular_corner_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
-) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are on the corners.
+    The neighbors of a rectangular pixelization depend only on its shape, which is fixed throughout a model-fit,
+    therefore the result is memoised per `shape_native` (see `rectangular_neighbors_cached_from`) and the returned
+    arrays are copies which can be safely modified by the caller.
 
     Parameters
     ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
     shape_native
         The shape of the rectangular 2D pixelization which pixels are defined on.
 
     Returns
     -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
+    The ndarrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
     """
-
-    pixels = int(shape_native[0] * shape_native[1])
-
-    neighbors[0, 0:2] = np.array([1, shape_native[1]])
-    neighbors_sizes[0] = 2
-
-    neighbors[shape_native[1] - 1, 0:2] = np.array(
-        [shape_native[1] - 2, shape_native[1] + shape_native[1] - 1]
-    )
-    neighbors_sizes[shape_native[1] - 1] = 2
-
-    neighbors[pixels - shape_native[1], 0:2] = np.array(
-        [pixels - shape_native[1] * 2, pixels - shape_native[1] + 1]
+    neighbors, neighbors_sizes = rectangular_neighbors_cached_from(
+        shape_native=(int(shape_native[0]), int(shape_native[1]))
     )
-    neighbors_sizes[pixels - shape_native[1]] = 2
-
-    neighbors[pixels - 1, 0:2] = np.array([pixels - shape_native[1] - 1, pixels - 2])
-    neighbors_sizes[pixels - 1] = 2
-
-    return neighbors, neighbors_sizes
 
+    return neighbors.copy(), neighbors_sizes.copy()
 
-@numba_util.jit()
-def rectangular_top_edge_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
-) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are on the top edge.
-
-    Parameters
-    ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
-    shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
-
-    Returns
-    -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
-    """
-    for pix in range(1, shape_native[1] - 1):
-        pixel_index = pix
-        neighbors[pixel_index, 0:3] = np.array(
-            [pixel_index - 1, pixel_index + 1, pixel_index + shape_native[1]]
-        )
-        neighbors_sizes[pixel_index] = 3
-
-    return neighbors, neighbors_sizes
-
-
-@numba_util.jit()
-def rectangular_left_edge_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
-) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are on the left edge.
 
-    Parameters
-    ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
-    shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
-
-    Returns
-    -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
-    """
-    for pix in range(1, shape_native[0] - 1):
-        pixel_index = pix * shape_native[1]
-        neighbors[pixel_index, 0:3] = np.array(
-            [
-                pixel_index - shape_native[1],
-                pixel_index + 1,
-                pixel_index + shape_native[1],
-            ]
-        )
-        neighbors_sizes[pixel_index] = 3
-
-    return neighbors, neighbors_sizes
-
-
-@numba_util.jit()
-def rectangular_right_edge_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
+@functools.lru_cache(maxsize=32)
+def rectangular_neighbors_cached_from(
+    shape_native: Tuple[int, int]
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are on the right edge.
-
-    Parameters
-    ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
-    shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
-
-    Returns
-    -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
-    """
-    for pix in range(1, shape_native[0] - 1):
-        pixel_index = pix * shape_native[1] + shape_native[1] - 1
-        neighbors[pixel_index, 0:3] = np.array(
-            [
-                pixel_index - shape_native[1],
-                pixel_index - 1,
-                pixel_index + shape_native[1],
-            ]
-        )
-        neighbors_sizes[pixel_index] = 3
+    Returns the neighbors of every pixel on a rectangular pixelization, as described in the
+    function `rectangular_neighbors_from()`, memoised per `shape_native`.
 
-    return neighbors, neighbors_sizes
+    The neighbors are computed for all pixels at once using array operations. Every pixel has four candidate
+    neighbors, ordered above (index - x_pixels), left (index - 1), right (index + 1) and below (index + x_pixels),
+    which is ascending 1D index order. Candidates which fall outside the rectangular pixelization are removed and
+    the remaining neighbors shifted to the front of each row, with the trailing entries filled with -1.
 
-
-@numba_util.jit()
-def rectangular_bottom_edge_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
-) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are on the bottom edge.
+    The returned arrays are shared between all callers with the same `shape_native` and are therefore set to
+    read-only.
 
     Parameters
     ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
     shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
+        The shape of the rectangular 2D pixelization which pixels are defined on, which must be a tuple of ints so
+        that it is hashable.
 
     Returns
     -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
+    The read-only ndarrays containing the 1D index of every pixel's neighbors and the number of neighbors that each
+    pixel has.
     """
-    pixels = int(shape_native[0] * shape_native[1])
-
-    for pix in range(1, shape_native[1] - 1):
-        pixel_index = pixels - pix - 1
-        neighbors[pixel_index, 0:3] = np.array(
-            [pixel_index - shape_native[1], pixel_index - 1, pixel_index + 1]
-        )
-        neighbors_sizes[pixel_index] = 3
-
-    return neighbors, neighbors_sizes
-
+    y_pixels, x_pixels = shape_native
+
+    y, x = np.divmod(np.arange(y_pixels * x_pixels), x_pixels)
+    pixel_index = y * x_pixels + x
+
+    candidates = np.stack(
+        (
+            pixel_index - x_pixels,
+            pixel_index - 1,
+            pixel_index + 1,
+            pixel_index + x_pixels,
+        ),
+        axis=1,
+    )
+    valid = np.stack(
+        (y > 0, x > 0, x < x_pixels - 1, y < y_pixels - 1),
+        axis=1,
+    )
 
-@numba_util.jit()
-def rectangular_central_neighbors(
-    neighbors: np.ndarray, neighbors_sizes: np.ndarray, shape_native: Tuple[int, int]
-) -> Tuple[np.ndarray, np.ndarray]:
-    """
-    Updates the `neighbors` and `neighbors_sizes` arrays described in the function
-    `rectangular_neighbors_from()` for pixels on the rectangular pixelization that are in the centre and thus have 4
-    adjacent neighbors.
+    order = np.argsort(~valid, axis=1, kind="stable")
 
-    Parameters
-    ----------
-    neighbors
-        An array of dimensions [total_pixels, 4] which provides the index of all neighbors of every pixel in
-        the rectangular pixelization (entries of -1 correspond to no neighbor).
-    neighbors_sizes
-        An array of dimensions [total_pixels] which gives the number of neighbors of every pixel in the rectangular
-        pixelization.
-    shape_native
-        The shape of the rectangular 2D pixelization which pixels are defined on.
+    neighbors = np.where(
+        np.take_along_axis(valid, order, axis=1),
+        np.take_along_axis(candidates, order, axis=1),
+        -1,
+    )
+    neighbors_sizes = np.sum(valid, axis=1)
 
-    Returns
-    -------
-    The arrays containing the 1D index of every pixel's neighbors and the number of neighbors that each pixel has.
-    """
-    for x in range(1, shape_native[0] - 1):
-        for y in range(1, shape_native[1] - 1):
-            pixel_index = x * shape_native[1] + y
-            neighbors[pixel_index, 0:4] = np.array(
-                [
-                    pixel_index - shape_native[1],
-                    pixel_index - 1,
-                    pixel_index + 1,
-                    pixel_index + shape_native[1],
-                ]
-            )
-            neighbors_sizes[pixel_index] = 4
+    neighbors.flags.writeable = False
+    neighbors_sizes.flags.writeable = False
 
     return neighbors, neighbors_sizes
 
@@ -312,13 +129,7 @@ def rectangular_edge_pixel_list_from(neighbors: np.ndarray) -> List:
     -------
     A list of the 1D indices of all pixels on the edge of a rectangular pixelization.
     """
-    edge_pixel_list = []
-
-    for i, neighbors in enumerate(neighbors):
-        if -1 in neighbors:
-            edge_pixel_list.append(i)
-
-    return edge_pixel_list
+    return np.where(np.any(np.asarray(neighbors) == -1, axis=1))[0].tolist()
 
 
 @numba_util.jit()
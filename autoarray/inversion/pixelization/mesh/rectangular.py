@@ -14,7 +14,7 @@ from autoarray.numba_util import profile_func
 
 
 class Rectangular(AbstractMesh):
-    def __init__(self, shape: Tuple[int, int] = (3, 3)):
+    def __init__(self, shape: Tuple[int, int] = (3, 3), interpolate: bool = False):
         """
         A uniform mesh of rectangular pixels, which without interpolation are paired with a 2D grid of (y,x)
         coordinates.
@@ -35,12 +35,18 @@ class Rectangular(AbstractMesh):
         It does not have a ``image_plane_mesh_grid`` because a rectangular pixelization is constructed by overlaying
         a grid of rectangular over the `source_plane_data_grid`.
 
-        Each (y,x) coordinate in the `source_plane_data_grid` is associated with the rectangular pixelization pixel
-        it falls within. No interpolation is performed when making these associations.
+        By default, each (y,x) coordinate in the `source_plane_data_grid` is associated with the rectangular
+        pixelization pixel it falls within and no interpolation is performed when making these associations. If
+        `interpolate=True`, each coordinate is instead associated with the four pixels whose centres surround it,
+        using bilinear interpolation weights.
+
         Parameters
         ----------
         shape
             The 2D dimensions of the rectangular grid of pixels (total_y_pixels, total_x_pixel).
+        interpolate
+            If `True`, data points are mapped to the mesh using bilinear interpolation, as opposed to the single
+            rectangular pixel they fall within.
         """
 
         if shape[0] <= 2 or shape[1] <= 2:
@@ -50,6 +56,7 @@ class Rectangular(AbstractMesh):
 
         self.shape = (int(shape[0]), int(shape[1]))
         self.pixels = self.shape[0] * self.shape[1]
+        self.interpolate = interpolate
         super().__init__()
 
         self.run_time_dict = {}
@@ -141,7 +148,9 @@ class Rectangular(AbstractMesh):
             by overlaying the `source_plane_data_grid` with the rectangular pixelization.
         """
         return Mesh2DRectangular.overlay_grid(
-            shape_native=self.shape, grid=source_plane_data_grid
+            shape_native=self.shape,
+            grid=source_plane_data_grid,
+            interpolate=self.interpolate,
         )
 
     @property
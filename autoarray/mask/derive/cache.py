@@ -0,0 +1,82 @@
+from __future__ import annotations
+import numpy as np
+from typing import TYPE_CHECKING, Callable, Dict, Hashable
+
+from autoarray.cache_util import LRUCache
+
+if TYPE_CHECKING:
+    from autoarray.mask.mask_2d import Mask2D
+
+"""
+The quantities derived from every mask (e.g. its `native_for_slim` indexes, edge and border indexes, grids and
+blurring masks), memoised on the mask's `content_hash` (see `derived_from`).
+"""
+derived_cache = LRUCache(size=128)
+
+
+def derived_from(mask: Mask2D, name: Hashable, func: Callable) -> np.ndarray:
+    """
+    Returns a quantity derived from a mask, memoised on the mask's `content_hash` and the name of the quantity.
+
+    The same mask is often reconstructed many times (e.g. when a dataset is masked, loaded from .fits or copied),
+    with every new instance previously recomputing its derived quantities. Masks with identical values,
+    `pixel_scales` and `origin` now share the same derived quantities, which are stored in a module level
+    least-recently-used cache of up to `derived_cache.size` entries.
+
+    Cached quantities are read-only `ndarray`'s, because they are shared by every equal mask. Functions which wrap
+    them in a data structure (e.g. a `Grid2D`) should copy them first if the structure may be modified in-place.
+
+    Parameters
+    ----------
+    mask
+        The mask from which the quantity is derived.
+    name
+        The name of the quantity, which includes any inputs the quantity depends on other than the mask (e.g. the
+        kernel shape of a blurring mask).
+    func
+        A function taking no arguments which computes the quantity as an `ndarray`, called if it is not cached.
+    """
+
+    def value_from():
+        value = np.asarray(func())
+        value.setflags(write=False)
+
+        return value
+
+    return derived_cache.value_from(key=(mask.content_hash, name), func=value_from)
+
+
+def derived_dict_from(mask: Mask2D) -> Dict[str, np.ndarray]:
+    """
+    Returns every quantity derived from a mask which is currently in the cache and named by a string, for example
+    so that they can be output alongside the mask and added back to the cache via `derived_dict_to_cache` when
+    it is loaded in another process.
+
+    Parameters
+    ----------
+    mask
+        The mask whose cached derived quantities are returned.
+    """
+    content_hash = mask.content_hash
+
+    return {
+        name: value
+        for (key_hash, name), value in derived_cache.items()
+        if key_hash == content_hash and isinstance(name, str)
+    }
+
+
+def derived_dict_to_cache(mask: Mask2D, derived_dict: Dict[str, np.ndarray]):
+    """
+    Add quantities derived from a mask (e.g. those returned by `derived_dict_from`) to the cache, such that they
+    are not recomputed for the mask or any mask equal to it.
+
+    Parameters
+    ----------
+    mask
+        The mask the quantities are derived from.
+    derived_dict
+        The derived quantities, where every key is the name of a quantity.
+    """
+    for name, value in derived_dict.items():
+        derived_from(mask=mask, name=name, func=lambda value=value: value)
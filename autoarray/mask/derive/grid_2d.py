@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from autoarray.mask.mask_2d import Mask2D
     from autoarray.structures.grids.uniform_2d import Grid2D
 
+from autoarray.mask.derive.cache import derived_from
 from autoarray.structures.grids import grid_2d_util
 
 
@@ -114,6 +115,22 @@ class DeriveGrid2D:
 
         return Grid2D(values=grid_slim, mask=self.mask.derive_mask.all_false)
 
+    @property
+    def _unmasked_slim(self) -> np.ndarray:
+        """
+        The read-only (y,x) scaled coordinates of every unmasked pixel, which are shared by all equal masks (see
+        `autoarray.mask.derive.cache`).
+        """
+        return derived_from(
+            mask=self.mask,
+            name="grid_unmasked_slim",
+            func=lambda: grid_2d_util.grid_2d_slim_via_mask_from(
+                mask_2d=np.array(self.mask),
+                pixel_scales=self.mask.pixel_scales,
+                origin=self.mask.origin,
+            ),
+        )
+
     @property
     def unmasked(self) -> Grid2D:
         """
@@ -158,12 +175,9 @@ class DeriveGrid2D:
         """
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        grid_1d = grid_2d_util.grid_2d_slim_via_mask_from(
-            mask_2d=np.array(self.mask),
-            pixel_scales=self.mask.pixel_scales,
-            origin=self.mask.origin,
+        return Grid2D._from_slim_unchecked(
+            values=np.array(self._unmasked_slim), mask=self.mask
         )
-        return Grid2D(values=grid_1d, mask=self.mask)
 
     @property
     def edge(self) -> Grid2D:
@@ -216,8 +230,8 @@ class DeriveGrid2D:
 
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        edge_grid_1d = self.unmasked[self.mask.derive_indexes.edge_slim]
-        return Grid2D(
+        edge_grid_1d = self._unmasked_slim[self.mask.derive_indexes.edge_slim]
+        return Grid2D._from_slim_unchecked(
             values=edge_grid_1d,
             mask=self.mask.derive_mask.edge,
         )
@@ -284,8 +298,8 @@ class DeriveGrid2D:
         """
         from autoarray.structures.grids.uniform_2d import Grid2D
 
-        border = self.unmasked[self.mask.derive_indexes.border_slim]
-        return Grid2D(
+        border = self._unmasked_slim[self.mask.derive_indexes.border_slim]
+        return Grid2D._from_slim_unchecked(
             values=border,
             mask=self.mask.derive_mask.border,
         )
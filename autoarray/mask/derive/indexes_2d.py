@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from autoarray.mask.mask_2d import Mask2D
 
 from autoarray.mask import mask_2d_util
+from autoarray.mask.derive.cache import derived_from
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -108,9 +109,13 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.unmasked_slim)
         """
-        return mask_2d_util.mask_slim_indexes_from(
-            mask_2d=np.array(self.mask), return_masked_indexes=False
-        ).astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="unmasked_slim",
+            func=lambda: mask_2d_util.mask_slim_indexes_from(
+                mask_2d=np.array(self.mask), return_masked_indexes=False
+            ).astype("int"),
+        )
 
     @property
     def masked_slim(self) -> np.ndarray:
@@ -150,9 +155,13 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.masked_slim)
         """
-        return mask_2d_util.mask_slim_indexes_from(
-            mask_2d=np.array(self.mask), return_masked_indexes=True
-        ).astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="masked_slim",
+            func=lambda: mask_2d_util.mask_slim_indexes_from(
+                mask_2d=np.array(self.mask), return_masked_indexes=True
+            ).astype("int"),
+        )
 
     @property
     def edge_slim(self) -> np.ndarray:
@@ -198,8 +207,12 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.edge_slim)
         """
-        return mask_2d_util.edge_1d_indexes_from(mask_2d=np.array(self.mask)).astype(
-            "int"
+        return derived_from(
+            mask=self.mask,
+            name="edge_slim",
+            func=lambda: mask_2d_util.edge_1d_indexes_from(
+                mask_2d=np.array(self.mask)
+            ).astype("int"),
         )
 
     @property
@@ -246,7 +259,11 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.edge_native)
         """
-        return self.native_for_slim[self.edge_slim].astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="edge_native",
+            func=lambda: self.native_for_slim[self.edge_slim].astype("int"),
+        )
 
     @property
     def border_slim(self) -> np.ndarray:
@@ -300,9 +317,13 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.border_slim)
         """
-        return mask_2d_util.border_slim_indexes_from(
-            mask_2d=np.array(self.mask)
-        ).astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="border_slim",
+            func=lambda: mask_2d_util.border_slim_indexes_from(
+                mask_2d=np.array(self.mask)
+            ).astype("int"),
+        )
 
     @property
     def border_native(self) -> np.ndarray:
@@ -360,7 +381,11 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.border_native)
         """
-        return self.native_for_slim[self.border_slim].astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="border_native",
+            func=lambda: self.native_for_slim[self.border_slim].astype("int"),
+        )
 
     @property
     def native_for_slim(self) -> np.ndarray:
@@ -405,6 +430,10 @@ class DeriveIndexes2D:
 
             print(derive_indexes_2d.native_for_slim)
         """
-        return mask_2d_util.native_index_for_slim_index_2d_from(
-            mask_2d=np.array(self.mask),
-        ).astype("int")
+        return derived_from(
+            mask=self.mask,
+            name="native_for_slim",
+            func=lambda: mask_2d_util.native_index_for_slim_index_2d_from(
+                mask_2d=np.array(self.mask),
+            ).astype("int"),
+        )
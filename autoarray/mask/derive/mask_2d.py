@@ -12,6 +12,7 @@ from autoarray.mask.derive.indexes_2d import DeriveIndexes2D
 
 from autoarray.structures.arrays import array_2d_util
 from autoarray.mask import mask_2d_util
+from autoarray.mask.derive.cache import derived_from
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -203,9 +204,13 @@ class DeriveMask2D:
         if kernel_shape_native[0] % 2 == 0 or kernel_shape_native[1] % 2 == 0:
             raise exc.MaskException("psf_size of exterior region must be odd")
 
-        blurring_mask = mask_2d_util.blurring_mask_2d_from(
-            mask_2d=np.array(self.mask),
-            kernel_shape_native=kernel_shape_native,
+        blurring_mask = derived_from(
+            mask=self.mask,
+            name=("blurring", tuple(kernel_shape_native)),
+            func=lambda: mask_2d_util.blurring_mask_2d_from(
+                mask_2d=np.array(self.mask),
+                kernel_shape_native=kernel_shape_native,
+            ),
         )
 
         return Mask2D(
@@ -324,9 +329,13 @@ class DeriveMask2D:
         """
         from autoarray.mask.mask_2d import Mask2D
 
-        edge_buffed_mask = mask_2d_util.buffed_mask_2d_from(
-            mask_2d=np.array(self.mask)
-        ).astype("bool")
+        edge_buffed_mask = derived_from(
+            mask=self.mask,
+            name="edge_buffed",
+            func=lambda: mask_2d_util.buffed_mask_2d_from(
+                mask_2d=np.array(self.mask)
+            ).astype("bool"),
+        )
 
         return Mask2D(
             mask=edge_buffed_mask,
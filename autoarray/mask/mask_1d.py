@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from astropy.io import fits
 import logging
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from astropy.io import fits
 
 
 from autoarray.mask.abstract_mask import Mask
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from astropy.io import fits
 import copy
+import hashlib
 import logging
 import numpy as np
 from pathlib import Path
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, List, Tuple, Union
 from autoarray.structures.abstract_structure import Structure
 
 if TYPE_CHECKING:
+    from astropy.io import fits
+
     from autoarray.structures.arrays.uniform_2d import Array2D
 
 from autoconf import cached_property
@@ -234,6 +236,33 @@ class Mask2D(Mask):
             origin=self.origin,
         )
 
+    @property
+    def content_hash(self) -> str:
+        """
+        A hash of the mask's values, ``pixel_scales`` and ``origin``, which is identical for every ``Mask2D`` with
+        the same contents.
+
+        Quantities derived from the mask (e.g. via ``derive_indexes``, ``derive_mask`` and ``derive_grid``) are
+        memoised on this hash, so that masks which are reconstructed (e.g. when a dataset is masked, loaded from
+        .fits or copied) share them without recomputation.
+
+        The hash is recomputed on every call, because a mask's values can be changed in-place.
+        """
+        key = hashlib.sha1()
+
+        key.update(
+            repr(
+                (
+                    tuple(self.shape_native),
+                    tuple(float(value) for value in self.pixel_scales),
+                    tuple(float(value) for value in self.origin),
+                )
+            ).encode()
+        )
+        key.update(np.ascontiguousarray(self._array, dtype="bool").tobytes())
+
+        return key.hexdigest()
+
     @property
     def derive_indexes(self) -> DeriveIndexes2D:
         return DeriveIndexes2D(mask=self)
@@ -467,7 +467,104 @@ def mask_2d_elliptical_annular_from(
     return mask_2d
 
 
-@numba_util.jit()
+def window_any_from(
+    values: np.ndarray, window_range: Tuple[int, int], axis: int
+) -> np.ndarray:
+    """
+    Returns a boolean array which for every entry of an input boolean array is `True` if any entry of the input
+    array in the window `[index - window_range[1], index - window_range[0]]` along the input axis is `True`.
+
+    The window is evaluated via a cumulative sum of the input array, such that the run time does not depend on the
+    size of the window.
+
+    Parameters
+    ----------
+    values
+        The boolean array whose windows are checked for `True` entries.
+    window_range
+        The (lower, upper) offsets (inclusive) by which a `True` entry spreads along the axis.
+    axis
+        The axis along which the window is applied.
+
+    Returns
+    -------
+    np.ndarray
+        The boolean array where entries with a `True` value within their window are `True`.
+    """
+    total = values.shape[axis]
+
+    cumulative_shape = list(values.shape)
+    cumulative_shape[axis] = 1
+
+    cumulative = np.concatenate(
+        (np.zeros(cumulative_shape, dtype="int"), np.cumsum(values, axis=axis)),
+        axis=axis,
+    )
+
+    indexes = np.arange(total)
+
+    start = np.clip(indexes - window_range[1], 0, total)
+    end = np.clip(indexes - window_range[0] + 1, 0, total)
+
+    return (
+        np.take(cumulative, end, axis=axis) - np.take(cumulative, start, axis=axis)
+    ) > 0
+
+
+def dilated_mask_2d_from(
+    mask_2d: np.ndarray, y_range: Tuple[int, int], x_range: Tuple[int, int]
+) -> np.ndarray:
+    """
+    Returns a dilated mask from an input mask, where every `False` entry of the input mask is spread to all pixels
+    offset from it by between `y_range[0]` and `y_range[1]` pixels in y and `x_range[0]` and `x_range[1]` pixels in x
+    (inclusive).
+
+    This is a binary dilation of the unmasked pixels with a rectangular footprint (e.g. the shape of a kernel),
+    which is separable and therefore computed as two 1D dilations via the function `window_any_from`. Pixels
+    which the dilation moves beyond the edge of the mask are discarded.
+
+    The dilation is only computed within the bounding box of the unmasked pixels extended by the footprint, as all
+    other pixels remain masked.
+
+    Parameters
+    ----------
+    mask_2d
+        The mask whose `False` entries are dilated.
+    y_range
+        The (lower, upper) pixel offsets in y of the footprint.
+    x_range
+        The (lower, upper) pixel offsets in x of the footprint.
+
+    Returns
+    -------
+    np.ndarray
+        The dilated mask.
+    """
+    unmasked = ~np.asarray(mask_2d, dtype="bool")
+
+    dilated_mask_2d = np.full(unmasked.shape, True)
+
+    y_unmasked = np.flatnonzero(np.any(unmasked, axis=1))
+    x_unmasked = np.flatnonzero(np.any(unmasked, axis=0))
+
+    if y_unmasked.shape[0] == 0:
+        return dilated_mask_2d
+
+    y0 = max(y_unmasked[0] + min(y_range[0], 0), 0)
+    y1 = min(y_unmasked[-1] + max(y_range[1], 0), unmasked.shape[0] - 1) + 1
+    x0 = max(x_unmasked[0] + min(x_range[0], 0), 0)
+    x1 = min(x_unmasked[-1] + max(x_range[1], 0), unmasked.shape[1] - 1) + 1
+
+    unmasked = window_any_from(
+        values=unmasked[y0:y1, x0:x1], window_range=y_range, axis=0
+    )
+    unmasked = window_any_from(values=unmasked, window_range=x_range, axis=1)
+
+    dilated_mask_2d[y0:y1, x0:x1] = ~unmasked
+
+    return dilated_mask_2d
+
+
 def blurring_mask_2d_from(
     mask_2d: np.ndarray, kernel_shape_native: Tuple[int, int]
 ) -> np.ndarray:
@@ -503,32 +600,35 @@ def blurring_mask_2d_from(
 
     """
 
-    blurring_mask_2d = np.full(mask_2d.shape, True)
+    mask_2d = np.asarray(mask_2d, dtype="bool")
 
-    for y in range(mask_2d.shape[0]):
-        for x in range(mask_2d.shape[1]):
-            if not mask_2d[y, x]:
-                for y1 in range(
-                    (-kernel_shape_native[0] + 1) // 2,
-                    (kernel_shape_native[0] + 1) // 2,
-                ):
-                    for x1 in range(
-                        (-kernel_shape_native[1] + 1) // 2,
-                        (kernel_shape_native[1] + 1) // 2,
-                    ):
-                        if (
-                            0 <= x + x1 <= mask_2d.shape[1] - 1
-                            and 0 <= y + y1 <= mask_2d.shape[0] - 1
-                        ):
-                            if mask_2d[y + y1, x + x1]:
-                                blurring_mask_2d[y + y1, x + x1] = False
-                        else:
-                            raise exc.MaskException(
-                                "setup_blurring_mask extends beyond the edge "
-                                "of the mask - pad the datas array before masking"
-                            )
-
-    return blurring_mask_2d
+    y_range = (
+        (-kernel_shape_native[0] + 1) // 2,
+        (kernel_shape_native[0] + 1) // 2 - 1,
+    )
+    x_range = (
+        (-kernel_shape_native[1] + 1) // 2,
+        (kernel_shape_native[1] + 1) // 2 - 1,
+    )
+
+    y_unmasked, x_unmasked = np.nonzero(~mask_2d)
+
+    if y_unmasked.shape[0] > 0 and (
+        y_unmasked.min() + y_range[0] < 0
+        or y_unmasked.max() + y_range[1] > mask_2d.shape[0] - 1
+        or x_unmasked.min() + x_range[0] < 0
+        or x_unmasked.max() + x_range[1] > mask_2d.shape[1] - 1
+    ):
+        raise exc.MaskException(
+            "setup_blurring_mask extends beyond the edge "
+            "of the mask - pad the datas array before masking"
+        )
+
+    dilated_mask_2d = dilated_mask_2d_from(
+        mask_2d=mask_2d, y_range=y_range, x_range=x_range
+    )
+
+    return ~(mask_2d & ~dilated_mask_2d)
 
 
 @numba_util.jit()
@@ -697,7 +797,90 @@ def total_edge_pixels_from(mask_2d: np.ndarray) -> int:
     return edge_pixel_total
 
 
-@numba_util.jit()
+def slim_indexes_from(mask_2d: np.ndarray, pixel_mask_2d: np.ndarray) -> np.ndarray:
+    """
+    Returns the slim indexes of a subset of the unmasked pixels of a mask (e.g. its edge pixels), which are the
+    `True` entries of an input 2D boolean array, in ascending order.
+
+    Parameters
+    ----------
+    mask_2d
+        The mask whose unmasked pixels define the slim indexes.
+    pixel_mask_2d
+        A 2D boolean array which is `True` for the unmasked pixels whose slim indexes are returned.
+
+    Returns
+    -------
+    np.ndarray
+        The slim indexes of the input pixels.
+    """
+    return np.searchsorted(
+        np.flatnonzero(~np.asarray(mask_2d, dtype="bool")),
+        np.flatnonzero(pixel_mask_2d),
+    )
+
+
+def edge_mask_2d_from(mask_2d: np.ndarray) -> np.ndarray:
+    """
+    Returns a 2D boolean array which is `True` for every edge pixel in the mask.
+
+    An edge pixel is defined as a pixel on the mask which is unmasked (has a `False`) value and at least 1 of its 8
+    direct neighbors is masked (is `True`). Pixels on the outer edge of the 2D array are not edge pixels, as not all
+    of their neighbors are contained in the array.
+
+    The neighbors are only checked within the bounding box of the unmasked pixels (extended by one pixel), as there
+    are no edge pixels outside of it.
+
+    Parameters
+    ----------
+    mask_2d
+        The mask for which the edge pixels are computed.
+
+    Returns
+    -------
+    np.ndarray
+        A 2D array which is `True` for all edge pixels on the mask.
+    """
+    mask_2d = np.asarray(mask_2d, dtype="bool")
+
+    edge_mask_2d = np.full(mask_2d.shape, False)
+
+    y_unmasked = np.flatnonzero(~np.all(mask_2d, axis=1))
+    x_unmasked = np.flatnonzero(~np.all(mask_2d, axis=0))
+
+    if y_unmasked.shape[0] == 0:
+        return edge_mask_2d
+
+    y0 = max(y_unmasked[0] - 1, 0)
+    y1 = min(y_unmasked[-1] + 1, mask_2d.shape[0] - 1) + 1
+    x0 = max(x_unmasked[0] - 1, 0)
+    x1 = min(x_unmasked[-1] + 1, mask_2d.shape[1] - 1) + 1
+
+    total_y = y1 - y0
+    total_x = x1 - x0
+
+    if total_y < 3 or total_x < 3:
+        return edge_mask_2d
+
+    mask_2d = mask_2d[y0:y1, x0:x1]
+
+    neighbor_masked = np.full((total_y - 2, total_x - 2), False)
+
+    for y_offset in (-1, 0, 1):
+        for x_offset in (-1, 0, 1):
+            if y_offset != 0 or x_offset != 0:
+                neighbor_masked |= mask_2d[
+                    1 + y_offset : total_y - 1 + y_offset,
+                    1 + x_offset : total_x - 1 + x_offset,
+                ]
+
+    edge_mask_2d[y0 + 1 : y1 - 1, x0 + 1 : x1 - 1] = (
+        ~mask_2d[1:-1, 1:-1] & neighbor_masked
+    )
+
+    return edge_mask_2d
+
+
 def edge_1d_indexes_from(mask_2d: np.ndarray) -> np.ndarray:
     """
     Returns a 1D array listing all edge pixel indexes in the mask.
@@ -734,31 +917,11 @@ def edge_1d_indexes_from(mask_2d: np.ndarray) -> np.ndarray:
         The 1D indexes of all edge pixels on the mask.
     """
 
-    edge_pixel_total = total_edge_pixels_from(mask_2d)
-
-    edge_pixels = np.zeros(edge_pixel_total)
-    edge_index = 0
-    regular_index = 0
-
-    for y in range(1, mask_2d.shape[0] - 1):
-        for x in range(1, mask_2d.shape[1] - 1):
-            if not mask_2d[y, x]:
-                if (
-                    mask_2d[y + 1, x]
-                    or mask_2d[y - 1, x]
-                    or mask_2d[y, x + 1]
-                    or mask_2d[y, x - 1]
-                    or mask_2d[y + 1, x + 1]
-                    or mask_2d[y + 1, x - 1]
-                    or mask_2d[y - 1, x + 1]
-                    or mask_2d[y - 1, x - 1]
-                ):
-                    edge_pixels[edge_index] = regular_index
-                    edge_index += 1
-
-                regular_index += 1
+    mask_2d = np.asarray(mask_2d, dtype="bool")
 
-    return edge_pixels
+    return slim_indexes_from(
+        mask_2d=mask_2d, pixel_mask_2d=edge_mask_2d_from(mask_2d=mask_2d)
+    ).astype("float")
 
 
 @numba_util.jit()
@@ -847,7 +1010,6 @@ def total_border_pixels_from(mask_2d, edge_pixels, native_to_slim):
     return border_pixel_total
 
 
-@numba_util.jit()
 def border_slim_indexes_from(mask_2d: np.ndarray) -> np.ndarray:
     """
     Returns a slim array of shape [total_unmasked_border_pixels] listing all borders pixel indexes in the mask.
@@ -893,34 +1055,32 @@ def border_slim_indexes_from(mask_2d: np.ndarray) -> np.ndarray:
         The slimmed indexes of all border pixels on the mask.
     """
 
-    edge_pixels = edge_1d_indexes_from(mask_2d=mask_2d)
-    native_index_for_slim_index_2d = native_index_for_slim_index_2d_from(
-        mask_2d=mask_2d,
-    )
+    mask_2d = np.asarray(mask_2d, dtype="bool")
 
-    border_pixel_total = total_border_pixels_from(
-        mask_2d=mask_2d,
-        edge_pixels=edge_pixels,
-        native_to_slim=native_index_for_slim_index_2d,
-    )
+    unmasked = ~mask_2d
 
-    border_pixels = np.zeros(border_pixel_total)
+    y_edge, x_edge = np.nonzero(edge_mask_2d_from(mask_2d=mask_2d))
 
-    border_pixel_index = 0
+    first_unmasked_y = np.argmax(unmasked, axis=0)
+    last_unmasked_y = mask_2d.shape[0] - 1 - np.argmax(unmasked[::-1, :], axis=0)
+    first_unmasked_x = np.argmax(unmasked, axis=1)
+    last_unmasked_x = mask_2d.shape[1] - 1 - np.argmax(unmasked[:, ::-1], axis=1)
 
-    for edge_pixel_index in range(edge_pixels.shape[0]):
-        if check_if_border_pixel(
-            mask_2d=mask_2d,
-            edge_pixel_slim=edge_pixels[edge_pixel_index],
-            native_to_slim=native_index_for_slim_index_2d,
-        ):
-            border_pixels[border_pixel_index] = edge_pixels[edge_pixel_index]
-            border_pixel_index += 1
+    is_border = (
+        (y_edge == first_unmasked_y[x_edge])
+        | (y_edge == last_unmasked_y[x_edge])
+        | (x_edge == first_unmasked_x[y_edge])
+        | (x_edge == last_unmasked_x[y_edge])
+    )
 
-    return border_pixels
+    border_mask_2d = np.full(mask_2d.shape, False)
+    border_mask_2d[y_edge[is_border], x_edge[is_border]] = True
+
+    return slim_indexes_from(mask_2d=mask_2d, pixel_mask_2d=border_mask_2d).astype(
+        "float"
+    )
 
 
-@numba_util.jit()
 def buffed_mask_2d_from(mask_2d: np.ndarray, buffer: int = 1) -> np.ndarray:
     """
     Returns a buffed mask from an input mask, where the buffed mask is the input mask but all `False` entries in the
@@ -938,22 +1098,9 @@ def buffed_mask_2d_from(mask_2d: np.ndarray, buffer: int = 1) -> np.ndarray:
     np.ndarray
         The buffed mask.
     """
-    buffed_mask_2d = mask_2d.copy()
-
-    for y in range(mask_2d.shape[0]):
-        for x in range(mask_2d.shape[1]):
-            if not mask_2d[y, x]:
-                for y0 in range(y - buffer, y + 1 + buffer):
-                    for x0 in range(x - buffer, x + 1 + buffer):
-                        if (
-                            y0 >= 0
-                            and x0 >= 0
-                            and y0 <= mask_2d.shape[0] - 1
-                            and x0 <= mask_2d.shape[1] - 1
-                        ):
-                            buffed_mask_2d[y0, x0] = False
-
-    return buffed_mask_2d
+    return dilated_mask_2d_from(
+        mask_2d=mask_2d, y_range=(-buffer, buffer), x_range=(-buffer, buffer)
+    )
 
 
 def rescaled_mask_2d_from(mask_2d: np.ndarray, rescale_factor: float) -> np.ndarray:
@@ -1009,7 +1156,11 @@ def rescaled_mask_2d_from(mask_2d: np.ndarray, rescale_factor: float) -> np.ndar
     return np.isclose(rescaled_mask_2d, 1)
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(bool_[:, ::1],)",
+    ],
+)
 def native_index_for_slim_index_2d_from(
     mask_2d: np.ndarray,
 ) -> np.ndarray:
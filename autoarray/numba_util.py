@@ -1,12 +1,15 @@
+import importlib
+import importlib.util
 import os
 from functools import wraps
 import logging
 import time
-from typing import Callable
+from typing import Callable, Dict, List, Optional
 
 from autoconf import conf
 
 from autoarray import exc
+from autoarray import profiler
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +34,10 @@ except Exception:
     cache = True
     parallel = False
 
-try:
-    if os.environ.get("USE_JAX") == "1":
-        logger.warning("JAX and numba do not work together, so JAX is being used.")
-    else:
-        import numba
-
-except ModuleNotFoundError:
+# Whether numba is installed is checked without importing it, as it is only imported when a function is jitted.
+if os.environ.get("USE_JAX") == "1":
+    logger.warning("JAX and numba do not work together, so JAX is being used.")
+elif importlib.util.find_spec("numba") is None:
     logger.warning(
         f"\n******************************************************************************\n"
         f"Numba is not being used, either because it is disabled in `config/general.yaml` "
@@ -49,8 +49,49 @@ except ModuleNotFoundError:
     )
 
 
-def jit(nopython=nopython, cache=cache, parallel=parallel):
+# The numba signature strings of the jitted functions which dominate the first call of a fit, registered by the
+# `hot_signatures` input of `jit` (see `hot_signatures_from`).
+hot_signature_dict: Dict[str, List[str]] = {}
+
+# The modules whose jitted functions register `hot_signatures`, which are imported by `hot_signatures_from`.
+hot_signature_module_list = [
+    "autoarray.inversion.pixelization.mappers.mapper_util",
+    "autoarray.inversion.inversion.imaging.inversion_imaging_util",
+    "autoarray.inversion.inversion.inversion_util",
+    "autoarray.operators.convolver",
+    "autoarray.operators.over_sampling.over_sample_util",
+    "autoarray.mask.mask_2d_util",
+]
+
+
+def jit(
+    nopython=nopython,
+    cache=cache,
+    parallel=parallel,
+    nogil=False,
+    hot_signatures: Optional[List[str]] = None,
+):
+    """
+    Decorate a function with `numba.jit`, using the settings in `config/general.yaml` unless overwritten.
+
+    If numba is not installed or is disabled in the config the function is returned undecorated.
+
+    Parameters
+    ----------
+    nogil
+        If `True` the compiled function releases the GIL, such that it can be run concurrently by multiple threads
+        (e.g. when the blocks of a curvature matrix are computed in a thread pool).
+    hot_signatures
+        The numba signature strings (e.g. `"(float64[:, ::1], int64[::1])"`) the function is called with in a
+        standard fit, which are registered so that `precompile` compiles them before the function is first called.
+    """
+
     def wrapper(func):
+        if hot_signatures is not None:
+            hot_signature_dict[f"{func.__module__}.{func.__qualname__}"] = list(
+                hot_signatures
+            )
+
         try:
             use_numba = conf.instance["general"]["numba"]["use_numba"]
 
@@ -63,7 +104,9 @@ def jit(nopython=nopython, cache=cache, parallel=parallel):
         try:
             import numba
 
-            return numba.jit(func, nopython=nopython, cache=cache, parallel=parallel)
+            return numba.jit(
+                func, nopython=nopython, cache=cache, parallel=parallel, nogil=nogil
+            )
 
         except ModuleNotFoundError:
             return func
@@ -71,6 +114,126 @@ def jit(nopython=nopython, cache=cache, parallel=parallel):
     return wrapper
 
 
+def hot_signatures_from() -> Dict[str, List[str]]:
+    """
+    The typed signatures of the jitted functions which dominate the first call of a fit, which are compiled by
+    `precompile` if no signatures are input.
+
+    Every signature is registered by the `hot_signatures` input of the `jit` decorator of its function, as a numba
+    signature string of the types the function is called with in a standard imaging fit, including whether an input
+    array is read-only (e.g. the indexes derived from a mask, which are shared between equal masks). A function
+    called with types not listed here is still compiled on its first call, as usual.
+
+    The signatures are only registered when the module of a function is imported, therefore the modules of the
+    jitted functions used by a fit (`hot_signature_module_list`) are imported first.
+    """
+    for module in hot_signature_module_list:
+        importlib.import_module(module)
+
+    return dict(hot_signature_dict)
+
+
+def jitted_func_from(name: str):
+    """
+    Returns a jitted function given by its module and qualified name, for example
+    `autoarray.operators.convolver.Convolver.convolve_jit`.
+
+    Parameters
+    ----------
+    name
+        The module and qualified name of the function, separated by dots.
+    """
+    parts = name.split(".")
+
+    for i in range(len(parts) - 1, 0, -1):
+        try:
+            obj = importlib.import_module(".".join(parts[:i]))
+        except ModuleNotFoundError:
+            continue
+
+        for attr in parts[i:]:
+            try:
+                obj = getattr(obj, attr)
+            except AttributeError as e:
+                raise exc.NumbaException(
+                    f"The jitted function {name} could not be found, as {attr} is not an attribute of "
+                    f"{obj.__name__}. Check the module and qualified name of the function are spelt correctly."
+                ) from e
+
+        return obj
+
+    raise exc.NumbaException(f"The jitted function {name} could not be imported.")
+
+
+def precompile(
+    signatures: Optional[Dict[str, List[tuple]]] = None,
+) -> Dict[str, float]:
+    """
+    Compile jitted functions for the input typed signatures before they are first called, returning the time
+    spent compiling every function.
+
+    Numba compiles a jitted function on its first call, which for the functions used by a fit takes several seconds.
+    Calling `precompile` when a process starts (e.g. when a worker of a batch job is created) moves this cost
+    to a single explicit step:
+
+    .. code-block:: python
+
+        import autoarray as aa
+
+        compile_time_dict = aa.numba_util.precompile()
+
+    When `cache` is `True` in `config/general.yaml` (the default) every compiled function is also written to numba's
+    on-disk cache, and loading it from the cache in later processes takes milliseconds. Running `precompile` once as
+    a build step (e.g. when a container image is created) therefore acts as an ahead-of-time compilation, after which
+    the start up of every worker is dominated by I/O. The cache is written next to the source of every module, or
+    to the directory given by the `NUMBA_CACHE_DIR` environment variable, which must be the same for the build step
+    and the workers.
+
+    If numba is not installed or disabled, no functions are compiled and an empty dictionary is returned.
+
+    Parameters
+    ----------
+    signatures
+        A dictionary mapping the module and qualified name of every jitted function to a list of its signatures,
+        where every signature is a tuple of numba types or a numba signature string (e.g. `"(float64[::1],)"`). If
+        `None`, the signatures of the functions which dominate the first call of a fit are used
+        (see `hot_signatures_from`).
+
+    Returns
+    -------
+    A dictionary mapping the name of every jitted function to the time in seconds spent compiling (or loading from
+    the cache) its signatures.
+    """
+    try:
+        import numba
+    except ModuleNotFoundError:
+        return {}
+
+    if signatures is None:
+        signatures = hot_signatures_from()
+
+    compile_time_dict = {}
+
+    for name, signature_list in signatures.items():
+        func = jitted_func_from(name=name)
+
+        if not isinstance(func, numba.core.dispatcher.Dispatcher):
+            continue
+
+        start = time.perf_counter()
+
+        for signature in signature_list:
+            func.compile(signature)
+
+        compile_time_dict[name] = time.perf_counter() - start
+
+        logger.info(
+            f"PRECOMPILE - {name} compiled in {compile_time_dict[name]:.3f} seconds."
+        )
+
+    return compile_time_dict
+
+
 def profile_func(func: Callable):
     """
     Time every function called in a class and averages over repeated calls for profiling likelihood functions.
@@ -94,6 +257,9 @@ def profile_func(func: Callable):
         Time a function and average over repeated calls for profiling an `Analysis` class's likelihood function. The
         time is stored in a `run_time_dict` attribute.
 
+        If a `Profiler` is active (see `autoarray.profiler`) the call is instead recorded by it, and the function is
+        called only once.
+
         It is possible for multiple functions with the `profile_func` decorator to be called. In this circumstance,
         we risk repeated profiling of the same functionality in these nested functions. Thus, before added
         the time to the run_time_dict, the keys of the dictionary are iterated over in reverse, subtracting off the
@@ -104,6 +270,11 @@ def profile_func(func: Callable):
             The result of the function being timed.
         """
 
+        if profiler.active_profiler is not None:
+            return profiler.active_profiler.call(
+                f"{obj.__class__.__name__}.{func.__name__}", func, obj, *args, **kwargs
+            )
+
         if not hasattr(obj, "run_time_dict"):
             return func(obj, *args, **kwargs)
 
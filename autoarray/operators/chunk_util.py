@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from typing import Callable, List, Optional, Tuple, Union
+
+from autoconf import conf
+
+
+def chunk_settings_from() -> Tuple[Optional[int], int]:
+    """
+    Returns the chunk size and number of workers used to evaluate grid decorated functions in chunks, which are
+    set in the `structures` section of `config/general.yaml`.
+
+    Chunking is opt-in: if `chunk_size` is not set (or is `None`) functions are evaluated on the entire grid in
+    one call.
+
+    Returns
+    -------
+    The maximum number of coordinates in every chunk (or `None` if chunking is disabled) and the number of threads
+    chunks are evaluated over.
+    """
+    try:
+        chunk_size = conf.instance["general"]["structures"]["chunk_size"]
+    except KeyError:
+        chunk_size = None
+
+    try:
+        chunk_workers = conf.instance["general"]["structures"]["chunk_workers"]
+    except KeyError:
+        chunk_workers = 1
+
+    if chunk_size is not None:
+        chunk_size = max(int(chunk_size), 1)
+
+    return chunk_size, max(int(chunk_workers or 1), 1)
+
+
+def chunk_slices_from(total: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Returns the (start, end) indexes which split `total` values into consecutive chunks of at most `chunk_size`
+    values.
+
+    Parameters
+    ----------
+    total
+        The total number of values which are split into chunks.
+    chunk_size
+        The maximum number of values in every chunk.
+    """
+    return [
+        (start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)
+    ]
+
+
+def values_via_chunks_from(
+    chunk_func: Callable,
+    chunk_slices: List[Tuple[int, int]],
+    total: int,
+    workers: int = 1,
+) -> Union[np.ndarray, List[np.ndarray]]:
+    """
+    Evaluate a function chunk by chunk and write the values of every chunk into preallocated output arrays, such
+    that only the intermediate arrays of the chunks being evaluated are held in memory at once.
+
+    The function is called with the (start, end) indexes of every chunk and returns the values of the chunk,
+    which are the rows `[start:end]` of the output. It can return a single array or a list of arrays, in which
+    case a list of output arrays is returned. The first chunk is evaluated before the others, to determine the
+    shape and type of the output arrays.
+
+    Parameters
+    ----------
+    chunk_func
+        The function evaluated on every chunk, which receives the chunk's start and end indexes.
+    chunk_slices
+        The (start, end) indexes of every chunk.
+    total
+        The total number of rows of the output arrays.
+    workers
+        The number of threads the chunks after the first are evaluated over.
+    """
+
+    def output_from(values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values)
+        return np.empty((total,) + values.shape[1:], dtype=values.dtype)
+
+    def fill(chunk_slice, values):
+        start, end = chunk_slice
+
+        if isinstance(values, list):
+            for output, value in zip(output_list, values):
+                output[start:end] = value
+        else:
+            output_list[0][start:end] = values
+
+    first_values = chunk_func(*chunk_slices[0])
+
+    if isinstance(first_values, list):
+        output_list = [output_from(values=values) for values in first_values]
+    else:
+        output_list = [output_from(values=first_values)]
+
+    fill(chunk_slices[0], first_values)
+
+    def chunk_fill(chunk_slice):
+        fill(chunk_slice, chunk_func(*chunk_slice))
+
+    if workers <= 1 or len(chunk_slices) <= 2:
+        for chunk_slice in chunk_slices[1:]:
+            chunk_fill(chunk_slice)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(chunk_fill, chunk_slices[1:]))
+
+    if isinstance(first_values, list):
+        return output_list
+
+    return output_list[0]
@@ -6,7 +6,8 @@ from scipy.spatial import QhullError
 
 from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 
-from autoarray.geometry import geometry_util
+from autoarray.geometry.affine_2d import AffineTransform2D
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
 
 
 class Grid2DContour:
@@ -35,15 +36,21 @@ class Grid2DContour:
         self.shape_native = shape_native
         self._contour_array = contour_array
 
+    @property
+    def affine(self) -> AffineTransform2D:
+        return affine_transform_2d_cached_from(
+            shape_native=(int(self.shape_native[0]), int(self.shape_native[1])),
+            pixel_scales=(float(self.pixel_scales[0]), float(self.pixel_scales[1])),
+            origin=(0.0, 0.0),
+        )
+
     @property
     def contour_array(self):
         if self._contour_array is not None:
             return self._contour_array
 
-        pixel_centres = geometry_util.grid_pixel_centres_2d_slim_from(
-            grid_scaled_2d_slim=np.array(self.grid),
-            shape_native=self.shape_native,
-            pixel_scales=self.pixel_scales,
+        pixel_centres = self.affine.pixel_centres_from(
+            grid_scaled_2d_slim=np.array(self.grid)
         ).astype("int")
 
         arr = np.zeros(self.shape_native)
@@ -61,10 +68,8 @@ class Grid2DContour:
         contour_list = []
 
         for contour_indices in contour_indices_list:
-            grid_scaled_1d = geometry_util.grid_scaled_2d_slim_from(
-                grid_pixels_2d_slim=contour_indices,
-                shape_native=self.shape_native,
-                pixel_scales=self.pixel_scales,
+            grid_scaled_1d = self.affine.scaled_from(
+                grid_pixels_2d_slim=contour_indices, out=contour_indices
             )
 
             grid_scaled_1d[:, 0] -= self.pixel_scales[0] / 2.0
@@ -1,5 +1,7 @@
 from autoarray import numba_util
+from autoarray.numba_util import profile_func
 import numpy as np
+from typing import Dict
 
 from autoarray.structures.arrays.uniform_2d import Array2D
 
@@ -268,8 +270,63 @@ class Convolver:
                     ] = image_frame_1d_indexes[image_frame_1d_indexes >= 0].shape[0]
                     mask_1d_index += 1
 
+    @property
+    def frame_dict(self) -> Dict[str, np.ndarray]:
+        """
+        The arrays describing the frame of every image and blurring pixel, which are computed when the `Convolver`
+        is created and loop over every pixel of the mask.
+
+        These can be output with a dataset (e.g. via `Imaging.output_to_bundle`) and used to create the `Convolver`
+        via `from_frame_dict`, which skips this computation.
+        """
+        return {
+            "mask_index_array": self.mask_index_array,
+            "image_frame_1d_indexes": self.image_frame_1d_indexes,
+            "image_frame_1d_kernels": self.image_frame_1d_kernels,
+            "image_frame_1d_lengths": self.image_frame_1d_lengths,
+            "blurring_mask": self.blurring_mask,
+            "blurring_frame_1d_indexes": self.blurring_frame_1d_indexes,
+            "blurring_frame_1d_kernels": self.blurring_frame_1d_kernels,
+            "blurring_frame_1d_lengths": self.blurring_frame_1d_lengths,
+        }
+
+    @classmethod
+    def from_frame_dict(cls, mask, kernel, frame_dict: Dict[str, np.ndarray]):
+        """
+        Create a `Convolver` from the arrays describing its frames (see `frame_dict`), which were computed for the
+        same mask and kernel, without recomputing them.
+
+        Parameters
+        ----------
+        mask
+            The mask the convolver was created for.
+        kernel
+            The kernel the convolver was created for.
+        frame_dict
+            The arrays describing the frame of every image and blurring pixel.
+        """
+        convolver = cls.__new__(cls)
+
+        convolver.mask = mask
+        convolver.kernel = kernel
+        convolver.kernel_max_size = kernel.shape_native[0] * kernel.shape_native[1]
+
+        for name, array in frame_dict.items():
+            setattr(convolver, name, array)
+
+        convolver.pixels_in_mask = int(convolver.image_frame_1d_lengths.shape[0])
+        convolver.pixels_in_blurring_mask = int(
+            convolver.blurring_frame_1d_lengths.shape[0]
+        )
+
+        return convolver
+
     @staticmethod
-    @numba_util.jit()
+    @numba_util.jit(
+        hot_signatures=[
+            "(UniTuple(int64, 2), bool_[:, ::1], int64[:, ::1], float64[:, ::1])",
+        ],
+    )
     def frame_at_coordinates_jit(coordinates, mask, mask_index_array, kernel_2d):
         """
         Returns the frame (indexes of pixels light is blurred into) and kernel_frame (kernel kernel values of those \
@@ -309,6 +366,7 @@ class Convolver:
 
         return frame, kernel_frame
 
+    @profile_func
     def convolve_image(self, image, blurring_image):
         """
         For a given 1D array and blurring array, convolve the two using this convolver.
@@ -341,7 +399,14 @@ class Convolver:
         return Array2D(values=convolved_image, mask=self.mask)
 
     @staticmethod
-    @numba_util.jit()
+    @numba_util.jit(
+        hot_signatures=[
+            (
+                "(float64[::1], int64[:, ::1], float64[:, ::1], int64[::1], "
+                "float64[::1], int64[:, ::1], float64[:, ::1], int64[::1])"
+            ),
+        ],
+    )
     def convolve_jit(
         image_1d_array,
         image_frame_1d_indexes,
@@ -378,6 +443,7 @@ class Convolver:
 
         return blurred_image_1d
 
+    @profile_func
     def convolve_image_no_blurring(self, image):
         """For a given 1D array and blurring array, convolve the two using this convolver.
 
@@ -396,6 +462,7 @@ class Convolver:
 
         return Array2D(values=convolved_image, mask=self.mask)
 
+    @profile_func
     def convolve_image_no_blurring_interpolation(self, image):
         """For a given 1D array and blurring array, convolve the two using this convolver.
 
@@ -415,7 +482,11 @@ class Convolver:
         return Array2D(values=convolved_image, mask=self.mask)
 
     @staticmethod
-    @numba_util.jit()
+    @numba_util.jit(
+        hot_signatures=[
+            "(float64[::1], int64[:, ::1], float64[:, ::1], int64[::1])",
+        ],
+    )
     def convolve_no_blurring_jit(
         image_1d_array,
         image_frame_1d_indexes,
@@ -437,6 +508,7 @@ class Convolver:
 
         return blurred_image_1d
 
+    @profile_func
     def convolve_mapping_matrix(self, mapping_matrix):
         """For a given inversion mapping matrix, convolve every pixel's mapped with the PSF kernel.
 
@@ -516,7 +588,11 @@ class Convolver:
         )
 
     @staticmethod
-    @numba_util.jit()
+    @numba_util.jit(
+        hot_signatures=[
+            "(float64[:, ::1], int64[:, ::1], float64[:, ::1], int64[::1])",
+        ],
+    )
     def convolve_matrix_jit(
         mapping_matrix,
         image_frame_1d_indexes,
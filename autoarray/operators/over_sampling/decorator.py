@@ -1,11 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from functools import wraps
 
 
-from typing import List, Union
+from typing import Callable, List, Tuple, Union
 
 from autoarray.operators.over_sampling.grid_oversampled import Grid2DOverSampled
 from autoarray.operators.over_sampling.uniform import OverSamplingUniform
+from autoarray.operators.over_sampling.uniform import OverSamplerUniform
 
 from autoarray.structures.arrays.irregular import ArrayIrregular
 from autoarray.structures.arrays.uniform_1d import Array1D
@@ -102,3 +104,69 @@ def over_sample(func):
         )
 
     return wrapper
+
+
+def array_via_func_list_from(
+    grid: Union[Grid2D, Grid2DIrregular, Grid2DOverSampled],
+    func_list: List[Tuple[object, Callable]],
+    workers: int = 1,
+    **kwargs,
+) -> np.ndarray:
+    """
+    Evaluate a list of (obj, func) pairs on the same grid, using a thread pool, and return the values of every
+    function as the columns of a single array (e.g. the columns of the `mapping_matrix` of a
+    `AbstractLinearObjFuncList`).
+
+    If the grid is over-sampled with a uniform over-sampler, every function is evaluated on the same over-sampled
+    grid and binned via the same over-sampling plan (see `OverSamplerUniform.array_via_func_list_from`). Otherwise,
+    every function is called on the grid as normal (including any over-sampling its decorators perform), with the
+    calls distributed over the thread pool.
+
+    Parameters
+    ----------
+    grid
+        The grid every function is evaluated on.
+    func_list
+        The (obj, func) pairs evaluated, where `func` is called as `func(obj, grid, **kwargs)` and returns one value
+        for every coordinate of the grid.
+    workers
+        The number of threads the functions are evaluated over.
+
+    Returns
+    -------
+    The values of every function, of shape [total_coordinates, total_functions].
+    """
+    if isinstance(grid, Grid2DOverSampled):
+        over_sampler = grid.over_sampler
+    elif perform_over_sampling_from(grid=grid, **kwargs):
+        over_sampler = grid.over_sampler
+    else:
+        over_sampler = None
+
+    if isinstance(over_sampler, OverSamplerUniform):
+        return over_sampler.array_via_func_list_from(
+            func_list=func_list,
+            workers=workers,
+            over_sampling_being_performed=True,
+            **kwargs,
+        )
+
+    def values_from(obj_func: Tuple[object, Callable]) -> np.ndarray:
+        obj, func = obj_func
+
+        if isinstance(grid, Grid2DOverSampled):
+            return np.asarray(
+                over_sampler.binned_array_2d_from(array=func(obj, grid.grid, **kwargs))
+            )
+
+        return np.asarray(func(obj, grid, **kwargs))
+
+    workers = min(workers, len(func_list))
+
+    if workers <= 1:
+        values_list = [values_from(obj_func) for obj_func in func_list]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            values_list = list(executor.map(values_from, func_list))
+
+    return np.stack(values_list, axis=1)
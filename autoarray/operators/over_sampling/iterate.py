@@ -1,12 +1,16 @@
 import numpy as np
 from typing import Callable, List, Optional
 
+from autoconf import conf
+
 from autoarray import numba_util
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.operators.over_sampling.abstract import AbstractOverSampling
 from autoarray.operators.over_sampling.abstract import AbstractOverSampler
-from autoarray.operators.over_sampling.uniform import OverSamplerUniform
 from autoarray.structures.arrays.uniform_2d import Array2D
+from autoarray.structures.grids.irregular_2d import Grid2DIrregular
+
+from autoarray.operators.over_sampling import over_sample_util
 
 
 class OverSamplingIterate(AbstractOverSampling):
@@ -114,27 +118,6 @@ def threshold_mask_via_arrays_jit_from(
     return threshold_mask
 
 
-@numba_util.jit()
-def iterated_array_jit_from(
-    iterated_array: np.ndarray,
-    threshold_mask_higher_sub: np.ndarray,
-    threshold_mask_lower_sub: np.ndarray,
-    array_higher_sub_2d: np.ndarray,
-) -> np.ndarray:
-    """
-    Create the iterated array from a result array that is computed at a higher sub size leel than the previous grid.
-
-    The iterated array is only updated for pixels where the fractional accuracy is met.
-    """
-
-    for y in range(iterated_array.shape[0]):
-        for x in range(iterated_array.shape[1]):
-            if threshold_mask_higher_sub[y, x] and not threshold_mask_lower_sub[y, x]:
-                iterated_array[y, x] = array_higher_sub_2d[y, x]
-
-    return iterated_array
-
-
 class OverSamplerIterate(AbstractOverSampler):
     def __init__(
         self,
@@ -148,16 +131,108 @@ class OverSamplerIterate(AbstractOverSampler):
         self.relative_accuracy = relative_accuracy
         self.sub_steps = sub_steps
 
-    def array_at_sub_size_from(
-        self, func: Callable, cls, mask: Mask2D, sub_size, *args, **kwargs
-    ) -> Array2D:
-        over_sample_uniform = OverSamplerUniform(mask=mask, sub_size=sub_size)
+    def samples_at_sub_size_from(
+        self,
+        func: Callable,
+        cls,
+        native_indexes: np.ndarray,
+        sub_size: int,
+        sub_size_lower: int,
+        samples_lower: np.ndarray,
+        *args,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Returns the values of a function evaluated on the (sub_size x sub_size) sub-grid of every input pixel, as an
+        array of shape [total_pixels, sub_size**2].
+
+        If the centres of sub-pixels of the lower (sub_size_lower x sub_size_lower) sub-grid coincide with those of
+        the higher sub-grid (see `over_sample_util.nested_sub_indexes_from`), the values of the function already
+        evaluated at these centres, `samples_lower`, are reused and the function is only evaluated at the new
+        sub-pixels.
+
+        Parameters
+        ----------
+        func
+            The function which is evaluated on the sub-grid.
+        cls
+            The class the function belongs to.
+        native_indexes
+            The native (y,x) pixel indexes of the pixels the function is evaluated in, of shape [total_pixels, 2].
+        sub_size
+            The size of the sub-grid the function is evaluated on.
+        sub_size_lower
+            The size of the sub-grid the function was previously evaluated on.
+        samples_lower
+            The values of the function evaluated on the lower sub-grid, of shape [total_pixels, sub_size_lower**2].
+        """
+        grid = over_sample_util.grid_2d_slim_over_sampled_via_native_indexes_from(
+            native_indexes=native_indexes,
+            shape_native=self.mask.shape_native,
+            pixel_scales=self.mask.pixel_scales,
+            sub_size=sub_size,
+            origin=self.mask.origin,
+        )
+
+        nested_sub_indexes = over_sample_util.nested_sub_indexes_from(
+            sub_size_lower=sub_size_lower, sub_size=sub_size
+        )
+
+        nested = nested_sub_indexes >= 0
+
+        if not np.any(nested):
+            samples = func(cls, Grid2DIrregular(values=grid), *args, **kwargs)
+
+            return np.asarray(samples).reshape(native_indexes.shape[0], sub_size**2)
+
+        grid = grid.reshape(native_indexes.shape[0], sub_size**2, 2)[:, ~nested]
 
-        over_sampled_grid = over_sample_uniform.over_sampled_grid
+        samples = np.zeros((native_indexes.shape[0], sub_size**2))
 
-        array_higher_sub = func(cls, over_sampled_grid, *args, **kwargs)
+        samples[:, ~nested] = np.asarray(
+            func(cls, Grid2DIrregular(values=grid.reshape(-1, 2)), *args, **kwargs)
+        ).reshape(native_indexes.shape[0], -1)
+        samples[:, nested] = samples_lower[:, nested_sub_indexes[nested]]
 
-        return over_sample_uniform.binned_array_2d_from(array=array_higher_sub).native
+        return samples
+
+    def converged_from(
+        self, array_lower: np.ndarray, array_higher: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns a boolean array which is `True` for every pixel whose value computed using a higher sub-grid size
+        is within the ``OverSamplingIterate``'s specified fractional and relative accuracy of the value computed
+        using the lower sub-grid size, such that it does not need to be reevaluated at a higher level of sub-gridding.
+
+        This performs the same check as `threshold_mask_from`, but on the `slim` values of only the pixels which are
+        being iterated over.
+
+        Parameters
+        ----------
+        array_lower
+            The results computed by a function using a lower sub-grid size.
+        array_higher
+            The results computed by a function using a higher sub-grid size.
+        """
+        converged = np.full(array_lower.shape[0], True)
+
+        if self.fractional_accuracy is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fractional_accuracy = array_lower / array_higher
+
+            fractional_accuracy = np.where(
+                fractional_accuracy > 1.0,
+                1.0 / fractional_accuracy,
+                fractional_accuracy,
+            )
+            fractional_accuracy[array_lower <= 0] = 0.0
+
+            converged &= ~(fractional_accuracy < self.fractional_accuracy)
+
+        if self.relative_accuracy is not None:
+            converged &= ~(np.abs(array_lower - array_higher) > self.relative_accuracy)
+
+        return converged
 
     def threshold_mask_from(
         self, array_lower_sub_2d: Array2D, array_higher_sub_2d: Array2D
@@ -215,6 +290,11 @@ class OverSamplerIterate(AbstractOverSampler):
         iteratively revaluated on higher resolution sub-grids. This is repeated until all pixels meet the fractional
         accuracy or the highest sub-size specified in the *sub_steps* attribute is computed.
 
+        Only the pixels which have not met the fractional accuracy (the active set) are evaluated at each sub-size,
+        which are tracked via their `slim` indexes. If the sub-grid of a sub-size nests within the sub-grid of the
+        previous sub-size (e.g. 1 -> 3 -> 9), the function values at the sub-pixel centres shared by both sub-grids
+        are reused and the function is only evaluated at the new sub-pixels.
+
         If the function return all zeros, the iteration is terminated early given that all levels of sub-gridding will
         return zeros. This occurs when a function is missing optional objects that contribute to the calculation.
 
@@ -222,22 +302,12 @@ class OverSamplerIterate(AbstractOverSampler):
         ``LightProfile`` module is comomputed, which by evaluating the function on a higher resolution sub-grids sample
         the analytic light profile at more points and thus more precisely.
 
-        Iterate over a function that returns an array or grid of values until the it meets a specified fractional
-        accuracy. The function returns a result on a pixel-grid where evaluating it on more points on a higher
-        resolution sub-grid followed by binning lead to a more precise evaluation of the function.
-
-        A full description of the iteration method can be found in the functions *array_via_func_from* and
-        *iterated_grid_from*. This function computes the result on a grid with a sub-size of 1, and uses its
-        shape to call the correct function.
-
         Parameters
         ----------
         func : func
             The function which is iterated over to compute a more precise evaluation.
         obj : cls
             The class the function belongs to.
-        grid_lower_sub_2d
-            The results computed by the function using a lower sub-grid size
         """
 
         unmasked_grid = self.mask.derive_grid.unmasked
@@ -249,47 +319,53 @@ class OverSamplerIterate(AbstractOverSampler):
         if not np.any(array_sub_1):
             return array_sub_1.slim
 
-        iterated_array = np.zeros(shape=self.mask.shape_native)
+        array_lower = np.array(array_sub_1.slim)
+
+        samples_lower = array_lower[:, None]
+        sub_size_lower = 1
 
-        threshold_mask_lower_sub = self.mask
+        native_for_slim = self.mask.derive_indexes.native_for_slim.astype("int")
 
-        for sub_size in self.sub_steps[:-1]:
-            array_higher_sub = self.array_at_sub_size_from(
-                func=func, cls=obj, mask=threshold_mask_lower_sub, sub_size=sub_size
+        active_slim = np.arange(array_lower.shape[0])
+
+        iterated_array = np.zeros(array_lower.shape[0])
+
+        for index, sub_size in enumerate(self.sub_steps):
+            samples = self.samples_at_sub_size_from(
+                func,
+                obj,
+                native_for_slim[active_slim],
+                sub_size,
+                sub_size_lower,
+                samples_lower,
+                *args,
+                **kwargs,
             )
 
-            try:
-                threshold_mask_higher_sub = self.threshold_mask_from(
-                    array_lower_sub_2d=array_sub_1,
-                    array_higher_sub_2d=array_higher_sub,
-                )
-
-                iterated_array = iterated_array_jit_from(
-                    iterated_array=iterated_array,
-                    threshold_mask_higher_sub=np.array(threshold_mask_higher_sub),
-                    threshold_mask_lower_sub=np.array(threshold_mask_lower_sub),
-                    array_higher_sub_2d=np.array(array_higher_sub),
-                )
-
-            except ZeroDivisionError:
-                return Array2D(values=iterated_array, mask=self.mask)
-
-            if threshold_mask_higher_sub.is_all_true:
-                return Array2D(values=iterated_array, mask=self.mask)
-
-            array_sub_1 = array_higher_sub
-            threshold_mask_lower_sub = threshold_mask_higher_sub
-            threshold_mask_higher_sub.pixel_scales = self.mask.pixel_scales
-
-        array_higher_sub = self.array_at_sub_size_from(
-            func=func,
-            cls=obj,
-            mask=threshold_mask_lower_sub,
-            sub_size=self.sub_steps[-1],
-            *args,
-            **kwargs
-        )
+            array_higher = np.add.reduceat(
+                samples.ravel(), np.arange(samples.shape[0]) * sub_size**2
+            ) * (1.0 / sub_size**2)
 
-        iterated_array_2d = iterated_array + array_higher_sub
+            if index == len(self.sub_steps) - 1:
+                iterated_array[active_slim] = array_higher
+                break
 
-        return Array2D(values=iterated_array_2d, mask=self.mask)
+            converged = self.converged_from(
+                array_lower=array_lower, array_higher=array_higher
+            )
+
+            iterated_array[active_slim[converged]] = array_higher[converged]
+
+            if np.all(converged):
+                break
+
+            active_slim = active_slim[~converged]
+            array_lower = array_higher[~converged]
+            samples_lower = samples[~converged]
+            sub_size_lower = sub_size
+
+        return Array2D._from_slim_unchecked(
+            values=iterated_array,
+            mask=self.mask,
+            store_native=conf.instance["general"]["structures"]["native_binned_only"],
+        )
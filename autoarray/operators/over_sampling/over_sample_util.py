@@ -330,7 +330,11 @@ def sub_size_radial_bins_from(
     return sub_size
 
 
-@numba_util.jit()
+@numba_util.jit(
+    hot_signatures=[
+        "(bool_[:, ::1], UniTuple(float64, 2), int64[::1], UniTuple(float64, 2))",
+    ],
+)
 def grid_2d_slim_over_sampled_via_mask_from(
     mask_2d: np.ndarray,
     pixel_scales: ty.PixelScales,
@@ -416,6 +420,123 @@ def grid_2d_slim_over_sampled_via_mask_from(
     return grid_slim
 
 
+@numba_util.jit()
+def grid_2d_slim_over_sampled_via_native_indexes_from(
+    native_indexes: np.ndarray,
+    shape_native: Tuple[int, int],
+    pixel_scales: ty.PixelScales,
+    sub_size: int,
+    origin: Tuple[float, float] = (0.0, 0.0),
+) -> np.ndarray:
+    """
+    Returns the (y,x) scaled coordinates at the centre of every sub-pixel of a uniform sub-grid of size
+    (sub_size x sub_size) in a subset of the pixels of a 2D mask, which are specified via their native (y,x) pixel
+    indexes.
+
+    The coordinates are computed in the same way as `grid_2d_slim_over_sampled_via_mask_from`, such that for the
+    same pixels and sub size both functions return identical coordinates, and sub-pixels of the same pixel are
+    indexed next to one another.
+
+    This is used to evaluate functions only in the pixels which have not yet been evaluated to a desired accuracy,
+    without creating a new mask for these pixels (see `OverSamplerIterate`).
+
+    Parameters
+    ----------
+    native_indexes
+        The native (y,x) pixel indexes of the pixels the sub-grid is computed in, of shape [total_pixels, 2].
+    shape_native
+        The 2D shape of the mask the pixels are paired with.
+    pixel_scales
+        The (y,x) scaled units to pixel units conversion factor of the 2D mask array.
+    sub_size
+        The size of the sub-grid that each pixel is divided into.
+    origin
+        The (y,x) origin of the 2D array, which the sub-grid is shifted around.
+
+    Returns
+    -------
+    ndarray
+        A sub grid of (y,x) scaled coordinates at the centre of every sub-pixel of the input pixels, with
+        dimensions (total_pixels*sub_size**2, 2).
+    """
+
+    grid_slim = np.zeros(shape=(native_indexes.shape[0] * sub_size**2, 2))
+
+    centres_scaled = geometry_util.central_scaled_coordinate_2d_from(
+        shape_native=shape_native, pixel_scales=pixel_scales, origin=origin
+    )
+
+    y_sub_half = pixel_scales[0] / 2
+    y_sub_step = pixel_scales[0] / (sub_size)
+
+    x_sub_half = pixel_scales[1] / 2
+    x_sub_step = pixel_scales[1] / (sub_size)
+
+    sub_index = 0
+
+    for index in range(native_indexes.shape[0]):
+        y_scaled = (native_indexes[index, 0] - centres_scaled[0]) * pixel_scales[0]
+        x_scaled = (native_indexes[index, 1] - centres_scaled[1]) * pixel_scales[1]
+
+        for y1 in range(sub_size):
+            for x1 in range(sub_size):
+                grid_slim[sub_index, 0] = -(
+                    y_scaled - y_sub_half + y1 * y_sub_step + (y_sub_step / 2.0)
+                )
+                grid_slim[sub_index, 1] = (
+                    x_scaled - x_sub_half + x1 * x_sub_step + (x_sub_step / 2.0)
+                )
+                sub_index += 1
+
+    return grid_slim
+
+
+def nested_sub_indexes_from(sub_size_lower: int, sub_size: int) -> np.ndarray:
+    """
+    Returns, for every sub-pixel of a pixel's (sub_size x sub_size) sub-grid, the index of the sub-pixel of the
+    pixel's (sub_size_lower x sub_size_lower) sub-grid whose centre is at the same (y,x) coordinate, or -1 if no such
+    sub-pixel exists.
+
+    Sub-pixel centres only coincide if `sub_size` is an odd multiple of `sub_size_lower` (e.g. 1 -> 3 -> 9), in
+    which case the central sub-pixel of every group of (k x k) higher sub-pixels shares the centre of a lower
+    sub-pixel, where k is `sub_size / sub_size_lower`. For other sub-sizes (e.g. 2 -> 4) no centres coincide and
+    all entries are -1.
+
+    This allows a function evaluated on the lower sub-grid to be reused when it is evaluated on the higher sub-grid.
+
+    Parameters
+    ----------
+    sub_size_lower
+        The size of the lower resolution sub-grid.
+    sub_size
+        The size of the higher resolution sub-grid.
+
+    Returns
+    -------
+    ndarray
+        The index of the coinciding lower sub-pixel of every higher sub-pixel, of shape [sub_size**2].
+    """
+    nested_sub_indexes = np.full(sub_size**2, -1)
+
+    if sub_size % sub_size_lower != 0:
+        return nested_sub_indexes
+
+    factor = sub_size // sub_size_lower
+
+    if factor % 2 == 0:
+        return nested_sub_indexes
+
+    y1, x1 = np.divmod(np.arange(sub_size**2), sub_size)
+
+    nested = (y1 % factor == factor // 2) & (x1 % factor == factor // 2)
+
+    nested_sub_indexes[nested] = (y1[nested] // factor) * sub_size_lower + (
+        x1[nested] // factor
+    )
+
+    return nested_sub_indexes
+
+
 @numba_util.jit()
 def binned_array_2d_from(
     array_2d: np.ndarray,
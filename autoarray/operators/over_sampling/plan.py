@@ -0,0 +1,214 @@
+import numpy as np
+from typing import Callable, List, Tuple
+
+from autoarray.mask.mask_2d import Mask2D
+
+from autoarray.operators.over_sampling import over_sample_util
+from autoarray.operators import chunk_util
+from autoarray.cache_util import LRUCache
+from autoarray.cache_util import mask_cache_key_from
+
+"""
+The over-sampling plans computed for every (mask, sub_size) pair, memoised on a hash of the mask and sub-size map
+(see `over_sampling_plan_from`).
+"""
+over_sampling_plan_cache = LRUCache(size=32)
+
+
+class OverSamplingPlan:
+    def __init__(self, mask: Mask2D, sub_size: np.ndarray):
+        """
+        The index work required to over-sample calculations on a mask with a uniform sub-grid in every pixel, which
+        is computed once and reused by every over-sampled calculation on the same (mask, sub_size) pair.
+
+        During a model-fit the mask and sub-size map are fixed, but every evaluation of a function (e.g. a light
+        profile image) on an over-sampled grid previously recomputed the sub-grid and rescanned the mask to bin the
+        values back to the pixel grid. The plan instead stores:
+
+        - `over_sampled_grid`: the (y,x) coordinates of every sub-pixel, of shape [total_sub_pixels, 2].
+        - `slim_for_sub_slim`: the `slim` pixel index every sub-pixel belongs to, of shape [total_sub_pixels].
+        - `sub_offsets`: the index of the first sub-pixel of every pixel, of shape [total_unmasked_pixels].
+        - `sub_fraction`: the fraction of a pixel's area every one of its sub-pixels contains.
+
+        Sub-pixels of the same pixel are stored contiguously, therefore binning an over-sampled array is a
+        single segment sum via `np.add.reduceat` over `sub_offsets`.
+
+        The arrays are read-only, because a plan is shared by every over-sampler with the same mask and sub-size.
+
+        Parameters
+        ----------
+        mask
+            The mask defining the 2D region where the over-sampled grid is computed.
+        sub_size
+            The size (sub_size x sub_size) of each unmasked pixels sub-grid, of shape [total_unmasked_pixels].
+        """
+        sub_size = np.array(sub_size).astype("int")
+
+        self.over_sampled_grid = over_sample_util.grid_2d_slim_over_sampled_via_mask_from(
+            mask_2d=np.array(mask),
+            pixel_scales=mask.pixel_scales,
+            sub_size=sub_size,
+            origin=mask.origin,
+        )
+
+        sub_length = sub_size**2
+
+        self.slim_for_sub_slim = np.repeat(np.arange(sub_length.shape[0]), sub_length)
+        self.sub_offsets = np.concatenate(
+            (np.zeros(1, dtype="int"), np.cumsum(sub_length)[:-1])
+        )[: sub_length.shape[0]]
+        self.sub_fraction = 1.0 / sub_length
+
+        for array in (
+            self.over_sampled_grid,
+            self.slim_for_sub_slim,
+            self.sub_offsets,
+            self.sub_fraction,
+        ):
+            array.setflags(write=False)
+
+    @property
+    def total_sub_pixels(self) -> int:
+        return self.over_sampled_grid.shape[0]
+
+    def binned_array_from(self, array: np.ndarray) -> np.ndarray:
+        """
+        Bin an array of values evaluated on the over-sampled grid to the pixel grid of the mask, by taking the mean
+        of the values in every pixel's sub-pixels.
+
+        Parameters
+        ----------
+        array
+            The values on the over-sampled grid, of shape [total_sub_pixels] (or [total_sub_pixels, 2] for
+            (y,x) values).
+
+        Returns
+        -------
+        The binned values, of shape [total_unmasked_pixels] (or [total_unmasked_pixels, 2] for (y,x) values).
+        """
+        if self.sub_offsets.shape[0] == 0:
+            return np.zeros(0)
+
+        binned_array = np.add.reduceat(np.asarray(array), self.sub_offsets, axis=0)
+
+        return binned_array * self.sub_fraction.reshape(
+            (-1,) + (1,) * (binned_array.ndim - 1)
+        )
+
+    def pixel_chunk_slices_from(self, chunk_size: int) -> List[Tuple[int, int]]:
+        """
+        Returns the (start, end) `slim` pixel indexes which split the pixels into consecutive chunks, where the
+        sub-pixels of every chunk total at most `chunk_size` (unless a single pixel has more sub-pixels).
+
+        Every chunk contains whole pixels, such that the values of a chunk's sub-pixels can be binned without the
+        values of any other chunk.
+
+        Parameters
+        ----------
+        chunk_size
+            The maximum number of sub-pixels in every chunk.
+        """
+        total_pixels = self.sub_offsets.shape[0]
+
+        sub_ends = np.append(self.sub_offsets[1:], self.total_sub_pixels)
+
+        chunk_slices = []
+
+        start = 0
+
+        while start < total_pixels:
+            end = np.searchsorted(
+                sub_ends, self.sub_offsets[start] + chunk_size, side="right"
+            )
+            end = max(int(end), start + 1)
+
+            chunk_slices.append((start, end))
+
+            start = end
+
+        return chunk_slices
+
+    def binned_array_via_chunks_from(
+        self, chunk_func: Callable, chunk_size: int, workers: int = 1
+    ) -> np.ndarray:
+        """
+        Evaluate a function on the over-sampled grid chunk by chunk, binning the values of every chunk to the pixel
+        grid before the next chunk is evaluated, such that neither the function's intermediate arrays nor its values
+        on the full over-sampled grid are held in memory at once.
+
+        The result is the same as evaluating the function on the full over-sampled grid and binning it via
+        `binned_array_from`.
+
+        Parameters
+        ----------
+        chunk_func
+            The function evaluated on every chunk, which receives the (y,x) coordinates of the chunk's sub-pixels and
+            returns their values.
+        chunk_size
+            The maximum number of sub-pixels in every chunk (see `pixel_chunk_slices_from`).
+        workers
+            The number of threads chunks are evaluated over.
+        """
+        def binned_chunk_from(start: int, end: int) -> np.ndarray:
+            sub_start = self.sub_offsets[start]
+            sub_end = (
+                self.sub_offsets[end]
+                if end < self.sub_offsets.shape[0]
+                else self.total_sub_pixels
+            )
+
+            values = np.asarray(chunk_func(self.over_sampled_grid[sub_start:sub_end]))
+
+            binned_values = np.add.reduceat(
+                values, self.sub_offsets[start:end] - sub_start, axis=0
+            )
+
+            return binned_values * self.sub_fraction[start:end].reshape(
+                (-1,) + (1,) * (binned_values.ndim - 1)
+            )
+
+        return chunk_util.values_via_chunks_from(
+            chunk_func=binned_chunk_from,
+            chunk_slices=self.pixel_chunk_slices_from(chunk_size=chunk_size),
+            total=self.sub_offsets.shape[0],
+            workers=workers,
+        )
+
+
+def over_sampling_plan_key_from(mask: Mask2D, sub_size: np.ndarray) -> str:
+    """
+    Returns a hash of the mask (via its `content_hash`) and sub-size map which uniquely determine an over-sampling
+    plan.
+
+    Parameters
+    ----------
+    mask
+        The mask defining the 2D region where the over-sampled grid is computed.
+    sub_size
+        The size (sub_size x sub_size) of each unmasked pixels sub-grid.
+
+    Returns
+    -------
+    The hexadecimal hash of the inputs.
+    """
+    return mask_cache_key_from(mask, np.asarray(sub_size, dtype="int"))
+
+
+def over_sampling_plan_from(mask: Mask2D, sub_size: np.ndarray) -> OverSamplingPlan:
+    """
+    Returns the over-sampling plan of a mask and sub-size map, memoised on a hash of both.
+
+    The most recently used plans are stored in a module level least-recently-used cache, which stores up to
+    `over_sampling_plan_cache.size` plans.
+
+    Parameters
+    ----------
+    mask
+        The mask defining the 2D region where the over-sampled grid is computed.
+    sub_size
+        The size (sub_size x sub_size) of each unmasked pixels sub-grid.
+    """
+    return over_sampling_plan_cache.value_from(
+        key=over_sampling_plan_key_from(mask=mask, sub_size=sub_size),
+        func=lambda: OverSamplingPlan(mask=mask, sub_size=sub_size),
+    )
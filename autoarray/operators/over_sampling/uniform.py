@@ -1,5 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import List, Tuple, Union
+from typing import Callable, List, Tuple, Union
 
 from autoconf import conf
 from autoconf import cached_property
@@ -7,12 +8,15 @@ from autoconf import cached_property
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.operators.over_sampling.abstract import AbstractOverSampling
 from autoarray.operators.over_sampling.abstract import AbstractOverSampler
+from autoarray.operators.over_sampling.plan import OverSamplingPlan
+from autoarray.operators.over_sampling.plan import over_sampling_plan_from
 from autoarray.structures.arrays.uniform_2d import Array2D
 from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 from autoarray.structures.grids.uniform_2d import Grid2D
 
 from autoarray import exc
 from autoarray.operators.over_sampling import over_sample_util
+from autoarray.operators import chunk_util
 
 
 class OverSamplingUniform(AbstractOverSampling):
@@ -374,16 +378,26 @@ class OverSamplerUniform(AbstractOverSampler):
 
         return 1.0 / self.sub_length
 
+    @cached_property
+    def plan(self) -> OverSamplingPlan:
+        """
+        The over-sampling plan of the mask and sub-size map, which contains the over-sampled grid and the indexes
+        used to bin over-sampled arrays.
+
+        The plan is computed once per (mask, sub_size) pair and shared by all over-samplers via a cache, so that
+        over-sampled calculations during a model-fit perform no index work.
+        """
+        return over_sampling_plan_from(mask=self.mask, sub_size=self.sub_size)
+
     @cached_property
     def over_sampled_grid(self) -> Grid2DIrregular:
-        grid = over_sample_util.grid_2d_slim_over_sampled_via_mask_from(
-            mask_2d=np.array(self.mask),
-            pixel_scales=self.mask.pixel_scales,
-            sub_size=np.array(self.sub_size).astype("int"),
-            origin=self.mask.origin,
-        )
+        """
+        The (y,x) coordinates of every sub-pixel of the over-sampled grid.
 
-        return Grid2DIrregular(values=grid)
+        The grid of the shared over-sampling plan is read-only, so it is copied such that the grid of every
+        over-sampler can be modified in place (e.g. when it is relocated).
+        """
+        return Grid2DIrregular(values=self.plan.over_sampled_grid.copy())
 
     def binned_array_2d_from(self, array: Array2D) -> "Array2D":
         """
@@ -408,18 +422,48 @@ class OverSamplerUniform(AbstractOverSampler):
         except AttributeError:
             pass
 
-        binned_array_2d = over_sample_util.binned_array_2d_from(
-            array_2d=np.array(array),
-            mask_2d=np.array(self.mask),
-            sub_size=np.array(self.sub_size),
-        )
+        binned_array_2d = self.plan.binned_array_from(array=array)
 
-        return Array2D(
-            values=binned_array_2d,
-            mask=self.mask,
-        )
+        return Array2D._from_slim_unchecked(values=binned_array_2d, mask=self.mask)
 
     def array_via_func_from(self, func, obj, *args, **kwargs):
+        """
+        Evaluate a function on the over-sampled grid and bin its values to the pixel grid of the mask.
+
+        If a `chunk_size` is set in the `structures` section of `config/general.yaml`, the function is evaluated
+        on chunks of whole pixels, whose values are binned before the next chunk is evaluated (see
+        `OverSamplingPlan.binned_array_via_chunks_from`), bounding the memory of the calculation by the chunk size.
+
+        Parameters
+        ----------
+        func
+            The function evaluated on the over-sampled grid.
+        obj
+            The object the function is a method of, or `None` if it is not a method.
+        """
+        chunk_size, chunk_workers = chunk_util.chunk_settings_from()
+
+        if (
+            chunk_size is not None
+            and self.plan.total_sub_pixels > chunk_size
+            and not conf.instance["general"]["structures"]["native_binned_only"]
+        ):
+
+            def chunk_func(grid):
+                grid = Grid2DIrregular(values=np.array(grid))
+
+                if obj is not None:
+                    return func(obj, grid, *args, **kwargs)
+                return func(grid, *args, **kwargs)
+
+            binned_array_2d = self.plan.binned_array_via_chunks_from(
+                chunk_func=chunk_func, chunk_size=chunk_size, workers=chunk_workers
+            )
+
+            return Array2D._from_slim_unchecked(
+                values=binned_array_2d, mask=self.mask
+            )
+
         over_sampled_grid = self.over_sampled_grid
 
         if obj is not None:
@@ -429,6 +473,79 @@ class OverSamplerUniform(AbstractOverSampler):
 
         return self.binned_array_2d_from(array=values)
 
+    def array_via_func_list_from(
+        self, func_list: List[Tuple[object, Callable]], workers: int = 1, **kwargs
+    ) -> np.ndarray:
+        """
+        Evaluate a list of functions on the over-sampled grid and bin the values of every function to the pixel grid
+        of the mask, returning them as the columns of a single array.
+
+        For example, the functions may be the images of the many light profiles of a model, whose binned images are
+        the columns of the `mapping_matrix` of a linear object which solves for their intensities.
+
+        Every function is evaluated on the same over-sampled grid and binned via the same over-sampling plan, so the
+        grid and binning indexes are computed once rather than for every function. The functions are independent and
+        therefore evaluated concurrently by a thread pool, which runs in parallel where the functions release the GIL
+        (e.g. numba jitted functions and most NumPy operations).
+
+        Parameters
+        ----------
+        func_list
+            The (obj, func) pairs evaluated, where `func` is called as `func(obj, grid, **kwargs)` (or `func(grid,
+            **kwargs)` if `obj` is `None`) and returns one value for every coordinate of the grid.
+        workers
+            The number of threads the functions are evaluated over.
+
+        Returns
+        -------
+        The binned values of every function, of shape [total_unmasked_pixels, total_functions].
+        """
+        plan = self.plan
+
+        chunk_size, _ = chunk_util.chunk_settings_from()
+
+        if (
+            chunk_size is None
+            or plan.total_sub_pixels <= chunk_size
+            or conf.instance["general"]["structures"]["native_binned_only"]
+        ):
+            chunk_size = None
+
+        over_sampled_grid = self.over_sampled_grid if chunk_size is None else None
+
+        array = np.zeros((plan.sub_offsets.shape[0], len(func_list)))
+
+        def column_fill(index: int):
+            obj, func = func_list[index]
+
+            def values_from(grid):
+                if obj is not None:
+                    return func(obj, grid, **kwargs)
+                return func(grid, **kwargs)
+
+            if chunk_size is None:
+                array[:, index] = plan.binned_array_from(
+                    array=values_from(over_sampled_grid)
+                )
+            else:
+                array[:, index] = plan.binned_array_via_chunks_from(
+                    chunk_func=lambda grid: values_from(
+                        Grid2DIrregular(values=np.array(grid))
+                    ),
+                    chunk_size=chunk_size,
+                )
+
+        workers = min(workers, len(func_list))
+
+        if workers <= 1:
+            for index in range(len(func_list)):
+                column_fill(index)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(column_fill, range(len(func_list))))
+
+        return array
+
     @cached_property
     def sub_mask_native_for_sub_mask_slim(self) -> np.ndarray:
         """
@@ -536,6 +653,4 @@ class OverSamplerUniform(AbstractOverSampler):
 
             print(derive_indexes_2d.slim_for_sub_slim)
         """
-        return over_sample_util.slim_index_for_sub_slim_index_via_mask_2d_from(
-            mask_2d=np.array(self.mask), sub_size=np.array(self.sub_size)
-        ).astype("int")
+        return self.plan.slim_for_sub_slim
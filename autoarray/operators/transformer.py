@@ -29,6 +29,7 @@ from autoarray.structures.grids.uniform_2d import Grid2D
 from autoarray.structures.visibilities import Visibilities
 
 from autoarray.structures.arrays import array_2d_util
+from autoarray.numba_util import profile_func
 from autoarray.operators import transformer_util
 
 
@@ -98,6 +99,7 @@ class TransformerDFT(PyLopsOperator):
         self.matmat_count = 0
         self.rmatmat_count = 0
 
+    @profile_func
     def visibilities_from(self, image):
         if self.preload_transform:
             visibilities = transformer_util.visibilities_via_preload_jit_from(
@@ -115,6 +117,7 @@ class TransformerDFT(PyLopsOperator):
 
         return Visibilities(visibilities=visibilities)
 
+    @profile_func
     def image_from(self, visibilities, use_adjoint_scaling: bool = False):
         image_slim = transformer_util.image_via_jit_from(
             n_pixels=self.grid.shape[0],
@@ -130,6 +133,7 @@ class TransformerDFT(PyLopsOperator):
 
         return Array2D(values=image_native, mask=self.real_space_mask)
 
+    @profile_func
     def transform_mapping_matrix(self, mapping_matrix):
         if self.preload_transform:
             return transformer_util.transformed_mapping_matrix_via_preload_jit_from(
@@ -233,6 +237,7 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
             Jd=interp_kernel,
         )
 
+    @profile_func
     def visibilities_from(self, image):
         """
         ...
@@ -246,6 +251,7 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
             )  # flip due to PyNUFFT internal flip
         )
 
+    @profile_func
     def image_from(self, visibilities, use_adjoint_scaling: bool = False):
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
@@ -256,6 +262,7 @@ class TransformerNUFFT(NUFFT_cpu, PyLopsOperator):
 
         return Array2D(values=image, mask=self.real_space_mask)
 
+    @profile_func
     def transform_mapping_matrix(self, mapping_matrix):
         transformed_mapping_matrix = 0 + 0j * np.zeros(
             (self.uv_wavelengths.shape[0], mapping_matrix.shape[1])
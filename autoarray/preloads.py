@@ -5,11 +5,7 @@ from typing import List
 
 from autoconf import conf
 
-from autoarray.inversion.linear_obj.func_list import AbstractLinearObjFuncList
-from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
-
 from autoarray import exc
-from autoarray.inversion.inversion.imaging import inversion_imaging_util
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +31,7 @@ class Preloads:
         log_det_regularization_matrix_term=None,
         traced_mesh_grids_list_of_planes=None,
         image_plane_mesh_grid_list=None,
+        workspace=None,
     ):
         self.w_tilde = w_tilde
         self.use_w_tilde = use_w_tilde
@@ -57,6 +54,10 @@ class Preloads:
         self.traced_mesh_grids_list_of_planes = traced_mesh_grids_list_of_planes
         self.image_plane_mesh_grid_list = image_plane_mesh_grid_list
 
+        # An `InversionWorkspace` whose buffers the matrices of every inversion are written into, which is not a
+        # preload computed from two fits and is therefore not reset by the `set_` methods.
+        self.workspace = workspace
+
     @property
     def check_threshold(self):
         return conf.instance["general"]["test"]["preloads_check_threshold"]
@@ -84,6 +85,9 @@ class Preloads:
         self.w_tilde = None
         self.use_w_tilde = False
 
+        from autoarray.inversion.inversion.imaging import inversion_imaging_util
+        from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
+
         if fit_0.inversion is None:
             return
 
@@ -139,6 +143,8 @@ class Preloads:
 
         self.relocated_grid = None
 
+        from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
+
         if fit_0.inversion is None:
             return
 
@@ -192,6 +198,8 @@ class Preloads:
 
         self.mapper_list = None
 
+        from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
+
         if fit_0.inversion is None:
             return
 
@@ -292,6 +300,8 @@ class Preloads:
 
         self.linear_func_operated_mapping_matrix_dict = None
 
+        from autoarray.inversion.linear_obj.func_list import AbstractLinearObjFuncList
+
         inversion_0 = fit_0.inversion
         inversion_1 = fit_1.inversion
 
@@ -428,6 +438,8 @@ class Preloads:
         self.regularization_matrix = None
         self.log_det_regularization_matrix_term = None
 
+        from autoarray.inversion.pixelization.mappers.abstract import AbstractMapper
+
         inversion_0 = fit_0.inversion
         inversion_1 = fit_1.inversion
 
@@ -0,0 +1,352 @@
+import json
+import os
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Union
+
+"""
+The `Profiler` which is currently recording, which every function decorated with `profile_func` reports its calls
+to. This is `None` when no profiler is active, in which case profiling adds no overhead beyond this check.
+"""
+active_profiler = None
+
+
+class FunctionProfile:
+    def __init__(self, name: str):
+        """
+        The profiling information of every call to a function recorded by a `Profiler`.
+
+        Parameters
+        ----------
+        name
+            The name of the function, given by its class and function name (e.g. `Convolver.convolve_image`).
+        """
+        self.name = name
+
+        self.calls = 0
+        self.cumulative_time = 0.0
+        self.self_time = 0.0
+        self.compile_time = 0.0
+        self.peak_memory = 0
+
+    @property
+    def run_time(self) -> float:
+        """
+        The cumulative time spent in the function excluding the time numba spent compiling functions it called.
+        """
+        return self.cumulative_time - self.compile_time
+
+    @property
+    def dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "cumulative_time": self.cumulative_time,
+            "self_time": self.self_time,
+            "compile_time": self.compile_time,
+            "run_time": self.run_time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class _Frame:
+    def __init__(self, profile: FunctionProfile, start: float, start_memory: int):
+        self.profile = profile
+        self.start = start
+        self.start_memory = start_memory
+        self.child_time = 0.0
+        self.compile_time = 0.0
+        self.peak_memory = 0
+
+
+class Profiler:
+    def __init__(self, memory: bool = False, numba_compile: bool = True):
+        """
+        Records the calls to every function decorated with `profile_func` (e.g. the functions of inversions, mappers,
+        convolvers, transformers and fits) whilst it is active as a context manager:
+
+        .. code-block:: python
+
+            import autoarray as aa
+
+            with aa.Profiler(memory=True) as profiler:
+                fit.figure_of_merit
+
+            print(profiler.profile_dict)
+
+            profiler.output_to_chrome_trace(file_path="trace.json")
+
+        For every function the following are recorded:
+
+        - `calls`: the number of times the function is called.
+        - `cumulative_time`: the total time spent in the function, including the functions it calls.
+        - `self_time`: the time spent in the function excluding other profiled functions it calls.
+        - `compile_time`: the time numba spent compiling jitted functions whilst this was the innermost profiled
+          function, which separates one-off compilation from the `run_time` of the function.
+        - `peak_memory`: the peak memory in bytes allocated by any one call of the function, measured via
+          `tracemalloc` if `memory=True`.
+
+        Unlike the `run_time_dict` of `profile_func`, functions are called once (not `repeats` times) so cached
+        properties are profiled as they are used, and there is no limit on how often a function may be called.
+
+        Parameters
+        ----------
+        memory
+            If `True`, the peak memory allocated by every function call is measured via `tracemalloc`, which slows
+            down all Python allocations whilst the profiler is active.
+        numba_compile
+            If `True` and numba is installed, the time numba spends compiling jitted functions is recorded, both
+            for the profiled function which triggered it and in `compile_dict` for every jitted function.
+        """
+        self.memory = memory
+        self.numba_compile = numba_compile
+
+        self.profiles = {}
+        self.compile_dict = {}
+        self.trace_events = []
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start_tracemalloc = False
+        self._numba_listener = None
+        self._compile_starts = {}
+        self._previous_profiler = None
+
+    def __enter__(self) -> "Profiler":
+        global active_profiler
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._start_tracemalloc = True
+
+        if self.numba_compile:
+            self._numba_listener = _numba_compile_listener_from(profiler=self)
+
+        self._previous_profiler = active_profiler
+        active_profiler = self
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global active_profiler
+
+        active_profiler = self._previous_profiler
+
+        if self._numba_listener is not None:
+            from numba.core import event
+
+            event.unregister("numba:compile", self._numba_listener)
+            self._numba_listener = None
+
+        if self._start_tracemalloc:
+            tracemalloc.stop()
+            self._start_tracemalloc = False
+
+    @property
+    def _stack(self) -> List[_Frame]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def call(self, name: str, func: Callable, /, *args, **kwargs):
+        """
+        Call a function and record its profiling information under the input name.
+
+        The `name` and `func` are positional-only, so the profiled function may itself take keyword arguments
+        with these names.
+
+        Parameters
+        ----------
+        name
+            The name the function's profiling information is recorded under.
+        func
+            The function which is called with the input `args` and `kwargs`.
+        """
+        with self._lock:
+            try:
+                profile = self.profiles[name]
+            except KeyError:
+                profile = FunctionProfile(name=name)
+                self.profiles[name] = profile
+
+        stack = self._stack
+
+        start_memory = 0
+
+        if self.memory:
+            start_memory, peak_memory = tracemalloc.get_traced_memory()
+
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak_memory)
+
+            tracemalloc.reset_peak()
+
+        frame = _Frame(
+            profile=profile, start=time.perf_counter(), start_memory=start_memory
+        )
+
+        stack.append(frame)
+
+        try:
+            return func(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+
+            stack.pop()
+
+            cumulative_time = end - frame.start
+
+            with self._lock:
+                profile.calls += 1
+                profile.cumulative_time += cumulative_time
+                profile.self_time += cumulative_time - frame.child_time
+                profile.compile_time += frame.compile_time
+
+                if self.memory:
+                    peak_memory = max(
+                        frame.peak_memory, tracemalloc.get_traced_memory()[1]
+                    )
+                    profile.peak_memory = max(
+                        profile.peak_memory, peak_memory - frame.start_memory
+                    )
+
+                self.trace_events.append(
+                    _trace_event_from(
+                        name=name, category="profile_func", start=frame.start, end=end
+                    )
+                )
+
+            if stack:
+                stack[-1].child_time += cumulative_time
+
+    def _on_compile_start(self, key):
+        with self._lock:
+            self._compile_starts[key] = time.perf_counter()
+
+    def _on_compile_end(self, key, name: str):
+        """
+        Record the compile time of a jitted function, where the compile time of jitted functions compiled whilst
+        compiling another (e.g. a jitted function it calls) is included in the compile time of the outer function.
+        """
+        end = time.perf_counter()
+
+        with self._lock:
+            try:
+                start = self._compile_starts.pop(key)
+            except KeyError:
+                return
+
+            nested = any(
+                other_key[0] == key[0] for other_key in self._compile_starts.keys()
+            )
+
+            compile_time = end - start
+
+            self.compile_dict[name] = self.compile_dict.get(name, 0.0) + compile_time
+
+            self.trace_events.append(
+                _trace_event_from(name=name, category="numba", start=start, end=end)
+            )
+
+        if nested:
+            return
+
+        stack = self._stack
+
+        if stack:
+            stack[-1].compile_time += compile_time
+
+    @property
+    def profile_dict(self) -> Dict[str, Dict]:
+        """
+        The profiling information of every function as a dictionary, sorted by their cumulative time.
+        """
+        profiles = sorted(
+            self.profiles.values(),
+            key=lambda profile: profile.cumulative_time,
+            reverse=True,
+        )
+
+        return {profile.name: profile.dict for profile in profiles}
+
+    def output_to_json(self, file_path: Union[Path, str]):
+        """
+        Output the profiling information of every function and the numba compile time of every jitted function
+        to a .json file.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the profiling information is output to.
+        """
+        with open(file_path, "w+") as f:
+            json.dump(
+                {"profile": self.profile_dict, "compile": self.compile_dict},
+                f,
+                indent=4,
+            )
+
+    def output_to_chrome_trace(self, file_path: Union[Path, str]):
+        """
+        Output every function call and numba compilation as a .json file in the Chrome trace event format, which
+        can be viewed as a timeline via `chrome://tracing` or https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        file_path
+            The path of the .json file the trace is output to.
+        """
+        with open(file_path, "w+") as f:
+            json.dump({"traceEvents": self.trace_events}, f)
+
+
+def _trace_event_from(name: str, category: str, start: float, end: float) -> Dict:
+    return {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start * 1.0e6,
+        "dur": (end - start) * 1.0e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+
+
+def _numba_compile_listener_from(profiler: Profiler) -> Optional[object]:
+    """
+    Returns a numba event listener which records the compile time of every jitted function into the profiler, or
+    `None` if numba is not installed.
+    """
+    try:
+        from numba.core import event
+    except ImportError:
+        return None
+
+    class CompileListener(event.Listener):
+        def on_start(self, numba_event):
+            profiler._on_compile_start(key=_compile_key_from(numba_event))
+
+        def on_end(self, numba_event):
+            py_func = numba_event.data["dispatcher"].py_func
+
+            profiler._on_compile_end(
+                key=_compile_key_from(numba_event),
+                name=f"{py_func.__module__}.{py_func.__qualname__}",
+            )
+
+    listener = CompileListener()
+
+    event.register("numba:compile", listener)
+
+    return listener
+
+
+def _compile_key_from(numba_event):
+    return (
+        threading.get_ident(),
+        id(numba_event.data["dispatcher"]),
+        str(numba_event.data["args"]),
+    )
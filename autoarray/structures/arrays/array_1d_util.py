@@ -1,11 +1,12 @@
 from __future__ import annotations
 import os
 import numpy as np
-from astropy.io import fits
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Union
 
 if TYPE_CHECKING:
+    from astropy.io import fits
+
     from autoarray.mask.mask_1d import Mask1D
 
 from autoarray import numba_util
@@ -215,6 +216,8 @@ def hdu_for_output_from(
     hdu_for_output_from(array_1d=array_1d, file_path='/path/to/file/filename.fits', overwrite=True)
     """
 
+    from astropy.io import fits
+
     header = fits.Header()
 
     if header_dict is not None:
@@ -290,5 +293,7 @@ def numpy_array_1d_via_fits_from(file_path: Union[Path, str], hdu: int):
     --------
     array_2d = numpy_array_via_fits(file_path='/path/to/file/filename.fits', hdu=0)
     """
-    hdu_list = fits.open(file_path)
-    return np.array(hdu_list[hdu].data)
+    from astropy.io import fits
+
+    with fits.open(file_path, memmap=True) as hdu_list:
+        return np.array(hdu_list[hdu].data)
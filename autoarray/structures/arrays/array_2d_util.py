@@ -1,11 +1,12 @@
 from __future__ import annotations
-from astropy.io import fits
 import numpy as np
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
+    from astropy.io import fits
+
     from autoarray.mask.mask_2d import Mask2D
 
 from autoconf import conf
@@ -130,7 +131,7 @@ def convert_array_2d(
         return array_2d
     elif not store_native:
         return array_2d_slim_from(
-            array_2d_native=np.array(array_2d),
+            array_2d_native=np.asarray(array_2d),
             mask_2d=np.array(mask_2d),
         )
     array_2d = array_2d_native_from(
@@ -737,6 +738,8 @@ def hdu_for_output_from(
     array_2d = np.ones((5,5))
     hdu_for_output_from(array_2d=array_2d, file_path='/path/to/file/filename.fits', overwrite=True)
     """
+    from astropy.io import fits
+
     header = fits.Header()
 
     if header_dict is not None:
@@ -798,15 +801,24 @@ def numpy_array_2d_to_fits(
     hdu.writeto(file_path)
 
 
-def numpy_array_2d_via_fits_from(
-    file_path: Union[Path, str], hdu: int, do_not_scale_image_data: bool = False
-):
+def numpy_array_2d_and_header_objs_via_fits_from(
+    file_path: Union[Path, str],
+    hdu: int,
+    do_not_scale_image_data: bool = False,
+    dtype: str = "float64",
+) -> Tuple[np.ndarray, fits.Header, fits.Header]:
     """
-    Read a 2D NumPy array from a .fits file.
+    Read a 2D NumPy array and the headers of its file from a .fits file, which is opened only once.
 
     After loading the NumPy array, the array is flipped upside-down using np.flipud. This is so that the structures
     appear the same orientation as .fits files loaded in DS9.
 
+    The file is opened with memory mapping and closed before this function returns. The flip is a view of the
+    memory mapped data, which is only copied if it is not already of the input `dtype` in native byte order. For
+    the (big-endian) floating point data of a .fits file this is a single copy which both converts the byte order
+    and flips the array, with the file read directly into this copy. If no copy is made, the array remains a
+    (copy-on-write) view of the memory mapped file, whose values are only read from disk when they are used.
+
     Parameters
     ----------
     file_path
@@ -815,32 +827,48 @@ def numpy_array_2d_via_fits_from(
         The HDU extension of the array that is loaded from the .fits file.
     do_not_scale_image_data
         If True, the .fits file is not rescaled automatically based on the .fits header info.
+    dtype
+        The data type of the returned array.
 
     Returns
     -------
-    ndarray
-        The NumPy array that is loaded from the .fits file.
+    The NumPy array that is loaded from the .fits file, the header of the primary (science) HDU and the header
+    of the HDU the array is loaded from.
 
     Examples
     --------
-    array_2d = numpy_array_2d_via_fits_from(file_path='/path/to/file/filename.fits', hdu=0)
+    array_2d, header_sci_obj, header_hdu_obj = numpy_array_2d_and_header_objs_via_fits_from(
+        file_path='/path/to/file/filename.fits', hdu=0
+    )
     """
-    hdu_list = fits.open(file_path, do_not_scale_image_data=do_not_scale_image_data)
-
     flip_for_ds9 = conf.instance["general"]["fits"]["flip_for_ds9"]
 
-    if flip_for_ds9:
-        return np.flipud(np.array(hdu_list[hdu].data)).astype("float64")
-    return np.array(hdu_list[hdu].data).astype("float64")
+    from astropy.io import fits
 
+    with fits.open(
+        file_path, memmap=True, do_not_scale_image_data=do_not_scale_image_data
+    ) as hdu_list:
+        array_2d = hdu_list[hdu].data
 
-def header_obj_from(file_path: Union[Path, str], hdu: int) -> Dict:
+        if flip_for_ds9:
+            array_2d = np.flipud(array_2d)
+
+        array_2d = np.asarray(array_2d, dtype=np.dtype(dtype).newbyteorder("="))
+
+        return array_2d, hdu_list[0].header, hdu_list[hdu].header
+
+
+def numpy_array_2d_via_fits_from(
+    file_path: Union[Path, str], hdu: int, do_not_scale_image_data: bool = False
+):
     """
     Read a 2D NumPy array from a .fits file.
 
     After loading the NumPy array, the array is flipped upside-down using np.flipud. This is so that the structures
     appear the same orientation as .fits files loaded in DS9.
 
+    See `numpy_array_2d_and_header_objs_via_fits_from` for how the file is loaded.
+
     Parameters
     ----------
     file_path
@@ -850,6 +878,33 @@ def header_obj_from(file_path: Union[Path, str], hdu: int) -> Dict:
     do_not_scale_image_data
         If True, the .fits file is not rescaled automatically based on the .fits header info.
 
+    Returns
+    -------
+    ndarray
+        The NumPy array that is loaded from the .fits file.
+
+    Examples
+    --------
+    array_2d = numpy_array_2d_via_fits_from(file_path='/path/to/file/filename.fits', hdu=0)
+    """
+    return numpy_array_2d_and_header_objs_via_fits_from(
+        file_path=file_path, hdu=hdu, do_not_scale_image_data=do_not_scale_image_data
+    )[0]
+
+
+def header_obj_from(file_path: Union[Path, str], hdu: int) -> Dict:
+    """
+    Read the header of an HDU of a .fits file.
+
+    The file is opened with memory mapping, such that the data of the HDU is not read.
+
+    Parameters
+    ----------
+    file_path
+        The full path of the file that is loaded, including the file name and ``.fits`` extension.
+    hdu
+        The HDU extension of the header that is loaded from the .fits file.
+
     Returns
     -------
     dict
@@ -857,8 +912,9 @@ def header_obj_from(file_path: Union[Path, str], hdu: int) -> Dict:
 
     Examples
     --------
-    array_2d = numpy_array_2d_via_fits_from(file_path='/path/to/file/filename.fits', hdu=0)
+    header_obj = header_obj_from(file_path='/path/to/file/filename.fits', hdu=0)
     """
-    hdu_list = fits.open(file_path)
+    from astropy.io import fits
 
-    return hdu_list[hdu].header
+    with fits.open(file_path, memmap=True) as hdu_list:
+        return hdu_list[hdu].header
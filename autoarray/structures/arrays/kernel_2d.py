@@ -1,15 +1,14 @@
-from astropy.io import fits
-from astropy import units
 import numpy as np
-import scipy.signal
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from astropy.io import fits
 
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.structures.arrays.uniform_2d import AbstractArray2D
 from autoarray.structures.arrays.uniform_2d import Array2D
 from autoarray.structures.grids.uniform_2d import Grid2D
-from autoarray.structures.header import Header
 
 from autoarray import exc
 from autoarray import type as ty
@@ -294,6 +293,8 @@ class Kernel2D(AbstractArray2D):
         centre: Tuple[float, float] = (0.0, 0.0),
         normalize: bool = False,
     ) -> "Kernel2D":
+        from astropy import units
+
         x_stddev = (
             x_stddev * (units.deg).to(units.arcsec) / (2.0 * np.sqrt(2.0 * np.log(2.0)))
         )
@@ -345,20 +346,17 @@ class Kernel2D(AbstractArray2D):
             file_path=file_path, hdu=hdu, pixel_scales=pixel_scales, origin=origin
         )
 
-        header_sci_obj = array_2d_util.header_obj_from(file_path=file_path, hdu=0)
-        header_hdu_obj = array_2d_util.header_obj_from(file_path=file_path, hdu=hdu)
-
         return Kernel2D(
             values=array[:],
             mask=array.mask,
             normalize=normalize,
-            header=Header(header_sci_obj=header_sci_obj, header_hdu_obj=header_hdu_obj),
+            header=array.header,
         )
 
     @classmethod
     def from_primary_hdu(
         cls,
-        primary_hdu: fits.PrimaryHDU,
+        primary_hdu: "fits.PrimaryHDU",
         origin: Tuple[float, float] = (0.0, 0.0),
     ) -> "Kernel2D":
         """
@@ -515,6 +513,8 @@ class Kernel2D(AbstractArray2D):
 
         array_2d = array.native
 
+        import scipy.signal
+
         convolved_array_2d = scipy.signal.convolve2d(array_2d, self.native, mode="same")
 
         convolved_array_1d = array_2d_util.array_2d_slim_from(
@@ -546,6 +546,8 @@ class Kernel2D(AbstractArray2D):
         if self.mask.shape[0] % 2 == 0 or self.mask.shape[1] % 2 == 0:
             raise exc.KernelException("Kernel2D Kernel2D must be odd")
 
+        import scipy.signal
+
         convolved_array_2d = scipy.signal.convolve2d(array, self.native, mode="same")
 
         convolved_array_1d = array_2d_util.array_2d_slim_from(
@@ -1,7 +1,9 @@
-from astropy.io import fits
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union, Tuple, List
+from typing import TYPE_CHECKING, Optional, Union, Tuple, List
+
+if TYPE_CHECKING:
+    from astropy.io import fits
 
 from autoarray.structures.header import Header
 
@@ -234,7 +236,7 @@ class Array1D(Structure):
     @classmethod
     def from_primary_hdu(
         cls,
-        primary_hdu: fits.PrimaryHDU,
+        primary_hdu: "fits.PrimaryHDU",
         origin: Tuple[float, float] = (0.0, 0.0),
     ) -> "Array1D":
         """
@@ -313,7 +315,7 @@ class Array1D(Structure):
         )
 
     @property
-    def hdu_for_output(self) -> fits.PrimaryHDU:
+    def hdu_for_output(self) -> "fits.PrimaryHDU":
         """
         The array as an HDU object, which can be output to a .fits file.
 
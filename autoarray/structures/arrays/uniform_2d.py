@@ -1,8 +1,10 @@
-from astropy.io import fits
 import logging
 import numpy as np
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from astropy.io import fits
 
 from autoconf import conf
 
@@ -252,6 +254,47 @@ class AbstractArray2D(Structure):
         self.mask = mask
         self.header = header
 
+    @classmethod
+    def _from_slim_unchecked(
+        cls,
+        values: np.ndarray,
+        mask: Mask2D,
+        header: Optional[Header] = None,
+        store_native: bool = False,
+    ) -> "Array2D":
+        """
+        Trusted internal constructor of an `Array2D` from values which are already in their `slim` representation
+        and paired with the input mask, such that they have shape [total_unmasked_pixels].
+
+        This skips the conversion and validation of the values performed by the normal constructor, and is used by
+        hot paths (e.g. inversions and over sampling) which create many arrays whose values are computed directly
+        from the mask and therefore known to be valid. No checks are performed, so it is not part of the public API.
+
+        The config option `native_binned_only` is not read, so that no config lookup is performed for every array.
+        Callers for which it applies look it up once and pass it as `store_native`, in which case the values are
+        converted to their `native` representation via the normal constructor.
+
+        Parameters
+        ----------
+        values
+            The values of the array in their `slim` representation, of shape [total_unmasked_pixels].
+        mask
+            The 2D mask associated with the array.
+        header
+            The header of the array, which is typically loaded from a .fits file.
+        store_native
+            If `True`, the array is stored in its `native` representation via the normal constructor.
+        """
+        if store_native:
+            return cls(values=values, mask=mask, header=header, store_native=True)
+
+        array = cls.__new__(cls)
+        Structure.__init__(array, values)
+        array.mask = mask
+        array.header = header
+
+        return array
+
     @property
     def values(self):
         return self._array
@@ -517,7 +560,7 @@ class AbstractArray2D(Structure):
         )
 
     @property
-    def hdu_for_output(self) -> fits.PrimaryHDU:
+    def hdu_for_output(self) -> "fits.PrimaryHDU":
         """
         The array as an HDU object, which can be output to a .fits file.
 
@@ -836,13 +879,14 @@ class Array2D(AbstractArray2D):
                 pixel_scales=1.0,
             )
         """
-        array_2d = array_2d_util.numpy_array_2d_via_fits_from(
+        (
+            array_2d,
+            header_sci_obj,
+            header_hdu_obj,
+        ) = array_2d_util.numpy_array_2d_and_header_objs_via_fits_from(
             file_path=file_path, hdu=hdu
         )
 
-        header_sci_obj = array_2d_util.header_obj_from(file_path=file_path, hdu=0)
-        header_hdu_obj = array_2d_util.header_obj_from(file_path=file_path, hdu=hdu)
-
         return cls.no_mask(
             values=array_2d,
             pixel_scales=pixel_scales,
@@ -853,7 +897,7 @@ class Array2D(AbstractArray2D):
     @classmethod
     def from_primary_hdu(
         cls,
-        primary_hdu: fits.PrimaryHDU,
+        primary_hdu: "fits.PrimaryHDU",
         origin: Tuple[float, float] = (0.0, 0.0),
     ) -> "Array2D":
         """
@@ -955,15 +999,11 @@ class Array2D(AbstractArray2D):
             pixel_scales=pixel_scales,
         )
 
-        grid_pixels = geometry_util.grid_pixel_indexes_2d_slim_from(
-            grid_scaled_2d_slim=np.array(grid.slim),
-            shape_native=shape_native,
-            pixel_scales=pixel_scales,
+        grid_pixels = grid.mask.geometry.affine.pixel_indexes_from(
+            grid_scaled_2d_slim=np.array(grid.slim)
         )
 
-        array_1d = np.array(
-            [values[int(grid_pixels[i])] for i in range(grid_pixels.shape[0])]
-        )
+        array_1d = np.asarray(values)[grid_pixels.astype("int")]
 
         return cls.no_mask(
             values=array_1d,
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import List, Union
 
 from autoarray.mask.mask_1d import Mask1D
@@ -10,6 +11,8 @@ from autoarray.structures.grids.uniform_1d import Grid1D
 from autoarray.structures.grids.irregular_2d import Grid2DIrregular
 from autoarray.structures.grids.uniform_2d import Grid2D
 
+from autoarray.operators import chunk_util
+
 
 class AbstractMaker:
     def __init__(self, func, obj, grid, *args, **kwargs):
@@ -96,8 +99,60 @@ class AbstractMaker:
             grid = self.grid.grid_2d_radial_projected_from()
             return self.func(self.obj, grid, *self.args, **self.kwargs)
 
+        chunk_size, chunk_workers = chunk_util.chunk_settings_from()
+
+        if (
+            chunk_size is not None
+            and isinstance(self.grid, (Grid2D, Grid2DIrregular))
+            and self.grid.shape[0] > chunk_size
+        ):
+            return self.evaluate_func_in_chunks(
+                chunk_size=chunk_size, workers=chunk_workers
+            )
+
         return self.func(self.obj, self.grid, *self.args, **self.kwargs)
 
+    def evaluate_func_in_chunks(self, chunk_size: int, workers: int = 1):
+        """
+        Evaluate the function that is being decorated on consecutive chunks of the grid, writing the values of every
+        chunk into preallocated output arrays, such that the memory of the function's intermediate arrays is bounded
+        by the chunk size rather than the size of the grid.
+
+        This is used instead of evaluating the function on the entire grid if a `chunk_size` is set in the
+        `structures` section of `config/general.yaml`. Every chunk is passed to the function as a `Grid2DIrregular`,
+        as a chunk of a `Grid2D` does not correspond to its mask.
+
+        Parameters
+        ----------
+        chunk_size
+            The maximum number of (y,x) coordinates in every chunk.
+        workers
+            The number of threads chunks are evaluated over.
+        """
+        grid = np.asarray(self.grid)
+
+        def chunk_func(start: int, end: int):
+            result = self.func(
+                self.obj,
+                Grid2DIrregular(values=grid[start:end]),
+                *self.args,
+                **self.kwargs,
+            )
+
+            if isinstance(result, list):
+                return [np.asarray(res) for res in result]
+
+            return np.asarray(result)
+
+        return chunk_util.values_via_chunks_from(
+            chunk_func=chunk_func,
+            chunk_slices=chunk_util.chunk_slices_from(
+                total=grid.shape[0], chunk_size=chunk_size
+            ),
+            total=grid.shape[0],
+            workers=workers,
+        )
+
     @property
     def result(self):
         """
@@ -1,13 +1,18 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import os
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
+    from scipy.spatial import cKDTree
+
     from autoarray.mask.mask_2d import Mask2D
 
 from autoarray import exc
 from autoarray.structures.arrays import array_2d_util
 from autoarray.geometry import geometry_util
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
 from autoarray import numba_util
 from autoarray.mask import mask_2d_util
 from autoarray import type as ty
@@ -630,6 +635,358 @@ def relocated_grid_via_jit_from(grid, border_grid):
     return grid_relocated
 
 
+def relocated_grid_via_kdtree_from(
+    grid: np.ndarray,
+    border_grid: np.ndarray,
+    border_tree: Optional[cKDTree] = None,
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    Relocate the coordinates of a grid to its border if they are outside the border, where the border is
+    defined as all pixels at the edge of the grid's mask (see *mask._border_1d_indexes*).
+
+    This gives the same result as `relocated_grid_via_jit_from`, but is performed as follows so that its cost
+    scales with the number of coordinates outside the border, as opposed to the number of coordinates multiplied
+    by the number of border pixels:
+
+    1: Compute the origin of the border and the radial distance of every border coordinate from it.
+    2: Compute the radial distance of every grid coordinate from the origin in one vectorized pass, and select only
+       the coordinates whose radial distance exceeds the minimum border radius (all other coordinates are inside the
+       border and cannot be relocated).
+    3: For only these coordinates, find their nearest pixel in the border via a KD-tree of the border coordinates,
+       where ties between equidistant border pixels are broken by choosing the lowest index (as `np.argmin` does).
+       If the nearest border pixels returned by the KD-tree are all equidistant, every border pixel at this
+       distance is found via a ball query of the KD-tree, so that the lowest index is chosen however many tie.
+    4: If their radial distance is larger than that of their paired border pixel, use the ratio of radial distances
+       to move the coordinate to the border.
+
+    Parameters
+    ----------
+    grid
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid
+        The grid of border (y,x) coordinates.
+    border_tree
+        A KD-tree of the `border_grid`, which can be input if it has already been computed to avoid rebuilding it.
+    workers
+        The number of workers used to query the KD-tree in parallel (-1 uses all available CPUs).
+    """
+    grid = np.asarray(grid)
+    border_grid = np.asarray(border_grid)
+
+    grid_relocated = np.array(grid, dtype="float")
+
+    border_origin = np.zeros(2)
+    border_origin[0] = np.mean(border_grid[:, 0])
+    border_origin[1] = np.mean(border_grid[:, 1])
+    border_grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(border_grid[:, 0], border_origin[0])),
+            np.square(np.subtract(border_grid[:, 1], border_origin[1])),
+        )
+    )
+    border_min_radii = np.min(border_grid_radii)
+
+    grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(grid[:, 0], border_origin[0])),
+            np.square(np.subtract(grid[:, 1], border_origin[1])),
+        )
+    )
+
+    outside_indexes = np.where(grid_radii > border_min_radii)[0]
+
+    if outside_indexes.shape[0] == 0:
+        return grid_relocated
+
+    if border_tree is None:
+        from scipy.spatial import cKDTree
+
+        border_tree = cKDTree(border_grid)
+
+    outside_grid = grid[outside_indexes]
+
+    k = min(4, border_grid.shape[0])
+
+    distances, pixel_indexes = border_tree.query(outside_grid, k=k, workers=workers)
+    distances = distances.reshape((outside_indexes.shape[0], k))
+    pixel_indexes = pixel_indexes.reshape((outside_indexes.shape[0], k))
+
+    # The squared distances are recomputed as `relocated_grid_via_jit_from` computes them, so that equidistant
+    # border pixels are tied exactly and the lowest index is chosen.
+    distances_squared = np.square(
+        outside_grid[:, 0:1] - border_grid[pixel_indexes, 0]
+    ) + np.square(outside_grid[:, 1:2] - border_grid[pixel_indexes, 1])
+
+    closest_pixel_indexes = np.min(
+        np.where(
+            distances_squared == np.min(distances_squared, axis=1, keepdims=True),
+            pixel_indexes,
+            border_grid.shape[0],
+        ),
+        axis=1,
+    )
+
+    # If all k border pixels are equidistant, more border pixels may tie with them, so every border pixel at the
+    # nearest distance is found to choose the lowest index.
+    if k < border_grid.shape[0]:
+        tie_indexes = np.where(
+            distances[:, -1] <= distances[:, 0] * (1.0 + 1.0e-8)
+        )[0]
+
+        if tie_indexes.shape[0] > 0:
+            tie_pixel_indexes_list = border_tree.query_ball_point(
+                outside_grid[tie_indexes],
+                r=distances[tie_indexes, 0] * (1.0 + 1.0e-8),
+                workers=workers,
+            )
+
+            for tie_index, tie_pixel_indexes in zip(
+                tie_indexes, tie_pixel_indexes_list
+            ):
+                tie_pixel_indexes = np.asarray(tie_pixel_indexes, dtype="int")
+
+                tie_distances_squared = np.square(
+                    outside_grid[tie_index, 0] - border_grid[tie_pixel_indexes, 0]
+                ) + np.square(
+                    outside_grid[tie_index, 1] - border_grid[tie_pixel_indexes, 1]
+                )
+
+                closest_pixel_indexes[tie_index] = np.min(
+                    tie_pixel_indexes[
+                        tie_distances_squared == np.min(tie_distances_squared)
+                    ]
+                )
+
+    move_factors = (
+        border_grid_radii[closest_pixel_indexes] / grid_radii[outside_indexes]
+    )
+
+    relocate = move_factors < 1.0
+    relocate_indexes = outside_indexes[relocate]
+
+    grid_relocated[relocate_indexes, :] = (
+        move_factors[relocate, None] * (grid[relocate_indexes, :] - border_origin)
+        + border_origin
+    )
+
+    return grid_relocated
+
+
+@numba_util.jit(nogil=True)
+def closest_border_indexes_via_angle_from(
+    grid: np.ndarray,
+    grid_radii: np.ndarray,
+    border_grid: np.ndarray,
+    border_angles: np.ndarray,
+    border_sort_indexes: np.ndarray,
+    border_origin: np.ndarray,
+    angle_tolerance: float,
+) -> np.ndarray:
+    """
+    Returns the index of the closest border coordinate of every input (y,x) coordinate, using the border coordinates
+    sorted by their polar angle about the border origin.
+
+    For every coordinate, a binary search on angle finds where it would be inserted into the sorted border
+    coordinates, and the border coordinates are then compared with it walking outwards from this position in both
+    directions (wrapping around at the angles -pi and pi). A border coordinate separated from the coordinate by an
+    angle `delta` about the origin is at least a distance `radius * sin(delta)` from it (or `radius` for angles above
+    pi / 2), so the walk in each direction stops once this lower bound exceeds the distance of the closest border
+    coordinate found so far, or once `delta` exceeds the `angle_tolerance`.
+
+    Ties between equidistant border coordinates are broken by choosing the lowest index (as `np.argmin` does).
+
+    The function releases the GIL, so that chunks of coordinates can be processed in parallel by a thread pool.
+
+    Parameters
+    ----------
+    grid
+        The (y,x) coordinates whose closest border coordinates are found.
+    grid_radii
+        The radial distance of every coordinate from the border origin.
+    border_grid
+        The (y,x) coordinates of the border.
+    border_angles
+        The polar angles of the border coordinates about the border origin, sorted in ascending order.
+    border_sort_indexes
+        The index in `border_grid` of every sorted angle in `border_angles`.
+    border_origin
+        The (y,x) origin of the border.
+    angle_tolerance
+        The maximum angle (in radians) between a coordinate and the border coordinates it is compared with, where
+        a value of pi or above gives the exact closest border coordinate. The two border coordinates adjacent to a
+        coordinate in angle are always compared with it.
+    """
+    total_border = border_angles.shape[0]
+
+    closest_indexes = np.zeros(grid.shape[0], dtype=np.int64)
+
+    max_delta = min(angle_tolerance, np.pi)
+
+    for grid_index in range(grid.shape[0]):
+        y = grid[grid_index, 0]
+        x = grid[grid_index, 1]
+        radius = grid_radii[grid_index]
+
+        angle = np.arctan2(y - border_origin[0], x - border_origin[1])
+
+        position = np.searchsorted(border_angles, angle)
+
+        closest_index = total_border
+        closest_distance = np.inf
+
+        for direction in (1, -1):
+            for step in range(total_border):
+                if direction == 1:
+                    sorted_index = (position + step) % total_border
+                    delta = border_angles[sorted_index] - angle
+                else:
+                    sorted_index = (position - 1 - step) % total_border
+                    delta = angle - border_angles[sorted_index]
+
+                if delta < 0.0:
+                    delta += 2.0 * np.pi
+
+                if step > 0 and delta > max_delta:
+                    break
+
+                if delta < 0.5 * np.pi:
+                    lower_bound = (radius * np.sin(delta)) ** 2
+                else:
+                    lower_bound = radius**2
+
+                # The bound is relaxed by a small fraction so that rounding errors cannot skip a tied border pixel.
+                if lower_bound > closest_distance * (1.0 + 1.0e-10):
+                    break
+
+                border_index = border_sort_indexes[sorted_index]
+
+                distance = (y - border_grid[border_index, 0]) ** 2 + (
+                    x - border_grid[border_index, 1]
+                ) ** 2
+
+                if distance < closest_distance or (
+                    distance == closest_distance and border_index < closest_index
+                ):
+                    closest_distance = distance
+                    closest_index = border_index
+
+        closest_indexes[grid_index] = closest_index
+
+    return closest_indexes
+
+
+def relocated_grid_via_angle_sort_from(
+    grid: np.ndarray,
+    border_grid: np.ndarray,
+    angle_tolerance: float = np.pi,
+    workers: int = 1,
+) -> np.ndarray:
+    """
+    Relocate the coordinates of a grid to its border if they are outside the border, where the border is
+    defined as all pixels at the edge of the grid's mask (see *mask._border_1d_indexes*).
+
+    This gives the same result as `relocated_grid_via_jit_from` (for an `angle_tolerance` of pi), but finds the
+    nearest border pixel of every coordinate outside the minimum border radius via a binary search on the polar
+    angles of the border pixels about the border origin, which are sorted once. Only the border pixels close in
+    angle to a coordinate are compared with it (see `closest_border_indexes_via_angle_from`), as opposed to every
+    border pixel.
+
+    The coordinates outside the minimum border radius are split into chunks which are processed in parallel by a
+    thread pool.
+
+    Parameters
+    ----------
+    grid
+        The grid (uniform or irregular) whose pixels are to be relocated to the border edge if outside it.
+    border_grid
+        The grid of border (y,x) coordinates.
+    angle_tolerance
+        The maximum angle (in radians) between a coordinate and the border pixels it is compared with. The default
+        of pi finds the exact nearest border pixel, whereas smaller values bound the number of border pixels
+        compared with every coordinate at the expense of possibly pairing it with a border pixel which is not the
+        nearest.
+    workers
+        The number of threads the coordinates are relocated over in parallel (-1 uses all available CPUs).
+    """
+    grid = np.asarray(grid)
+    border_grid = np.asarray(border_grid, dtype="float")
+
+    grid_relocated = np.array(grid, dtype="float")
+
+    border_origin = np.zeros(2)
+    border_origin[0] = np.mean(border_grid[:, 0])
+    border_origin[1] = np.mean(border_grid[:, 1])
+    border_grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(border_grid[:, 0], border_origin[0])),
+            np.square(np.subtract(border_grid[:, 1], border_origin[1])),
+        )
+    )
+    border_min_radii = np.min(border_grid_radii)
+
+    grid_radii = np.sqrt(
+        np.add(
+            np.square(np.subtract(grid[:, 0], border_origin[0])),
+            np.square(np.subtract(grid[:, 1], border_origin[1])),
+        )
+    )
+
+    outside_indexes = np.where(grid_radii > border_min_radii)[0]
+
+    if outside_indexes.shape[0] == 0:
+        return grid_relocated
+
+    border_angles = np.arctan2(
+        border_grid[:, 0] - border_origin[0], border_grid[:, 1] - border_origin[1]
+    )
+    border_sort_indexes = np.argsort(border_angles, kind="stable")
+    border_angles = np.ascontiguousarray(border_angles[border_sort_indexes])
+
+    outside_grid = np.ascontiguousarray(grid_relocated[outside_indexes])
+    outside_radii = np.ascontiguousarray(grid_radii[outside_indexes])
+
+    def closest_indexes_from(chunk):
+        return closest_border_indexes_via_angle_from(
+            grid=outside_grid[chunk],
+            grid_radii=outside_radii[chunk],
+            border_grid=border_grid,
+            border_angles=border_angles,
+            border_sort_indexes=border_sort_indexes,
+            border_origin=border_origin,
+            angle_tolerance=float(angle_tolerance),
+        )
+
+    if workers == -1:
+        workers = os.cpu_count() or 1
+
+    workers = max(min(workers, outside_indexes.shape[0]), 1)
+
+    chunks = np.array_split(np.arange(outside_indexes.shape[0]), workers)
+
+    if workers == 1:
+        closest_pixel_indexes = closest_indexes_from(chunks[0])
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            closest_pixel_indexes = np.concatenate(
+                list(executor.map(closest_indexes_from, chunks))
+            )
+
+    move_factors = (
+        border_grid_radii[closest_pixel_indexes] / grid_radii[outside_indexes]
+    )
+
+    relocate = move_factors < 1.0
+    relocate_indexes = outside_indexes[relocate]
+
+    grid_relocated[relocate_indexes, :] = (
+        move_factors[relocate, None] * (grid[relocate_indexes, :] - border_origin)
+        + border_origin
+    )
+
+    return grid_relocated
+
+
 @numba_util.jit()
 def furthest_grid_2d_slim_index_from(
     grid_2d_slim: np.ndarray, slim_indexes: np.ndarray, coordinate: Tuple[float, float]
@@ -809,7 +1166,6 @@ def compute_polygon_area(points):
     return 0.5 * np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))
 
 
-@numba_util.jit()
 def grid_pixels_in_mask_pixels_from(
     grid, shape_native, pixel_scales, origin
 ) -> np.ndarray:
@@ -831,19 +1187,22 @@ def grid_pixels_in_mask_pixels_from(
     -------
     An array containing the integer number of image-mesh pixels that fall without each of the data's mask.
     """
-    grid_pixel_centres = geometry_util.grid_pixel_centres_2d_slim_from(
-        grid_scaled_2d_slim=grid,
-        shape_native=shape_native,
-        pixel_scales=pixel_scales,
-        origin=origin,
-    ).astype("int")
+    affine = affine_transform_2d_cached_from(
+        shape_native=(int(shape_native[0]), int(shape_native[1])),
+        pixel_scales=(float(pixel_scales[0]), float(pixel_scales[1])),
+        origin=(float(origin[0]), float(origin[1])),
+    )
 
-    mesh_pixels_per_image_pixel = np.zeros(shape=shape_native)
+    grid_pixel_centres = affine.pixel_centres_from(grid_scaled_2d_slim=grid).astype(
+        "int"
+    )
 
-    for i in range(grid_pixel_centres.shape[0]):
-        y = grid_pixel_centres[i, 0]
-        x = grid_pixel_centres[i, 1]
+    mesh_pixels_per_image_pixel = np.zeros(shape=shape_native)
 
-        mesh_pixels_per_image_pixel[y, x] += 1
+    np.add.at(
+        mesh_pixels_per_image_pixel,
+        (grid_pixel_centres[:, 0], grid_pixel_centres[:, 1]),
+        1,
+    )
 
     return mesh_pixels_per_image_pixel
@@ -175,6 +175,41 @@ class Grid2D(Structure):
         self.over_sampling = over_sampling
         self.over_sampling_non_uniform = over_sampling_non_uniform
 
+    @classmethod
+    def _from_slim_unchecked(
+        cls,
+        values: np.ndarray,
+        mask: Mask2D,
+        over_sampling: Optional[AbstractOverSampling] = None,
+        over_sampling_non_uniform: Optional[AbstractOverSampling] = None,
+    ) -> "Grid2D":
+        """
+        Trusted internal constructor of a `Grid2D` from (y,x) coordinates which are already in their `slim`
+        representation and paired with the input mask, such that they have shape [total_unmasked_pixels, 2].
+
+        This skips the conversion and checks of the values performed by the normal constructor, and is used by
+        hot paths (e.g. the grids derived from a mask) which create many grids whose values are computed directly
+        from the mask and therefore known to be valid. No checks are performed, so it is not part of the public API.
+
+        Parameters
+        ----------
+        values
+            The (y,x) coordinates of the grid in their `slim` representation, of shape [total_unmasked_pixels, 2].
+        mask
+            The 2D mask associated with the grid.
+        over_sampling
+            The over sampling scheme of the grid.
+        over_sampling_non_uniform
+            The over sampling scheme used for non-uniform grids computed from the grid.
+        """
+        grid = cls.__new__(cls)
+        Structure.__init__(grid, values)
+        grid.mask = mask
+        grid.over_sampling = over_sampling
+        grid.over_sampling_non_uniform = over_sampling_non_uniform
+
+        return grid
+
     @classmethod
     def no_mask(
         cls,
@@ -1,9 +1,6 @@
 import logging
-from astropy import time
 from typing import Dict, Tuple, Optional
 
-from autoarray.dataset import preprocess
-
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
@@ -40,6 +37,8 @@ class Header:
             self.date_of_observation is not None
             and self.time_of_observation is not None
         ):
+            from astropy import time
+
             t = time.Time(self.date_of_observation + "T" + self.time_of_observation)
             return t.mjd
         return None
@@ -48,6 +47,8 @@ class Header:
         raise NotImplementedError()
 
     def array_counts_to_counts_per_second(self, array_counts):
+        from autoarray.dataset import preprocess
+
         return preprocess.array_counts_to_counts_per_second(
             array_counts=array_counts, exposure_time=self.exposure_time
         )
@@ -28,6 +28,7 @@ class Mesh2DRectangular(Abstract2DMesh):
         shape_native: Tuple[int, int],
         pixel_scales: ty.PixelScales,
         origin: Tuple[float, float] = (0.0, 0.0),
+        interpolate: bool = False,
     ):
         """
         A grid of (y,x) coordinates which represent a uniform rectangular pixelization.
@@ -55,6 +56,9 @@ class Mesh2DRectangular(Abstract2DMesh):
             it is converted to a (float, float) structure.
         origin
             The (y,x) origin of the pixelization.
+        interpolate
+            If `True`, data points are mapped to the rectangular pixelization using bilinear interpolation between
+            the four pixel centres surrounding them, as opposed to the single pixel they fall within.
         """
 
         mask = Mask2D.all_false(
@@ -64,12 +68,17 @@ class Mesh2DRectangular(Abstract2DMesh):
         )
 
         self.mask = mask
+        self.interpolate = interpolate
 
         super().__init__(array=values)
 
     @classmethod
     def overlay_grid(
-        cls, shape_native: Tuple[int, int], grid: np.ndarray, buffer: float = 1e-8
+        cls,
+        shape_native: Tuple[int, int],
+        grid: np.ndarray,
+        buffer: float = 1e-8,
+        interpolate: bool = False,
     ) -> "Mesh2DRectangular":
         """
         Creates a `Grid2DRecntagular` by overlaying the rectangular pixelization over an input grid of (y,x)
@@ -90,6 +99,8 @@ class Mesh2DRectangular(Abstract2DMesh):
             A grid of (y,x) coordinates which the rectangular pixelization is laid-over.
         buffer
             The size of the extra spacing placed between the edges of the rectangular pixelization and input grid.
+        interpolate
+            If `True`, data points are mapped to the rectangular pixelization using bilinear interpolation.
         """
 
         y_min = np.min(grid[:, 0]) - buffer
@@ -115,6 +126,7 @@ class Mesh2DRectangular(Abstract2DMesh):
             shape_native=shape_native,
             pixel_scales=pixel_scales,
             origin=origin,
+            interpolate=interpolate,
         )
 
     @cached_property
@@ -124,7 +136,8 @@ class Mesh2DRectangular(Abstract2DMesh):
         `Neighbors` for a complete description of the neighboring scheme).
 
         The neighbors of a rectangular pixelization are computed by exploiting the uniform and symmetric nature of the
-        rectangular grid, as described in the method `mesh_util.rectangular_neighbors_from`.
+        rectangular grid, as described in the method `mesh_util.rectangular_neighbors_from`, which are memoised per
+        `shape_native`.
         """
         neighbors, sizes = mesh_util.rectangular_neighbors_from(
             shape_native=self.shape_native
@@ -8,6 +8,179 @@ from autoarray import Grid2D
 HEIGHT_FACTOR = 3**0.5 / 2
 
 
+def containing_mask_from(triangles, point):
+    """
+    Returns a boolean mask which is `True` for every triangle which contains a point, including points on the edges
+    of a triangle.
+
+    The point may also be a pair of arrays, with one point for every triangle, such that many points can be tested
+    against different triangles at once (e.g. by a `TrianglesSpatialIndex`).
+
+    Parameters
+    ----------
+    triangles
+        The triangles, of shape [total_triangles, 3, 2].
+    point
+        The point which is tested, or a pair of arrays of shape [total_triangles].
+    """
+    x, y = point
+
+    y1, x1 = triangles[:, 0, 1], triangles[:, 0, 0]
+    y2, x2 = triangles[:, 1, 1], triangles[:, 1, 0]
+    y3, x3 = triangles[:, 2, 1], triangles[:, 2, 0]
+
+    denominator = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
+
+    a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / denominator
+    b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / denominator
+    c = 1 - a - b
+
+    return (0 <= a) & (a <= 1) & (0 <= b) & (b <= 1) & (0 <= c) & (c <= 1)
+
+
+def containing_circle_mask_from(triangles, center, radius):
+    """
+    Returns a boolean mask which is `True` for every triangle which intersects a circle, defined as a triangle with
+    a vertex inside the circle or which contains the circle's center.
+
+    As for `containing_mask_from`, the center and radius may also be arrays with one value for every triangle.
+
+    Parameters
+    ----------
+    triangles
+        The triangles, of shape [total_triangles, 3, 2].
+    center
+        The center of the circle, or a pair of arrays of shape [total_triangles].
+    radius
+        The radius of the circle, or an array of shape [total_triangles].
+    """
+    x, y = center
+
+    y1, x1 = triangles[:, 0, 1], triangles[:, 0, 0]
+    y2, x2 = triangles[:, 1, 1], triangles[:, 1, 0]
+    y3, x3 = triangles[:, 2, 1], triangles[:, 2, 0]
+
+    a = x1 - x
+    b = y1 - y
+    c = x2 - x
+    d = y2 - y
+    e = x3 - x
+    f = y3 - y
+
+    aa = a * a + b * b
+    bb = c * c + d * d
+    cc = e * e + f * f
+
+    radius_2 = radius * radius
+
+    return (
+        (aa <= radius_2)
+        | (bb <= radius_2)
+        | (cc <= radius_2)
+        | containing_mask_from(triangles=triangles, point=center)
+    )
+
+
+def triangles_for_limits_and_scale_from(
+    y_min: float,
+    y_max: float,
+    x_min: float,
+    x_max: float,
+    scale: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the indices and vertices of a grid of equilateral triangles covering the input limits, where every
+    triangle has sides of length `scale`.
+
+    The integer lattice coordinates of every vertex are also returned, which are its row in the grid and its column
+    in units of half the scale (as every other row of vertices is offset by half the scale). Vertices of triangles
+    made by up sampling these triangles or by expanding their neighborhood are on the same lattice, which lets
+    duplicate vertices be detected exactly via these integer coordinates.
+
+    Parameters
+    ----------
+    y_min
+        The minimum y coordinate of the grid.
+    y_max
+        The maximum y coordinate of the grid.
+    x_min
+        The minimum x coordinate of the grid.
+    x_max
+        The maximum x coordinate of the grid.
+    scale
+        The side length of every triangle.
+
+    Returns
+    -------
+    The indices of the vertices of every triangle, the vertices and the integer lattice coordinates of the vertices.
+    """
+    height = scale * HEIGHT_FACTOR
+
+    vertices = []
+    lattice = []
+    indices = []
+    vertex_dict = {}
+    lattice_dict = {}
+
+    def add_vertex(v):
+        if v not in vertex_dict:
+            vertex_dict[v] = len(vertices)
+            vertices.append(v)
+            lattice.append(lattice_dict[v])
+        return vertex_dict[v]
+
+    rows = []
+    for row_y in np.arange(y_min, y_max + height, height):
+        row = []
+        offset_index = len(rows) % 2
+        offset = offset_index * scale / 2
+        for col_x in np.arange(x_min - offset, x_max + scale, scale):
+            lattice_dict[(row_y, col_x)] = (len(rows), 2 * len(row) - offset_index)
+            row.append((row_y, col_x))
+        rows.append(row)
+
+    for i in range(len(rows) - 1):
+        row = rows[i]
+        next_row = rows[i + 1]
+        for j in range(len(row)):
+            if i % 2 == 0 and j < len(next_row) - 1:
+                t1 = [
+                    add_vertex(row[j]),
+                    add_vertex(next_row[j]),
+                    add_vertex(next_row[j + 1]),
+                ]
+                if j < len(row) - 1:
+                    t2 = [
+                        add_vertex(row[j]),
+                        add_vertex(row[j + 1]),
+                        add_vertex(next_row[j + 1]),
+                    ]
+                    indices.append(t2)
+            elif i % 2 == 1 and j < len(next_row) - 1:
+                t1 = [
+                    add_vertex(row[j]),
+                    add_vertex(next_row[j]),
+                    add_vertex(row[j + 1]),
+                ]
+                indices.append(t1)
+                if j < len(next_row) - 1:
+                    t2 = [
+                        add_vertex(next_row[j]),
+                        add_vertex(next_row[j + 1]),
+                        add_vertex(row[j + 1]),
+                    ]
+                    indices.append(t2)
+            else:
+                continue
+            indices.append(t1)
+
+    return (
+        np.array(indices),
+        np.array(vertices),
+        np.array(lattice, dtype="int64").reshape(-1, 2),
+    )
+
+
 class AbstractTriangles(ABC):
     def __init__(
         self,
@@ -29,49 +202,11 @@ class AbstractTriangles(ABC):
         self.vertices = vertices
 
     def _containing_mask(self, point):
-        x, y = point
-
-        triangles = self.triangles
-
-        y1, x1 = triangles[:, 0, 1], triangles[:, 0, 0]
-        y2, x2 = triangles[:, 1, 1], triangles[:, 1, 0]
-        y3, x3 = triangles[:, 2, 1], triangles[:, 2, 0]
-
-        denominator = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3)
-
-        a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / denominator
-        b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / denominator
-        c = 1 - a - b
-
-        return (0 <= a) & (a <= 1) & (0 <= b) & (b <= 1) & (0 <= c) & (c <= 1)
+        return containing_mask_from(triangles=self.triangles, point=point)
 
     def _containing_circle_mask(self, center, radius):
-        triangles = self.triangles
-
-        x, y = center
-
-        y1, x1 = triangles[:, 0, 1], triangles[:, 0, 0]
-        y2, x2 = triangles[:, 1, 1], triangles[:, 1, 0]
-        y3, x3 = triangles[:, 2, 1], triangles[:, 2, 0]
-
-        a = x1 - x
-        b = y1 - y
-        c = x2 - x
-        d = y2 - y
-        e = x3 - x
-        f = y3 - y
-
-        aa = a * a + b * b
-        bb = c * c + d * d
-        cc = e * e + f * f
-
-        radius_2 = radius * radius
-
-        return (
-            (aa <= radius_2)
-            | (bb <= radius_2)
-            | (cc <= radius_2)
-            | self._containing_mask(point=center)
+        return containing_circle_mask_from(
+            triangles=self.triangles, center=center, radius=radius
         )
 
     @property
@@ -79,8 +214,9 @@ class AbstractTriangles(ABC):
     def numpy(self):
         pass
 
-    def _up_sample_triangle(self):
-        triangles = self.triangles
+    def _up_sample_triangle(self, triangles=None):
+        if triangles is None:
+            triangles = self.triangles
 
         m01 = (triangles[:, 0] + triangles[:, 1]) / 2
         m12 = (triangles[:, 1] + triangles[:, 2]) / 2
@@ -96,8 +232,9 @@ class AbstractTriangles(ABC):
             axis=0,
         )
 
-    def _neighborhood_triangles(self):
-        triangles = self.triangles
+    def _neighborhood_triangles(self, triangles=None):
+        if triangles is None:
+            triangles = self.triangles
 
         new_v0 = triangles[:, 1] + triangles[:, 2] - triangles[:, 0]
         new_v1 = triangles[:, 0] + triangles[:, 2] - triangles[:, 1]
@@ -134,63 +271,13 @@ class AbstractTriangles(ABC):
         scale: float,
         **kwargs,
     ) -> "AbstractTriangles":
-        height = scale * HEIGHT_FACTOR
-
-        vertices = []
-        indices = []
-        vertex_dict = {}
-
-        def add_vertex(v):
-            if v not in vertex_dict:
-                vertex_dict[v] = len(vertices)
-                vertices.append(v)
-            return vertex_dict[v]
-
-        rows = []
-        for row_y in np.arange(y_min, y_max + height, height):
-            row = []
-            offset = (len(rows) % 2) * scale / 2
-            for col_x in np.arange(x_min - offset, x_max + scale, scale):
-                row.append((row_y, col_x))
-            rows.append(row)
-
-        for i in range(len(rows) - 1):
-            row = rows[i]
-            next_row = rows[i + 1]
-            for j in range(len(row)):
-                if i % 2 == 0 and j < len(next_row) - 1:
-                    t1 = [
-                        add_vertex(row[j]),
-                        add_vertex(next_row[j]),
-                        add_vertex(next_row[j + 1]),
-                    ]
-                    if j < len(row) - 1:
-                        t2 = [
-                            add_vertex(row[j]),
-                            add_vertex(row[j + 1]),
-                            add_vertex(next_row[j + 1]),
-                        ]
-                        indices.append(t2)
-                elif i % 2 == 1 and j < len(next_row) - 1:
-                    t1 = [
-                        add_vertex(row[j]),
-                        add_vertex(next_row[j]),
-                        add_vertex(row[j + 1]),
-                    ]
-                    indices.append(t1)
-                    if j < len(next_row) - 1:
-                        t2 = [
-                            add_vertex(next_row[j]),
-                            add_vertex(next_row[j + 1]),
-                            add_vertex(row[j + 1]),
-                        ]
-                        indices.append(t2)
-                else:
-                    continue
-                indices.append(t1)
-
-        vertices = np.array(vertices)
-        indices = np.array(indices)
+        indices, vertices, _ = triangles_for_limits_and_scale_from(
+            y_min=y_min,
+            y_max=y_max,
+            x_min=x_min,
+            x_max=x_max,
+            scale=scale,
+        )
 
         return cls(
             indices=indices,
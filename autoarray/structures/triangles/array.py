@@ -1,11 +1,68 @@
-from typing import Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
+from autoconf import cached_property
+
 from autoarray.structures.triangles.abstract import AbstractTriangles
+from autoarray.structures.triangles.abstract import (
+    triangles_for_limits_and_scale_from,
+)
+from autoarray.structures.triangles.spatial_index import TrianglesSpatialIndex
+from autoarray.structures.triangles import lattice_util
 
 
 class ArrayTriangles(AbstractTriangles):
+    def __init__(
+        self,
+        indices: np.ndarray,
+        vertices: np.ndarray,
+        lattice: Optional[np.ndarray] = None,
+    ):
+        """
+        Represents a set of triangles in efficient NumPy arrays.
+
+        Parameters
+        ----------
+        indices
+            The indices of the vertices of the triangles. This is a 2D array where each row is a triangle
+            with the three indices of the vertices.
+        vertices
+            The vertices of the triangles.
+        lattice
+            The integer coordinates of every vertex on the lattice of triangles made by `for_limits_and_scale`,
+            which `up_sample`, `neighborhood` and `for_indexes` use to remove duplicate vertices exactly and in
+            linear time. If `None`, duplicate vertices are found by sorting their floating point coordinates.
+        """
+        super().__init__(indices=indices, vertices=vertices)
+
+        self.lattice = lattice
+
+    @classmethod
+    def for_limits_and_scale(
+        cls,
+        y_min: float,
+        y_max: float,
+        x_min: float,
+        x_max: float,
+        scale: float,
+        **kwargs,
+    ) -> "ArrayTriangles":
+        indices, vertices, lattice = triangles_for_limits_and_scale_from(
+            y_min=y_min,
+            y_max=y_max,
+            x_min=x_min,
+            x_max=x_max,
+            scale=scale,
+        )
+
+        return cls(
+            indices=indices,
+            vertices=vertices,
+            lattice=lattice,
+            **kwargs,
+        )
+
     @property
     def triangles(self):
         return self.vertices[self.indices]
@@ -31,6 +88,9 @@ class ArrayTriangles(AbstractTriangles):
         -------
         The triangles that contain the point.
         """
+        if "spatial_index" in self.__dict__:
+            return self.spatial_index.containing_indices_from(points=[point])[0]
+
         inside = self._containing_mask(point)
 
         return np.where(inside)[0]
@@ -52,10 +112,67 @@ class ArrayTriangles(AbstractTriangles):
         -------
         The triangles that contain the circle.
         """
+        if "spatial_index" in self.__dict__:
+            return self.spatial_index.containing_indices_circle_from(
+                centers=[center], radius=radius
+            )[0]
+
         inside = self._containing_circle_mask(center, radius)
 
         return np.where(inside)[0]
 
+    @cached_property
+    def spatial_index(self) -> TrianglesSpatialIndex:
+        """
+        A uniform grid index over the bounding boxes of the triangles, which is built the first time many points
+        or circles are queried at once (see `containing_indices_batch`).
+
+        Once built, single queries via `containing_indices` and `containing_indices_circle` also use it.
+        """
+        return TrianglesSpatialIndex(triangles=self.triangles)
+
+    def containing_indices_batch(self, points: np.ndarray) -> List[np.ndarray]:
+        """
+        Find the triangles that contain each of many points.
+
+        This uses the `spatial_index` of the triangles, such that every point is only tested against the triangles
+        near it rather than every triangle, giving the same result as calling `containing_indices` for every point.
+
+        Parameters
+        ----------
+        points
+            The points to find the containing triangles for, of shape [total_points, 2].
+
+        Returns
+        -------
+        A list with the indices of the triangles that contain every point.
+        """
+        return self.spatial_index.containing_indices_from(points=points)
+
+    def containing_indices_circle_batch(
+        self, centers: np.ndarray, radius: Union[float, np.ndarray]
+    ) -> List[np.ndarray]:
+        """
+        Find the triangles that intersect each of many circles.
+
+        This uses the `spatial_index` of the triangles, giving the same result as calling
+        `containing_indices_circle` for every circle.
+
+        Parameters
+        ----------
+        centers
+            The centers of the circles, of shape [total_circles, 2].
+        radius
+            The radius of the circles, or an array with the radius of every circle.
+
+        Returns
+        -------
+        A list with the indices of the triangles that intersect every circle.
+        """
+        return self.spatial_index.containing_indices_circle_from(
+            centers=centers, radius=radius
+        )
+
     def for_indexes(self, indexes: np.ndarray) -> "ArrayTriangles":
         """
         Create a new ArrayTriangles containing indices and vertices corresponding to the given indexes
@@ -72,6 +189,21 @@ class ArrayTriangles(AbstractTriangles):
         """
         selected_indices = self.indices[indexes]
 
+        if self.lattice is not None:
+            flat_indices = selected_indices.reshape(-1).astype("int64")
+
+            first_indexes, inverse_indices = lattice_util.unique_keys_from(
+                keys=flat_indices
+            )
+
+            vertex_indexes = flat_indices[first_indexes]
+
+            return ArrayTriangles(
+                indices=inverse_indices.reshape(selected_indices.shape),
+                vertices=self.vertices[vertex_indexes],
+                lattice=self.lattice[vertex_indexes],
+            )
+
         flat_indices = selected_indices.flatten()
         unique_vertices, inverse_indices = np.unique(
             self.vertices[flat_indices], axis=0, return_inverse=True
@@ -81,12 +213,47 @@ class ArrayTriangles(AbstractTriangles):
 
         return ArrayTriangles(indices=new_indices, vertices=unique_vertices)
 
+    def _for_lattice_triangles(
+        self, triangles: np.ndarray, lattice: np.ndarray
+    ) -> "ArrayTriangles":
+        """
+        Create a new ArrayTriangles from the vertices of every triangle and their integer lattice coordinates, where
+        vertices with the same lattice coordinates are merged into one vertex.
+
+        Parameters
+        ----------
+        triangles
+            The vertices of every triangle, of shape [total_triangles, 3, 2].
+        lattice
+            The integer lattice coordinates of the vertices of every triangle, of shape [total_triangles, 3, 2].
+        """
+        lattice = lattice.reshape(-1, 2)
+
+        first_indexes, inverse_indices = lattice_util.unique_lattice_from(
+            lattice=lattice
+        )
+
+        return ArrayTriangles(
+            indices=inverse_indices.reshape(-1, 3),
+            vertices=triangles.reshape(-1, 2)[first_indexes],
+            lattice=lattice[first_indexes],
+        )
+
     def up_sample(self) -> "ArrayTriangles":
         """
         Up-sample the triangles by adding a new vertex at the midpoint of each edge.
 
         This means each triangle becomes four smaller triangles.
         """
+        if self.lattice is not None:
+            # The lattice is doubled, so that the midpoint of every edge is also on the lattice.
+            lattice = self._up_sample_triangle(triangles=2 * self.lattice[self.indices])
+
+            return self._for_lattice_triangles(
+                triangles=self._up_sample_triangle(),
+                lattice=lattice.astype("int64"),
+            )
+
         unique_vertices, inverse_indices = np.unique(
             self._up_sample_triangle().reshape(-1, 2), axis=0, return_inverse=True
         )
@@ -103,6 +270,29 @@ class ArrayTriangles(AbstractTriangles):
 
         Includes the current triangles and the triangles that share an edge with the current triangles.
         """
+        if self.lattice is not None:
+            lattice = self._neighborhood_triangles(
+                triangles=self.lattice[self.indices]
+            )
+
+            neighborhood = self._for_lattice_triangles(
+                triangles=self._neighborhood_triangles(), lattice=lattice
+            )
+
+            # Every triangle of the lattice has a different centroid, so duplicate triangles are those whose
+            # vertices have the same sum of lattice coordinates.
+            unique_triangle_indexes, _ = lattice_util.unique_lattice_from(
+                lattice=lattice.sum(axis=1)
+            )
+
+            return ArrayTriangles(
+                indices=np.sort(
+                    neighborhood.indices[unique_triangle_indexes], axis=1
+                ),
+                vertices=neighborhood.vertices,
+                lattice=neighborhood.lattice,
+            )
+
         unique_vertices, inverse_indices = np.unique(
             self._neighborhood_triangles().reshape(-1, 2), axis=0, return_inverse=True
         )
@@ -0,0 +1,154 @@
+import numpy as np
+from typing import Tuple
+
+from autoarray import numba_util
+
+
+@numba_util.jit()
+def unique_keys_via_hash_table_from(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unique values of an array of integer keys in the order they first appear, using an open addressing
+    hash table such that the run time is linear in the number of keys (unlike `np.unique`, which sorts them).
+
+    The hash of every key relies on unsigned 64 bit multiplication wrapping around on overflow, therefore this
+    function should be called via `unique_keys_from`, which only uses it when it is compiled by numba.
+
+    Parameters
+    ----------
+    keys
+        The integer keys, of shape [total_keys].
+
+    Returns
+    -------
+    The index of the first appearance of every unique key, and the index of the unique key of every input key, such
+    that `keys[first_indexes][inverse] == keys`.
+    """
+    total_keys = keys.shape[0]
+
+    table_size = 2
+    table_bits = 1
+
+    while table_size < 2 * total_keys:
+        table_size *= 2
+        table_bits += 1
+
+    table = np.full(table_size, -1, dtype=np.int64)
+
+    first_indexes = np.empty(total_keys, dtype=np.int64)
+    inverse = np.empty(total_keys, dtype=np.int64)
+
+    total_unique = 0
+
+    for i in range(total_keys):
+        key = keys[i]
+
+        # Fibonacci hashing, which spreads the neighbouring keys of a lattice over the table.
+        slot = (np.uint64(key) * np.uint64(11400714819323198485)) >> np.uint64(
+            64 - table_bits
+        )
+
+        while True:
+            unique_index = table[slot]
+
+            if unique_index == -1:
+                table[slot] = total_unique
+                first_indexes[total_unique] = i
+                inverse[i] = total_unique
+                total_unique += 1
+                break
+
+            if keys[first_indexes[unique_index]] == key:
+                inverse[i] = unique_index
+                break
+
+            slot = (slot + np.uint64(1)) & np.uint64(table_size - 1)
+
+    return first_indexes[:total_unique], inverse
+
+
+def unique_via_sort_from(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unique values (or rows) of an array in the order they first appear, via the sort of `np.unique`.
+
+    `np.unique` orders the unique values by their value, so they are reordered by their first appearance to give the
+    same result as `unique_keys_via_hash_table_from`.
+
+    Parameters
+    ----------
+    values
+        The values, of shape [total_values] or [total_values, total_columns].
+
+    Returns
+    -------
+    The index of the first appearance of every unique value, and the index of the unique value of every input value.
+    """
+    _, first_indexes, inverse = np.unique(
+        values, axis=0, return_index=True, return_inverse=True
+    )
+
+    order = np.argsort(first_indexes)
+
+    unique_index_for_sorted_index = np.empty_like(order)
+    unique_index_for_sorted_index[order] = np.arange(order.shape[0])
+
+    return first_indexes[order], unique_index_for_sorted_index[inverse.reshape(-1)]
+
+
+def unique_keys_from(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unique values of an array of integer keys in the order they first appear, in a run time linear in
+    the number of keys (see `unique_keys_via_hash_table_from`).
+
+    If numba is not installed or is disabled, the hash table is an interpreted Python loop over every key, which is
+    far slower than sorting the keys, so `unique_via_sort_from` is used instead.
+
+    Parameters
+    ----------
+    keys
+        The integer keys, of shape [total_keys].
+
+    Returns
+    -------
+    The index of the first appearance of every unique key, and the index of the unique key of every input key, such
+    that `keys[first_indexes][inverse] == keys`.
+    """
+    if not hasattr(unique_keys_via_hash_table_from, "py_func"):
+        return unique_via_sort_from(values=keys)
+
+    return unique_keys_via_hash_table_from(keys=keys)
+
+
+def unique_lattice_from(lattice: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the unique (y,x) integer coordinates of an array of points on a lattice, in the order they first appear.
+
+    Every pair of coordinates is combined into a single integer key, which are made unique in linear time via
+    `unique_keys_from`. Duplicates are therefore detected exactly, rather than by comparing floating point
+    coordinates which may differ by rounding errors.
+
+    Parameters
+    ----------
+    lattice
+        The (y,x) integer lattice coordinates, of shape [total_points, 2].
+
+    Returns
+    -------
+    The index of the first appearance of every unique point, and the index of the unique point of every input
+    point.
+    """
+    lattice = np.asarray(lattice, dtype="int64")
+
+    if lattice.shape[0] == 0:
+        return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64")
+
+    lower = lattice.min(axis=0)
+    extent = lattice.max(axis=0) - lower + 1
+
+    # Combining the coordinates into one key would overflow, which requires lattices far larger than those made by
+    # repeatedly up sampling triangles, so an exact (but slower) sort is used instead.
+    if int(extent[0]) * int(extent[1]) >= 2**62:
+        return unique_via_sort_from(values=lattice)
+
+    keys = (lattice[:, 0] - lower[0]) * extent[1] + (lattice[:, 1] - lower[1])
+
+    return unique_keys_from(keys=keys)
@@ -0,0 +1,269 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from autoarray.structures.triangles.abstract import containing_circle_mask_from
+from autoarray.structures.triangles.abstract import containing_mask_from
+
+
+def _ranges_from(
+    starts: np.ndarray, counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the concatenation of the integer ranges `[start, start + count)` of every input range, and the index of
+    the range each value belongs to.
+    """
+    range_indexes = np.repeat(np.arange(counts.shape[0]), counts)
+
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+
+    return (
+        np.repeat(starts, counts) + np.arange(range_indexes.shape[0]) - offsets,
+        range_indexes,
+    )
+
+
+class TrianglesSpatialIndex:
+    def __init__(self, triangles: np.ndarray):
+        """
+        A uniform grid of cells over the bounding boxes of a set of triangles, which finds the triangles containing
+        many points (or intersecting many circles) at once without testing every triangle for every point.
+
+        Every triangle is stored in every cell its bounding box overlaps, in compressed sparse row (CSR) format. The
+        cell size is the mean bounding box size of the triangles, such that each cell contains a few triangles and
+        each triangle is in a few cells. A query tests only the triangles in the cell(s) it overlaps, using the same
+        test as a brute force search over every triangle (see `containing_mask_from`), therefore giving identical
+        results.
+
+        Building the index is O(total_triangles) and vectorized, so it is cheap to rebuild for the new triangles
+        created by `up_sample` or `neighborhood`.
+
+        Parameters
+        ----------
+        triangles
+            The triangles, of shape [total_triangles, 3, 2].
+        """
+        self.triangles = triangles
+
+        total_triangles = triangles.shape[0]
+
+        finite = np.all(np.isfinite(triangles.reshape(total_triangles, -1)), axis=1)
+        triangle_indexes = np.nonzero(finite)[0]
+
+        self.shape = (0, 0)
+        self.cell_offsets = np.zeros(1, dtype="int")
+        self.cell_triangles = np.zeros(0, dtype="int")
+
+        if triangle_indexes.shape[0] == 0:
+            self.origin = np.zeros(2)
+            self.cell_size = 1.0
+            self.pad = 0.0
+            return
+
+        mins = triangles[triangle_indexes].min(axis=1)
+        maxs = triangles[triangle_indexes].max(axis=1)
+
+        self.origin = mins.min(axis=0)
+        extent = maxs.max(axis=0) - self.origin
+
+        self.cell_size = float(np.mean(np.max(maxs - mins, axis=1)))
+
+        if self.cell_size <= 0.0:
+            self.cell_size = max(float(np.max(extent)), 1.0)
+
+        # Triangles spread sparsely over a large area would otherwise give many more cells than triangles.
+        max_cells = 4 * total_triangles + 16
+
+        total_cells = np.prod(np.floor(extent / self.cell_size) + 1)
+
+        if total_cells > max_cells:
+            self.cell_size *= float(np.sqrt(total_cells / max_cells)) + 1.0e-6
+
+        # Bounding boxes are padded, so that points which are on the boundary of a triangle up to floating point
+        # precision are still tested against it.
+        self.pad = 1.0e-9 * (
+            self.cell_size + float(np.max(np.abs(np.concatenate([mins, maxs]))))
+        )
+
+        self.shape = tuple((np.floor(extent / self.cell_size) + 1).astype("int"))
+
+        lower = self._cells_from(mins - self.pad)
+        upper = self._cells_from(maxs + self.pad)
+
+        widths = upper[:, 1] - lower[:, 1] + 1
+        counts = (upper[:, 0] - lower[:, 0] + 1) * widths
+
+        cell_offsets_in_triangle, range_indexes = _ranges_from(
+            starts=np.zeros(counts.shape[0], dtype="int"), counts=counts
+        )
+
+        cells = (
+            lower[range_indexes, 0] + cell_offsets_in_triangle // widths[range_indexes]
+        ) * self.shape[1] + (
+            lower[range_indexes, 1] + cell_offsets_in_triangle % widths[range_indexes]
+        )
+
+        order = np.argsort(cells, kind="stable")
+
+        self.cell_triangles = triangle_indexes[range_indexes[order]]
+        self.cell_offsets = np.concatenate(
+            [
+                [0],
+                np.cumsum(np.bincount(cells, minlength=self.shape[0] * self.shape[1])),
+            ]
+        )
+
+    def _cells_from(self, points: np.ndarray) -> np.ndarray:
+        """
+        Returns the (row, column) cell of every point, clipped to the grid of cells.
+        """
+        cells = np.floor((points - self.origin) / self.cell_size)
+
+        return np.clip(cells, 0, np.array(self.shape) - 1).astype("int")
+
+    def _candidates_from(
+        self, lower: np.ndarray, upper: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns every pair of (query, triangle) indexes where the triangle is in a cell within the rectangle of cells
+        between the `lower` and `upper` cells of the query, without duplicate pairs.
+
+        The pairs are sorted by query and then by triangle, because the triangles of every cell are stored in
+        ascending order and pairs from queries spanning multiple cells are made unique via `np.unique`.
+        """
+        widths = upper[:, 1] - lower[:, 1] + 1
+        counts = np.where(
+            (widths > 0) & (upper[:, 0] >= lower[:, 0]),
+            (upper[:, 0] - lower[:, 0] + 1) * widths,
+            0,
+        )
+
+        cell_offsets_in_query, query_indexes = _ranges_from(
+            starts=np.zeros(counts.shape[0], dtype="int"), counts=counts
+        )
+
+        cells = (
+            lower[query_indexes, 0] + cell_offsets_in_query // widths[query_indexes]
+        ) * self.shape[1] + (
+            lower[query_indexes, 1] + cell_offsets_in_query % widths[query_indexes]
+        )
+
+        starts = self.cell_offsets[cells]
+
+        triangle_positions, cell_indexes = _ranges_from(
+            starts=starts, counts=self.cell_offsets[cells + 1] - starts
+        )
+
+        query_indexes = query_indexes[cell_indexes]
+        triangle_indexes = self.cell_triangles[triangle_positions]
+
+        if np.any(counts > 1):
+            pairs = np.unique(
+                query_indexes * self.triangles.shape[0] + triangle_indexes
+            )
+
+            query_indexes = pairs // self.triangles.shape[0]
+            triangle_indexes = pairs % self.triangles.shape[0]
+
+        return query_indexes, triangle_indexes
+
+    @staticmethod
+    def _split_from(
+        query_indexes: np.ndarray, triangle_indexes: np.ndarray, total_queries: int
+    ) -> List[np.ndarray]:
+        """
+        Split the triangle indexes of every (query, triangle) pair, which are sorted by query and then triangle, into
+        an array of triangle indexes for every query.
+        """
+        counts = np.bincount(query_indexes, minlength=total_queries)
+
+        return np.split(triangle_indexes, np.cumsum(counts)[:-1])
+
+    def containing_indices_from(self, points: np.ndarray) -> List[np.ndarray]:
+        """
+        Returns the indexes of the triangles containing every point.
+
+        Parameters
+        ----------
+        points
+            The points, of shape [total_points, 2].
+
+        Returns
+        -------
+        A list with an array of the (sorted) indexes of the triangles containing every point.
+        """
+        points = np.asarray(points, dtype="float").reshape(-1, 2)
+
+        valid = np.all(np.isfinite(points), axis=1)
+
+        if self.cell_triangles.shape[0] == 0:
+            valid[:] = False
+
+        cells = self._cells_from(np.where(valid[:, None], points, self.origin))
+        upper = np.where(valid[:, None], cells, cells - 1)
+
+        query_indexes, triangle_indexes = self._candidates_from(
+            lower=cells, upper=upper
+        )
+
+        inside = containing_mask_from(
+            triangles=self.triangles[triangle_indexes],
+            point=(points[query_indexes, 0], points[query_indexes, 1]),
+        )
+
+        return self._split_from(
+            query_indexes=query_indexes[inside],
+            triangle_indexes=triangle_indexes[inside],
+            total_queries=points.shape[0],
+        )
+
+    def containing_indices_circle_from(
+        self, centers: np.ndarray, radius: Union[float, np.ndarray]
+    ) -> List[np.ndarray]:
+        """
+        Returns the indexes of the triangles intersecting every circle (see `containing_circle_mask_from`).
+
+        Parameters
+        ----------
+        centers
+            The centers of the circles, of shape [total_circles, 2].
+        radius
+            The radius of every circle, or an array of shape [total_circles] with a radius for each circle.
+
+        Returns
+        -------
+        A list with an array of the (sorted) indexes of the triangles intersecting every circle.
+        """
+        centers = np.asarray(centers, dtype="float").reshape(-1, 2)
+        radius = np.broadcast_to(
+            np.asarray(radius, dtype="float"), (centers.shape[0],)
+        )
+
+        valid = np.all(np.isfinite(centers), axis=1) & np.isfinite(radius)
+
+        if self.cell_triangles.shape[0] == 0:
+            valid[:] = False
+
+        safe_centers = np.where(valid[:, None], centers, self.origin)
+        safe_radius = np.where(valid, radius, 0.0)[:, None]
+
+        lower = self._cells_from(safe_centers - safe_radius - self.pad)
+        upper = self._cells_from(safe_centers + safe_radius + self.pad)
+
+        upper = np.where(valid[:, None], upper, lower - 1)
+
+        query_indexes, triangle_indexes = self._candidates_from(
+            lower=lower, upper=upper
+        )
+
+        inside = containing_circle_mask_from(
+            triangles=self.triangles[triangle_indexes],
+            center=(centers[query_indexes, 0], centers[query_indexes, 1]),
+            radius=radius[query_indexes],
+        )
+
+        return self._split_from(
+            query_indexes=query_indexes[inside],
+            triangle_indexes=triangle_indexes[inside],
+            total_queries=centers.shape[0],
+        )
@@ -1,11 +1,12 @@
 from abc import ABC
 
-from astropy.io import fits
-
 import logging
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from astropy.io import fits
 
 from autoconf import cached_property
 
@@ -103,7 +104,7 @@ class AbstractVisibilities(Structure, ABC):
         return np.arctan2(self.imag, self.real)
 
     @property
-    def hdu_for_output(self) -> fits.PrimaryHDU:
+    def hdu_for_output(self) -> "fits.PrimaryHDU":
         """
         The visibilities as an HDU object, which can be output to a .fits file.
 
@@ -49,6 +49,25 @@ def test__signal_to_noise_map():
     assert dataset.signal_to_noise_max == 0.2
 
 
+def test__noise_normalization():
+    array = aa.Array2D.no_mask([[1.0, 2.0], [3.0, 4.0]], pixel_scales=1.0)
+    noise_map = aa.Array2D.no_mask([[1.0, 2.0], [3.0, 4.0]], pixel_scales=1.0)
+
+    dataset = ds.AbstractDataset(data=array, noise_map=noise_map)
+
+    assert dataset.noise_normalization == pytest.approx(
+        np.sum(np.log(2 * np.pi * np.array([1.0, 2.0, 3.0, 4.0]) ** 2.0)), 1.0e-4
+    )
+
+    dataset.noise_map = aa.Array2D.no_mask(
+        [[2.0, 2.0], [2.0, 2.0]], pixel_scales=1.0
+    )
+
+    assert dataset.noise_normalization == pytest.approx(
+        4.0 * np.log(2 * np.pi * 4.0), 1.0e-4
+    )
+
+
 def test__grid__uses_mask_and_settings(
     image_7x7,
     noise_map_7x7,
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+import autoarray as aa
+
+
+def make_banded_matrix():
+    return sparse.diags(
+        [0.2 * np.ones(5), np.arange(1.0, 7.0), 0.2 * np.ones(5)],
+        offsets=[-1, 0, 1],
+    )
+
+
+def test__sparse__inverse_dot_from():
+    matrix = make_banded_matrix()
+
+    noise_covariance = aa.NoiseCovarianceSparse(matrix=matrix)
+
+    vector = np.array([1.0, -2.0, 3.0, 0.5, 1.5, -1.0])
+
+    assert noise_covariance.inverse_dot_from(vector) == pytest.approx(
+        np.linalg.solve(matrix.toarray(), vector), 1.0e-4
+    )
+    assert noise_covariance.matrix_diagonal == pytest.approx(
+        np.arange(1.0, 7.0), 1.0e-4
+    )
+
+    mapping_matrix = np.arange(12.0).reshape(6, 2)
+
+    assert noise_covariance.inverse_dot_from(mapping_matrix) == pytest.approx(
+        np.linalg.solve(matrix.toarray(), mapping_matrix), 1.0e-4
+    )
+
+
+def test__sparse__chi_squared_from():
+    matrix = make_banded_matrix()
+
+    noise_covariance = aa.NoiseCovarianceSparse(matrix=matrix)
+
+    residual_map = np.array([1.0, -2.0, 3.0, 0.5, 1.5, -1.0])
+
+    assert noise_covariance.chi_squared_from(
+        residual_map=residual_map
+    ) == pytest.approx(
+        residual_map @ np.linalg.inv(matrix.toarray()) @ residual_map, 1.0e-4
+    )
+
+
+def test__sparse__masked_from():
+    matrix = make_banded_matrix()
+
+    noise_covariance = aa.NoiseCovarianceSparse(matrix=matrix)
+
+    noise_covariance = noise_covariance.masked_from(
+        unmasked_indexes=np.array([0, 1, 3, 4])
+    )
+
+    assert noise_covariance.matrix.toarray() == pytest.approx(
+        np.array(
+            [
+                [1.0, 0.2, 0.0, 0.0],
+                [0.2, 2.0, 0.0, 0.0],
+                [0.0, 0.0, 4.0, 0.2],
+                [0.0, 0.0, 0.2, 5.0],
+            ]
+        ),
+        1.0e-4,
+    )
+
+
+def test__low_rank__inverse_dot_from():
+    diagonal = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    low_rank = np.array(
+        [[1.0, 0.0], [0.5, 1.0], [0.0, 1.0], [0.5, 0.5], [1.0, -1.0]]
+    )
+
+    noise_covariance = aa.NoiseCovarianceLowRank(diagonal=diagonal, low_rank=low_rank)
+
+    matrix = np.diag(diagonal) + low_rank @ low_rank.T
+
+    vector = np.array([1.0, -2.0, 3.0, 0.5, 1.5])
+
+    assert noise_covariance.inverse_dot_from(vector) == pytest.approx(
+        np.linalg.solve(matrix, vector), 1.0e-4
+    )
+    assert noise_covariance.matrix_diagonal == pytest.approx(np.diag(matrix), 1.0e-4)
+    assert noise_covariance.chi_squared_from(residual_map=vector) == pytest.approx(
+        vector @ np.linalg.inv(matrix) @ vector, 1.0e-4
+    )
+
+    mapping_matrix = np.arange(10.0).reshape(5, 2)
+
+    assert noise_covariance.inverse_dot_from(mapping_matrix) == pytest.approx(
+        np.linalg.solve(matrix, mapping_matrix), 1.0e-4
+    )
+
+    noise_covariance = noise_covariance.masked_from(
+        unmasked_indexes=np.array([0, 2, 4])
+    )
+
+    assert noise_covariance.inverse_dot_from(vector[[0, 2, 4]]) == pytest.approx(
+        np.linalg.solve(matrix[np.ix_([0, 2, 4], [0, 2, 4])], vector[[0, 2, 4]]),
+        1.0e-4,
+    )
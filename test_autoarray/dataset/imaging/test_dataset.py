@@ -125,6 +125,39 @@ def test__output_to_fits(imaging_7x7, test_data_path):
     assert dataset.pixel_scales == (0.1, 0.1)
 
 
+def test__output_to_bundle__from_bundle(masked_imaging_7x7, test_data_path):
+    masked_imaging_7x7.output_to_bundle(directory=test_data_path, derived=True)
+
+    dataset = aa.Imaging.from_bundle(directory=test_data_path)
+
+    assert isinstance(dataset.data.array, np.memmap)
+    assert (dataset.data.native == masked_imaging_7x7.data.native).all()
+    assert (dataset.noise_map.native == masked_imaging_7x7.noise_map.native).all()
+    assert (dataset.psf.native == masked_imaging_7x7.psf.native).all()
+    assert (dataset.mask == masked_imaging_7x7.mask).all()
+    assert dataset.pixel_scales == masked_imaging_7x7.pixel_scales
+    assert dataset.noise_normalization == masked_imaging_7x7.noise_normalization
+
+    assert dataset._w_tilde is not None
+    assert (
+        dataset.w_tilde.curvature_preload
+        == masked_imaging_7x7.w_tilde.curvature_preload
+    ).all()
+    assert (dataset.w_tilde.indexes == masked_imaging_7x7.w_tilde.indexes).all()
+
+    assert dataset._convolver is not None
+    assert (
+        dataset.convolver.image_frame_1d_indexes
+        == masked_imaging_7x7.convolver.image_frame_1d_indexes
+    ).all()
+
+    with pytest.raises(aa.exc.DatasetException):
+        dataset.apply_mask(mask=dataset.mask)
+
+    with pytest.raises(aa.exc.DatasetException):
+        masked_imaging_7x7.output_to_bundle(directory=test_data_path)
+
+
 def test__apply_mask(imaging_7x7, mask_2d_7x7, psf_3x3):
     masked_imaging_7x7 = imaging_7x7.apply_mask(mask=mask_2d_7x7)
 
@@ -101,6 +101,75 @@ def test__output_all_arrays(mask_2d_7x7):
     assert (dataset.uv_wavelengths[:, 1] == 6.0 * np.ones(3)).all()
 
 
+def test__output_to_bundle__from_bundle(interferometer_7):
+    test_data_path = path.join(
+        "{}".format(path.dirname(path.realpath(__file__))),
+        "files",
+        "array",
+        "output_test",
+    )
+
+    if path.exists(test_data_path):
+        shutil.rmtree(test_data_path)
+
+    interferometer_7.output_to_bundle(directory=test_data_path)
+
+    dataset = aa.Interferometer.from_bundle(
+        directory=test_data_path, transformer_class=aa.TransformerDFT
+    )
+
+    assert (dataset.data == interferometer_7.data).all()
+    assert (dataset.noise_map == interferometer_7.noise_map).all()
+    assert (dataset.uv_wavelengths == interferometer_7.uv_wavelengths).all()
+    assert (dataset.real_space_mask == interferometer_7.real_space_mask).all()
+    assert isinstance(dataset.noise_map, aa.VisibilitiesNoiseMap)
+    assert isinstance(dataset.transformer, aa.TransformerDFT)
+
+
+def test__output_to_bundle__from_bundle__derived(interferometer_7):
+    test_data_path = path.join(
+        "{}".format(path.dirname(path.realpath(__file__))),
+        "files",
+        "array",
+        "output_test",
+    )
+
+    if path.exists(test_data_path):
+        shutil.rmtree(test_data_path)
+
+    w_tilde = aa.WTildeInterferometer(
+        w_matrix=np.ones((9, 9)),
+        curvature_preload=2.0 * np.ones((13, 13)),
+        dirty_image=3.0 * np.ones(9),
+        real_space_mask=interferometer_7.real_space_mask,
+        noise_map_value=interferometer_7.noise_map[0],
+    )
+
+    interferometer_7 = aa.Interferometer(
+        data=interferometer_7.data,
+        noise_map=interferometer_7.noise_map,
+        uv_wavelengths=interferometer_7.uv_wavelengths,
+        real_space_mask=interferometer_7.real_space_mask,
+        transformer_class=aa.TransformerDFT,
+        w_tilde=w_tilde,
+    )
+
+    interferometer_7.output_to_bundle(directory=test_data_path, derived=True)
+
+    dataset = aa.Interferometer.from_bundle(
+        directory=test_data_path, transformer_class=aa.TransformerDFT
+    )
+
+    assert dataset.noise_normalization == interferometer_7.noise_normalization
+
+    assert dataset._w_tilde is not None
+    assert isinstance(dataset.w_tilde.w_matrix, np.memmap)
+    assert (dataset.w_tilde.w_matrix == w_tilde.w_matrix).all()
+    assert (dataset.w_tilde.curvature_preload == w_tilde.curvature_preload).all()
+    assert (dataset.w_tilde.dirty_image == w_tilde.dirty_image).all()
+    assert dataset.w_tilde.noise_map_value == w_tilde.noise_map_value
+
+
 def test__transformer(
     visibilities_7,
     visibilities_noise_map_7,
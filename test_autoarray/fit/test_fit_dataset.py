@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+from scipy import sparse
 
 import autoarray as aa
 
@@ -64,6 +66,44 @@ def test__figure_of_merit__with_noise_covariance_matrix_in_dataset(
     assert fit.chi_squared != pytest.approx(chi_squared, 1.0e-4)
 
 
+def test__figure_of_merit__with_structured_noise_covariance_in_dataset(
+    image_7x7, psf_3x3, mask_2d_7x7, model_image_7x7
+):
+    noise_covariance_matrix = sparse.diags(
+        [0.5 * np.ones(48), 4.0 * np.ones(49), 0.5 * np.ones(48)],
+        offsets=[-1, 0, 1],
+    )
+
+    dataset = aa.Imaging(
+        data=image_7x7,
+        psf=psf_3x3,
+        noise_covariance_matrix=aa.NoiseCovarianceSparse(
+            matrix=noise_covariance_matrix
+        ),
+    )
+
+    masked_dataset = dataset.apply_mask(mask=mask_2d_7x7)
+
+    fit = aa.m.MockFitImaging(
+        dataset=masked_dataset,
+        use_mask_in_fit=False,
+        model_data=model_image_7x7,
+    )
+
+    unmasked_indexes = mask_2d_7x7.derive_indexes.unmasked_slim
+
+    chi_squared = aa.util.fit.chi_squared_with_noise_covariance_from(
+        residual_map=np.array(fit.residual_map),
+        noise_covariance_matrix_inv=np.linalg.inv(
+            noise_covariance_matrix.toarray()[
+                np.ix_(unmasked_indexes, unmasked_indexes)
+            ]
+        ),
+    )
+
+    assert fit.chi_squared == pytest.approx(chi_squared, 1.0e-4)
+
+
 def test__grid_offset_via_data_model(masked_imaging_7x7, model_image_7x7):
     fit = aa.m.MockFitImaging(
         dataset=masked_imaging_7x7,
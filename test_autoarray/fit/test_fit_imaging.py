@@ -33,6 +33,8 @@ def test__data_and_model_are_identical__no_masking__check_values_are_correct():
     assert fit.noise_normalization == np.sum(np.log(2 * np.pi * noise_map**2.0))
     assert fit.log_likelihood == -0.5 * (fit.chi_squared + fit.noise_normalization)
 
+    assert fit.noise_normalization == dataset.noise_normalization
+
 
 def test__data_and_model_are_different__include_masking__check_values_are_correct():
     mask = aa.Mask2D(mask=[[False, False], [True, False]], pixel_scales=(1.0, 1.0))
@@ -234,6 +234,104 @@ def test__chi_squared_with_mask_fast_from():
     assert chi_squared == pytest.approx(chi_squared_fast, 1.0e-4)
 
 
+def test__chi_squared_fast_from():
+    data = np.array([10.0, 10.0, 10.0, 10.0])
+    noise_map = np.array([1.0, 2.0, 3.0, 4.0])
+    model_data = np.array([11.0, 10.0, 9.0, 8.0])
+
+    chi_squared = aa.util.fit.chi_squared_fast_from(
+        data=data, model_data=model_data, noise_map=noise_map
+    )
+
+    assert chi_squared == pytest.approx(
+        (1.0 / 1.0) ** 2.0 + (1.0 / 3.0) ** 2.0 + (2.0 / 4.0) ** 2.0, 1.0e-4
+    )
+
+    data = np.array([10.0 + 10.0j, 10.0 + 10.0j])
+    noise_map = np.array([2.0 + 1.0j, 2.0 + 1.0j])
+    model_data = np.array([9.0 + 12.0j, 9.0 + 9.0j])
+
+    chi_squared = aa.util.fit.chi_squared_fast_from(
+        data=data, model_data=model_data, noise_map=noise_map
+    )
+
+    assert chi_squared == pytest.approx(0.25 + 4.0 + 0.25 + 1.0, 1.0e-4)
+
+
+def test__chi_squared_and_noise_normalization_from():
+    data = np.array([10.0, 10.0, 10.0, 10.0])
+    noise_map = np.array([1.0, 2.0, 3.0, 4.0])
+    model_data = np.array([11.0, 10.0, 9.0, 8.0])
+
+    chi_squared, noise_normalization = (
+        aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=data, model_data=model_data, noise_map=noise_map
+        )
+    )
+
+    assert chi_squared == pytest.approx(
+        (1.0 / 1.0) ** 2.0 + (1.0 / 3.0) ** 2.0 + (2.0 / 4.0) ** 2.0, 1.0e-4
+    )
+    assert noise_normalization == pytest.approx(
+        aa.util.fit.noise_normalization_from(noise_map=noise_map), 1.0e-4
+    )
+
+    data = np.array([[10.0, 10.0], [10.0, 10.0]])
+    mask = np.array([[True, False], [False, True]])
+    noise_map = np.array([[1.0, 2.0], [3.0, 4.0]])
+    model_data = np.array([[11.0, 10.0], [9.0, 8.0]])
+
+    chi_squared, noise_normalization = (
+        aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=data, model_data=model_data, noise_map=noise_map, mask=mask
+        )
+    )
+
+    assert chi_squared == pytest.approx((1.0 / 3.0) ** 2.0, 1.0e-4)
+    assert noise_normalization == pytest.approx(
+        aa.util.fit.noise_normalization_with_mask_from(noise_map=noise_map, mask=mask),
+        1.0e-4,
+    )
+
+    chi_squared, noise_normalization = (
+        aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=data[~mask],
+            model_data=model_data[~mask],
+            noise_map=noise_map[~mask],
+            mask=mask,
+        )
+    )
+
+    assert chi_squared == pytest.approx((1.0 / 3.0) ** 2.0, 1.0e-4)
+    assert noise_normalization == pytest.approx(
+        aa.util.fit.noise_normalization_with_mask_from(noise_map=noise_map, mask=mask),
+        1.0e-4,
+    )
+
+    with pytest.raises(aa.exc.FitException):
+        aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=np.array([10.0, 10.0, 10.0]),
+            model_data=np.array([11.0, 10.0, 9.0]),
+            noise_map=np.array([1.0, 2.0, 3.0]),
+            mask=mask,
+        )
+
+    data = np.array([10.0 + 10.0j, 10.0 + 10.0j])
+    noise_map = np.array([2.0 + 1.0j, 2.0 + 1.0j])
+    model_data = np.array([9.0 + 12.0j, 9.0 + 9.0j])
+
+    chi_squared, noise_normalization = (
+        aa.util.fit.chi_squared_and_noise_normalization_from(
+            data=data, model_data=model_data, noise_map=noise_map
+        )
+    )
+
+    assert chi_squared == pytest.approx(0.25 + 4.0 + 0.25 + 1.0, 1.0e-4)
+    assert noise_normalization == pytest.approx(
+        aa.util.fit.noise_normalization_complex_from(noise_map=noise_map), 1.0e-4
+    )
+
+
 def test__log_likelihood_from():
     data = np.array([10.0, 10.0, 10.0, 10.0])
     noise_map = np.array([2.0, 2.0, 2.0, 2.0])
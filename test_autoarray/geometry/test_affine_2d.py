@@ -0,0 +1,74 @@
+import numpy as np
+
+from autoarray.geometry.affine_2d import AffineTransform2D
+from autoarray.geometry.affine_2d import affine_transform_2d_cached_from
+from autoarray.geometry import geometry_util
+
+
+def test__transforms_match_geometry_util():
+    affine = AffineTransform2D(
+        shape_native=(6, 7), pixel_scales=(0.3, 0.1), origin=(1.0, -1.5)
+    )
+
+    grid_scaled_2d_slim = np.random.default_rng(seed=1).uniform(
+        -2.0, 2.0, size=(100, 2)
+    )
+    grid_scaled_2d_slim[:10] = np.round(grid_scaled_2d_slim[:10], 1)
+
+    util_kwargs = {
+        "shape_native": (6, 7),
+        "pixel_scales": (0.3, 0.1),
+        "origin": (1.0, -1.5),
+    }
+
+    grid_pixels_2d_slim = geometry_util.grid_pixels_2d_slim_from(
+        grid_scaled_2d_slim=grid_scaled_2d_slim, **util_kwargs
+    )
+
+    assert (affine.pixels_from(grid_scaled_2d_slim) == grid_pixels_2d_slim).all()
+    assert (
+        affine.pixel_centres_from(grid_scaled_2d_slim)
+        == geometry_util.grid_pixel_centres_2d_slim_from(
+            grid_scaled_2d_slim=grid_scaled_2d_slim, **util_kwargs
+        )
+    ).all()
+    assert (
+        affine.pixel_indexes_from(grid_scaled_2d_slim)
+        == geometry_util.grid_pixel_indexes_2d_slim_from(
+            grid_scaled_2d_slim=grid_scaled_2d_slim, **util_kwargs
+        )
+    ).all()
+    assert (
+        affine.scaled_from(grid_pixels_2d_slim)
+        == geometry_util.grid_scaled_2d_slim_from(
+            grid_pixels_2d_slim=grid_pixels_2d_slim, **util_kwargs
+        )
+    ).all()
+
+
+def test__transforms_in_place():
+    affine = AffineTransform2D(shape_native=(3, 3), pixel_scales=(1.0, 1.0))
+
+    grid = np.array([[1.0, -1.0], [0.0, 0.0], [-1.0, 1.0]])
+
+    grid_pixels = affine.pixels_from(grid, out=grid)
+
+    assert grid_pixels is grid
+    assert (grid == np.array([[0.5, 0.5], [1.5, 1.5], [2.5, 2.5]])).all()
+
+    affine.scaled_from(grid, out=grid)
+
+    assert (grid == np.array([[1.0, -1.0], [0.0, 0.0], [-1.0, 1.0]])).all()
+
+
+def test__affine_transform_2d_cached_from():
+    affine = affine_transform_2d_cached_from(
+        shape_native=(3, 3), pixel_scales=(1.0, 1.0), origin=(0.0, 0.0)
+    )
+
+    assert (
+        affine_transform_2d_cached_from(
+            shape_native=(3, 3), pixel_scales=(1.0, 1.0), origin=(0.0, 0.0)
+        )
+        is affine
+    )
@@ -179,3 +179,24 @@ def test__grid_scaled_2d_from():
     grid_pixels = geometry.grid_scaled_2d_from(grid_pixels_2d=grid_pixels)
 
     assert (grid_pixels == grid_pixels_util).all()
+
+
+def test__affine():
+    geometry = aa.Geometry2D(
+        shape_native=(6, 7), pixel_scales=(2.4, 1.8), origin=(1.0, 1.5)
+    )
+
+    assert geometry.affine.shape_native == (6, 7)
+    assert geometry.affine.pixel_scales == (2.4, 1.8)
+    assert geometry.affine.origin == (1.0, 1.5)
+
+    assert (
+        aa.Geometry2D(shape_native=(6, 7), pixel_scales=2.4).affine
+        is not geometry.affine
+    )
+    assert (
+        aa.Geometry2D(
+            shape_native=(6, 7), pixel_scales=(2.4, 1.8), origin=(1.0, 1.5)
+        ).affine
+        is geometry.affine
+    )
@@ -381,3 +381,137 @@ def test__curvature_matrix_via_w_tilde_preload_two_methods_agree():
         )
 
         assert curvature_matrix_via_w_tilde == pytest.approx(curvature_matrix, 1.0e-4)
+
+
+def test__curvature_matrix_and_data_vector_via_w_tilde_csr__agree_with_padded():
+    mask = aa.Mask2D.circular(shape_native=(51, 51), pixel_scales=0.1, radius=2.0)
+
+    image = np.random.uniform(size=mask.shape_native)
+    image = aa.Array2D(values=image, mask=mask)
+
+    noise_map = np.random.uniform(size=mask.shape_native)
+    noise_map = aa.Array2D(values=noise_map, mask=mask)
+
+    kernel = aa.Kernel2D.from_gaussian(
+        shape_native=(7, 7), pixel_scales=mask.pixel_scales, sigma=1.0, normalize=True
+    )
+
+    over_sampler = aa.OverSamplerUniform(mask=mask, sub_size=2)
+
+    mapper_grids = aa.mesh.Rectangular(shape=(20, 20)).mapper_grids_from(
+        mask=mask,
+        border_relocator=None,
+        source_plane_data_grid=over_sampler.over_sampled_grid,
+    )
+
+    mapper = aa.Mapper(
+        mapper_grids=mapper_grids, over_sampler=over_sampler, regularization=None
+    )
+
+    (
+        w_tilde_preload,
+        w_tilde_indexes,
+        w_tilde_lengths,
+    ) = aa.util.inversion_imaging.w_tilde_curvature_preload_imaging_from(
+        noise_map_native=np.array(noise_map.native),
+        kernel_native=np.array(kernel.native),
+        native_index_for_slim_index=mask.derive_indexes.native_for_slim,
+    )
+
+    w_tilde_data = aa.util.inversion_imaging.w_tilde_data_imaging_from(
+        image_native=np.array(image.native),
+        noise_map_native=np.array(noise_map.native),
+        kernel_native=np.array(kernel.native),
+        native_index_for_slim_index=mask.derive_indexes.native_for_slim,
+    )
+
+    (
+        data_to_pix_unique,
+        data_weights,
+        pix_lengths,
+    ) = aa.util.mapper.data_slim_to_pixelization_unique_from(
+        data_pixels=w_tilde_lengths.shape[0],
+        pix_indexes_for_sub_slim_index=mapper.pix_indexes_for_sub_slim_index,
+        pix_sizes_for_sub_slim_index=mapper.pix_sizes_for_sub_slim_index,
+        pix_weights_for_sub_slim_index=mapper.pix_weights_for_sub_slim_index,
+        pix_pixels=mapper.params,
+        sub_size=np.array(over_sampler.sub_size),
+    )
+
+    unique_mappings = mapper.unique_mappings
+
+    curvature_matrix = aa.util.inversion_imaging.curvature_matrix_via_w_tilde_curvature_preload_imaging_from(
+        curvature_preload=w_tilde_preload,
+        curvature_indexes=w_tilde_indexes.astype("int"),
+        curvature_lengths=w_tilde_lengths.astype("int"),
+        data_to_pix_unique=data_to_pix_unique.astype("int"),
+        data_weights=data_weights,
+        pix_lengths=pix_lengths.astype("int"),
+        pix_pixels=mapper.params,
+    )
+
+    curvature_matrix_csr = aa.util.inversion_imaging.curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_from(
+        curvature_preload=w_tilde_preload,
+        curvature_indexes=w_tilde_indexes.astype("int"),
+        curvature_lengths=w_tilde_lengths.astype("int"),
+        offsets=unique_mappings.offsets,
+        indexes=unique_mappings.indexes,
+        weights=unique_mappings.weights,
+        pix_pixels=mapper.params,
+    )
+
+    assert curvature_matrix_csr == pytest.approx(curvature_matrix, 1.0e-4)
+
+    curvature_matrix_blocks = np.zeros((mapper.params + 2, mapper.params + 2))
+
+    aa.util.inversion_imaging.curvature_matrix_via_w_tilde_curvature_preload_imaging_csr_in_place_from(
+        curvature_matrix=curvature_matrix_blocks[2:, 2:],
+        curvature_preload=w_tilde_preload,
+        curvature_indexes=w_tilde_indexes.astype("int"),
+        curvature_lengths=w_tilde_lengths.astype("int"),
+        offsets=unique_mappings.offsets,
+        indexes=unique_mappings.indexes,
+        weights=unique_mappings.weights,
+    )
+
+    assert curvature_matrix_blocks[2:, 2:] == pytest.approx(
+        curvature_matrix_csr, 1.0e-8
+    )
+    assert (curvature_matrix_blocks[:2] == 0.0).all()
+
+    data_vector = aa.util.inversion_imaging.data_vector_via_w_tilde_data_imaging_from(
+        w_tilde_data=w_tilde_data,
+        data_to_pix_unique=data_to_pix_unique.astype("int"),
+        data_weights=data_weights,
+        pix_lengths=pix_lengths.astype("int"),
+        pix_pixels=mapper.params,
+    )
+
+    data_vector_csr = (
+        aa.util.inversion_imaging.data_vector_via_w_tilde_data_imaging_csr_from(
+            w_tilde_data=w_tilde_data,
+            offsets=unique_mappings.offsets,
+            indexes=unique_mappings.indexes,
+            weights=unique_mappings.weights,
+            pix_pixels=mapper.params,
+        )
+    )
+
+    assert data_vector_csr == pytest.approx(data_vector, 1.0e-4)
+
+    reconstruction = np.random.uniform(size=mapper.params)
+
+    assert aa.util.inversion.mapped_reconstructed_data_via_image_to_pix_unique_csr_from(
+        offsets=unique_mappings.offsets,
+        indexes=unique_mappings.indexes,
+        weights=unique_mappings.weights,
+        reconstruction=reconstruction,
+    ) == pytest.approx(
+        aa.util.inversion.mapped_reconstructed_data_via_image_to_pix_unique_from(
+            data_to_pix_unique=data_to_pix_unique.astype("int"),
+            data_weights=data_weights,
+            pix_lengths=pix_lengths.astype("int"),
+            reconstruction=reconstruction,
+        ),
+        1.0e-4,
+    )
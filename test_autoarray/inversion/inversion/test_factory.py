@@ -425,6 +425,22 @@ def test__inversion_imaging__linear_obj_func_with_w_tilde(
         inversion_w_tilde.curvature_matrix, 1.0e-4
     )
 
+    inversion_w_tilde_threads = aa.Inversion(
+        dataset=masked_imaging_7x7,
+        linear_obj_list=[
+            rectangular_mapper_7x7_3x3,
+            linear_obj,
+            delaunay_mapper_9_3x3,
+            linear_obj_1,
+            linear_obj_2,
+        ],
+        settings=aa.SettingsInversion(use_w_tilde=True, curvature_matrix_workers=4),
+    )
+
+    assert inversion_w_tilde_threads.curvature_matrix == pytest.approx(
+        inversion_w_tilde.curvature_matrix, 1.0e-8
+    )
+
 
 def test__inversion_imaging__linear_obj_func_with_w_tilde__include_preload_data_linear_func_matrix(
     masked_imaging_7x7,
@@ -601,6 +617,22 @@ def test__inversion_interferometer__via_mapper(
     )
 
 
+def test__inversion_interferometer__structured_noise_covariance__raises_exception(
+    interferometer_7_no_fft,
+    rectangular_mapper_7x7_3x3,
+):
+    interferometer_7_no_fft.noise_covariance_matrix = aa.NoiseCovarianceLowRank(
+        diagonal=np.ones(7), low_rank=np.zeros((7, 1))
+    )
+
+    with pytest.raises(aa.exc.InversionException):
+        aa.Inversion(
+            dataset=interferometer_7_no_fft,
+            linear_obj_list=[rectangular_mapper_7x7_3x3],
+            settings=aa.SettingsInversion(use_w_tilde=False),
+        )
+
+
 def test__inversion_matrices__x2_mappers(
     masked_imaging_7x7_no_blur,
     rectangular_mapper_7x7_3x3,
@@ -677,6 +709,101 @@ def test__inversion_matrices__x2_mappers(
     assert inversion.mapped_reconstructed_image == pytest.approx(np.ones(9), 1.0e-4)
 
 
+def test__inversion_imaging__workspace(
+    masked_imaging_7x7,
+    rectangular_mapper_7x7_3x3,
+    delaunay_mapper_9_3x3,
+):
+    masked_imaging_7x7 = copy.copy(masked_imaging_7x7)
+    masked_imaging_7x7.data[4] = 2.0
+    masked_imaging_7x7.noise_map[3] = 4.0
+
+    grid = aa.Grid2D.from_mask(mask=masked_imaging_7x7.mask)
+
+    mapping_matrix = np.full(fill_value=0.5, shape=(9, 2))
+    mapping_matrix[0, 0] = 0.8
+    mapping_matrix[1, 1] = 0.4
+
+    linear_obj = aa.m.MockLinearObjFuncList(
+        parameters=2, grid=grid, mapping_matrix=mapping_matrix
+    )
+
+    linear_obj_list = [rectangular_mapper_7x7_3x3, linear_obj, delaunay_mapper_9_3x3]
+
+    workspace = aa.InversionWorkspace()
+
+    for use_w_tilde in (False, True):
+        settings = aa.SettingsInversion(use_w_tilde=use_w_tilde)
+
+        inversion = aa.Inversion(
+            dataset=masked_imaging_7x7,
+            linear_obj_list=linear_obj_list,
+            settings=settings,
+        )
+
+        for _ in range(2):
+            inversion_workspace = aa.Inversion(
+                dataset=masked_imaging_7x7,
+                linear_obj_list=linear_obj_list,
+                settings=settings,
+                preloads=aa.Preloads(workspace=workspace),
+            )
+
+            assert inversion_workspace.data_vector == pytest.approx(
+                inversion.data_vector, 1.0e-8
+            )
+            assert inversion_workspace.curvature_matrix == pytest.approx(
+                inversion.curvature_matrix, 1.0e-8
+            )
+            assert inversion_workspace.regularization_matrix == pytest.approx(
+                inversion.regularization_matrix, 1.0e-8
+            )
+            assert inversion_workspace.curvature_reg_matrix_reduced == pytest.approx(
+                inversion.curvature_reg_matrix_reduced, 1.0e-8
+            )
+            assert inversion_workspace.reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-8
+            )
+            assert inversion_workspace.log_det_curvature_reg_matrix_term == (
+                pytest.approx(inversion.log_det_curvature_reg_matrix_term, 1.0e-8)
+            )
+            assert inversion_workspace.log_det_regularization_matrix_term == (
+                pytest.approx(inversion.log_det_regularization_matrix_term, 1.0e-8)
+            )
+
+        assert inversion_workspace.curvature_reg_matrix is workspace.array_from(
+            name="curvature_reg_matrix",
+            shape=inversion.curvature_reg_matrix.shape,
+            zeroed=False,
+        )
+
+
+def test__inversion_imaging__workspace__mapper_diag_does_not_overwrite_curvature_matrix(
+    masked_imaging_7x7,
+    rectangular_mapper_7x7_3x3,
+    delaunay_mapper_9_3x3,
+):
+    masked_imaging_7x7 = copy.copy(masked_imaging_7x7)
+    masked_imaging_7x7.data[4] = 2.0
+
+    linear_obj_list = [rectangular_mapper_7x7_3x3, delaunay_mapper_9_3x3]
+
+    for use_w_tilde in (False, True):
+        inversion = aa.Inversion(
+            dataset=masked_imaging_7x7,
+            linear_obj_list=linear_obj_list,
+            settings=aa.SettingsInversion(use_w_tilde=use_w_tilde),
+            preloads=aa.Preloads(workspace=aa.InversionWorkspace()),
+        )
+
+        curvature_matrix = np.array(inversion.curvature_matrix)
+
+        curvature_matrix_mapper_diag = inversion._curvature_matrix_mapper_diag
+
+        assert curvature_matrix_mapper_diag is not inversion.curvature_matrix
+        assert inversion.curvature_matrix == pytest.approx(curvature_matrix, 1.0e-8)
+
+
 def test__inversion_imaging__positive_only_solver(masked_imaging_7x7_no_blur):
     mask = masked_imaging_7x7_no_blur.mask
 
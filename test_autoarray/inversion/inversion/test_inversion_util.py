@@ -72,6 +72,103 @@ def test__curvature_matrix_via_mapping_matrix_from():
         == np.array([[1.25, 0.25, 0.0], [0.25, 2.25, 1.0], [0.0, 1.0, 1.0]])
     ).all()
 
+    buffer = np.full((3, 3), 9.0)
+
+    curvature_matrix = aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+        mapping_matrix=blurred_mapping_matrix,
+        noise_map=noise_map,
+        curvature_matrix=buffer,
+    )
+
+    assert curvature_matrix is buffer
+    assert (
+        curvature_matrix
+        == np.array([[1.25, 0.25, 0.0], [0.25, 2.25, 1.0], [0.0, 1.0, 1.0]])
+    ).all()
+
+
+def test__curvature_matrix_mirrored_in_place_from():
+    curvature_matrix = np.array(
+        [
+            [1.0, 2.0, 0.0, 3.0],
+            [0.0, 4.0, 5.0, 0.0],
+            [6.0, 0.0, 7.0, 0.0],
+            [8.0, 9.0, 0.0, 1.0],
+        ]
+    )
+
+    curvature_matrix_mirrored = aa.util.inversion.curvature_matrix_mirrored_from(
+        curvature_matrix=curvature_matrix
+    )
+
+    curvature_matrix_in_place = (
+        aa.util.inversion.curvature_matrix_mirrored_in_place_from(
+            curvature_matrix=curvature_matrix
+        )
+    )
+
+    assert curvature_matrix_in_place is curvature_matrix
+    assert (curvature_matrix_in_place == curvature_matrix_mirrored).all()
+
+
+def test__curvature_matrix_and_data_vector_via_noise_covariance_from():
+    blurred_mapping_matrix = np.array(
+        [
+            [1.0, 1.0, 0.0],
+            [1.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 1.0, 1.0],
+            [0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0],
+        ]
+    )
+
+    data = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    noise_map = np.array([2.0, 2.0, 2.0, 2.0, 2.0, 2.0])
+
+    noise_covariance = aa.NoiseCovarianceLowRank(
+        diagonal=noise_map**2.0, low_rank=np.zeros((6, 1))
+    )
+
+    curvature_matrix = aa.util.inversion.curvature_matrix_via_noise_covariance_from(
+        mapping_matrix=blurred_mapping_matrix, noise_covariance=noise_covariance
+    )
+
+    assert curvature_matrix == pytest.approx(
+        aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        ),
+        1.0e-4,
+    )
+
+    curvature_matrix = aa.util.inversion.curvature_matrix_via_noise_covariance_from(
+        mapping_matrix=blurred_mapping_matrix,
+        noise_covariance=noise_covariance,
+        add_to_curvature_diag=True,
+    )
+
+    assert curvature_matrix == pytest.approx(
+        aa.util.inversion.curvature_matrix_via_mapping_matrix_from(
+            mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        ),
+        1.0e-4,
+    )
+
+    data_vector = aa.util.inversion.data_vector_via_noise_covariance_from(
+        mapping_matrix=blurred_mapping_matrix,
+        data=data,
+        noise_covariance=noise_covariance,
+    )
+
+    assert data_vector == pytest.approx(
+        aa.util.inversion_imaging.data_vector_via_blurred_mapping_matrix_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=data,
+            noise_map=noise_map,
+        ),
+        1.0e-4,
+    )
+
 
 def test__reconstruction_positive_negative_from():
     data_vector = np.array([1.0, 1.0, 2.0])
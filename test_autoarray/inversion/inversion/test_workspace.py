@@ -0,0 +1,40 @@
+import numpy as np
+
+import autoarray as aa
+
+
+def test__array_from():
+    workspace = aa.InversionWorkspace()
+
+    array = workspace.array_from(name="curvature_matrix", shape=(3, 3))
+
+    assert (array == np.zeros((3, 3))).all()
+
+    array[0, 0] = 1.0
+
+    array_reused = workspace.array_from(name="curvature_matrix", shape=(3, 3))
+
+    assert array_reused is array
+    assert (array_reused == np.zeros((3, 3))).all()
+
+    array_reused[0, 0] = 1.0
+
+    array_not_zeroed = workspace.array_from(
+        name="curvature_matrix", shape=(3, 3), zeroed=False
+    )
+
+    assert array_not_zeroed is array
+    assert array_not_zeroed[0, 0] == 1.0
+
+    assert workspace.array_from(name="curvature_matrix", shape=(2, 2)).shape == (2, 2)
+    assert workspace.array_from(name="data_vector", shape=3).shape == (3,)
+    assert (
+        workspace.array_from(name="data_vector", shape=3, dtype="complex").dtype
+        == np.complex128
+    )
+
+    assert workspace.nbytes == 2 * 2 * 8 + 3 * 16
+
+    workspace.clear()
+
+    assert workspace.nbytes == 0
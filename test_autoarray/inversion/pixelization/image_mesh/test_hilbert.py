@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 import autoarray as aa
@@ -22,3 +23,47 @@ def test__image_plane_mesh_grid_from():
         [-1.02590674, -1.70984456],
         1.0e-4,
     )
+
+
+def test__gilbert2d_indexes_from():
+    from autoarray.inversion.pixelization.image_mesh import hilbert
+
+    assert (
+        hilbert.gilbert2d_indexes_from(3, 2)
+        == np.array([[0, 0], [0, 1], [1, 1], [2, 1], [2, 0], [1, 0]])
+    ).all()
+    assert (
+        hilbert.gilbert2d_indexes_from(2, 3)
+        == np.array([[0, 0], [1, 0], [1, 1], [1, 2], [0, 2], [0, 1]])
+    ).all()
+    assert (
+        hilbert.gilbert2d_indexes_from(4, 4)
+        == np.array(
+            [
+                [0, 0],
+                [1, 0],
+                [1, 1],
+                [0, 1],
+                [0, 2],
+                [0, 3],
+                [1, 3],
+                [1, 2],
+                [2, 2],
+                [2, 3],
+                [3, 3],
+                [3, 2],
+                [3, 1],
+                [2, 1],
+                [2, 0],
+                [3, 0],
+            ]
+        )
+    ).all()
+
+    for width, height in [(1, 1), (5, 7), (7, 5), (10, 3), (16, 16), (1, 9)]:
+        indexes = hilbert.gilbert2d_indexes_from(width, height)
+
+        assert len(set(map(tuple, indexes))) == width * height
+        assert (np.abs(np.diff(indexes, axis=0)).sum(axis=1) == 1).all()
+
+    assert hilbert.gilbert2d_indexes_from(5, 7) is hilbert.gilbert2d_indexes_from(5, 7)
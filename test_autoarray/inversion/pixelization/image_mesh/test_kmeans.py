@@ -26,3 +26,78 @@ def test__image_plane_mesh_grid_from():
         [0.5, 0.25],
         1.0e-4,
     )
+
+
+def test__image_plane_mesh_grid_from__memoised_on_mask_and_adapt_data():
+    from autoarray.inversion.pixelization.image_mesh import abstract_weighted
+
+    mask = aa.Mask2D.all_false(shape_native=(4, 4), pixel_scales=(0.5, 0.5))
+
+    weight_map = np.arange(1.0, mask.pixels_in_mask + 1.0)
+
+    kmeans = aa.image_mesh.KMeans(pixels=8)
+
+    key = kmeans.cache_key_from(mask=mask, adapt_data=weight_map)
+
+    abstract_weighted.mesh_grid_cache.pop(key, None)
+
+    image_mesh = kmeans.image_plane_mesh_grid_from(mask=mask, adapt_data=weight_map)
+
+    assert key in abstract_weighted.mesh_grid_cache
+
+    image_mesh_cached = kmeans.image_plane_mesh_grid_from(
+        mask=mask, adapt_data=weight_map
+    )
+
+    assert (np.array(image_mesh_cached) == np.array(image_mesh)).all()
+    assert kmeans.cache_key_from(mask=mask, adapt_data=2.0 * weight_map) != key
+    assert (
+        aa.image_mesh.KMeans(pixels=7).cache_key_from(mask=mask, adapt_data=weight_map)
+        != key
+    )
+    assert (
+        aa.image_mesh.KMeans(pixels=8, warm_start=True).cache_key_from(
+            mask=mask, adapt_data=weight_map
+        )
+        != key
+    )
+
+
+def test__image_plane_mesh_grid_from__mini_batch_and_warm_start():
+    mask = aa.Mask2D.all_false(shape_native=(6, 6), pixel_scales=(0.5, 0.5))
+
+    weight_map = np.ones(mask.pixels_in_mask)
+
+    kmeans = aa.image_mesh.KMeans(pixels=8, mini_batch=True, warm_start=True)
+
+    image_mesh = kmeans.image_plane_mesh_grid_from(mask=mask, adapt_data=weight_map)
+
+    assert image_mesh.shape == (8, 2)
+
+    image_mesh = kmeans.image_plane_mesh_grid_from(
+        mask=mask, adapt_data=2.0 * weight_map
+    )
+
+    assert image_mesh.shape == (8, 2)
+
+
+def test__image_plane_mesh_grid_from__warm_start_cache_is_bounded():
+    from autoarray.inversion.pixelization.image_mesh import kmeans as kmeans_module
+
+    weight_map = np.ones(16)
+
+    kmeans = aa.image_mesh.KMeans(pixels=4, warm_start=True)
+
+    for pixel_scale in np.linspace(
+        0.1, 1.0, kmeans_module.cluster_centres_cache.size + 2
+    ):
+        mask = aa.Mask2D.all_false(
+            shape_native=(4, 4), pixel_scales=(pixel_scale, pixel_scale)
+        )
+
+        kmeans.image_plane_mesh_grid_from(mask=mask, adapt_data=weight_map)
+
+    assert (
+        len(kmeans_module.cluster_centres_cache)
+        == kmeans_module.cluster_centres_cache.size
+    )
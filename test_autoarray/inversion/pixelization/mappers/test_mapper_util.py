@@ -309,6 +309,62 @@ def test__mapping_matrix(three_pixels, five_pixels):
     ).all()
 
 
+def test__rectangular_pix_indexes_for_sub_slim_index_from():
+    grid = np.array(
+        [
+            [1.0, -1.0],
+            [1.0, 1.0],
+            [0.0, 0.0],
+            [-1.0, -1.0],
+            [-1.0, 1.0],
+            [1.49, 1.49],
+            [-2.0, 2.0],
+        ]
+    )
+
+    pix_indexes = aa.util.mapper.rectangular_pix_indexes_for_sub_slim_index_from(
+        source_plane_data_grid=grid,
+        shape_native=(3, 3),
+        pixel_scales=(1.0, 1.0),
+        origin=(0.0, 0.0),
+    )
+
+    assert (pix_indexes == np.array([0, 2, 4, 6, 8, 2, 8])).all()
+
+    pix_indexes_util = aa.util.geometry.grid_pixel_indexes_2d_slim_from(
+        grid_scaled_2d_slim=grid[:6],
+        shape_native=(3, 3),
+        pixel_scales=(1.0, 1.0),
+        origin=(0.0, 0.0),
+    ).astype("int")
+
+    assert (pix_indexes[:6] == pix_indexes_util).all()
+
+
+def test__rectangular_pix_sub_weights_bilinear_from():
+    grid = np.array([[1.0, -1.0], [0.5, -0.5], [0.0, 0.25], [-1.4, 1.4]])
+
+    mappings, sizes, weights = aa.util.mapper.rectangular_pix_sub_weights_bilinear_from(
+        source_plane_data_grid=grid,
+        shape_native=(3, 3),
+        pixel_scales=(1.0, 1.0),
+        origin=(0.0, 0.0),
+    )
+
+    assert (mappings[0] == np.array([0, 1, 3, 4])).all()
+    assert (mappings[1] == np.array([0, 1, 3, 4])).all()
+    assert (mappings[2] == np.array([4, 5, 7, 8])).all()
+    assert (mappings[3] == np.array([4, 5, 7, 8])).all()
+
+    assert (sizes == np.array([4, 4, 4, 4])).all()
+
+    assert weights[0] == pytest.approx(np.array([1.0, 0.0, 0.0, 0.0]), 1.0e-4)
+    assert weights[1] == pytest.approx(np.array([0.25, 0.25, 0.25, 0.25]), 1.0e-4)
+    assert weights[2] == pytest.approx(np.array([0.75, 0.25, 0.0, 0.0]), 1.0e-4)
+    assert weights[3] == pytest.approx(np.array([0.0, 0.0, 0.0, 1.0]), 1.0e-4)
+    assert np.sum(weights, axis=1) == pytest.approx(np.ones(4), 1.0e-4)
+
+
 def test__data_to_pix_unique_from():
     image_pixels = 2
     sub_size = np.array([2, 2])
@@ -390,6 +446,105 @@ def test__data_to_pix_unique_from():
     assert (pix_lengths == np.array([3, 3])).all()
 
 
+def test__data_to_pix_unique_csr_from__matches_padded():
+    image_pixels = 2
+    sub_size = np.array([2, 2])
+
+    pix_indexes_for_sub_slim_index = np.array(
+        [[0, -1], [0, -1], [0, -1], [1, -1], [2, -1], [1, -1], [0, -1], [2, -1]]
+    ).astype("int")
+    pix_size_for_sub_slim_index = np.array([1, 1, 1, 1, 1, 1, 1, 1]).astype("int")
+    pix_weights_for_sub_slim_index = np.array(
+        [
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+            [1.0, -1],
+        ]
+    )
+
+    offsets, indexes, weights = (
+        aa.util.mapper.data_slim_to_pixelization_unique_csr_from(
+            data_pixels=image_pixels,
+            pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+            pix_sizes_for_sub_slim_index=pix_size_for_sub_slim_index,
+            pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+            pix_pixels=3,
+            sub_size=sub_size,
+        )
+    )
+
+    assert (offsets == np.array([0, 2, 5])).all()
+    assert (indexes == np.array([0, 1, 2, 1, 0])).all()
+    assert (weights == np.array([0.75, 0.25, 0.5, 0.25, 0.25])).all()
+
+    pix_indexes_for_sub_slim_index = np.array(
+        [[0, 2], [1, -1], [2, 0], [1, 0], [0, 1], [2, -1], [1, 2], [0, -1]]
+    ).astype("int")
+    pix_size_for_sub_slim_index = np.array([2, 1, 2, 2, 2, 1, 2, 1]).astype("int")
+    pix_weights_for_sub_slim_index = np.array(
+        [
+            [0.6, 0.4],
+            [1.0, 0.0],
+            [0.3, 0.7],
+            [0.5, 0.5],
+            [0.2, 0.8],
+            [1.0, 0.0],
+            [0.9, 0.1],
+            [1.0, 0.0],
+        ]
+    )
+
+    (
+        data_to_pix_unique,
+        data_weights,
+        pix_lengths,
+    ) = aa.util.mapper.data_slim_to_pixelization_unique_from(
+        data_pixels=image_pixels,
+        pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+        pix_sizes_for_sub_slim_index=pix_size_for_sub_slim_index,
+        pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+        pix_pixels=3,
+        sub_size=sub_size,
+    )
+
+    offsets, indexes, weights = (
+        aa.util.mapper.data_slim_to_pixelization_unique_csr_from(
+            data_pixels=image_pixels,
+            pix_indexes_for_sub_slim_index=pix_indexes_for_sub_slim_index,
+            pix_sizes_for_sub_slim_index=pix_size_for_sub_slim_index,
+            pix_weights_for_sub_slim_index=pix_weights_for_sub_slim_index,
+            pix_pixels=3,
+            sub_size=sub_size,
+        )
+    )
+
+    assert (np.diff(offsets) == pix_lengths).all()
+
+    for data_index in range(image_pixels):
+        pix_length = int(pix_lengths[data_index])
+        csr_slice = slice(offsets[data_index], offsets[data_index + 1])
+
+        assert (indexes[csr_slice] == data_to_pix_unique[data_index, :pix_length]).all()
+        assert weights[csr_slice] == pytest.approx(
+            data_weights[data_index, :pix_length], 1.0e-4
+        )
+
+
+def test__data_weight_total_for_pix_from__skips_unmapped_entries():
+    data_weight_total_for_pix = aa.util.mapper.data_weight_total_for_pix_from(
+        pix_indexes_for_sub_slim_index=np.array([[0, 1], [2, -1], [1, -1]]),
+        pix_weights_for_sub_slim_index=np.array([[0.4, 0.6], [1.0, 0.5], [1.0, 0.5]]),
+        pixels=4,
+    )
+
+    assert data_weight_total_for_pix == pytest.approx([0.4, 1.6, 1.0, 0.0], 1.0e-4)
+
+
 def test__weights():
     source_plane_data_grid = np.array([[0.1, 0.1], [1.0, 1.0]])
 
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import autoarray as aa
 
@@ -48,6 +49,42 @@ def test__pix_indexes_for_sub_slim_index__matches_util():
     ).all()
 
 
+def test__pix_sub_weights__interpolate__matches_util(grid_2d_7x7):
+    mesh_grid = aa.Mesh2DRectangular.overlay_grid(
+        shape_native=(3, 3), grid=grid_2d_7x7, interpolate=True
+    )
+
+    mapper_grids = aa.MapperGrids(
+        mask=grid_2d_7x7.mask,
+        source_plane_data_grid=grid_2d_7x7,
+        source_plane_mesh_grid=mesh_grid,
+    )
+
+    over_sampler = aa.OverSamplerUniform(mask=grid_2d_7x7.mask, sub_size=1)
+
+    mapper = aa.Mapper(
+        mapper_grids=mapper_grids, over_sampler=over_sampler, regularization=None
+    )
+
+    (
+        mappings_util,
+        sizes_util,
+        weights_util,
+    ) = aa.util.mapper.rectangular_pix_sub_weights_bilinear_from(
+        source_plane_data_grid=np.array(grid_2d_7x7),
+        shape_native=mesh_grid.shape_native,
+        pixel_scales=mesh_grid.pixel_scales,
+        origin=mesh_grid.origin,
+    )
+
+    assert (mapper.pix_indexes_for_sub_slim_index == mappings_util).all()
+    assert (mapper.pix_sizes_for_sub_slim_index == sizes_util).all()
+    assert (mapper.pix_weights_for_sub_slim_index == weights_util).all()
+    assert np.sum(mapper.mapping_matrix, axis=1) == pytest.approx(
+        np.ones(grid_2d_7x7.shape[0]), 1.0e-4
+    )
+
+
 def test__pixel_signals_from__matches_util(grid_2d_7x7, image_7x7):
     mesh_grid = aa.Mesh2DRectangular.overlay_grid(shape_native=(3, 3), grid=grid_2d_7x7)
 
@@ -106,6 +106,26 @@ def test__rectangular_neighbors_from():
     ).all()
 
 
+def test__rectangular_neighbors_from__memoised_per_shape():
+    neighbors_cached, sizes_cached = aa.util.mesh.rectangular_neighbors_cached_from(
+        shape_native=(3, 4)
+    )
+
+    assert aa.util.mesh.rectangular_neighbors_cached_from(shape_native=(3, 4))[0] is (
+        neighbors_cached
+    )
+    assert not neighbors_cached.flags.writeable
+
+    neighbors, neighbors_sizes = aa.util.mesh.rectangular_neighbors_from(
+        shape_native=(3, 4)
+    )
+
+    neighbors[0, 0] = 100
+
+    assert (neighbors_cached[0] == [1, 4, -1, -1]).all()
+    assert (neighbors_sizes == sizes_cached).all()
+
+
 def test__voronoi_neighbors_from():
     points = np.array([[1.0, -1.0], [1.0, 1.0], [0.0, 0.0], [-1.0, -1.0], [-1.0, 1.0]])
 
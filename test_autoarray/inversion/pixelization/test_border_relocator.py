@@ -381,3 +381,138 @@ def test__relocated_grid_from__positive_origin_included_in_relocate():
     relocated_grid = border_relocator.relocated_grid_from(grid=grid)
 
     assert relocated_grid[1] == pytest.approx([1.97783243, 1.0], 1e-4)
+
+
+def test__relocated_grid_from__matches_jit_relocation_and_reuses_border_tree():
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), radius=1.0, pixel_scales=(0.1, 0.1)
+    )
+
+    over_sampling = aa.OverSamplerUniform(
+        mask=mask, sub_size=np.array(mask.pixels_in_mask * [2])
+    )
+    grid = over_sampling.over_sampled_grid
+    grid[1, :] = [10.1, 0.1]
+    grid[5, :] = [-3.0, 2.0]
+    grid[9, :] = [0.5, -7.0]
+
+    border_relocator = aa.BorderRelocator(
+        mask=mask, sub_size=np.array(mask.pixels_in_mask * [2])
+    )
+
+    relocated_grid = border_relocator.relocated_grid_from(grid=grid)
+
+    relocated_grid_util = aa.util.grid_2d.relocated_grid_via_jit_from(
+        grid=np.array(grid),
+        border_grid=np.array(grid[border_relocator.sub_border_slim]),
+    )
+
+    assert relocated_grid == pytest.approx(relocated_grid_util, 1.0e-4)
+
+    border_tree = border_relocator._border_tree
+
+    border_relocator.relocated_mesh_grid_from(
+        grid=grid, mesh_grid=aa.Grid2DIrregular(values=[(20.0, 20.0)])
+    )
+
+    assert border_relocator._border_tree is border_tree
+
+
+def test__relocated_grid_from__angle_tolerance__matches_jit_relocation():
+    mask = aa.Mask2D.circular(
+        shape_native=(30, 30), radius=1.0, pixel_scales=(0.1, 0.1)
+    )
+
+    over_sampling = aa.OverSamplerUniform(
+        mask=mask, sub_size=np.array(mask.pixels_in_mask * [2])
+    )
+    grid = over_sampling.over_sampled_grid
+    grid[1, :] = [10.1, 0.1]
+    grid[5, :] = [-3.0, 2.0]
+    grid[9, :] = [0.5, -7.0]
+
+    border_relocator = aa.BorderRelocator(
+        mask=mask, sub_size=np.array(mask.pixels_in_mask * [2]), angle_tolerance=np.pi
+    )
+
+    relocated_grid = border_relocator.relocated_grid_from(grid=grid)
+
+    relocated_grid_util = aa.util.grid_2d.relocated_grid_via_jit_from(
+        grid=np.array(grid),
+        border_grid=np.array(grid[border_relocator.sub_border_slim]),
+    )
+
+    assert relocated_grid == pytest.approx(relocated_grid_util, 1.0e-4)
+    assert border_relocator._border_tree is None
+
+
+def test__relocated_grid_via_angle_sort_from__matches_jit_relocation():
+    border_grid = np.array(
+        [
+            [1.0, 0.0],
+            [0.0, 1.0],
+            [-1.0, 0.0],
+            [0.0, -1.0],
+            [1.0, 1.0],
+            [-1.0, -1.0],
+            [1.0, -1.0],
+            [-1.0, 1.0],
+        ]
+    )
+
+    grid = np.random.default_rng(seed=1).uniform(-3.0, 3.0, size=(500, 2))
+    grid[:100] = np.round(grid[:100])
+
+    relocated_grid_util = aa.util.grid_2d.relocated_grid_via_jit_from(
+        grid=grid, border_grid=border_grid
+    )
+
+    relocated_grid = aa.util.grid_2d.relocated_grid_via_angle_sort_from(
+        grid=grid, border_grid=border_grid
+    )
+
+    assert relocated_grid == pytest.approx(relocated_grid_util, 1.0e-8)
+
+    relocated_grid = aa.util.grid_2d.relocated_grid_via_angle_sort_from(
+        grid=grid, border_grid=border_grid, workers=3
+    )
+
+    assert relocated_grid == pytest.approx(relocated_grid_util, 1.0e-8)
+
+
+def test__relocated_grid_via_kdtree_from__more_than_four_equidistant_border_pixels():
+    # The first twelve border pixels are all a distance of 5.0 from the coordinate (20.0, 0.0), such that the
+    # lowest index must be chosen from more ties than the KD-tree returns by default.
+    border_grid = np.array(
+        [
+            [24.0, 3.0],
+            [17.0, 4.0],
+            [16.0, -3.0],
+            [23.0, 4.0],
+            [20.0, -5.0],
+            [17.0, -4.0],
+            [23.0, -4.0],
+            [20.0, 5.0],
+            [25.0, 0.0],
+            [16.0, 3.0],
+            [15.0, 0.0],
+            [24.0, -3.0],
+            [-20.0, 0.0],
+            [-20.0, 5.0],
+            [-20.0, -5.0],
+            [0.0, 15.0],
+            [0.0, -15.0],
+        ]
+    )
+
+    grid = np.array([[20.0, 0.0], [0.0, 0.0], [30.0, 1.0], [-30.0, 2.0]])
+
+    relocated_grid_util = aa.util.grid_2d.relocated_grid_via_jit_from(
+        grid=grid, border_grid=border_grid
+    )
+
+    relocated_grid = aa.util.grid_2d.relocated_grid_via_kdtree_from(
+        grid=grid, border_grid=border_grid
+    )
+
+    assert relocated_grid == pytest.approx(relocated_grid_util, 1.0e-8)
@@ -1,5 +1,6 @@
 import autoarray as aa
 import numpy as np
+import pytest
 
 
 def test__data_to_pix_unique_from():
@@ -57,6 +58,35 @@ def test__data_to_pix_unique_from():
     assert (linear_obj.unique_mappings.pix_lengths == pix_lengths).all()
 
 
+def test__unique_mappings__csr_and_padded_formats_agree():
+    from autoarray.inversion.linear_obj.unique_mappings import UniqueMappings
+    from autoarray.inversion.linear_obj.unique_mappings import UniqueMappingsCSR
+
+    unique_mappings = UniqueMappings(
+        data_to_pix_unique=np.array([[0, 1, -1], [2, -1, -1], [1, 0, 2]]),
+        data_weights=np.array([[0.75, 0.25, 0.0], [1.0, 0.0, 0.0], [0.5, 0.25, 0.25]]),
+        pix_lengths=np.array([2, 1, 3]),
+    )
+
+    assert (unique_mappings.offsets == np.array([0, 2, 3, 6])).all()
+    assert (unique_mappings.indexes == np.array([0, 1, 2, 1, 0, 2])).all()
+    assert (
+        unique_mappings.weights == np.array([0.75, 0.25, 1.0, 0.5, 0.25, 0.25])
+    ).all()
+
+    unique_mappings_csr = UniqueMappingsCSR(
+        offsets=unique_mappings.offsets,
+        indexes=unique_mappings.indexes,
+        weights=unique_mappings.weights,
+    )
+
+    assert (
+        unique_mappings_csr.data_to_pix_unique == unique_mappings.data_to_pix_unique
+    ).all()
+    assert (unique_mappings_csr.data_weights == unique_mappings.data_weights).all()
+    assert (unique_mappings_csr.pix_lengths == unique_mappings.pix_lengths).all()
+
+
 def test__neighbors():
     class FuncList(aa.AbstractLinearObjFuncList):
         @property
@@ -76,3 +106,32 @@ def test__neighbors():
     assert neighbors.sizes[1] == 2
     assert neighbors.sizes[2] == 2
     assert neighbors.sizes[3] == 1
+
+
+def test__mapping_matrix_via_func_list_from():
+    mask = aa.Mask2D.circular(shape_native=(10, 10), radius=0.4, pixel_scales=0.1)
+
+    grid = aa.Grid2D.from_mask(
+        mask=mask, over_sampling=aa.OverSamplingUniform(sub_size=2)
+    )
+
+    obj_0 = aa.m.MockGridLikeIteratorObj()
+    obj_1 = aa.m.MockGrid2DLikeObj()
+
+    linear_obj = aa.m.MockLinearObjFuncList(grid=grid)
+
+    mapping_matrix = linear_obj.mapping_matrix_via_func_list_from(
+        func_list=[
+            (obj_0, aa.m.MockGridLikeIteratorObj.ndarray_1d_from),
+            (obj_1, aa.m.MockGrid2DLikeObj.ndarray_1d_from),
+        ],
+        workers=2,
+    )
+
+    assert mapping_matrix.shape == (mask.pixels_in_mask, 2)
+    assert mapping_matrix[:, 0] == pytest.approx(
+        obj_0.ndarray_1d_from(grid=grid).slim, 1.0e-12
+    )
+    assert mapping_matrix[:, 1] == pytest.approx(
+        obj_1.ndarray_1d_from(grid=grid).slim, 1.0e-12
+    )
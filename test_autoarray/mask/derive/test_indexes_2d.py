@@ -78,3 +78,21 @@ def test__border_1d_indexes(indexes_2d_9x9):
 def test__border_2d_indexes(indexes_2d_9x9):
     assert indexes_2d_9x9.border_native[0] == pytest.approx(np.array([1, 1]), 1e-4)
     assert indexes_2d_9x9.border_native[10] == pytest.approx(np.array([3, 7]), 1e-4)
+
+
+def test__derived_indexes_shared_by_equal_masks(indexes_2d_9x9):
+    mask = aa.Mask2D(
+        mask=np.array(indexes_2d_9x9.mask),
+        pixel_scales=indexes_2d_9x9.mask.pixel_scales,
+    )
+
+    derive_indexes = aa.DeriveIndexes2D(mask=mask)
+
+    assert derive_indexes.native_for_slim is indexes_2d_9x9.native_for_slim
+    assert derive_indexes.border_slim is indexes_2d_9x9.border_slim
+    assert derive_indexes.native_for_slim.flags.writeable is False
+
+    mask[1, 1] = True
+
+    assert derive_indexes.native_for_slim is not indexes_2d_9x9.native_for_slim
+    assert derive_indexes.native_for_slim[0] == pytest.approx(np.array([1, 2]), 1e-4)
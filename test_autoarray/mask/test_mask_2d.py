@@ -459,6 +459,30 @@ def test__is_all_false():
     assert mask.is_all_false is False
 
 
+def test__content_hash():
+    mask = aa.Mask2D(mask=[[False, True], [False, False]], pixel_scales=1.0)
+
+    mask_copy = aa.Mask2D(
+        mask=np.array([[False, True], [False, False]]), pixel_scales=(1.0, 1.0)
+    )
+
+    assert mask.content_hash == mask_copy.content_hash
+
+    mask_other = aa.Mask2D(mask=[[False, True], [True, False]], pixel_scales=1.0)
+
+    assert mask.content_hash != mask_other.content_hash
+
+    mask_other = aa.Mask2D(mask=[[False, True], [False, False]], pixel_scales=2.0)
+
+    assert mask.content_hash != mask_other.content_hash
+
+    mask_other = aa.Mask2D(
+        mask=[[False, True], [False, False]], pixel_scales=1.0, origin=(1.0, 0.0)
+    )
+
+    assert mask.content_hash != mask_other.content_hash
+
+
 def test__shape_native_masked_pixels():
     mask = aa.Mask2D(
         mask=[
@@ -1090,6 +1090,38 @@ def test__edge_1d_indexes_from():
     ).all()
 
 
+def test__edge_mask_2d_from():
+    mask = np.array(
+        [
+            [True, True, True, True, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, True, True, True, True],
+        ]
+    )
+
+    edge_mask = util.mask_2d.edge_mask_2d_from(mask_2d=mask)
+
+    assert (
+        edge_mask
+        == np.array(
+            [
+                [False, False, False, False, False],
+                [False, True, True, True, False],
+                [False, True, False, True, False],
+                [False, True, True, True, False],
+                [False, False, False, False, False],
+            ]
+        )
+    ).all()
+
+    assert (
+        util.mask_2d.slim_indexes_from(mask_2d=mask, pixel_mask_2d=edge_mask)
+        == np.array([0, 1, 2, 3, 5, 6, 7, 8])
+    ).all()
+
+
 def test__border_slim_indexes_from():
     mask = np.array(
         [
@@ -1221,6 +1253,35 @@ def test__border_slim_indexes_from():
     ).all()
 
 
+def test__border_slim_indexes_from__matches_check_if_border_pixel():
+    mask_2d = util.mask_2d.mask_2d_circular_annular_from(
+        shape_native=(15, 15),
+        pixel_scales=(1.0, 1.0),
+        inner_radius=2.5,
+        outer_radius=6.0,
+    )
+
+    native_to_slim = util.mask_2d.native_index_for_slim_index_2d_from(mask_2d=mask_2d)
+    edge_pixels = util.mask_2d.edge_1d_indexes_from(mask_2d=mask_2d)
+
+    border_pixels = [
+        edge_pixel
+        for edge_pixel in edge_pixels
+        if util.mask_2d.check_if_border_pixel(
+            mask_2d=mask_2d,
+            edge_pixel_slim=edge_pixel,
+            native_to_slim=native_to_slim,
+        )
+    ]
+
+    border_slim_indexes = util.mask_2d.border_slim_indexes_from(mask_2d=mask_2d)
+
+    assert (np.sort(border_slim_indexes) == np.sort(border_pixels)).all()
+    assert util.mask_2d.total_border_pixels_from(
+        mask_2d=mask_2d, edge_pixels=edge_pixels, native_to_slim=native_to_slim
+    ) == len(border_pixels)
+
+
 def test__native_index_for_slim_index_2d_from():
     mask = np.array([[True, True, True], [True, False, True], [True, True, True]])
 
@@ -1276,6 +1337,41 @@ def test__rescaled_mask_2d_from():
     ).all()
 
 
+def test__dilated_mask_2d_from():
+    mask = np.array(
+        [
+            [True, True, True, True, True],
+            [True, True, True, True, True],
+            [True, True, False, True, True],
+            [True, True, True, True, True],
+            [True, True, True, True, True],
+        ]
+    )
+
+    dilated_mask = util.mask_2d.dilated_mask_2d_from(
+        mask_2d=mask, y_range=(-2, 1), x_range=(0, 1)
+    )
+
+    assert (
+        dilated_mask
+        == np.array(
+            [
+                [True, True, False, False, True],
+                [True, True, False, False, True],
+                [True, True, False, False, True],
+                [True, True, False, False, True],
+                [True, True, True, True, True],
+            ]
+        )
+    ).all()
+
+    dilated_mask = util.mask_2d.dilated_mask_2d_from(
+        mask_2d=np.full((3, 3), True), y_range=(-1, 1), x_range=(-1, 1)
+    )
+
+    assert dilated_mask.all()
+
+
 def test__buffed_mask_2d_from():
     mask = np.array(
         [
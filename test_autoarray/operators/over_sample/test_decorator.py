@@ -2,7 +2,10 @@ import os
 import numpy as np
 import pytest
 
+from autoconf.conf import with_config
+
 import autoarray as aa
+from autoarray.operators.over_sampling.decorator import array_via_func_list_from
 from autoarray.structures.mock.mock_decorators import (
     ndarray_1d_from,
     ndarray_2d_from,
@@ -121,3 +124,64 @@ def test__in_grid_2d_over_sample_iterate__out_ndarray_1d__values_use_iteration()
 
     assert ndarray_1d.native[1, 1] != values_sub_4.native[1, 1]
     assert ndarray_1d.native[2, 2] == values_sub_4.native[2, 2]
+
+
+@with_config("general", "structures", "chunk_size", value=7)
+@with_config("general", "structures", "chunk_workers", value=2)
+def test__in_grid_2d__over_sample_uniform__chunked__out_ndarray_1d():
+    mask = aa.Mask2D.circular(shape_native=(10, 10), radius=0.4, pixel_scales=0.1)
+
+    obj = aa.m.MockGridLikeIteratorObj()
+
+    grid_2d = aa.Grid2D.from_mask(
+        mask=mask, over_sampling=aa.OverSamplingUniform(sub_size=2)
+    )
+
+    ndarray_1d = obj.ndarray_1d_from(grid=grid_2d)
+
+    over_sample_uniform = aa.OverSamplerUniform(mask=mask, sub_size=2)
+
+    ndarray_1d_func = aa.m.MockGridLikeIteratorObj.ndarray_1d_from.__wrapped__.__wrapped__
+
+    ndarray_1d_via_grid = over_sample_uniform.binned_array_2d_from(
+        array=ndarray_1d_func(obj, over_sample_uniform.over_sampled_grid),
+    )
+
+    assert isinstance(ndarray_1d, aa.Array2D)
+    assert ndarray_1d == pytest.approx(ndarray_1d_via_grid, 1.0e-12)
+
+
+def test__array_via_func_list_from():
+    mask = aa.Mask2D.circular(shape_native=(10, 10), radius=0.4, pixel_scales=0.1)
+
+    obj_0 = aa.m.MockGridLikeIteratorObj()
+    obj_1 = aa.m.MockGrid2DLikeObj()
+
+    func_list = [
+        (obj_0, aa.m.MockGridLikeIteratorObj.ndarray_1d_from),
+        (obj_1, aa.m.MockGrid2DLikeObj.ndarray_1d_from),
+    ]
+
+    grid_2d = aa.Grid2D.from_mask(
+        mask=mask, over_sampling=aa.OverSamplingUniform(sub_size=2)
+    )
+
+    array = array_via_func_list_from(grid=grid_2d, func_list=func_list, workers=2)
+
+    assert array.shape == (mask.pixels_in_mask, 2)
+    assert array[:, 0] == pytest.approx(
+        obj_0.ndarray_1d_from(grid=grid_2d).slim, 1.0e-12
+    )
+    assert array[:, 1] == pytest.approx(
+        obj_1.ndarray_1d_from(grid=grid_2d).slim, 1.0e-12
+    )
+
+    grid_2d = aa.Grid2D.from_mask(
+        mask=mask, over_sampling=aa.OverSamplingUniform(sub_size=1)
+    )
+
+    array = array_via_func_list_from(grid=grid_2d, func_list=func_list, workers=2)
+
+    assert array[:, 0] == pytest.approx(
+        obj_0.ndarray_1d_from(grid=grid_2d).slim, 1.0e-12
+    )
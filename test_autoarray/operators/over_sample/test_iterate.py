@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import autoarray as aa
 
@@ -228,3 +229,74 @@ def test__array_via_func_from__func_returns_all_zeros__iteration_terminated():
     )
 
     assert (values == np.zeros((9,))).all()
+
+
+def test__array_via_func_from__nested_sub_steps_reuse_lower_sub_samples():
+    mask = aa.Mask2D(
+        mask=[
+            [True, True, True, True, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, True, True, True, True],
+        ],
+        pixel_scales=(1.0, 1.0),
+        origin=(0.001, 0.001),
+    )
+
+    total_evaluations = []
+
+    def ndarray_1d_counted_from(profile, grid, *args, **kwargs):
+        total_evaluations.append(grid.shape[0])
+        return ndarray_1d_from(profile, grid)
+
+    over_sampling = aa.OverSamplerIterate(
+        mask=mask, fractional_accuracy=1.0, sub_steps=[3, 9]
+    )
+
+    values = over_sampling.array_via_func_from(
+        func=ndarray_1d_counted_from,
+        obj=None,
+    )
+
+    assert total_evaluations == [9, 9 * 8, 9 * 72]
+
+    over_sample_uniform = aa.OverSamplerUniform(mask=mask, sub_size=9)
+
+    values_sub_9 = over_sample_uniform.array_via_func_from(
+        func=ndarray_1d_from, obj=object
+    )
+
+    assert values == pytest.approx(values_sub_9, 1.0e-8)
+
+
+def test__array_via_func_from__only_unconverged_pixels_evaluated():
+    mask = aa.Mask2D(
+        mask=[
+            [True, True, True, True, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, False, False, False, True],
+            [True, True, True, True, True],
+        ],
+        pixel_scales=(1.0, 1.0),
+        origin=(0.001, 0.001),
+    )
+
+    total_evaluations = []
+
+    def ndarray_1d_counted_from(profile, grid, *args, **kwargs):
+        total_evaluations.append(grid.shape[0])
+        return ndarray_1d_from(profile, grid)
+
+    over_sampling = aa.OverSamplerIterate(
+        mask=mask, fractional_accuracy=0.5, sub_steps=[2, 4]
+    )
+
+    over_sampling.array_via_func_from(
+        func=ndarray_1d_counted_from,
+        obj=None,
+    )
+
+    assert total_evaluations[:2] == [9, 9 * 4]
+    assert 0 < total_evaluations[2] < 9 * 16
@@ -367,3 +367,55 @@ def test__grid_2d_slim_over_sampled_via_mask_from():
     assert grid[0:4] == pytest.approx(
         np.array([[1.75, -0.5], [1.75, 2.5], [0.25, -0.5], [0.25, 2.5]]), 1e-4
     )
+
+
+def test__grid_2d_slim_over_sampled_via_native_indexes_from__matches_mask_util():
+    mask = np.array([[True, False, True], [False, False, False], [True, False, False]])
+
+    grid_via_mask = util.over_sample.grid_2d_slim_over_sampled_via_mask_from(
+        mask_2d=mask,
+        pixel_scales=(1.0, 2.0),
+        sub_size=np.full(6, 3),
+        origin=(0.5, -0.5),
+    )
+
+    grid = util.over_sample.grid_2d_slim_over_sampled_via_native_indexes_from(
+        native_indexes=np.array([[0, 1], [1, 0], [1, 1], [1, 2], [2, 1], [2, 2]]),
+        shape_native=(3, 3),
+        pixel_scales=(1.0, 2.0),
+        sub_size=3,
+        origin=(0.5, -0.5),
+    )
+
+    assert (grid == grid_via_mask).all()
+
+    grid = util.over_sample.grid_2d_slim_over_sampled_via_native_indexes_from(
+        native_indexes=np.array([[1, 2], [2, 1]]),
+        shape_native=(3, 3),
+        pixel_scales=(1.0, 2.0),
+        sub_size=3,
+        origin=(0.5, -0.5),
+    )
+
+    assert (grid == grid_via_mask[27:45]).all()
+
+
+def test__nested_sub_indexes_from():
+    nested_sub_indexes = util.over_sample.nested_sub_indexes_from(
+        sub_size_lower=1, sub_size=3
+    )
+
+    assert (nested_sub_indexes == np.array([-1, -1, -1, -1, 0, -1, -1, -1, -1])).all()
+
+    nested_sub_indexes = util.over_sample.nested_sub_indexes_from(
+        sub_size_lower=2, sub_size=6
+    )
+
+    assert (nested_sub_indexes[[7, 10, 25, 28]] == np.array([0, 1, 2, 3])).all()
+    assert (nested_sub_indexes >= 0).sum() == 4
+
+    nested_sub_indexes = util.over_sample.nested_sub_indexes_from(
+        sub_size_lower=2, sub_size=4
+    )
+
+    assert (nested_sub_indexes == -1).all()
@@ -202,3 +202,102 @@ def test__slim_index_for_sub_slim_index():
     )
 
     assert (over_sampling.slim_for_sub_slim == slim_index_for_sub_slim_index_util).all()
+
+
+def test__plan__shared_between_over_samplers_and_matches_util():
+    mask = aa.Mask2D(
+        mask=[[True, False, True], [False, False, False], [True, False, False]],
+        pixel_scales=(1.0, 2.0),
+        origin=(0.5, -0.5),
+    )
+
+    sub_size = aa.Array2D(values=np.array([1, 2, 3, 2, 1, 4]), mask=mask)
+
+    over_sampler = aa.OverSamplerUniform(mask=mask, sub_size=sub_size)
+
+    assert over_sampler.plan is aa.OverSamplerUniform(mask=mask, sub_size=sub_size).plan
+    assert over_sampler.plan is not aa.OverSamplerUniform(mask=mask, sub_size=2).plan
+
+    grid_util = aa.util.over_sample.grid_2d_slim_over_sampled_via_mask_from(
+        mask_2d=np.array(mask),
+        pixel_scales=mask.pixel_scales,
+        sub_size=np.array(sub_size).astype("int"),
+        origin=mask.origin,
+    )
+
+    assert (over_sampler.over_sampled_grid == grid_util).all()
+
+    slim_for_sub_slim_util = (
+        aa.util.over_sample.slim_index_for_sub_slim_index_via_mask_2d_from(
+            mask_2d=np.array(mask), sub_size=np.array(sub_size).astype("int")
+        )
+    )
+
+    assert (over_sampler.slim_for_sub_slim == slim_for_sub_slim_util).all()
+
+    values = np.arange(over_sampler.sub_total, dtype="float")
+
+    binned_array_util = aa.util.over_sample.binned_array_2d_from(
+        array_2d=values,
+        mask_2d=np.array(mask),
+        sub_size=np.array(sub_size).astype("int"),
+    )
+
+    binned_array = over_sampler.binned_array_2d_from(array=values)
+
+    assert isinstance(binned_array, aa.Array2D)
+    assert binned_array.slim == pytest.approx(binned_array_util, 1.0e-8)
+
+
+def test__plan__binned_array_via_chunks_from():
+    mask = aa.Mask2D.circular(shape_native=(10, 10), radius=0.4, pixel_scales=0.1)
+
+    sub_size = np.arange(mask.pixels_in_mask) % 3 + 1
+
+    plan = aa.OverSamplerUniform(mask=mask, sub_size=sub_size).plan
+
+    chunk_slices = plan.pixel_chunk_slices_from(chunk_size=5)
+
+    assert chunk_slices[0][0] == 0
+    assert chunk_slices[-1][1] == mask.pixels_in_mask
+    assert all(end > start for start, end in chunk_slices)
+    assert all(
+        np.sum(sub_size[start:end] ** 2) <= 5 or end - start == 1
+        for start, end in chunk_slices
+    )
+
+    def chunk_func(grid):
+        return np.stack((grid[:, 0] ** 2, grid[:, 1] + 1.0), axis=1)
+
+    binned_array = plan.binned_array_via_chunks_from(
+        chunk_func=chunk_func, chunk_size=5, workers=2
+    )
+
+    assert binned_array == pytest.approx(
+        plan.binned_array_from(chunk_func(plan.over_sampled_grid)), 1.0e-12
+    )
+
+
+def test__array_via_func_list_from():
+    mask = aa.Mask2D.circular(shape_native=(10, 10), radius=0.4, pixel_scales=0.1)
+
+    over_sampler = aa.OverSamplerUniform(mask=mask, sub_size=3)
+
+    def func_0(grid, **kwargs):
+        return grid[:, 0] ** 2
+
+    def func_1(obj, grid, power):
+        return obj * np.abs(grid[:, 1]) ** power
+
+    array = over_sampler.array_via_func_list_from(
+        func_list=[(None, func_0), (2.0, func_1)], workers=2, power=0.5
+    )
+
+    assert array.shape == (mask.pixels_in_mask, 2)
+    assert array[:, 0] == pytest.approx(
+        over_sampler.array_via_func_from(func=func_0, obj=None).slim, 1.0e-12
+    )
+    assert array[:, 1] == pytest.approx(
+        over_sampler.array_via_func_from(func=func_1, obj=2.0, power=0.5).slim,
+        1.0e-12,
+    )
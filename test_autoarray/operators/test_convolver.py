@@ -1162,3 +1162,31 @@ def test__summed_convolved_array_from():
     summed_convolved_array = convolver.convolve_image_no_blurring(image=image_array)
 
     assert summed_convolved_array == pytest.approx(np.array([2.0, 4.0, 4.0]), 1.0e-4)
+
+
+def test__from_frame_dict(simple_mask_2d_7x7):
+    kernel = aa.Kernel2D.no_mask(
+        values=[[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]], pixel_scales=1.0
+    )
+
+    convolver = aa.Convolver(mask=simple_mask_2d_7x7, kernel=kernel)
+
+    convolver_frames = aa.Convolver.from_frame_dict(
+        mask=simple_mask_2d_7x7, kernel=kernel, frame_dict=convolver.frame_dict
+    )
+
+    assert convolver_frames.pixels_in_mask == convolver.pixels_in_mask
+    assert convolver_frames.pixels_in_blurring_mask == convolver.pixels_in_blurring_mask
+
+    image = aa.Array2D(values=np.arange(49.0).reshape(7, 7), mask=simple_mask_2d_7x7)
+    blurring_image = aa.Array2D(
+        values=np.arange(49.0).reshape(7, 7),
+        mask=simple_mask_2d_7x7.derive_mask.blurring_from(kernel_shape_native=(3, 3)),
+    )
+
+    assert convolver_frames.convolve_image(
+        image=image, blurring_image=blurring_image
+    ) == pytest.approx(
+        np.array(convolver.convolve_image(image=image, blurring_image=blurring_image)),
+        1.0e-4,
+    )
@@ -303,6 +303,32 @@ def test__numpy_array_2d_via_fits_from():
     assert (arr == np.ones((4, 3))).all()
 
 
+def test__numpy_array_2d_and_header_objs_via_fits_from():
+    file_path = os.path.join(test_data_path, "array_out.fits")
+
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+    arr = np.array([[10.0, 30.0, 40.0], [92.0, 19.0, 20.0]])
+
+    util.array_2d.numpy_array_2d_to_fits(arr, file_path=file_path, header_dict={"A": 1})
+
+    (
+        array_load,
+        header_sci_obj,
+        header_hdu_obj,
+    ) = util.array_2d.numpy_array_2d_and_header_objs_via_fits_from(
+        file_path=file_path, hdu=0
+    )
+
+    assert (arr == array_load).all()
+    assert array_load.dtype == np.dtype("float64")
+    assert array_load.dtype.isnative
+    assert array_load.flags.writeable
+    assert header_sci_obj["A"] == 1
+    assert header_hdu_obj["A"] == 1
+
+
 def test__numpy_array_2d_to_fits():
     file_path = os.path.join(test_data_path, "array_out.fits")
 
@@ -581,3 +581,28 @@ def test__array_2d__recursive_shape_storage():
 
     assert (array_2d.native.slim.native == np.array([[1.0, 2.0], [3.0, 4.0]])).all()
     assert (array_2d.slim.native.slim == np.array([1.0, 2.0, 3.0, 4.0])).all()
+
+
+def test__from_slim_unchecked__same_as_constructor():
+    mask = aa.Mask2D(
+        mask=[[False, False, True], [False, False, False], [True, False, False]],
+        pixel_scales=1.0,
+    )
+
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+
+    array = aa.Array2D(values=values, mask=mask)
+    array_unchecked = aa.Array2D._from_slim_unchecked(values=values, mask=mask)
+
+    assert isinstance(array_unchecked, aa.Array2D)
+    assert (array_unchecked.slim == array.slim).all()
+    assert (array_unchecked.native == array.native).all()
+    assert array_unchecked.mask is mask
+    assert array_unchecked.header is None
+
+    array_unchecked = aa.Array2D._from_slim_unchecked(
+        values=values, mask=mask, store_native=True
+    )
+
+    assert array_unchecked.shape == (3, 3)
+    assert (array_unchecked.native == array.native).all()
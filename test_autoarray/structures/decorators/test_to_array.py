@@ -1,4 +1,7 @@
 import numpy as np
+import pytest
+
+from autoconf.conf import with_config
 
 import autoarray as aa
 
@@ -163,3 +166,19 @@ def test__in_grid_2d_irregular__out_ndarray_1d_list():
 
     assert ndarray_1d_list[0].in_list == [1.0, 1.0, 1.0]
     assert ndarray_1d_list[1].in_list == [2.0, 2.0, 2.0]
+
+
+@with_config("general", "structures", "chunk_size", value=5)
+def test__in_grid_2d__chunked__out_ndarray_1d_list():
+    grid_2d = aa.Grid2D.uniform(shape_native=(4, 4), pixel_scales=1.0)
+
+    obj = aa.m.MockGridLikeIteratorObj()
+
+    ndarray_1d_list = obj.ndarray_1d_list_from(grid=grid_2d)
+
+    ndarray_1d_list_func = aa.m.MockGridLikeIteratorObj.ndarray_1d_list_from.__wrapped__
+
+    assert isinstance(ndarray_1d_list[0], aa.Array2D)
+    assert ndarray_1d_list[0].slim == pytest.approx(
+        ndarray_1d_list_func(obj, np.array(grid_2d))[0], 1.0e-12
+    )
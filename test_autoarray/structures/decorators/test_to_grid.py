@@ -1,6 +1,8 @@
 import numpy as np
 import pytest
 
+from autoconf.conf import with_config
+
 import autoarray as aa
 
 
@@ -133,3 +135,22 @@ def test__in_grid_2d_irregular__out_ndarray_2d_list():
 
     assert ndarray_2d_list[0].in_list == [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
     assert ndarray_2d_list[1].in_list == [(2.0, 4.0), (6.0, 8.0), (10.0, 12.0)]
+
+
+@with_config("general", "structures", "chunk_size", value=5)
+@with_config("general", "structures", "chunk_workers", value=2)
+def test__in_grid_2d_irregular__chunked__out_ndarray_2d():
+    grid_2d = aa.Grid2DIrregular(
+        values=np.random.default_rng(seed=1).uniform(-1.0, 1.0, size=(23, 2))
+    )
+
+    obj = aa.m.MockGridLikeIteratorObj()
+
+    ndarray_2d = obj.ndarray_2d_from(grid=grid_2d)
+
+    ndarray_2d_func = aa.m.MockGridLikeIteratorObj.ndarray_2d_from.__wrapped__
+
+    assert isinstance(ndarray_2d, aa.Grid2DIrregular)
+    assert np.array(ndarray_2d) == pytest.approx(
+        ndarray_2d_func(obj, np.array(grid_2d)), 1.0e-12
+    )
@@ -853,3 +853,20 @@ def test__is_uniform():
     )
 
     assert grid_2d.is_uniform == False
+
+
+def test__from_slim_unchecked__same_as_constructor():
+    mask = aa.Mask2D(
+        mask=[[False, True], [False, False]],
+        pixel_scales=1.0,
+    )
+
+    values = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+
+    grid = aa.Grid2D(values=values, mask=mask)
+    grid_unchecked = aa.Grid2D._from_slim_unchecked(values=values, mask=mask)
+
+    assert isinstance(grid_unchecked, aa.Grid2D)
+    assert (grid_unchecked.slim == grid.slim).all()
+    assert (grid_unchecked.native == grid.native).all()
+    assert grid_unchecked.over_sampling is None
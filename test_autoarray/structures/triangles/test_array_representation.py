@@ -51,6 +51,51 @@ def test_contains_vertices(
     assert (containing_indices == indices).all()
 
 
+def test_containing_indices_batch(triangles):
+    containing_indices = triangles.containing_indices_batch(
+        np.array([[0.1, 0.1], [0.6, 0.6], [0.5, 0.5], [2.0, 2.0], [np.nan, 0.0]])
+    )
+
+    assert (containing_indices[0] == np.array([0])).all()
+    assert (containing_indices[1] == np.array([1])).all()
+    assert (containing_indices[2] == np.array([0, 1])).all()
+    assert containing_indices[3].shape == (0,)
+    assert containing_indices[4].shape == (0,)
+
+
+def test_containing_indices_batch__same_as_single_queries():
+    triangles = ArrayTriangles.for_limits_and_scale(
+        y_min=-1.0,
+        y_max=1.0,
+        x_min=-1.0,
+        x_max=1.0,
+        scale=0.25,
+    )
+
+    points = np.concatenate(
+        [
+            np.random.default_rng(seed=1).uniform(-1.2, 1.2, size=(100, 2)),
+            triangles.vertices,
+        ]
+    )
+
+    for point, containing_indices in zip(
+        points, triangles.containing_indices_batch(points)
+    ):
+        assert (
+            containing_indices
+            == np.where(triangles._containing_mask(tuple(point)))[0]
+        ).all()
+
+    for center, containing_indices in zip(
+        points, triangles.containing_indices_circle_batch(points, radius=0.1)
+    ):
+        assert (
+            containing_indices
+            == np.where(triangles._containing_circle_mask(tuple(center), 0.1))[0]
+        ).all()
+
+
 @pytest.mark.parametrize(
     "indexes, vertices, indices",
     [
@@ -232,3 +277,37 @@ def test_means(triangles):
             ]
         )
     )
+
+
+def test_lattice__same_triangles_without_duplicate_vertices():
+    triangles = ArrayTriangles.for_limits_and_scale(
+        y_min=-1.0,
+        y_max=1.0,
+        x_min=-1.0,
+        x_max=1.0,
+        scale=0.5,
+    )
+
+    assert triangles.lattice.shape == triangles.vertices.shape
+
+    triangles = triangles.for_indexes(np.array([3, 4, 5]))
+
+    float_triangles = ArrayTriangles(
+        indices=triangles.indices, vertices=triangles.vertices
+    )
+
+    for _ in range(2):
+        triangles = triangles.neighborhood().up_sample()
+        float_triangles = float_triangles.neighborhood().up_sample()
+
+        assert np.unique(triangles.lattice, axis=0).shape == triangles.lattice.shape
+        assert np.unique(np.round(triangles.vertices, 10), axis=0).shape == (
+            triangles.vertices.shape
+        )
+
+        assert set(map(tuple, np.round(triangles.means, 10))) == set(
+            map(tuple, np.round(float_triangles.means, 10))
+        )
+        assert triangles.indices.shape[0] == len(
+            set(map(tuple, np.round(triangles.means, 10)))
+        )
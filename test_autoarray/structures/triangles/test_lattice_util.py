@@ -0,0 +1,40 @@
+import numpy as np
+
+from autoarray.structures.triangles import lattice_util
+
+
+def test__unique_keys_from():
+    keys = np.array([5, 3, 5, 0, 3, 7])
+
+    first_indexes, inverse = lattice_util.unique_keys_from(keys=keys)
+
+    assert (first_indexes == np.array([0, 1, 3, 5])).all()
+    assert (inverse == np.array([0, 1, 0, 2, 1, 3])).all()
+
+
+def test__unique_via_sort_from():
+    keys = np.array([5, 3, 5, 0, 3, 7])
+
+    first_indexes, inverse = lattice_util.unique_via_sort_from(values=keys)
+
+    assert (first_indexes == np.array([0, 1, 3, 5])).all()
+    assert (inverse == np.array([0, 1, 0, 2, 1, 3])).all()
+
+
+def test__unique_lattice_from():
+    lattice = np.array([[0, -2], [1, 1], [0, -2], [-3, 4], [1, 1]])
+
+    first_indexes, inverse = lattice_util.unique_lattice_from(lattice=lattice)
+
+    assert (first_indexes == np.array([0, 1, 3])).all()
+    assert (lattice[first_indexes][inverse] == lattice).all()
+
+
+def test__unique_lattice_from__extent_too_large_for_keys__same_order_as_keys():
+    lattice = np.array([[2**40, 1], [-3, 4], [2**40, 1], [0, -2], [-3, 4]])
+
+    first_indexes, inverse = lattice_util.unique_lattice_from(lattice=lattice)
+
+    assert (first_indexes == np.array([0, 1, 3])).all()
+    assert (inverse == np.array([0, 1, 0, 2, 1])).all()
+    assert (lattice[first_indexes][inverse] == lattice).all()
@@ -0,0 +1,44 @@
+import numpy as np
+
+import autoarray as aa
+from autoarray.cache_util import LRUCache
+from autoarray.cache_util import mask_cache_key_from
+
+
+def test__lru_cache__value_from_memoises_and_discards_least_recently_used():
+    cache = LRUCache(size=2)
+
+    assert cache.value_from(key="a", func=lambda: 1) == 1
+    assert cache.value_from(key="a", func=lambda: 2) == 1
+
+    cache.set(key="b", value=3)
+
+    assert cache.get(key="a") == 1
+
+    cache.set(key="c", value=4)
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get(key="b", default=5) == 5
+
+
+def test__mask_cache_key_from():
+    mask = aa.Mask2D.all_false(shape_native=(3, 3), pixel_scales=1.0)
+
+    key = mask_cache_key_from(mask, np.ones(9))
+
+    assert (
+        mask_cache_key_from(
+            aa.Mask2D.all_false(shape_native=(3, 3), pixel_scales=1.0), np.ones(9)
+        )
+        == key
+    )
+    assert mask_cache_key_from(mask, 2.0 * np.ones(9)) != key
+    assert mask_cache_key_from(mask, np.ones(9, dtype="int")) != key
+    assert (
+        mask_cache_key_from(
+            aa.Mask2D.all_false(shape_native=(3, 3), pixel_scales=2.0), np.ones(9)
+        )
+        != key
+    )
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import autoarray as aa
+
+
+def test__import__heavy_dependencies_not_imported():
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import autoarray\n"
+        "print(time.perf_counter() - start)\n"
+        "modules = ['numba', 'scipy', 'astropy', 'sklearn', 'pylops', 'pynufft']\n"
+        "print(','.join(module for module in modules if module in sys.modules))\n"
+    )
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(aa.__file__)), env.get("PYTHONPATH", "")]
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    import_time, imported_modules = output[-2:]
+
+    assert imported_modules == ""
+    assert float(import_time) < 5.0
+
+
+def test__lazy_attributes():
+    from autoarray.structures.arrays.uniform_2d import Array2D
+
+    assert aa.Array2D is Array2D
+    assert aa.mesh.Rectangular is aa.mesh.rectangular.Rectangular
+
+    assert "Imaging" in dir(aa)
+    assert set(aa.__all__) <= set(dir(aa))
+
+    with pytest.raises(AttributeError):
+        aa.NotAnAttribute
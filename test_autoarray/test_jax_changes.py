@@ -23,3 +23,18 @@ def test_in_place_multiply(array):
     array[0] *= 2.0
 
     assert array[0] == 2.0
+
+
+def test_with_new_array__does_not_copy_buffers(array):
+    values = array.array.copy() * 2.0
+
+    new_array = array.with_new_array(values)
+
+    assert new_array.array is values
+    assert new_array.mask is array.mask
+    assert array[0] == 1.0
+    assert new_array[0] == 2.0
+
+
+def test_pytree_registration_once_per_class(array):
+    assert aa.Array2D in aa.Array2D._pytree_registered_classes
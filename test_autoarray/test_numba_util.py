@@ -0,0 +1,68 @@
+import pytest
+
+from autoarray import exc
+from autoarray import numba_util
+from autoarray.mask import mask_2d_util
+from autoarray.operators.convolver import Convolver
+
+
+def test__jitted_func_from():
+    assert (
+        numba_util.jitted_func_from(
+            name="autoarray.mask.mask_2d_util.native_index_for_slim_index_2d_from"
+        )
+        is mask_2d_util.native_index_for_slim_index_2d_from
+    )
+    assert (
+        numba_util.jitted_func_from(
+            name="autoarray.operators.convolver.Convolver.convolve_jit"
+        )
+        is Convolver.convolve_jit
+    )
+
+    with pytest.raises(exc.NumbaException):
+        numba_util.jitted_func_from(name="not_a_module.func")
+
+    with pytest.raises(exc.NumbaException):
+        numba_util.jitted_func_from(name="autoarray.mask.mask_2d_util.not_a_func")
+
+
+def test__precompile():
+    numba = pytest.importorskip("numba")
+
+    name = "autoarray.mask.mask_2d_util.total_pixels_2d_from"
+
+    compile_time_dict = numba_util.precompile(
+        signatures={name: [(numba.types.bool_[:, ::1],)]}
+    )
+
+    assert list(compile_time_dict) == [name]
+    assert compile_time_dict[name] >= 0.0
+
+    assert (numba.types.bool_[:, ::1],) in mask_2d_util.total_pixels_2d_from.signatures
+
+
+def test__hot_signatures_from():
+    signature_dict = numba_util.hot_signatures_from()
+
+    assert signature_dict[
+        "autoarray.mask.mask_2d_util.native_index_for_slim_index_2d_from"
+    ] == ["(bool_[:, ::1],)"]
+    assert (
+        "autoarray.operators.convolver.Convolver.convolve_jit" in signature_dict
+    )
+
+    for name in signature_dict:
+        assert any(
+            name.startswith(f"{module}.")
+            for module in numba_util.hot_signature_module_list
+        )
+
+
+def test__hot_signatures_from__all_functions_are_jitted():
+    numba = pytest.importorskip("numba")
+
+    for name in numba_util.hot_signatures_from():
+        assert isinstance(
+            numba_util.jitted_func_from(name=name), numba.core.dispatcher.Dispatcher
+        )
@@ -0,0 +1,119 @@
+import json
+import numpy as np
+import pytest
+
+import autoarray as aa
+from autoarray import numba_util
+from autoarray import profiler as prof
+
+
+class MockClass:
+    def __init__(self, run_time_dict=None):
+        self.run_time_dict = run_time_dict
+
+    @aa.profile_func
+    def outer(self):
+        return self.inner() + self.inner()
+
+    @aa.profile_func
+    def inner(self):
+        return np.ones(1000).sum()
+
+    @aa.profile_func
+    def compile(self, func):
+        return func(np.ones(10))
+
+
+def test__profiler__records_calls_and_nested_times():
+    cls = MockClass()
+
+    with aa.Profiler() as profiler:
+        assert prof.active_profiler is profiler
+
+        assert cls.outer() == 2000.0
+
+    assert prof.active_profiler is None
+
+    profile_dict = profiler.profile_dict
+
+    assert profile_dict["MockClass.outer"]["calls"] == 1
+    assert profile_dict["MockClass.inner"]["calls"] == 2
+
+    outer = profile_dict["MockClass.outer"]
+
+    assert outer["self_time"] == pytest.approx(
+        outer["cumulative_time"] - profile_dict["MockClass.inner"]["cumulative_time"],
+        abs=1.0e-8,
+    )
+
+    assert len(profiler.trace_events) == 3
+
+
+def test__profiler__run_time_dict_not_used_when_profiler_active():
+    cls = MockClass(run_time_dict={})
+
+    with aa.Profiler():
+        cls.outer()
+
+    assert cls.run_time_dict == {}
+
+    cls.inner()
+
+    assert "inner_0" in cls.run_time_dict
+
+
+def test__profiler__peak_memory():
+    cls = MockClass()
+
+    with aa.Profiler(memory=True) as profiler:
+        cls.inner()
+
+    assert profiler.profile_dict["MockClass.inner"]["peak_memory"] >= 8000
+
+
+def test__profiler__numba_compile_time():
+    pytest.importorskip("numba")
+
+    # Not cached to disk, so that it is always compiled in the test.
+    @numba_util.jit(cache=False)
+    def sum_jit(values):
+        total = 0.0
+
+        for i in range(values.shape[0]):
+            total += values[i]
+
+        return total
+
+    cls = MockClass()
+
+    with aa.Profiler() as profiler:
+        cls.compile(func=sum_jit)
+
+    compile_time = profiler.profile_dict["MockClass.compile"]["compile_time"]
+
+    assert compile_time > 0.0
+    assert any(name.endswith("<locals>.sum_jit") for name in profiler.compile_dict)
+
+
+def test__profiler__output_to_json_and_chrome_trace(tmp_path):
+    cls = MockClass()
+
+    with aa.Profiler() as profiler:
+        cls.outer()
+
+    file_path = tmp_path / "profile.json"
+
+    profiler.output_to_json(file_path=file_path)
+
+    with open(file_path) as f:
+        profile = json.load(f)
+
+    assert profile["profile"]["MockClass.inner"]["calls"] == 2
+
+    profiler.output_to_chrome_trace(file_path=file_path)
+
+    with open(file_path) as f:
+        trace = json.load(f)
+
+    assert trace["traceEvents"][-1]["name"] == "MockClass.outer"
+    assert trace["traceEvents"][-1]["ph"] == "X"